@@ -0,0 +1,5 @@
+"""
+RankSmart 2.0 - Benchmarks
+
+Offline performance benchmarks for the Content Manager system.
+"""
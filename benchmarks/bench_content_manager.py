@@ -0,0 +1,292 @@
+"""
+Content Manager Benchmarks
+
+Measures throughput and latency of the Content Manager hot paths against a
+stub LLM, at several dataset sizes, and emits machine-readable JSON.
+
+Usage:
+    python -m benchmarks.bench_content_manager --sizes 1000 10000 100000 --output bench.json
+    python -m benchmarks.bench_content_manager --sizes 1000 --compare bench.json
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.stats import summarize_latencies
+from benchmarks.stub_llm import canned_response, patch_generative_model
+from benchmarks.synthetic import group_by_writer, make_submissions
+
+
+def _result(name: str, size: int, latencies: List[float], wall_s: float) -> Dict[str, Any]:
+    """Build one benchmark result record"""
+    return {
+        "benchmark": name,
+        "size": size,
+        "ops": len(latencies),
+        "total_s": round(wall_s, 4),
+        "throughput_ops_s": round(len(latencies) / wall_s, 2) if wall_s else 0.0,
+        "latency_ms": summarize_latencies(latencies)
+    }
+
+
+def _time_sync(fn: Callable[[], Any], ops: int) -> List[float]:
+    """Run a sync callable `ops` times and return per-call latencies"""
+    latencies = []
+    for _ in range(ops):
+        start = time.perf_counter()
+        fn()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+async def _time_async(factories: List[Callable[[], Any]], concurrency: int) -> List[float]:
+    """Run coroutine factories with bounded concurrency and return latencies"""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+
+    async def run(factory):
+        async with semaphore:
+            start = time.perf_counter()
+            await factory()
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(run(f) for f in factories))
+    return latencies
+
+
+def bench_size(size: int, args: argparse.Namespace) -> List[Dict[str, Any]]:
+    """
+    Run every benchmark at one dataset size.
+
+    Args:
+        size: Number of synthetic submissions
+        args: Parsed command-line arguments
+
+    Returns:
+        List of benchmark result records
+    """
+    from src.agents.content_manager import ContentManagerAgent, WriterAnalysisAgent
+    from src.api import content_manager_routes as routes
+    from src.config import LLMConfig
+
+    results = []
+    submissions = make_submissions(size, args.submissions_per_writer, seed=args.seed)
+    writers = group_by_writer(submissions)
+
+    # Budgets wide open: measure the agent, not the rate limiter
+    manager_agent = ContentManagerAgent(
+        gemini_api_key="benchmark",
+        llm_config=LLMConfig(
+            requests_per_minute=10 ** 9,
+            tokens_per_minute=10 ** 12,
+            initial_concurrency=args.concurrency * 3,
+            max_concurrency=args.concurrency * 3
+        )
+    )
+    writer_agent = WriterAnalysisAgent()
+
+    # _parse_json_response: one scores response per submission
+    responses = [
+        canned_response(f"Provide scores for {s.title}\n{s.content}") for s in submissions
+    ]
+    start = time.perf_counter()
+    latencies = []
+    for text in responses:
+        t0 = time.perf_counter()
+        manager_agent._parse_json_response(text)
+        latencies.append(time.perf_counter() - t0)
+    results.append(_result("parse_json_response", size, latencies, time.perf_counter() - start))
+
+    # review_submission: full three-stage pipeline against the stub
+    to_review = [s.model_copy(deep=True) for s in submissions[:min(size, args.review_sample)]]
+    start = time.perf_counter()
+    latencies = asyncio.run(_time_async(
+        [lambda s=s: manager_agent.review_submission(s, ["online casinos"], "UK") for s in to_review],
+        args.concurrency
+    ))
+    results.append(_result("review_submission", size, latencies, time.perf_counter() - start))
+
+    # calculate_writer_progress: every writer once
+    start = time.perf_counter()
+    progress = []
+    latencies = []
+    for writer_id, writer_submissions in writers.items():
+        t0 = time.perf_counter()
+        progress.append(writer_agent.calculate_writer_progress(
+            writer_id, writer_submissions[0].writer_name, writer_submissions
+        ))
+        latencies.append(time.perf_counter() - t0)
+    results.append(_result("calculate_writer_progress", size, latencies, time.perf_counter() - start))
+
+    # generate_team_analytics: whole team, repeated
+    start = time.perf_counter()
+    latencies = _time_sync(
+        lambda: writer_agent.generate_team_analytics(submissions, progress), args.repeat
+    )
+    results.append(_result("generate_team_analytics", size, latencies, time.perf_counter() - start))
+
+    # Columnar snapshot: every writer's progress and team analytics, vectorized
+    from src.core.columnar import SubmissionColumns
+    columns = SubmissionColumns.from_submissions(submissions)
+    start = time.perf_counter()
+    latencies = _time_sync(lambda: writer_agent.calculate_progress_columnar(columns), args.repeat)
+    results.append(_result("calculate_progress_columnar", size, latencies, time.perf_counter() - start))
+
+    start = time.perf_counter()
+    latencies = _time_sync(lambda: writer_agent.generate_team_analytics_columnar(columns), args.repeat)
+    results.append(_result("team_analytics_columnar", size, latencies, time.perf_counter() - start))
+
+    # writer_trends_batch: slopes, EWMA and skill trends for the whole team at once
+    from src.core.trends import SKILL_COLUMNS, pad, writer_trends
+    histories = [
+        [s.scores for s in sorted(writer_submissions, key=lambda x: x.created_at) if s.scores]
+        for writer_submissions in writers.values()
+    ]
+    trend = pad([p.score_trend for p in progress])
+    overall = pad([[score.overall_score for score in scores] for scores in histories])
+    skills = {
+        skill: pad([[getattr(score, field) for score in scores] for scores in histories])
+        for skill, field in SKILL_COLUMNS
+    }
+    start = time.perf_counter()
+    latencies = _time_sync(lambda: writer_trends(trend, overall, skills), args.repeat)
+    results.append(_result("writer_trends_batch", size, latencies, time.perf_counter() - start))
+
+    # list_submissions: route handler over the populated in-memory store
+    routes.get_store().clear()
+    routes.get_store().save_many(submissions)
+    sample_writer = next(iter(writers))
+    queries = [
+        {},
+        {"status": "approved"},
+        {"writer_id": sample_writer},
+        {"status": "needs_revision", "limit": 100},
+        {"min_score": 80, "max_score": 90}
+    ]
+    start = time.perf_counter()
+    latencies = asyncio.run(_time_async(
+        [lambda q=q: routes.list_submissions(**q) for q in queries * args.repeat],
+        1
+    ))
+    results.append(_result("list_submissions", size, latencies, time.perf_counter() - start))
+
+    # list_submissions_paged: follow next_cursor page by page (deep pages should stay flat)
+    async def walk_pages() -> List[float]:
+        page_latencies = []
+        cursor = None
+        for _ in range(min(200, size // 20)):
+            t0 = time.perf_counter()
+            response = await routes.list_submissions(cursor=cursor, limit=20)
+            page_latencies.append(time.perf_counter() - t0)
+            cursor = json.loads(response.body)["data"]["next_cursor"]
+            if cursor is None:
+                break
+        return page_latencies
+
+    start = time.perf_counter()
+    latencies = asyncio.run(walk_pages())
+    results.append(_result("list_submissions_paged", size, latencies, time.perf_counter() - start))
+
+    # Maintained aggregates: leaderboard pages, team analytics and trends routes
+    routes.get_leaderboards().refresh()
+    start = time.perf_counter()
+    latencies = asyncio.run(_time_async(
+        [lambda: routes.get_leaderboard("average_score", 0, 10)] * args.repeat, 1
+    ))
+    results.append(_result("leaderboard_page", size, latencies, time.perf_counter() - start))
+
+    start = time.perf_counter()
+    latencies = asyncio.run(_time_async([lambda: routes.get_team_analytics()] * args.repeat, 1))
+    results.append(_result("team_analytics_route", size, latencies, time.perf_counter() - start))
+
+    routes.get_rolling_analytics().refresh()
+    start = time.perf_counter()
+    latencies = asyncio.run(_time_async([lambda: routes.get_team_trends("day")] * args.repeat, 1))
+    results.append(_result("team_trends_route", size, latencies, time.perf_counter() - start))
+    routes.get_store().clear()
+
+    return results
+
+
+def compare(current: List[Dict[str, Any]], baseline_path: str, threshold: float) -> int:
+    """
+    Compare results with a previous run and print regressions.
+
+    Returns:
+        Number of benchmarks that regressed beyond the threshold
+    """
+    baseline = json.loads(Path(baseline_path).read_text())
+    previous = {(r["benchmark"], r["size"]): r for r in baseline["results"]}
+    regressions = 0
+
+    for result in current:
+        old = previous.get((result["benchmark"], result["size"]))
+        if not old or not old["latency_ms"]["p50"]:
+            continue
+        ratio = result["latency_ms"]["p50"] / old["latency_ms"]["p50"]
+        flag = ""
+        if ratio > 1 + threshold:
+            regressions += 1
+            flag = "  <-- REGRESSION"
+        print(
+            f"{result['benchmark']:<28} n={result['size']:<7} "
+            f"p50 {old['latency_ms']['p50']:.4f}ms -> {result['latency_ms']['p50']:.4f}ms "
+            f"({ratio:.2f}x){flag}",
+            file=sys.stderr
+        )
+
+    return regressions
+
+
+def main():
+    """Benchmark entry point"""
+    parser = argparse.ArgumentParser(description="Content Manager benchmarks (stub LLM)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Simulated latency per LLM call")
+    parser.add_argument("--review-sample", type=int, default=1000, help="Max reviews per size")
+    parser.add_argument("--concurrency", type=int, default=50, help="Concurrent reviews")
+    parser.add_argument("--submissions-per-writer", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions for whole-dataset benchmarks")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write JSON results to this file (default: stdout)")
+    parser.add_argument("--compare", help="Previous JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed p50 slowdown ratio")
+    args = parser.parse_args()
+
+    results = []
+    with patch_generative_model(latency_s=args.latency_ms / 1000):
+        for size in args.sizes:
+            print(f"Running benchmarks at {size} submissions...", file=sys.stderr)
+            results.extend(bench_size(size, args))
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "params": {k: v for k, v in vars(args).items() if k not in ("output", "compare")}
+        },
+        "results": results
+    }
+
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(payload)
+    else:
+        print(payload)
+
+    if args.compare:
+        sys.exit(1 if compare(results, args.compare, args.threshold) else 0)
+
+
+if __name__ == "__main__":
+    main()
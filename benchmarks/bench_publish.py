@@ -0,0 +1,97 @@
+"""
+CMS Publishing Benchmark
+
+Bulk-publishes synthetic approved submissions to the mocked WordPress and
+Webflow APIs (`stub_cms.py`, with simulated server latency) at several
+per-site concurrency limits, then re-publishes the same content (which the
+idempotency ledger turns into no-ops).
+
+Usage:
+    python -m benchmarks.bench_publish --submissions 1000 --latency-ms 50 --output publish.json
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.stub_cms import MockCMS, mock_targets
+from benchmarks.synthetic import make_submissions
+from src.core.schemas import ContentSubmission, SubmissionStatus
+from src.integrations.publishing import Publisher
+
+
+def run(submissions: List[ContentSubmission], concurrency: int, latency_s: float) -> Dict[str, Any]:
+    """Publish everything once, then again unchanged"""
+    cms = MockCMS(latency_s)
+    publisher = Publisher(mock_targets(concurrency), transport=cms.transport, max_connections=2 * concurrency)
+
+    start = time.perf_counter()
+    job = asyncio.run(publisher.publish_many(submissions))
+    publish_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    asyncio.run(publisher.publish_many(submissions))
+    republish_s = time.perf_counter() - start
+
+    return {
+        "concurrency": concurrency,
+        "posts": job.completed - job.failed,
+        "failed": job.failed,
+        "publish_s": round(publish_s, 3),
+        "posts_per_second": round(job.total / publish_s, 1),
+        "max_in_flight": {"wordpress": cms.wordpress.max_in_flight, "webflow": cms.webflow.max_in_flight},
+        "republish_s": round(republish_s, 3),
+        "duplicates": len(cms.wordpress.posts) + len(cms.webflow.posts) - job.total
+    }
+
+
+def main():
+    """Benchmark entry point"""
+    parser = argparse.ArgumentParser(description="CMS publishing benchmark")
+    parser.add_argument("--submissions", type=int, default=1000)
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="Simulated CMS response time")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write JSON results to this file (default: stdout)")
+    args = parser.parse_args()
+
+    submissions = make_submissions(args.submissions, seed=args.seed)
+    for submission in submissions:
+        submission.status = SubmissionStatus.APPROVED
+
+    results = []
+    for concurrency in args.concurrency:
+        result = run(submissions, concurrency, args.latency_ms / 1000)
+        results.append(result)
+        print(
+            f"concurrency {concurrency:>3}: {result['posts_per_second']:>8.1f} posts/s  "
+            f"republish {result['republish_s']:.3f}s  duplicates {result['duplicates']}",
+            file=sys.stderr
+        )
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "params": {k: v for k, v in vars(args).items() if k != "output"}
+        },
+        "results": results
+    }
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(payload)
+    else:
+        print(payload)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Full-Text Search Benchmark
+
+Builds the BM25 index over synthetic submissions, then measures query
+latency (cold per-term scores, then warm), filtered queries and the cost of
+re-indexing one document.
+
+Usage:
+    python -m benchmarks.bench_search --docs 100000 --output search.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.stats import summarize_latencies
+from benchmarks.synthetic import make_submissions
+from src.core.search import SearchIndex
+
+QUERIES = [
+    "wagering requirements",
+    "casino",
+    "responsible gambling disclaimer",
+    "live dealer games 2025",
+    "fast withdrawals bonuses"
+]
+
+
+def _time(fn: Callable[[], Any], ops: int) -> Dict[str, Any]:
+    latencies: List[float] = []
+    for _ in range(ops):
+        start = time.perf_counter()
+        fn()
+        latencies.append(time.perf_counter() - start)
+    return {"ops": ops, "latency_ms": summarize_latencies(latencies)}
+
+
+def main():
+    """Benchmark entry point"""
+    parser = argparse.ArgumentParser(description="Full-text search benchmark")
+    parser.add_argument("--docs", type=int, default=100000)
+    parser.add_argument("--ops", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write JSON results to this file (default: stdout)")
+    args = parser.parse_args()
+
+    submissions = make_submissions(args.docs, seed=args.seed)
+    index = SearchIndex()
+    start = time.perf_counter()
+    for submission in submissions:
+        index.add(submission)
+    build_s = time.perf_counter() - start
+    print(f"indexed {len(index)} docs, {len(index.postings)} terms in {build_s:.2f}s", file=sys.stderr)
+
+    results = []
+    for query in QUERIES:
+        cold = _time(lambda: index.search(query), 1)
+        warm = _time(lambda: index.search(query), args.ops)
+        filtered = _time(lambda: index.search(query, writer_id="writer_00001", status="approved"), args.ops)
+        total = index.search(query)[1]
+        results.append({
+            "query": query,
+            "matches": total,
+            "cold_ms": cold["latency_ms"]["p50"],
+            "warm": warm,
+            "filtered": filtered
+        })
+        print(
+            f"{query:<34} {total:>7} hits  cold {cold['latency_ms']['p50']:8.2f}ms  "
+            f"warm p50 {warm['latency_ms']['p50']:7.2f}ms  filtered p50 {filtered['latency_ms']['p50']:7.2f}ms",
+            file=sys.stderr
+        )
+
+    updated = submissions[0]
+    reindex = _time(lambda: index.add(updated), args.ops)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "params": {k: v for k, v in vars(args).items() if k != "output"}
+        },
+        "build": {"docs": len(index), "terms": len(index.postings), "total_s": round(build_s, 3)},
+        "queries": results,
+        "reindex_one": reindex
+    }
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(payload)
+    else:
+        print(payload)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Response Serialization Benchmark
+
+Compares the original response path (`submission.dict()` wrapped in
+`APIResponse`, validated by FastAPI's `response_model`, `jsonable_encoder`
+and stdlib `json`) with `src.api.responses` (orjson, `?fields=`
+projection), and reports body sizes with gzip/brotli.
+
+Usage:
+    python -m benchmarks.bench_serialization --output serialization.json
+"""
+
+import argparse
+import gzip
+import json
+import platform
+import sys
+import time
+import warnings
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi.encoders import jsonable_encoder
+
+from benchmarks.stats import summarize_latencies
+from benchmarks.synthetic import group_by_writer, make_submissions
+from src.api.responses import api_response, brotli, dump_model
+from src.core.schemas import APIResponse
+
+LIST_FIELDS = "submission_id,title,status,scores.overall_score,created_at"
+
+
+def baseline_body(message: str, data: Any) -> bytes:
+    """Original path: APIResponse -> response_model validation -> jsonable_encoder -> json.dumps"""
+    response = APIResponse.model_validate(APIResponse(success=True, message=message, data=data).model_dump())
+    content = jsonable_encoder(response)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+def _time(fn: Callable[[], bytes], ops: int) -> Dict[str, Any]:
+    latencies: List[float] = []
+    body = b""
+    for _ in range(ops):
+        start = time.perf_counter()
+        body = fn()
+        latencies.append(time.perf_counter() - start)
+    sizes = {"raw_bytes": len(body), "gzip_bytes": len(gzip.compress(body, 6))}
+    if brotli is not None:
+        sizes["br_bytes"] = len(brotli.compress(body, quality=4))
+    return {"ops": ops, "latency_ms": summarize_latencies(latencies), **sizes}
+
+
+def main():
+    """Benchmark entry point"""
+    parser = argparse.ArgumentParser(description="Response serialization benchmark")
+    parser.add_argument("--ops", type=int, default=500)
+    parser.add_argument("--article-chars", type=int, default=12000, help="Pad article bodies to this size")
+    parser.add_argument("--submissions", type=int, default=2000, help="Submissions behind team analytics")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write JSON results to this file (default: stdout)")
+    args = parser.parse_args()
+
+    # The baseline deliberately uses the deprecated `.dict()` the routes used to call
+    warnings.filterwarnings("ignore", category=DeprecationWarning)
+
+    submissions = make_submissions(args.submissions, seed=args.seed)
+    for submission in submissions:
+        repeats = max(1, args.article_chars // max(1, len(submission.content)))
+        submission.content = "\n".join([submission.content] * repeats)
+    submission = next(s for s in submissions if s.scores)
+
+    from src.agents.content_manager import WriterAnalysisAgent
+    writer_agent = WriterAnalysisAgent()
+    writers = group_by_writer(submissions)
+    progress = [writer_agent.calculate_writer_progress(w, s[0].writer_name, s) for w, s in writers.items()]
+    analytics = writer_agent.generate_team_analytics(submissions, progress)
+
+    cases = {
+        "submission": {
+            "baseline": lambda: baseline_body("ok", submission.dict()),
+            "fast": lambda: api_response("ok", dump_model(submission)).body,
+            "fast_projected": lambda: api_response("ok", dump_model(submission, LIST_FIELDS)).body
+        },
+        "writer_progress": {
+            "baseline": lambda: baseline_body("ok", {"progress": progress[0].dict()}),
+            "fast": lambda: api_response("ok", {"progress": dump_model(progress[0])}).body,
+            "fast_projected": lambda: api_response(
+                "ok", {"progress": dump_model(progress[0], "average_score,score_trend")}
+            ).body
+        },
+        "team_analytics": {
+            "baseline": lambda: baseline_body("ok", analytics.dict()),
+            "fast": lambda: api_response("ok", dump_model(analytics)).body,
+            "fast_projected": lambda: api_response(
+                "ok", dump_model(analytics, "total_submissions,average_team_score")
+            ).body
+        }
+    }
+
+    results = []
+    for endpoint, variants in cases.items():
+        baseline_p50 = None
+        for variant, fn in variants.items():
+            result = {"endpoint": endpoint, "variant": variant, **_time(fn, args.ops)}
+            if baseline_p50 is None:
+                baseline_p50 = result["latency_ms"]["p50"]
+            result["speedup_p50"] = round(baseline_p50 / result["latency_ms"]["p50"], 2)
+            results.append(result)
+            print(
+                f"{endpoint:<16} {variant:<15} p50 {result['latency_ms']['p50']:8.4f}ms "
+                f"({result['speedup_p50']:5.2f}x)  {result['raw_bytes']:>8}B raw  {result['gzip_bytes']:>7}B gzip",
+                file=sys.stderr
+            )
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "params": {k: v for k, v in vars(args).items() if k != "output"}
+        },
+        "results": results
+    }
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(payload)
+    else:
+        print(payload)
+
+
+if __name__ == "__main__":
+    main()
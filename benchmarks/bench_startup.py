@@ -0,0 +1,139 @@
+"""
+Startup Benchmark
+
+Measures API server cold start: time from spawning `python -m src.main` to
+the first healthy `/health` response, plus the import time of the app and
+route modules in a fresh interpreter.
+
+Usage:
+    python -m benchmarks.bench_startup --runs 5 --output startup.json
+    python -m benchmarks.bench_startup --runs 5 --compare startup.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.load_test import REPO_ROOT, _free_port
+from benchmarks.stats import summarize_latencies
+
+IMPORT_SNIPPET = (
+    "import time; start = time.perf_counter(); "
+    "import src.main, src.api.content_manager_routes; "
+    "print(time.perf_counter() - start)"
+)
+
+
+def _env(workdir: str, port: int) -> Dict[str, str]:
+    return dict(os.environ, PYTHONPATH=str(REPO_ROOT), GOOGLE_API_KEY="startup-bench", PORT=str(port))
+
+
+def measure_cold_start(timeout_s: float = 60.0) -> float:
+    """Seconds from process spawn to the first 200 from /health"""
+    workdir = tempfile.mkdtemp(prefix="ranksmart-startup-")
+    port = _free_port()
+    url = f"http://127.0.0.1:{port}/health"
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "src.main"],
+        cwd=workdir,
+        env=_env(workdir, port),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    try:
+        with httpx.Client(timeout=1.0) as client:
+            while time.perf_counter() - start < timeout_s:
+                if process.poll() is not None:
+                    raise RuntimeError("Server exited before becoming healthy")
+                try:
+                    if client.get(url).status_code == 200:
+                        return time.perf_counter() - start
+                except httpx.HTTPError:
+                    pass
+                time.sleep(0.005)
+        raise RuntimeError(f"Timed out waiting for {url}")
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+def measure_import() -> float:
+    """Seconds to import the app and route modules in a fresh interpreter"""
+    workdir = tempfile.mkdtemp(prefix="ranksmart-startup-")
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_SNIPPET],
+        cwd=workdir,
+        env=_env(workdir, 0),
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return float(output.stdout.strip().splitlines()[-1])
+
+
+def _result(name: str, latencies: List[float]) -> Dict[str, Any]:
+    return {"benchmark": name, "runs": len(latencies), "latency_ms": summarize_latencies(latencies)}
+
+
+def main():
+    """Benchmark entry point"""
+    parser = argparse.ArgumentParser(description="API server startup benchmark")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--output", help="Write JSON results to this file (default: stdout)")
+    parser.add_argument("--compare", help="Previous JSON results to compare against")
+    args = parser.parse_args()
+
+    cold_starts, imports = [], []
+    for run in range(args.runs):
+        cold_starts.append(measure_cold_start())
+        imports.append(measure_import())
+        print(
+            f"run {run + 1}: cold start {cold_starts[-1] * 1000:.0f}ms, import {imports[-1] * 1000:.0f}ms",
+            file=sys.stderr
+        )
+
+    results = [_result("cold_start_to_healthy", cold_starts), _result("import_app_and_routes", imports)]
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "params": {"runs": args.runs}
+        },
+        "results": results
+    }
+
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(payload)
+    else:
+        print(payload)
+
+    if args.compare:
+        baseline = {r["benchmark"]: r for r in json.loads(Path(args.compare).read_text())["results"]}
+        for result in results:
+            old = baseline.get(result["benchmark"])
+            if old:
+                before, after = old["latency_ms"]["p50"], result["latency_ms"]["p50"]
+                print(
+                    f"{result['benchmark']:<24} p50 {before:.0f}ms -> {after:.0f}ms "
+                    f"({after / before:.2f}x)",
+                    file=sys.stderr
+                )
+
+
+if __name__ == "__main__":
+    main()
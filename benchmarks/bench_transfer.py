@@ -0,0 +1,95 @@
+"""
+Bulk Import / Export Benchmark
+
+Imports synthetic submissions from NDJSON into each storage backend, then
+exports them back, reporting records per second for both directions.
+
+Usage:
+    python -m benchmarks.bench_transfer --records 100000 --output transfer.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.synthetic import make_submissions
+from src.core.listing import SubmissionListIndex
+from src.core.storage import MemorySubmissionStore, SQLiteSubmissionStore, SubmissionStore
+from src.core.transfer import export_ndjson, import_ndjson
+
+
+def run(store: SubmissionStore, lines, batch_size: int) -> Dict[str, Any]:
+    """Import `lines` into an empty store, then export everything"""
+    report = import_ndjson(store, lines, batch_size)
+
+    index = SubmissionListIndex()
+    index.attach(store)
+    start = time.perf_counter()
+    exported = sum(len(line) for line in export_ndjson(store, index))
+    export_s = time.perf_counter() - start
+
+    return {
+        "import": {
+            "records": report.imported,
+            "total_s": report.seconds,
+            "records_per_second": report.records_per_second
+        },
+        "export": {
+            "records": len(index),
+            "bytes": exported,
+            "total_s": round(export_s, 3),
+            "records_per_second": round(len(index) / export_s, 1) if export_s else 0.0
+        }
+    }
+
+
+def main():
+    """Benchmark entry point"""
+    parser = argparse.ArgumentParser(description="Bulk import/export benchmark")
+    parser.add_argument("--records", type=int, default=100000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write JSON results to this file (default: stdout)")
+    args = parser.parse_args()
+
+    lines = [s.model_dump_json().encode("utf-8") + b"\n" for s in make_submissions(args.records, seed=args.seed)]
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for backend, store in (
+            ("memory", MemorySubmissionStore()),
+            ("sqlite", SQLiteSubmissionStore(str(Path(tmp) / "state.db")))
+        ):
+            results[backend] = run(store, lines, args.batch_size)
+            print(
+                f"{backend:<7} import {results[backend]['import']['records_per_second']:>9.0f} records/s  "
+                f"export {results[backend]['export']['records_per_second']:>9.0f} records/s",
+                file=sys.stderr
+            )
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "params": {k: v for k, v in vars(args).items() if k != "output"}
+        },
+        "backends": results
+    }
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(payload)
+    else:
+        print(payload)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+HTTP LLM Client
+
+Async `GenerativeModel` replacement that calls a Gemini-compatible REST
+endpoint (e.g. `benchmarks.mock_gemini`) over pooled httpx connections.
+"""
+
+import httpx
+from google.api_core import exceptions as google_exceptions
+
+
+class HTTPResponse:
+    """Response object exposing `.text` and `.usage_metadata` like the Gemini SDK"""
+
+    def __init__(self, payload: dict):
+        candidates = payload.get("candidates") or [{}]
+        parts = candidates[0].get("content", {}).get("parts", [])
+        self.text = "".join(part.get("text", "") for part in parts)
+        self.usage_metadata = payload.get("usageMetadata", {})
+
+
+class HTTPGenerativeModel:
+    """
+    Minimal Gemini REST client.
+
+    Non-2xx responses are raised as `google.api_core` exceptions (e.g.
+    `ResourceExhausted` for 429) so callers see the same errors as with
+    the real SDK.
+    """
+
+    def __init__(self, model_name: str, endpoint: str, api_key: str = "mock", timeout: float = 120.0):
+        self.model_name = model_name
+        self.url = f"{endpoint.rstrip('/')}/v1beta/models/{model_name}:generateContent"
+        self.api_key = api_key
+        self.client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=500, max_keepalive_connections=100)
+        )
+
+    async def generate_content_async(self, contents, generation_config=None, **kwargs) -> HTTPResponse:
+        """POST a generateContent request"""
+        body = {"contents": [{"role": "user", "parts": [{"text": str(contents)}]}]}
+        if generation_config and generation_config.get("response_mime_type"):
+            body["generationConfig"] = {"responseMimeType": generation_config["response_mime_type"]}
+        response = await self.client.post(self.url, params={"key": self.api_key}, json=body)
+        if response.status_code >= 400:
+            message = response.json().get("error", {}).get("message", response.text)
+            raise google_exceptions.from_http_status(response.status_code, message)
+        return HTTPResponse(response.json())
@@ -0,0 +1,308 @@
+"""
+HTTP Load Test
+
+Starts a mock Gemini server and the RankSmart API, then drives a mixed
+workload (submit, review, progress, analytics, list) at fixed request rates
+and reports throughput, p50/p95/p99 and error rates per route. Runs fully
+offline.
+
+Usage:
+    python -m benchmarks.load_test --rates 5 10 20 40 --duration 30 --llm-latency-ms 800
+    python -m benchmarks.load_test --app-url http://127.0.0.1:8000 --rates 10
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.stats import summarize_latencies
+from benchmarks.synthetic import make_article
+
+
+REPO_ROOT = Path(__file__).parent.parent
+API_PREFIX = "/api/content-manager"
+DEFAULT_MIX = "submit=20,review=20,progress=15,analytics=5,list=40"
+
+
+def _free_port() -> int:
+    """Ask the OS for an unused TCP port"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for(url: str, timeout_s: float = 30.0):
+    """Poll a URL until it answers or the timeout expires"""
+    deadline = time.monotonic() + timeout_s
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(url, timeout=1.0).status_code < 500:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.1)
+    raise RuntimeError(f"Timed out waiting for {url}")
+
+
+def _spawn(args: List[str], workdir: str, extra_env: Optional[Dict[str, str]] = None) -> subprocess.Popen:
+    """Start a benchmark helper module in a subprocess (all load comes from one IP, so no rate limits)"""
+    env = dict(
+        os.environ, PYTHONPATH=str(REPO_ROOT), GOOGLE_API_KEY="mock", RATE_LIMIT_ENABLED="false",
+        **(extra_env or {})
+    )
+    return subprocess.Popen(
+        [sys.executable, "-m", *args],
+        cwd=workdir,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    """Parse 'route=weight,...' into a weight mapping"""
+    weights = {}
+    for item in mix.split(","):
+        route, weight = item.split("=")
+        weights[route.strip()] = float(weight)
+    return weights
+
+
+class Workload:
+    """
+    Mixed Content Manager workload.
+
+    Keeps track of submissions and writers it has created so that review,
+    progress and list requests always target real data.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, writers: int, seed: int):
+        self.client = client
+        self.rng = random.Random(seed)
+        self.writer_ids = [f"load_writer_{i:04d}" for i in range(writers)]
+        self.submission_ids: List[str] = []
+
+    async def submit(self, writer_id: Optional[str] = None) -> httpx.Response:
+        writer_id = writer_id or self.rng.choice(self.writer_ids)
+        title = f"Best Online Casinos {self.rng.randrange(10 ** 6)}"
+        response = await self.client.post(f"{API_PREFIX}/submit", params={
+            "writer_id": writer_id,
+            "writer_name": writer_id.replace("_", " ").title(),
+            "title": title,
+            "content": make_article(self.rng, title)
+        })
+        if response.status_code == 200:
+            self.submission_ids.append(response.json()["data"]["submission_id"])
+        return response
+
+    async def review(self) -> httpx.Response:
+        submission_id = self.rng.choice(self.submission_ids)
+        return await self.client.post(f"{API_PREFIX}/review/{submission_id}", params={"jurisdiction": "UK"})
+
+    async def progress(self) -> httpx.Response:
+        return await self.client.get(f"{API_PREFIX}/writer/{self.rng.choice(self.writer_ids)}/progress")
+
+    async def analytics(self) -> httpx.Response:
+        return await self.client.get(f"{API_PREFIX}/team/analytics")
+
+    async def list(self) -> httpx.Response:
+        return await self.client.get(f"{API_PREFIX}/submissions", params={"limit": 20})
+
+
+async def seed_workload(workload: Workload, count: int):
+    """Create initial submissions so every writer exists before measuring"""
+    for writer_id in workload.writer_ids:
+        await workload.submit(writer_id)
+    for _ in range(max(0, count - len(workload.writer_ids))):
+        await workload.submit()
+
+
+async def run_stage(
+    workload: Workload,
+    weights: Dict[str, float],
+    rate: float,
+    duration_s: float,
+    poisson: bool
+) -> Dict[str, Any]:
+    """
+    Drive one open-loop stage at a fixed arrival rate.
+
+    Args:
+        workload: Workload to draw requests from
+        weights: Route mix weights
+        rate: Target requests per second
+        duration_s: Stage duration
+        poisson: Use exponential inter-arrival times instead of a fixed interval
+
+    Returns:
+        Per-route and overall statistics
+    """
+    routes = list(weights)
+    route_weights = [weights[r] for r in routes]
+    samples: Dict[str, List[float]] = {r: [] for r in routes}
+    errors: Dict[str, int] = {r: 0 for r in routes}
+    tasks = []
+
+    async def one(route: str):
+        start = time.perf_counter()
+        try:
+            response = await getattr(workload, route)()
+            if response.status_code >= 400:
+                errors[route] += 1
+        except httpx.HTTPError:
+            errors[route] += 1
+        samples[route].append(time.perf_counter() - start)
+
+    stage_start = time.perf_counter()
+    next_at = 0.0
+    while next_at < duration_s:
+        delay = stage_start + next_at - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        route = workload.rng.choices(routes, route_weights)[0]
+        tasks.append(asyncio.create_task(one(route)))
+        next_at += workload.rng.expovariate(rate) if poisson else 1 / rate
+
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - stage_start
+
+    report: Dict[str, Any] = {"target_rps": rate, "duration_s": round(elapsed, 2), "routes": {}}
+    all_latencies: List[float] = []
+    total_errors = 0
+    for route in routes:
+        count = len(samples[route])
+        all_latencies.extend(samples[route])
+        total_errors += errors[route]
+        report["routes"][route] = {
+            "requests": count,
+            "errors": errors[route],
+            "error_rate": round(errors[route] / count, 4) if count else 0.0,
+            "throughput_rps": round(count / elapsed, 2),
+            "latency_ms": summarize_latencies(samples[route])
+        }
+    report["overall"] = {
+        "requests": len(all_latencies),
+        "errors": total_errors,
+        "error_rate": round(total_errors / len(all_latencies), 4) if all_latencies else 0.0,
+        "throughput_rps": round(len(all_latencies) / elapsed, 2),
+        "latency_ms": summarize_latencies(all_latencies)
+    }
+    return report
+
+
+def print_stage(stage: Dict[str, Any]):
+    """Print a human-readable stage table to stderr"""
+    print(f"\n=== {stage['target_rps']} req/s for {stage['duration_s']}s ===", file=sys.stderr)
+    print(f"{'route':<10} {'reqs':>6} {'rps':>7} {'err%':>6} {'p50':>9} {'p95':>9} {'p99':>9}", file=sys.stderr)
+    for name, row in list(stage["routes"].items()) + [("overall", stage["overall"])]:
+        lat = row["latency_ms"]
+        print(
+            f"{name:<10} {row['requests']:>6} {row['throughput_rps']:>7.1f} {row['error_rate'] * 100:>5.1f}% "
+            f"{lat['p50']:>8.1f}ms {lat['p95']:>8.1f}ms {lat['p99']:>8.1f}ms",
+            file=sys.stderr
+        )
+
+
+async def run_load_test(args: argparse.Namespace, app_url: str) -> Dict[str, Any]:
+    """Seed the app and run every configured rate stage"""
+    limits = httpx.Limits(max_connections=args.max_connections, max_keepalive_connections=args.max_connections)
+    async with httpx.AsyncClient(base_url=app_url, timeout=args.timeout, limits=limits) as client:
+        workload = Workload(client, args.writers, args.seed)
+        await seed_workload(workload, args.seed_submissions)
+
+        stages = []
+        for rate in args.rates:
+            stage = await run_stage(workload, parse_mix(args.mix), rate, args.duration, args.poisson)
+            print_stage(stage)
+            stages.append(stage)
+
+    sustained = [
+        s["target_rps"] for s in stages
+        if s["overall"]["latency_ms"]["p99"] <= args.p99_slo_ms
+        and s["overall"]["error_rate"] <= args.max_error_rate
+    ]
+    return {
+        "params": {k: v for k, v in vars(args).items() if k != "output"},
+        "stages": stages,
+        "max_sustained_rps": max(sustained) if sustained else None
+    }
+
+
+def main():
+    """Load test entry point"""
+    parser = argparse.ArgumentParser(description="Offline HTTP load test for the RankSmart API")
+    parser.add_argument("--rates", type=float, nargs="+", default=[5, 10, 20], help="Target req/s per stage")
+    parser.add_argument("--duration", type=float, default=20.0, help="Seconds per stage")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="Route weights, e.g. 'submit=20,review=20,list=60'")
+    parser.add_argument("--poisson", action="store_true", help="Poisson arrivals instead of fixed interval")
+    parser.add_argument("--writers", type=int, default=25)
+    parser.add_argument("--seed-submissions", type=int, default=200)
+    parser.add_argument("--llm-latency-ms", type=float, default=800.0)
+    parser.add_argument("--llm-jitter-ms", type=float, default=200.0)
+    parser.add_argument("--llm-error-rate", type=float, default=0.0)
+    parser.add_argument("--llm-throttle-rate", type=float, default=0.0)
+    parser.add_argument("--llm-rpm", type=int, default=100000, help="App LLM requests/minute budget")
+    parser.add_argument("--llm-tpm", type=int, default=10 ** 9, help="App LLM tokens/minute budget")
+    parser.add_argument("--llm-max-concurrency", type=int, default=256, help="App adaptive concurrency cap")
+    parser.add_argument("--p99-slo-ms", type=float, default=10000.0, help="p99 budget for 'sustained'")
+    parser.add_argument("--max-error-rate", type=float, default=0.01)
+    parser.add_argument("--timeout", type=float, default=60.0, help="Client request timeout")
+    parser.add_argument("--max-connections", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=1, help="App worker processes (shared SQLite state)")
+    parser.add_argument("--app-url", help="Target an already running app instead of spawning one")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", help="Write JSON report to this file (default: stdout)")
+    args = parser.parse_args()
+
+    processes: List[subprocess.Popen] = []
+    workdir = tempfile.mkdtemp(prefix="ranksmart-load-")
+    app_url: Optional[str] = args.app_url
+    try:
+        if not app_url:
+            llm_port, app_port = _free_port(), _free_port()
+            processes.append(_spawn([
+                "benchmarks.mock_gemini", "--port", str(llm_port),
+                "--latency-ms", str(args.llm_latency_ms), "--jitter-ms", str(args.llm_jitter_ms),
+                "--error-rate", str(args.llm_error_rate), "--throttle-rate", str(args.llm_throttle_rate),
+                "--seed", str(args.seed)
+            ], workdir))
+            _wait_for(f"http://127.0.0.1:{llm_port}/stats")
+            processes.append(_spawn([
+                "benchmarks.serve_app", "--port", str(app_port),
+                "--llm-endpoint", f"http://127.0.0.1:{llm_port}", "--workers", str(args.workers)
+            ], workdir, {
+                "LLM_REQUESTS_PER_MINUTE": str(args.llm_rpm),
+                "LLM_TOKENS_PER_MINUTE": str(args.llm_tpm),
+                "LLM_MAX_CONCURRENCY": str(args.llm_max_concurrency)
+            }))
+            app_url = f"http://127.0.0.1:{app_port}"
+            _wait_for(f"{app_url}/health")
+
+        report = asyncio.run(run_load_test(args, app_url))
+    finally:
+        for process in processes:
+            process.terminate()
+            process.wait(timeout=10)
+
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(payload)
+    else:
+        print(payload)
+
+
+if __name__ == "__main__":
+    main()
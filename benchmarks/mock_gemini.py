@@ -0,0 +1,115 @@
+"""
+Mock Gemini Server
+
+Local HTTP server that speaks the Gemini REST `generateContent` API with
+tunable latency and error rates, so the app can be load-tested offline.
+
+Usage:
+    python -m benchmarks.mock_gemini --port 8765 --latency-ms 800 --jitter-ms 200 --error-rate 0.01
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+from pathlib import Path
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+import uvicorn
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.stub_llm import canned_response
+
+
+def create_app(
+    latency_ms: float = 0.0,
+    jitter_ms: float = 0.0,
+    error_rate: float = 0.0,
+    throttle_rate: float = 0.0,
+    seed: int = 0
+) -> FastAPI:
+    """
+    Create the mock Gemini application.
+
+    Args:
+        latency_ms: Mean response latency
+        jitter_ms: Uniform +/- jitter applied to the latency
+        error_rate: Probability of a 500 response
+        throttle_rate: Probability of a 429 RESOURCE_EXHAUSTED response
+        seed: Random seed for reproducible error patterns
+
+    Returns:
+        FastAPI application
+    """
+    app = FastAPI(title="Mock Gemini")
+    rng = random.Random(seed)
+    stats = {"requests": 0, "errors": 0, "throttled": 0}
+
+    @app.post("/v1beta/models/{model_action}")
+    async def generate_content(model_action: str, request: Request):
+        stats["requests"] += 1
+        delay = max(0.0, latency_ms + rng.uniform(-jitter_ms, jitter_ms)) / 1000
+        if delay:
+            await asyncio.sleep(delay)
+
+        roll = rng.random()
+        if roll < throttle_rate:
+            stats["throttled"] += 1
+            return JSONResponse(
+                status_code=429,
+                content={"error": {"code": 429, "message": "Resource has been exhausted (e.g. check quota).", "status": "RESOURCE_EXHAUSTED"}}
+            )
+        if roll < throttle_rate + error_rate:
+            stats["errors"] += 1
+            return JSONResponse(
+                status_code=500,
+                content={"error": {"code": 500, "message": "Internal error encountered.", "status": "INTERNAL"}}
+            )
+
+        body = await request.json()
+        prompt = "".join(
+            part.get("text", "")
+            for content in body.get("contents", [])
+            for part in content.get("parts", [])
+        )
+        text = canned_response(prompt)
+        return {
+            "candidates": [{
+                "content": {"parts": [{"text": text}], "role": "model"},
+                "finishReason": "STOP",
+                "index": 0
+            }],
+            "usageMetadata": {
+                "promptTokenCount": len(prompt) // 4,
+                "candidatesTokenCount": len(text) // 4,
+                "totalTokenCount": (len(prompt) + len(text)) // 4
+            }
+        }
+
+    @app.get("/stats")
+    async def get_stats():
+        return stats
+
+    return app
+
+
+def main():
+    """Mock server entry point"""
+    parser = argparse.ArgumentParser(description="Mock Gemini REST server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    app = create_app(args.latency_ms, args.jitter_ms, args.error_rate, args.throttle_rate, args.seed)
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Serve App Against Mock LLM
+
+Starts the RankSmart API (`src/main.py`) with every Gemini call routed to a
+local Gemini-compatible endpoint instead of Google.
+
+Usage:
+    python -m benchmarks.serve_app --port 8000 --llm-endpoint http://127.0.0.1:8765
+    python -m benchmarks.serve_app --port 8000 --llm-endpoint http://127.0.0.1:8765 --workers 4
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+import google.generativeai as genai
+import uvicorn
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.http_llm import HTTPGenerativeModel
+
+
+def create_app():
+    """App factory (also run by every worker process) with the LLM routed to `MOCK_LLM_ENDPOINT`"""
+    endpoint = os.environ["MOCK_LLM_ENDPOINT"]
+    genai.GenerativeModel = lambda model_name, **kwargs: HTTPGenerativeModel(model_name, endpoint)
+
+    from src.main import create_app as create_main_app
+    return create_main_app()
+
+
+def main():
+    """Serve entry point"""
+    parser = argparse.ArgumentParser(description="Run the API against a mock LLM endpoint")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--llm-endpoint", required=True, help="Base URL of a Gemini-compatible server")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes (>1 shares state via SQLite)")
+    args = parser.parse_args()
+
+    os.environ.setdefault("GOOGLE_API_KEY", "mock")
+    os.environ.setdefault("RATE_LIMIT_ENABLED", "false")  # load comes from a single IP
+    os.environ["MOCK_LLM_ENDPOINT"] = args.llm_endpoint
+
+    if args.workers > 1:
+        os.environ.setdefault("STATE_BACKEND", "sqlite")
+        uvicorn.run(
+            "benchmarks.serve_app:create_app", factory=True,
+            host=args.host, port=args.port, workers=args.workers, log_level="warning"
+        )
+    else:
+        uvicorn.run(create_app(), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
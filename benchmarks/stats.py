@@ -0,0 +1,39 @@
+"""
+Benchmark Statistics
+
+Latency summaries shared by the benchmark and load-test tools.
+"""
+
+import math
+from typing import Dict, List
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize_latencies(latencies_s: List[float]) -> Dict[str, float]:
+    """
+    Summarize a list of latencies.
+    
+    Args:
+        latencies_s: Latencies in seconds
+    
+    Returns:
+        Dictionary of latency statistics in milliseconds
+    """
+    values = sorted(latencies_s)
+    if not values:
+        return {"mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    
+    return {
+        "mean": round(sum(values) / len(values) * 1000, 4),
+        "p50": round(percentile(values, 50) * 1000, 4),
+        "p95": round(percentile(values, 95) * 1000, 4),
+        "p99": round(percentile(values, 99) * 1000, 4),
+        "max": round(values[-1] * 1000, 4)
+    }
@@ -0,0 +1,133 @@
+"""
+Stub CMS
+
+In-process mocks of the WordPress REST API and the Webflow CMS API v2, as an
+`httpx.MockTransport`, so publishing can be exercised offline.
+
+Each site keeps its posts in memory and records request counts and the
+highest number of requests it saw in flight at once. Failures can be
+injected per site: a queue of statuses to answer create requests with, and
+"lost responses" where the post is created but the client gets an error
+(the case idempotency has to survive).
+"""
+
+import asyncio
+import json
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from src.integrations.publishing import CMSTarget, WebflowTarget, WordPressTarget
+
+
+WORDPRESS_HOST = "wordpress.test"
+WEBFLOW_HOST = "webflow.test"
+WEBFLOW_COLLECTION = "blog"
+
+
+class MockSite:
+    """Posts and request accounting for one mocked CMS"""
+
+    def __init__(self, latency_s: float = 0.0):
+        self.latency_s = latency_s
+        self.posts: Dict[str, dict] = {}
+        self.requests = 0
+        self.creates = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.fail_statuses: List[int] = []  # answered to the next create requests
+        self.lose_responses = 0             # creates that succeed but time out client-side
+        self._next_id = 1
+
+    def next_id(self) -> str:
+        value = self._next_id
+        self._next_id += 1
+        return str(value)
+
+    def by_slug(self, slug: str) -> Optional[dict]:
+        return next((post for post in self.posts.values() if post["slug"] == slug), None)
+
+
+class MockCMS:
+    """
+    WordPress at http://wordpress.test and Webflow at http://webflow.test/v2.
+
+    Args:
+        latency_s: Simulated server time per request
+    """
+
+    def __init__(self, latency_s: float = 0.0):
+        self.wordpress = MockSite(latency_s)
+        self.webflow = MockSite(latency_s)
+        self.transport = httpx.MockTransport(self.handle)
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        site = self.wordpress if request.url.host == WORDPRESS_HOST else self.webflow
+        site.requests += 1
+        site.in_flight += 1
+        site.max_in_flight = max(site.max_in_flight, site.in_flight)
+        try:
+            if site.latency_s:
+                await asyncio.sleep(site.latency_s)
+            if site is self.wordpress:
+                return self._wordpress(request)
+            return self._webflow(request)
+        finally:
+            site.in_flight -= 1
+
+    def _create(self, site: MockSite, request: httpx.Request, post: dict) -> httpx.Response:
+        site.creates += 1
+        if site.fail_statuses:
+            return httpx.Response(site.fail_statuses.pop(0), headers={"Retry-After": "0"}, json={"message": "busy"})
+        site.posts[str(post["id"])] = post
+        if site.lose_responses:
+            site.lose_responses -= 1
+            raise httpx.ReadTimeout("response lost", request=request)
+        return httpx.Response(201, json=post)
+
+    def _wordpress(self, request: httpx.Request) -> httpx.Response:
+        site = self.wordpress
+        if "authorization" not in request.headers:
+            return httpx.Response(401, json={"code": "rest_not_logged_in"})
+        path = urlsplit(str(request.url)).path
+        if request.method == "GET":
+            post = site.by_slug(request.url.params.get("slug", ""))
+            return httpx.Response(200, json=[{"id": post["id"], "link": post["link"]}] if post else [])
+        body = json.loads(request.content)
+        if path == "/wp-json/wp/v2/posts":
+            post = {**body, "id": int(site.next_id()), "link": f"https://{WORDPRESS_HOST}/{body['slug']}/"}
+            return self._create(site, request, post)
+        post_id = path.rsplit("/", 1)[1]
+        if post_id not in site.posts:
+            return httpx.Response(404, json={"code": "rest_post_invalid_id"})
+        site.posts[post_id].update(body)
+        return httpx.Response(200, json=site.posts[post_id])
+
+    def _webflow(self, request: httpx.Request) -> httpx.Response:
+        site = self.webflow
+        if request.headers.get("authorization", "") != "Bearer webflow-token":
+            return httpx.Response(401, json={"message": "Unauthorized"})
+        parts = urlsplit(str(request.url)).path.strip("/").split("/")  # v2/collections/{id}/items[/{item}]/live
+        if parts[2] != WEBFLOW_COLLECTION:
+            return httpx.Response(404, json={"message": "Collection not found"})
+        if request.method == "GET":
+            item = site.by_slug(request.url.params.get("slug", ""))
+            return httpx.Response(200, json={"items": [item] if item else []})
+        body = json.loads(request.content)
+        if request.method == "POST":
+            item_id = f"item{site.next_id()}"
+            return self._create(site, request, {**body, "id": item_id, "slug": body["fieldData"]["slug"]})
+        item_id = parts[4]
+        if item_id not in site.posts:
+            return httpx.Response(404, json={"message": "Item not found"})
+        site.posts[item_id].update({**body, "slug": body["fieldData"]["slug"]})
+        return httpx.Response(200, json=site.posts[item_id])
+
+
+def mock_targets(concurrency: int = 4) -> List[CMSTarget]:
+    """WordPress and Webflow targets pointed at `MockCMS`"""
+    return [
+        WordPressTarget(f"http://{WORDPRESS_HOST}", "editor", "app-password", concurrency),
+        WebflowTarget("webflow-token", WEBFLOW_COLLECTION, api_url=f"http://{WEBFLOW_HOST}/v2", concurrency=concurrency)
+    ]
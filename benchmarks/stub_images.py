@@ -0,0 +1,49 @@
+"""
+Stub Image Generator
+
+Deterministic stand-in for the Flux/OpenAI image models: renders a PNG
+gradient whose colours derive from the prompt, after a configurable delay,
+and counts calls, so the image pipeline runs offline.
+"""
+
+import asyncio
+import hashlib
+import io
+
+from PIL import Image
+
+from src.core.images import ImageGenerator
+
+
+class StubImageGenerator(ImageGenerator):
+    """
+    Args:
+        latency_s: Simulated generation time
+        scale: Rendered size relative to the requested size (models rarely
+            return the exact output size, so post-processing resizes)
+    """
+
+    name = "stub"
+
+    def __init__(self, latency_s: float = 0.0, scale: float = 1.5):
+        self.latency_s = latency_s
+        self.scale = scale
+        self.calls = 0
+        self.prompts = []
+
+    async def generate(self, prompt: str, width: int, height: int) -> bytes:
+        self.calls += 1
+        self.prompts.append(prompt)
+        if self.latency_s:
+            await asyncio.sleep(self.latency_s)
+        return render(prompt, int(width * self.scale), int(height * self.scale))
+
+
+def render(prompt: str, width: int, height: int) -> bytes:
+    """PNG gradient between two prompt-derived colours"""
+    digest = hashlib.md5(prompt.encode("utf-8")).digest()
+    start, end = Image.new("RGB", (width, height), tuple(digest[:3])), Image.new("RGB", (width, height), tuple(digest[3:6]))
+    mask = Image.linear_gradient("L").resize((width, height))
+    buffer = io.BytesIO()
+    Image.composite(start, end, mask).save(buffer, "PNG")
+    return buffer.getvalue()
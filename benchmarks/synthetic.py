@@ -0,0 +1,122 @@
+"""
+Synthetic Data
+
+Seeded generators for realistic Content Manager datasets.
+"""
+
+import random
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+from src.core.schemas import (
+    ContentSubmission,
+    ContentScore,
+    IssueAnnotation,
+    IssueSeverity,
+    SubmissionStatus
+)
+from benchmarks.stub_llm import SAMPLE_ISSUES
+
+
+ARTICLE_TEMPLATE = """
+# {title}
+
+Looking for the best online casinos? Here's our top picks for {year}.
+
+## Top Casinos
+
+Casino {a} is great. They have lots of games and fast withdrawals.
+Casino {b} is also good. They offer bonuses with {wagering}x wagering requirements.
+
+## Conclusion
+
+These casinos are the best. Sign up today!
+"""
+
+TOPICS = ["Online Casinos", "Casino Bonuses", "Sports Betting", "Poker Sites", "Slots", "Live Dealer Games"]
+
+
+def make_article(rng: random.Random, title: str) -> str:
+    """Build a short synthetic article body"""
+    return ARTICLE_TEMPLATE.format(
+        title=title,
+        year=rng.choice([2024, 2025]),
+        a=rng.choice("ABCDEFGH"),
+        b=rng.choice("IJKLMNOP"),
+        wagering=rng.choice([10, 20, 35, 40, 50])
+    )
+
+
+def make_submissions(
+    count: int,
+    submissions_per_writer: int = 20,
+    reviewed_ratio: float = 0.8,
+    seed: int = 42
+) -> List[ContentSubmission]:
+    """
+    Generate synthetic submissions spread across writers.
+    
+    Args:
+        count: Number of submissions to generate
+        submissions_per_writer: Average submissions per writer
+        reviewed_ratio: Fraction of submissions that carry scores and annotations
+        seed: Random seed for reproducible datasets
+    
+    Returns:
+        List of submissions ordered by creation time
+    """
+    rng = random.Random(seed)
+    writer_count = max(1, count // max(1, submissions_per_writer))
+    start = datetime.now() - timedelta(days=365)
+    statuses = list(SubmissionStatus)
+    
+    submissions = []
+    for i in range(count):
+        writer_index = rng.randrange(writer_count)
+        created_at = start + timedelta(minutes=i * (525600 / max(1, count)))
+        title = f"Best {rng.choice(TOPICS)} {i}"
+        submission = ContentSubmission(
+            submission_id=str(uuid.UUID(int=rng.getrandbits(128))),
+            writer_id=f"writer_{writer_index:05d}",
+            writer_name=f"Writer {writer_index}",
+            title=title,
+            content=make_article(rng, title),
+            status=SubmissionStatus.PENDING_REVIEW,
+            created_at=created_at,
+            updated_at=created_at
+        )
+        
+        if rng.random() < reviewed_ratio:
+            scores = ContentScore(
+                seo_score=rng.randint(30, 100),
+                eeat_score=rng.randint(30, 100),
+                content_quality=rng.randint(30, 100),
+                compliance_score=rng.randint(30, 100),
+                overall_score=0
+            )
+            scores.calculate_overall()
+            submission.scores = scores
+            submission.status = rng.choice(statuses[1:])
+            submission.reviewed_at = created_at + timedelta(hours=rng.uniform(0.5, 72))
+            submission.annotations = [
+                IssueAnnotation(
+                    issue_id=str(uuid.UUID(int=rng.getrandbits(128))),
+                    severity=IssueSeverity(severity),
+                    explanation=explanation,
+                    fix_suggestion=fix
+                )
+                for severity, explanation, fix in rng.sample(SAMPLE_ISSUES, rng.randint(1, 5))
+            ]
+        
+        submissions.append(submission)
+    
+    return submissions
+
+
+def group_by_writer(submissions: List[ContentSubmission]) -> Dict[str, List[ContentSubmission]]:
+    """Group submissions by writer ID (mirrors `SubmissionStore.by_writer`)"""
+    writers: Dict[str, List[ContentSubmission]] = {}
+    for submission in submissions:
+        writers.setdefault(submission.writer_id, []).append(submission)
+    return writers
@@ -5,9 +5,10 @@ Reviews content submissions, generates scores, creates annotations,
 and provides educational feedback to writers.
 """
 
+import asyncio
 import uuid
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, TYPE_CHECKING
 import google.generativeai as genai
 
 from src.core.schemas import (
@@ -19,8 +20,18 @@ from src.core.schemas import (
     SubmissionStatus,
     SEOIssue,
     IssuePriority,
-    IssueCategory
+    IssueCategory,
+    ScoresOutput,
+    IssueOutput,
+    FeedbackOutput
 )
+from src.core.llm_client import LLMClient
+from src.core.structured_output import extract_json, generate_structured
+from src.core.prompts import PromptBudgets, ReviewPromptSession, fixes_prompts
+from src.core.tracing import get_tracer
+
+if TYPE_CHECKING:
+    from src.config import LLMConfig
 
 
 class ContentManagerAgent:
@@ -35,10 +46,34 @@ class ContentManagerAgent:
     - Track improvement over time
     """
     
-    def __init__(self, gemini_api_key: str):
-        """Initialize the Content Manager Agent"""
+    def __init__(
+        self,
+        gemini_api_key: str,
+        llm_config: Optional["LLMConfig"] = None,
+        prompt_budgets: Optional[PromptBudgets] = None
+    ):
+        """
+        Initialize the Content Manager Agent
+        
+        Args:
+            gemini_api_key: Google Gemini API key
+            llm_config: Optional LLM budget settings (rate limits, concurrency, retries)
+            prompt_budgets: Optional per-stage prompt token budgets
+        """
         genai.configure(api_key=gemini_api_key)
         self.model = genai.GenerativeModel('gemini-2.0-flash-exp')
+        
+        # All LLM calls go through the rate-limited client
+        llm_settings = llm_config.model_dump() if llm_config else {}
+        self.json_mode = llm_settings.pop("json_mode", True)
+        self.max_reasks = llm_settings.pop("max_reasks", 1)
+        self.llm = LLMClient(self.model, **llm_settings)
+        
+        # Structured output counters (repaired, reasked, failed)
+        self.output_stats: Dict[str, int] = {}
+        
+        # Prompt token budgets (each review's token report is kept on its submission)
+        self.prompt_budgets = prompt_budgets or PromptBudgets.from_env()
     
     async def review_submission(
         self,
@@ -57,14 +92,29 @@ class ContentManagerAgent:
         Returns:
             Updated submission with scores, annotations, and feedback
         """
+        with get_tracer().span("agent.review_submission", attributes={
+            "submission.id": submission.submission_id,
+            "submission.content_chars": len(submission.content)
+        }):
+            return await self._review(submission, target_keywords, jurisdiction)
+    
+    async def _review(
+        self,
+        submission: ContentSubmission,
+        target_keywords: Optional[List[str]],
+        jurisdiction: Optional[str]
+    ) -> ContentSubmission:
+        """Run the three review stages (scores, annotations, feedback)"""
         # Update status
         submission.status = SubmissionStatus.IN_REVIEW
         submission.reviewed_at = datetime.now()
         
+        # Prompts for all stages share one budgeted article block
+        session = ReviewPromptSession(submission.title, submission.content, self.prompt_budgets)
+        
         # Step 1: Analyze content and generate scores
         scores = await self._generate_scores(
-            submission.content,
-            submission.title,
+            session,
             target_keywords,
             jurisdiction
         )
@@ -72,14 +122,14 @@ class ContentManagerAgent:
         
         # Step 2: Detect and annotate issues
         annotations = await self._detect_and_annotate_issues(
-            submission.content,
-            submission.title,
+            session,
             scores
         )
         submission.annotations = annotations
         
         # Step 3: Generate educational feedback
         feedback = await self._generate_feedback(
+            session,
             submission,
             scores,
             annotations
@@ -88,59 +138,26 @@ class ContentManagerAgent:
         
         # Update timestamp
         submission.updated_at = datetime.now()
+        submission.review_tokens = session.report()
         
         return submission
     
     async def _generate_scores(
         self,
-        content: str,
-        title: str,
+        session: ReviewPromptSession,
         target_keywords: Optional[List[str]],
         jurisdiction: Optional[str]
     ) -> ContentScore:
         """Generate multi-dimensional content scores"""
         
-        prompt = f"""
-You are an expert content quality analyst. Analyze this article and provide scores (0-100) for each dimension.
-
-**Article Title:** {title}
-
-**Article Content:**
-{content[:3000]}  # Limit for context
-
-**Target Keywords:** {', '.join(target_keywords) if target_keywords else 'Not specified'}
-**Jurisdiction:** {jurisdiction or 'Not specified'}
-
-Provide scores for:
-
-1. **SEO Score (0-100)**: Keywords usage, meta optimization, heading structure, internal linking potential
-2. **E-E-A-T Score (0-100)**: Experience signals, expertise demonstration, authoritativeness, trustworthiness
-3. **Content Quality (0-100)**: Originality, accuracy, readability, engagement
-4. **Compliance Score (0-100)**: Adherence to regulations, legal requirements, industry standards
-
-Return ONLY a JSON object with this exact structure:
-{{
-    "seo_score": <number>,
-    "eeat_score": <number>,
-    "content_quality": <number>,
-    "compliance_score": <number>,
-    "reasoning": {{
-        "seo": "<brief explanation>",
-        "eeat": "<brief explanation>",
-        "quality": "<brief explanation>",
-        "compliance": "<brief explanation>"
-    }}
-}}
-"""
-        
-        response = await self.model.generate_content_async(prompt)
-        result = self._parse_json_response(response.text)
+        prompt = session.scores_prompt(target_keywords, jurisdiction)
+        result = await self._generate_structured(prompt, ScoresOutput, "scores")
         
         score = ContentScore(
-            seo_score=result.get("seo_score", 50),
-            eeat_score=result.get("eeat_score", 50),
-            content_quality=result.get("content_quality", 50),
-            compliance_score=result.get("compliance_score", 50),
+            seo_score=result.seo_score,
+            eeat_score=result.eeat_score,
+            content_quality=result.content_quality,
+            compliance_score=result.compliance_score,
             overall_score=0  # Will be calculated
         )
         score.calculate_overall()
@@ -149,55 +166,23 @@ Return ONLY a JSON object with this exact structure:
     
     async def _detect_and_annotate_issues(
         self,
-        content: str,
-        title: str,
+        session: ReviewPromptSession,
         scores: ContentScore
     ) -> List[IssueAnnotation]:
         """Detect issues and create educational annotations"""
         
-        prompt = f"""
-You are a content quality expert helping writers improve. Analyze this article and identify specific issues.
-
-**Title:** {title}
-**Content:** {content[:3000]}
-
-**Current Scores:**
-- SEO: {scores.seo_score}/100
-- E-E-A-T: {scores.eeat_score}/100
-- Quality: {scores.content_quality}/100
-- Compliance: {scores.compliance_score}/100
-
-For each issue found, provide:
-1. **Severity**: "critical" (🔴), "warning" (🟡), or "suggestion" (🟢)
-2. **Explanation**: WHY this is an issue (educational)
-3. **Fix**: HOW to fix it (actionable)
-4. **Learning Note**: Educational context to help writer improve
-
-Focus on the TOP 10 most impactful issues. Return JSON array:
-[
-    {{
-        "severity": "critical|warning|suggestion",
-        "title": "<short title>",
-        "explanation": "<why this matters>",
-        "fix_suggestion": "<how to fix>",
-        "learning_note": "<educational context>",
-        "highlighted_text": "<text to highlight in article>"
-    }}
-]
-"""
-        
-        response = await self.model.generate_content_async(prompt)
-        issues_data = self._parse_json_response(response.text)
+        prompt = session.annotations_prompt(scores)
+        issues = await self._generate_structured(prompt, List[IssueOutput], "annotations")
         
         annotations = []
-        for issue in issues_data[:10]:  # Limit to top 10
+        for issue in issues[:10]:  # Limit to top 10
             annotation = IssueAnnotation(
                 issue_id=str(uuid.uuid4()),
-                severity=IssueSeverity(issue.get("severity", "suggestion")),
-                explanation=issue.get("explanation", ""),
-                fix_suggestion=issue.get("fix_suggestion", ""),
-                learning_note=issue.get("learning_note"),
-                highlighted_text=issue.get("highlighted_text"),
+                severity=issue.severity,
+                explanation=issue.explanation,
+                fix_suggestion=issue.fix_suggestion,
+                learning_note=issue.learning_note,
+                highlighted_text=issue.highlighted_text,
                 applied=False
             )
             annotations.append(annotation)
@@ -206,6 +191,7 @@ Focus on the TOP 10 most impactful issues. Return JSON array:
     
     async def _generate_feedback(
         self,
+        session: ReviewPromptSession,
         submission: ContentSubmission,
         scores: ContentScore,
         annotations: List[IssueAnnotation]
@@ -215,49 +201,23 @@ Focus on the TOP 10 most impactful issues. Return JSON array:
         critical_count = sum(1 for a in annotations if a.severity == IssueSeverity.CRITICAL)
         warning_count = sum(1 for a in annotations if a.severity == IssueSeverity.WARNING)
         
-        prompt = f"""
-You are a supportive content manager providing feedback to a writer.
-
-**Writer:** {submission.writer_name}
-**Article:** {submission.title}
-**Overall Score:** {scores.overall_score}/100
-
-**Scores Breakdown:**
-- SEO: {scores.seo_score}/100
-- E-E-A-T: {scores.eeat_score}/100
-- Quality: {scores.content_quality}/100
-- Compliance: {scores.compliance_score}/100
-
-**Issues Found:**
-- 🔴 Critical: {critical_count}
-- 🟡 Warnings: {warning_count}
-- 🟢 Suggestions: {len(annotations) - critical_count - warning_count}
-
-Provide constructive feedback with:
-1. **Overall Comment**: Encouraging but honest assessment
-2. **Strengths**: 3-5 things the writer did well
-3. **Areas for Improvement**: 3-5 specific areas to work on
-4. **Learning Resources**: 2-3 helpful links or resources
-
-Return JSON:
-{{
-    "overall_comment": "<encouraging feedback>",
-    "strengths": ["<strength 1>", "<strength 2>", ...],
-    "areas_for_improvement": ["<area 1>", "<area 2>", ...],
-    "learning_resources": ["<resource 1>", "<resource 2>", ...]
-}}
-"""
+        prompt = session.feedback_prompt(
+            submission.writer_name,
+            scores,
+            critical_count,
+            warning_count,
+            len(annotations) - critical_count - warning_count
+        )
         
-        response = await self.model.generate_content_async(prompt)
-        feedback_data = self._parse_json_response(response.text)
+        feedback_data = await self._generate_structured(prompt, FeedbackOutput, "feedback")
         
         feedback = WriterFeedback(
             submission_id=submission.submission_id,
             manager_id="system",  # Will be replaced with actual manager ID
-            overall_comment=feedback_data.get("overall_comment", ""),
-            strengths=feedback_data.get("strengths", []),
-            areas_for_improvement=feedback_data.get("areas_for_improvement", []),
-            learning_resources=feedback_data.get("learning_resources", [])
+            overall_comment=feedback_data.overall_comment,
+            strengths=feedback_data.strengths,
+            areas_for_improvement=feedback_data.areas_for_improvement,
+            learning_resources=feedback_data.learning_resources
         )
         
         return feedback
@@ -277,6 +237,14 @@ Return JSON:
         Returns:
             Updated content with fixes applied
         """
+        with get_tracer().span("agent.apply_fixes", attributes={
+            "submission.id": submission.submission_id,
+            "fixes.requested": len(annotation_ids)
+        }) as span:
+            return await self._apply_fixes(submission, annotation_ids, span)
+    
+    async def _apply_fixes(self, submission: ContentSubmission, annotation_ids: List[str], span) -> str:
+        """Apply fixes chunk by chunk (only chunks containing a highlight when any match)"""
         # Get annotations to apply
         annotations_to_apply = [
             a for a in submission.annotations 
@@ -292,20 +260,26 @@ Return JSON:
             for a in annotations_to_apply
         ])
         
-        prompt = f"""
-Apply these fixes to the article while preserving the writer's voice and style.
-
-**Original Content:**
-{submission.content}
-
-**Fixes to Apply:**
-{fix_instructions}
-
-Return the updated content with fixes applied. Maintain the original format (markdown/HTML).
-"""
-        
-        response = await self.model.generate_content_async(prompt)
-        updated_content = response.text.strip()
+        # Chunk large articles to the apply-fixes budget; only chunks that
+        # contain highlighted text are sent when any highlight matches
+        parts = fixes_prompts(submission.content, fix_instructions, self.prompt_budgets)
+        if len(parts) == 1:
+            response = await self.llm.generate(parts[0][2])
+            updated_content = response.text.strip()
+        else:
+            highlights = [a.highlighted_text for a in annotations_to_apply if a.highlighted_text]
+            relevant = [
+                i for i, (chunk, _, _) in enumerate(parts)
+                if any(h in chunk for h in highlights)
+            ] or list(range(len(parts)))
+            span.set_attribute("fixes.chunks", len(parts))
+            span.set_attribute("fixes.chunks_sent", len(relevant))
+            chunks = [chunk for chunk, _, _ in parts]
+            responses = await asyncio.gather(*(self.llm.generate(parts[i][2]) for i in relevant))
+            for i, response in zip(relevant, responses):
+                chunks[i] = response.text.strip()
+            # Untouched chunks keep their original separators
+            updated_content = "".join(chunk + sep for chunk, (_, sep, _) in zip(chunks, parts))
         
         # Mark annotations as applied
         for annotation in submission.annotations:
@@ -314,21 +288,22 @@ Return the updated content with fixes applied. Maintain the original format (mar
         
         return updated_content
     
+    async def _generate_structured(self, prompt: str, schema, stage: str):
+        """Generate schema-validated output for one review stage"""
+        with get_tracer().span(f"agent.{stage}", attributes={"llm.stage": stage}):
+            return await generate_structured(
+                self.llm,
+                prompt,
+                schema,
+                stage,
+                json_mode=self.json_mode,
+                max_reasks=self.max_reasks,
+                stats=self.output_stats
+            )
+    
     def _parse_json_response(self, text: str) -> Dict:
-        """Parse JSON from AI response, handling markdown code blocks"""
-        import json
-        import re
-        
-        # Remove markdown code blocks if present
-        text = re.sub(r'```json\s*', '', text)
-        text = re.sub(r'```\s*', '', text)
-        text = text.strip()
-        
+        """Parse JSON (object or array) from AI response, handling markdown code blocks"""
         try:
-            return json.loads(text)
-        except json.JSONDecodeError:
-            # Fallback: try to extract JSON object
-            match = re.search(r'\{.*\}', text, re.DOTALL)
-            if match:
-                return json.loads(match.group())
+            return extract_json(text)
+        except ValueError:
             return {}
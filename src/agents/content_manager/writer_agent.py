@@ -4,9 +4,8 @@ Writer Analysis Agent
 Tracks writer progress, skill development, and improvement over time.
 """
 
-from typing import List, Dict
+from typing import TYPE_CHECKING, List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
-from collections import Counter
 
 from src.core.schemas import (
     ContentSubmission,
@@ -15,6 +14,13 @@ from src.core.schemas import (
     TeamAnalytics,
     SubmissionStatus
 )
+from src.core.issues import IssueStats, count_issues, top_issues
+from src.core.leaderboards import Leaderboards
+from src.core.timeseries import RollingAnalytics
+from src.core.trends import SKILL_COLUMNS, single_writer_trends
+
+if TYPE_CHECKING:
+    from src.core.columnar import SubmissionColumns
 
 
 class WriterAnalysisAgent:
@@ -83,15 +89,21 @@ class WriterAnalysisAgent:
         scores = [s.scores.overall_score for s in submissions if s.scores]
         average_score = sum(scores) / len(scores) if scores else 0.0
         
+        # Trends: improvement rate (score change per article over the trend),
+        # smoothed score and per-skill fitted change
+        scored = [s.scores for s in sorted_submissions if s.scores]
+        improvement_rate, smoothed_score, skill_changes = single_writer_trends(
+            score_trend,
+            [s.overall_score for s in scored],
+            {skill: [getattr(s, field) for s in scored] for skill, field in SKILL_COLUMNS}
+        )
+        
         # Skill areas analysis
-        skill_areas = self._analyze_skill_areas(sorted_submissions)
+        skill_areas = self._analyze_skill_areas(sorted_submissions, skill_changes)
         
         # Common issues
         common_issues = self._identify_common_issues(submissions)
         
-        # Improvement rate (score change per article)
-        improvement_rate = self._calculate_improvement_rate(score_trend)
-        
         # Last submission date
         last_submission = sorted_submissions[-1].created_at if submissions else None
         
@@ -105,74 +117,33 @@ class WriterAnalysisAgent:
             skill_areas=skill_areas,
             common_issues=common_issues,
             improvement_rate=round(improvement_rate, 2),
+            smoothed_score=round(smoothed_score, 1),
             last_submission=last_submission
         )
     
     def _analyze_skill_areas(
         self,
-        submissions: List[ContentSubmission]
+        submissions: List[ContentSubmission],
+        skill_changes: Dict[str, float]
     ) -> List[WriterSkillArea]:
         """Analyze performance in different skill areas"""
         
-        if not submissions:
+        scored = [sub.scores for sub in submissions if sub.scores]
+        if not scored:
             return []
         
-        # Track scores for each skill area
-        seo_scores = []
-        eeat_scores = []
-        quality_scores = []
-        compliance_scores = []
-        
-        for sub in submissions:
-            if sub.scores:
-                seo_scores.append(sub.scores.seo_score)
-                eeat_scores.append(sub.scores.eeat_score)
-                quality_scores.append(sub.scores.content_quality)
-                compliance_scores.append(sub.scores.compliance_score)
-        
-        skill_areas = []
-        
-        # SEO Optimization
-        if seo_scores:
-            skill_areas.append(WriterSkillArea(
-                skill_name="SEO Optimization",
-                current_score=seo_scores[-1],
-                initial_score=seo_scores[0],
-                improvement=seo_scores[-1] - seo_scores[0],
-                articles_count=len(seo_scores)
-            ))
-        
-        # E-E-A-T
-        if eeat_scores:
-            skill_areas.append(WriterSkillArea(
-                skill_name="E-E-A-T",
-                current_score=eeat_scores[-1],
-                initial_score=eeat_scores[0],
-                improvement=eeat_scores[-1] - eeat_scores[0],
-                articles_count=len(eeat_scores)
-            ))
-        
-        # Content Quality
-        if quality_scores:
-            skill_areas.append(WriterSkillArea(
-                skill_name="Content Quality",
-                current_score=quality_scores[-1],
-                initial_score=quality_scores[0],
-                improvement=quality_scores[-1] - quality_scores[0],
-                articles_count=len(quality_scores)
-            ))
-        
-        # Compliance
-        if compliance_scores:
-            skill_areas.append(WriterSkillArea(
-                skill_name="Compliance",
-                current_score=compliance_scores[-1],
-                initial_score=compliance_scores[0],
-                improvement=compliance_scores[-1] - compliance_scores[0],
-                articles_count=len(compliance_scores)
-            ))
-        
-        return skill_areas
+        # Current and initial score per skill; improvement is the fitted change
+        # from the trend engine (robust to one unusually good or bad article)
+        return [
+            WriterSkillArea(
+                skill_name=skill,
+                current_score=getattr(scored[-1], field),
+                initial_score=getattr(scored[0], field),
+                improvement=round(skill_changes[skill]),
+                articles_count=len(scored)
+            )
+            for skill, field in SKILL_COLUMNS
+        ]
     
     def _identify_common_issues(
         self,
@@ -180,41 +151,16 @@ class WriterAnalysisAgent:
     ) -> Dict[str, int]:
         """Identify most common issues across submissions"""
         
-        issue_counter = Counter()
-        
-        for sub in submissions:
-            for annotation in sub.annotations:
-                # Extract issue type from explanation
-                issue_type = annotation.explanation.split(':')[0] if ':' in annotation.explanation else annotation.explanation[:50]
-                issue_counter[issue_type] += 1
-        
-        # Return top 10 most common issues
-        return dict(issue_counter.most_common(10))
-    
-    def _calculate_improvement_rate(self, score_trend: List[int]) -> float:
-        """Calculate improvement rate (score change per article)"""
-        
-        if len(score_trend) < 2:
-            return 0.0
-        
-        # Linear regression to find trend
-        n = len(score_trend)
-        x_mean = (n - 1) / 2
-        y_mean = sum(score_trend) / n
-        
-        numerator = sum((i - x_mean) * (score - y_mean) for i, score in enumerate(score_trend))
-        denominator = sum((i - x_mean) ** 2 for i in range(n))
-        
-        if denominator == 0:
-            return 0.0
-        
-        slope = numerator / denominator
-        return slope
+        # Return top 10 most common issue types
+        return top_issues(count_issues(submissions), 10)
     
     def generate_team_analytics(
         self,
         all_submissions: List[ContentSubmission],
-        all_writers: List[WriterProgress]
+        all_writers: List[WriterProgress],
+        leaderboards: Optional[Leaderboards] = None,
+        rolling: Optional[RollingAnalytics] = None,
+        issue_stats: Optional[IssueStats] = None
     ) -> TeamAnalytics:
         """
         Generate team-wide analytics for managers.
@@ -222,6 +168,9 @@ class WriterAnalysisAgent:
         Args:
             all_submissions: All submissions across the team
             all_writers: Progress data for all writers
+            leaderboards: Maintained leaderboards (read instead of sorting every writer)
+            rolling: Maintained lifecycle counters (read instead of rescanning scores and review times)
+            issue_stats: Maintained issue counts (read instead of classifying every annotation)
         
         Returns:
             TeamAnalytics with team-wide metrics
@@ -240,7 +189,72 @@ class WriterAnalysisAgent:
             if s.status == SubmissionStatus.PENDING_REVIEW
         )
         
-        # Average team score
+        # Average team score and review time
+        if rolling is not None:
+            totals = rolling.totals()
+            average_team_score = totals["average_score"]
+            average_review_time = totals["average_review_time"]
+        else:
+            average_team_score, average_review_time = self._average_score_and_review_time(all_submissions)
+        
+        # Top performers (by average score) and improvement leaders (by improvement rate)
+        if leaderboards is not None:
+            top_performers = leaderboards.top("average_score", 5)
+            improvement_leaders = leaderboards.top("improvement_rate", 5)
+        else:
+            top_performers, improvement_leaders = self._rank_writers(all_writers)
+        
+        # Common team issues
+        issue_counts = issue_stats.team_counts() if issue_stats is not None else count_issues(all_submissions)
+        common_team_issues = top_issues(issue_counts, 10)
+        
+        return TeamAnalytics(
+            total_writers=len(all_writers),
+            active_writers=active_writers,
+            total_submissions=len(all_submissions),
+            pending_review=pending_review,
+            average_team_score=round(average_team_score, 1),
+            top_performers=top_performers,
+            improvement_leaders=improvement_leaders,
+            common_team_issues=common_team_issues,
+            average_review_time=round(average_review_time, 1)
+        )
+    
+    def calculate_progress_columnar(self, columns: "SubmissionColumns") -> List[WriterProgress]:
+        """
+        Progress of every writer in a columnar snapshot (vectorized).
+        
+        Args:
+            columns: Snapshot from `SubmissionColumns.from_submissions` or `.load`
+        
+        Returns:
+            WriterProgress per writer, as `calculate_writer_progress` computes it
+        """
+        from src.core.columnar import writer_progress
+        
+        return writer_progress(columns)
+    
+    def generate_team_analytics_columnar(self, columns: "SubmissionColumns") -> TeamAnalytics:
+        """
+        Team analytics over a columnar snapshot (vectorized).
+        
+        Args:
+            columns: Snapshot from `SubmissionColumns.from_submissions` or `.load`
+        
+        Returns:
+            TeamAnalytics as `generate_team_analytics` computes it
+        """
+        from src.core.columnar import team_metrics
+        
+        top_performers, improvement_leaders = self._rank_writers(self.calculate_progress_columnar(columns))
+        return TeamAnalytics(
+            top_performers=top_performers,
+            improvement_leaders=improvement_leaders,
+            **team_metrics(columns)
+        )
+    
+    def _average_score_and_review_time(self, all_submissions: List[ContentSubmission]) -> Tuple[float, float]:
+        """Team average overall score and average review time in hours"""
         all_scores = [
             s.scores.overall_score 
             for s in all_submissions 
@@ -248,7 +262,17 @@ class WriterAnalysisAgent:
         ]
         average_team_score = sum(all_scores) / len(all_scores) if all_scores else 0.0
         
-        # Top performers (by average score)
+        review_times = []
+        for sub in all_submissions:
+            if sub.reviewed_at and sub.created_at:
+                delta = sub.reviewed_at - sub.created_at
+                review_times.append(delta.total_seconds() / 3600)  # Convert to hours
+        average_review_time = sum(review_times) / len(review_times) if review_times else 0.0
+        
+        return average_team_score, average_review_time
+    
+    def _rank_writers(self, all_writers: List[WriterProgress]) -> Tuple[List[Dict], List[Dict]]:
+        """Top 5 writers by average score and by (positive) improvement rate"""
         top_performers = sorted(
             [
                 {
@@ -263,7 +287,6 @@ class WriterAnalysisAgent:
             reverse=True
         )[:5]
         
-        # Improvement leaders (by improvement rate)
         improvement_leaders = sorted(
             [
                 {
@@ -279,33 +302,7 @@ class WriterAnalysisAgent:
             reverse=True
         )[:5]
         
-        # Common team issues
-        all_issues = Counter()
-        for sub in all_submissions:
-            for annotation in sub.annotations:
-                issue_type = annotation.explanation.split(':')[0] if ':' in annotation.explanation else annotation.explanation[:50]
-                all_issues[issue_type] += 1
-        common_team_issues = dict(all_issues.most_common(10))
-        
-        # Average review time
-        review_times = []
-        for sub in all_submissions:
-            if sub.reviewed_at and sub.created_at:
-                delta = sub.reviewed_at - sub.created_at
-                review_times.append(delta.total_seconds() / 3600)  # Convert to hours
-        average_review_time = sum(review_times) / len(review_times) if review_times else 0.0
-        
-        return TeamAnalytics(
-            total_writers=len(all_writers),
-            active_writers=active_writers,
-            total_submissions=len(all_submissions),
-            pending_review=pending_review,
-            average_team_score=round(average_team_score, 1),
-            top_performers=top_performers,
-            improvement_leaders=improvement_leaders,
-            common_team_issues=common_team_issues,
-            average_review_time=round(average_review_time, 1)
-        )
+        return top_performers, improvement_leaders
     
     def get_writer_insights(self, progress: WriterProgress) -> Dict[str, str]:
         """
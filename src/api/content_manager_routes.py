@@ -4,31 +4,197 @@ Content Manager API Routes
 FastAPI routes for content submission, review, and writer analytics.
 """
 
-from fastapi import APIRouter, HTTPException, Depends
-from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi.responses import StreamingResponse
+from typing import Awaitable, Callable, Dict, List, Optional, Set, TypeVar, TYPE_CHECKING
+import asyncio
+import time
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import lru_cache
 
 from src.core.schemas import (
     ContentSubmission,
     WriterProgress,
     TeamAnalytics,
     APIResponse,
+    PublishJob,
     SubmissionStatus
 )
-from src.agents.content_manager import ContentManagerAgent, WriterAnalysisAgent
-from src.config import get_settings
+from src.config import get_config
+from src.core.blobs import create_blob_store
+from src.core.issues import IssueStats, breakdown
+from src.core.leaderboards import BOARDS, Leaderboards
+from src.core.listing import ListingQuery, SubmissionListIndex
+from src.core.revisions import diff_text
+from src.core.search import SearchIndex, annotation_text, highlight, snippet
+from src.core.singleflight import SingleFlight, make_key
+from src.core.storage import SubmissionStore, create_store
+from src.core.timeseries import GRANULARITIES, RollingAnalytics, local_time
+from src.core.transfer import BulkImporter, export_ndjson
+from src.integrations.notifications import (
+    NotificationDispatcher,
+    RetryQueue,
+    discord_webhook,
+    review_event,
+    slack_webhook
+)
+from src.integrations.publishing import PublicationLedger, Publisher, WebflowTarget, WordPressTarget
+from src.api.responses import api_response, dump_model
+
+if TYPE_CHECKING:
+    from src.agents.content_manager import ContentManagerAgent, WriterAnalysisAgent
 
 router = APIRouter(prefix="/api/content-manager", tags=["Content Manager"])
 
-# Initialize agents
-settings = get_settings()
-manager_agent = ContentManagerAgent(gemini_api_key=settings.GEMINI_API_KEY)
-writer_agent = WriterAnalysisAgent()
 
-# In-memory storage (replace with database in production)
-submissions_db: dict[str, ContentSubmission] = {}
-writers_db: dict[str, List[ContentSubmission]] = {}
+# Agents and storage are built on first use, so importing this module (and
+# starting the server) doesn't pay for google.generativeai or config setup
+
+@lru_cache(maxsize=None)
+def get_manager_agent() -> "ContentManagerAgent":
+    """Content Manager agent (imports and configures Gemini on first call)"""
+    from src.agents.content_manager import ContentManagerAgent
+    config = get_config()
+    return ContentManagerAgent(
+        gemini_api_key=config.api.google_api_key,
+        llm_config=config.llm
+    )
+
+
+@lru_cache(maxsize=None)
+def get_writer_agent() -> "WriterAnalysisAgent":
+    """Writer analysis agent"""
+    from src.agents.content_manager import WriterAnalysisAgent
+    return WriterAnalysisAgent()
+
+
+@lru_cache(maxsize=None)
+def get_store() -> SubmissionStore:
+    """Submission/writer/job state (in-memory, or SQLite shared by all workers)"""
+    database = get_config().database
+    # Shared state needs shared bodies: SQLite state keeps blobs on disk
+    blob_backend = "file" if database.state_backend == "sqlite" else "memory"
+    blobs = create_blob_store(blob_backend, database.blob_path, database.blob_cache_mb)
+    return create_store(database.state_backend, database.state_path, blobs)
+
+
+@lru_cache(maxsize=None)
+def get_leaderboards() -> Leaderboards:
+    """Per-writer aggregates and leaderboards, maintained from store changes"""
+    leaderboards = Leaderboards(get_writer_agent().calculate_writer_progress, size=get_config().app.leaderboard_size)
+    leaderboards.attach(get_store())
+    return leaderboards
+
+
+@lru_cache(maxsize=None)
+def get_rolling_analytics() -> RollingAnalytics:
+    """Hourly/daily/weekly lifecycle counters, maintained from store changes"""
+    rolling = RollingAnalytics()
+    rolling.attach(get_store())
+    return rolling
+
+
+@lru_cache(maxsize=None)
+def get_issue_stats() -> IssueStats:
+    """Per-writer and team issue counts by issue type, maintained from store changes"""
+    issue_stats = IssueStats()
+    issue_stats.attach(get_store())
+    return issue_stats
+
+
+@lru_cache(maxsize=None)
+def get_list_index() -> SubmissionListIndex:
+    """Sorted listing index over the store (keyset pagination and filters)"""
+    index = SubmissionListIndex()
+    index.attach(get_store())
+    return index
+
+
+@lru_cache(maxsize=None)
+def get_search_index() -> SearchIndex:
+    """Full-text index over the store, kept current through its change notifications"""
+    index = SearchIndex()
+    index.attach(get_store())
+    return index
+
+
+@lru_cache(maxsize=None)
+def get_notifier() -> NotificationDispatcher:
+    """Slack/Discord notifications (a no-op without configured webhooks)"""
+    settings = get_config().integrations
+    webhooks = []
+    if settings.slack_webhook_url:
+        webhooks.append(slack_webhook(settings.slack_webhook_url))
+    if settings.discord_webhook_url:
+        webhooks.append(discord_webhook(settings.discord_webhook_url))
+    return NotificationDispatcher(
+        webhooks,
+        RetryQueue(settings.notification_retry_path) if webhooks else None,
+        max_queue=settings.notification_queue_size,
+        batch_window_s=settings.notification_batch_window_s
+    )
+
+
+@lru_cache(maxsize=None)
+def get_publisher() -> Publisher:
+    """WordPress/Webflow publishing for the sites configured in the environment"""
+    settings = get_config().integrations
+    targets = []
+    if settings.wordpress_site_url and settings.wordpress_username and settings.wordpress_app_password:
+        targets.append(WordPressTarget(
+            settings.wordpress_site_url,
+            settings.wordpress_username,
+            settings.wordpress_app_password,
+            settings.publish_concurrency
+        ))
+    if settings.webflow_api_token and settings.webflow_collection_id:
+        targets.append(WebflowTarget(
+            settings.webflow_api_token,
+            settings.webflow_collection_id,
+            concurrency=settings.publish_concurrency
+        ))
+    ledger = PublicationLedger(settings.publish_ledger_path) if targets else None
+    return Publisher(targets, ledger, store=get_store(), notifier=get_notifier())
+
+
+# Coalesce concurrent identical reviews / fix requests (double-clicks, client retries)
+review_flights = SingleFlight()
+fix_flights = SingleFlight()
+
+# How often a worker checks whether another worker finished a shared job
+JOB_POLL_INTERVAL_S = 0.2
+
+# Most buckets one trends request may return
+MAX_TREND_BUCKETS = 1000
+
+# Bulk publishing jobs of this worker (most recent MAX_PUBLISH_JOBS) and their running tasks
+MAX_PUBLISH_JOBS = 100
+publish_jobs: Dict[str, PublishJob] = {}
+_publish_tasks: Set[asyncio.Task] = set()
+
+T = TypeVar("T")
+
+
+async def run_job(key: str, fn: Callable[[], Awaitable[T]], on_remote: Callable[[], Optional[T]]) -> T:
+    """
+    Run a job once across worker processes.
+
+    If another worker holds the lease for `key`, wait for it to finish and
+    return `on_remote()` (the result read back from the store); fall back to
+    running `fn` if that yields nothing (e.g. the other worker failed).
+    """
+    store = get_store()
+    while not store.start_job(key):
+        while store.job_running(key):
+            await asyncio.sleep(JOB_POLL_INTERVAL_S)
+        result = on_remote()
+        if result is not None:
+            return result
+    try:
+        return await fn()
+    finally:
+        store.finish_job(key)
 
 
 @router.post("/submit", response_model=APIResponse)
@@ -64,13 +230,8 @@ async def submit_content(
             status=SubmissionStatus.PENDING_REVIEW
         )
         
-        # Store submission
-        submissions_db[submission.submission_id] = submission
-        
-        # Track by writer
-        if writer_id not in writers_db:
-            writers_db[writer_id] = []
-        writers_db[writer_id].append(submission)
+        # Store submission (tracked by writer)
+        get_store().save(submission)
         
         return APIResponse(
             success=True,
@@ -104,20 +265,36 @@ async def review_submission(
         APIResponse with review results
     """
     try:
+        store = get_store()
+        manager_agent = get_manager_agent()
+        
         # Get submission
-        submission = submissions_db.get(submission_id)
+        submission = store.get(submission_id)
         if not submission:
             raise HTTPException(status_code=404, detail="Submission not found")
         
-        # Review submission
-        reviewed_submission = await manager_agent.review_submission(
-            submission,
-            target_keywords,
-            jurisdiction
-        )
+        def reviewed_elsewhere() -> Optional[ContentSubmission]:
+            current = store.get(submission_id)
+            return current if current and current.scores and current.content_hash == submission.content_hash else None
+        
+        async def run_review() -> ContentSubmission:
+            reviewed = await manager_agent.review_submission(
+                submission,
+                target_keywords,
+                jurisdiction
+            )
+            
+            # Update storage
+            store.save(reviewed)
+            get_notifier().notify(review_event(reviewed))
+            return reviewed
         
-        # Update storage
-        submissions_db[submission_id] = reviewed_submission
+        # Review submission (identical concurrent requests share one run,
+        # within this worker and across workers)
+        key = make_key(submission_id, submission.content_hash, target_keywords or [], jurisdiction)
+        reviewed_submission = await review_flights.do(
+            key, lambda: run_job(f"review:{key}", run_review, reviewed_elsewhere)
+        )
         
         return APIResponse(
             success=True,
@@ -133,7 +310,8 @@ async def review_submission(
                     "compliance": reviewed_submission.scores.compliance_score
                 },
                 "issues_count": len(reviewed_submission.annotations),
-                "critical_issues": sum(1 for a in reviewed_submission.annotations if a.severity.value == "critical")
+                "critical_issues": sum(1 for a in reviewed_submission.annotations if a.severity.value == "critical"),
+                "tokens": reviewed_submission.review_tokens
             }
         )
     
@@ -144,18 +322,88 @@ async def review_submission(
 
 
 @router.get("/submission/{submission_id}", response_model=APIResponse)
-async def get_submission(submission_id: str):
-    """Get detailed submission information"""
+async def get_submission(submission_id: str, fields: Optional[str] = None):
+    """
+    Get detailed submission information.
+    
+    Args:
+        submission_id: Submission ID
+        fields: Optional comma-separated fields to return (e.g. "title,status,scores.overall_score")
+    """
     
-    submission = submissions_db.get(submission_id)
+    submission = get_store().get(submission_id)
     if not submission:
         raise HTTPException(status_code=404, detail="Submission not found")
     
-    return APIResponse(
-        success=True,
-        message="Submission retrieved successfully",
-        data=submission.dict()
-    )
+    return api_response("Submission retrieved successfully", dump_model(submission, fields))
+
+
+@router.get("/submission/{submission_id}/revisions", response_model=APIResponse)
+async def list_revisions(submission_id: str):
+    """
+    List a submission's content versions (oldest first).
+
+    Args:
+        submission_id: Submission ID
+    """
+    revisions = get_store().revisions(submission_id)
+    if not revisions:
+        raise HTTPException(status_code=404, detail="Submission not found")
+
+    return api_response(f"Found {len(revisions)} revisions", {
+        "submission_id": submission_id,
+        "revisions": [dump_model(r) for r in revisions]
+    })
+
+
+@router.get("/submission/{submission_id}/revisions/{version}", response_model=APIResponse)
+async def get_revision(submission_id: str, version: int):
+    """
+    Get the content of one version.
+
+    Args:
+        submission_id: Submission ID
+        version: Version number (1 = original draft)
+    """
+    content = get_store().revision_content(submission_id, version)
+    if content is None:
+        raise HTTPException(status_code=404, detail="Revision not found")
+
+    return api_response("Revision retrieved successfully", {
+        "submission_id": submission_id,
+        "version": version,
+        "content": content
+    })
+
+
+@router.get("/submission/{submission_id}/diff", response_model=APIResponse)
+async def diff_revisions(submission_id: str, from_version: int = 1, to_version: Optional[int] = None):
+    """
+    Unified diff between two versions.
+
+    Args:
+        submission_id: Submission ID
+        from_version: Older version (default: original draft)
+        to_version: Newer version (default: latest)
+    """
+    store = get_store()
+    if to_version is None:
+        to_version = len(store.revisions(submission_id))
+    old = store.revision_content(submission_id, from_version)
+    new = store.revision_content(submission_id, to_version)
+    if old is None or new is None:
+        raise HTTPException(status_code=404, detail="Revision not found")
+
+    diff = diff_text(old, new, f"v{from_version}", f"v{to_version}")
+    lines = diff.splitlines()
+    return api_response("Diff generated successfully", {
+        "submission_id": submission_id,
+        "from_version": from_version,
+        "to_version": to_version,
+        "lines_added": sum(1 for line in lines if line.startswith("+") and not line.startswith("+++")),
+        "lines_removed": sum(1 for line in lines if line.startswith("-") and not line.startswith("---")),
+        "diff": diff
+    })
 
 
 @router.post("/apply-fixes/{submission_id}", response_model=APIResponse)
@@ -174,17 +422,31 @@ async def apply_fixes(
         APIResponse with updated content
     """
     try:
-        submission = submissions_db.get(submission_id)
+        store = get_store()
+        submission = store.get(submission_id)
         if not submission:
             raise HTTPException(status_code=404, detail="Submission not found")
+        original_hash = submission.content_hash
+        
+        def fixed_elsewhere() -> Optional[str]:
+            current = store.get(submission_id)
+            return current.content if current and current.content_hash != original_hash else None
         
-        # Apply fixes
-        updated_content = await manager_agent.apply_fixes(submission, annotation_ids)
+        async def run_fixes() -> str:
+            updated = await get_manager_agent().apply_fixes(submission, annotation_ids)
+            
+            # Update submission
+            submission.content = updated
+            submission.updated_at = datetime.now()
+            store.save(submission)
+            return updated
         
-        # Update submission
-        submission.content = updated_content
-        submission.updated_at = datetime.now()
-        submissions_db[submission_id] = submission
+        # Apply fixes (identical concurrent requests share one run,
+        # within this worker and across workers)
+        key = make_key(submission_id, original_hash, annotation_ids)
+        updated_content = await fix_flights.do(
+            key, lambda: run_job(f"fixes:{key}", run_fixes, fixed_elsewhere)
+        )
         
         return APIResponse(
             success=True,
@@ -203,42 +465,31 @@ async def apply_fixes(
 
 
 @router.get("/writer/{writer_id}/progress", response_model=APIResponse)
-async def get_writer_progress(writer_id: str):
+async def get_writer_progress(writer_id: str, fields: Optional[str] = None):
     """
     Get writer progress and analytics.
     
     Args:
         writer_id: Writer's unique ID
+        fields: Optional comma-separated progress fields to return
     
     Returns:
         APIResponse with writer progress data
     """
     try:
-        # Get writer's submissions
-        writer_submissions = writers_db.get(writer_id, [])
+        # Maintained progress (recomputed only when the writer's submissions change)
+        progress = get_leaderboards().progress(writer_id)
         
-        if not writer_submissions:
+        if progress is None:
             raise HTTPException(status_code=404, detail="Writer not found")
         
-        # Calculate progress
-        writer_name = writer_submissions[0].writer_name
-        progress = writer_agent.calculate_writer_progress(
-            writer_id,
-            writer_name,
-            writer_submissions
-        )
-        
         # Get insights
-        insights = writer_agent.get_writer_insights(progress)
+        insights = get_writer_agent().get_writer_insights(progress)
         
-        return APIResponse(
-            success=True,
-            message="Writer progress retrieved successfully",
-            data={
-                "progress": progress.dict(),
-                "insights": insights
-            }
-        )
+        return api_response("Writer progress retrieved successfully", {
+            "progress": dump_model(progress, fields),
+            "insights": insights
+        })
     
     except HTTPException:
         raise
@@ -247,37 +498,341 @@ async def get_writer_progress(writer_id: str):
 
 
 @router.get("/team/analytics", response_model=APIResponse)
-async def get_team_analytics():
+async def get_team_analytics(fields: Optional[str] = None):
     """
     Get team-wide analytics for managers.
     
+    Args:
+        fields: Optional comma-separated analytics fields to return
+    
     Returns:
         APIResponse with team analytics
     """
     try:
-        # Get all submissions
-        all_submissions = list(submissions_db.values())
-        
-        # Calculate progress for all writers
-        all_writers = []
-        for writer_id, submissions in writers_db.items():
-            if submissions:
-                writer_name = submissions[0].writer_name
-                progress = writer_agent.calculate_writer_progress(
-                    writer_id,
-                    writer_name,
-                    submissions
-                )
-                all_writers.append(progress)
+        # Get all submissions, and every writer's maintained progress
+        leaderboards = get_leaderboards()
+        all_writers = leaderboards.writers()
+        all_submissions = get_store().list_all()
         
         # Generate team analytics
-        analytics = writer_agent.generate_team_analytics(all_submissions, all_writers)
+        analytics = get_writer_agent().generate_team_analytics(
+            all_submissions, all_writers, leaderboards, get_rolling_analytics(), get_issue_stats()
+        )
         
-        return APIResponse(
-            success=True,
-            message="Team analytics retrieved successfully",
-            data=analytics.dict()
+        return api_response("Team analytics retrieved successfully", dump_model(analytics, fields))
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/team/issues", response_model=APIResponse)
+async def get_team_issues(writer_id: Optional[str] = None):
+    """
+    Get issue frequencies by issue type.
+    
+    Args:
+        writer_id: Optional writer to restrict counts to (default: whole team)
+    
+    Returns:
+        APIResponse with per-type counts, categories and severity split
+    """
+    try:
+        issue_stats = get_issue_stats()
+        counts = issue_stats.writer_counts(writer_id) if writer_id else issue_stats.team_counts()
+        
+        return api_response("Issue frequencies retrieved successfully", {
+            "writer_id": writer_id,
+            "total": sum(counts),
+            "issue_types": breakdown(counts)
+        })
+    
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/team/trends", response_model=APIResponse)
+async def get_team_trends(
+    granularity: str = "day",
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None
+):
+    """
+    Get time-bucketed team activity for dashboards.
+    
+    Args:
+        granularity: Bucket size (hour, day or week)
+        start: Window start (default: 30 buckets before end)
+        end: Window end (default: now)
+    
+    Returns:
+        APIResponse with one entry per bucket plus a summary of the window
+    """
+    if granularity not in GRANULARITIES:
+        raise HTTPException(status_code=400, detail=f"Unknown granularity: {granularity} (choose from {', '.join(GRANULARITIES)})")
+    
+    # Aware bounds (e.g. "...Z") are compared on the local wall clock, like the buckets
+    try:
+        end = local_time(end) if end else datetime.now()
+        start = local_time(start) if start else end - timedelta(hours=30 * GRANULARITIES[granularity])
+    except (OverflowError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid window: {e}")
+    if start > end:
+        raise HTTPException(status_code=400, detail="start must not be after end")
+    if (end - start) / timedelta(hours=GRANULARITIES[granularity]) > MAX_TREND_BUCKETS:
+        raise HTTPException(status_code=400, detail=f"Window spans more than {MAX_TREND_BUCKETS} {granularity} buckets")
+    
+    try:
+        rolling = get_rolling_analytics()
+        
+        return api_response("Team trends retrieved successfully", {
+            "granularity": granularity,
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "summary": rolling.window(start, end),
+            "buckets": rolling.series(granularity, start, end)
+        })
+    
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/analytics/snapshot", response_model=APIResponse)
+async def create_analytics_snapshot():
+    """
+    Write a columnar snapshot of all submissions for historical reporting.
+    
+    Returns:
+        APIResponse with the snapshot's size and location
+    """
+    from src.core.columnar import SubmissionColumns
+    
+    try:
+        columns = SubmissionColumns.from_submissions(get_store().list_all())
+        path = columns.save(get_config().database.snapshot_path)
+        
+        return api_response("Analytics snapshot written successfully", {
+            "path": str(path),
+            "submissions": len(columns),
+            "writers": len(columns.writer_ids),
+            "bytes": columns.nbytes
+        })
+    
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/analytics/snapshot/team", response_model=APIResponse)
+async def get_snapshot_team_analytics(
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    fields: Optional[str] = None
+):
+    """
+    Get team analytics from the columnar snapshot (memory-mapped, vectorized).
+    
+    Args:
+        created_from: Only submissions created at or after this time
+        created_to: Only submissions created before this time
+        fields: Optional comma-separated analytics fields to return
+    
+    Returns:
+        APIResponse with team analytics over the snapshot
+    """
+    from src.core.columnar import SubmissionColumns
+    
+    try:
+        columns = SubmissionColumns.load(get_config().database.snapshot_path)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="No analytics snapshot (POST /analytics/snapshot first)")
+    
+    try:
+        if created_from or created_to:
+            columns = columns.between(created_from, created_to)
+        analytics = get_writer_agent().generate_team_analytics_columnar(columns)
+        
+        return api_response("Snapshot team analytics retrieved successfully", dump_model(analytics, fields))
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/export")
+async def export_submissions(
+    status: Optional[SubmissionStatus] = None,
+    writer_id: Optional[str] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None
+):
+    """
+    Stream submissions (content, scores, annotations, feedback) as NDJSON.
+    
+    Args:
+        status: Only submissions with this status
+        writer_id: Only this writer's submissions
+        created_from: Only submissions created at or after this time
+        created_to: Only submissions created at or before this time
+    
+    Returns:
+        application/x-ndjson stream, one submission per line, oldest first
+    """
+    query = ListingQuery(
+        status=status.value if status else None,
+        writer_id=writer_id,
+        created_from=created_from,
+        created_to=created_to
+    )
+    return StreamingResponse(
+        export_ndjson(get_store(), get_list_index(), query),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="submissions.ndjson"'}
+    )
+
+
+@router.post("/import", response_model=APIResponse)
+async def import_submissions(request: Request, batch_size: int = 1000, skip_existing: bool = False):
+    """
+    Bulk-import submissions from an NDJSON request body (as written by /export).
+    
+    Args:
+        request: Request whose body is read as a stream of NDJSON lines
+        batch_size: Records per storage transaction
+        skip_existing: Leave submissions whose ID already exists untouched
+    
+    Returns:
+        APIResponse with imported/skipped/failed counts, first errors and throughput
+    """
+    try:
+        importer = BulkImporter(get_store(), min(max(batch_size, 1), 10000), skip_existing)
+        pending = b""
+        # Validation and batch writes are blocking: run them off the event loop
+        async for chunk in request.stream():
+            lines = (pending + chunk).split(b"\n")
+            pending = lines.pop()
+            await asyncio.to_thread(importer.add_lines, lines)
+        await asyncio.to_thread(importer.add_line, pending)
+        report = await asyncio.to_thread(importer.finish)
+        
+        return api_response(f"Imported {report.imported} submissions", report.model_dump())
+    
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/publish", response_model=APIResponse)
+async def publish_submissions(
+    submission_ids: Optional[List[str]] = None,
+    platforms: Optional[List[str]] = None,
+    wait: bool = False
+):
+    """
+    Publish approved submissions to the configured CMS sites.
+    
+    Publishing is idempotent: retries and repeated requests update the
+    existing posts (or skip unchanged ones) rather than creating duplicates.
+    
+    Args:
+        submission_ids: Submissions to publish (default: every approved submission)
+        platforms: wordpress and/or webflow (default: every configured CMS)
+        wait: Respond when publishing finishes instead of immediately
+    
+    Returns:
+        APIResponse with the publishing job (poll GET /publish/{job_id} for progress)
+    """
+    publisher = get_publisher()
+    if not publisher.targets:
+        raise HTTPException(status_code=400, detail="No CMS configured (WORDPRESS_* or WEBFLOW_* settings)")
+    try:
+        targets = publisher.resolve(platforms)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    store = get_store()
+    if submission_ids:
+        submissions = [store.get(submission_id) for submission_id in submission_ids]
+        missing = [i for i, s in zip(submission_ids, submissions) if s is None]
+        if missing:
+            raise HTTPException(status_code=404, detail=f"Submissions not found: {', '.join(missing)}")
+    else:
+        submissions = [
+            store.get(record.submission_id)
+            for record in store.list_all()
+            if record.status == SubmissionStatus.APPROVED
+        ]
+    
+    try:
+        job = PublishJob(
+            job_id=str(uuid.uuid4()),
+            total=len({s.submission_id for s in submissions}) * len(targets)
         )
+        publish_jobs[job.job_id] = job
+        while len(publish_jobs) > MAX_PUBLISH_JOBS:
+            publish_jobs.pop(next(iter(publish_jobs)))
+        
+        run = publisher.publish_many(submissions, platforms, job)
+        if wait:
+            await run
+            return api_response(f"Published {job.completed - job.failed} of {job.total}", job.model_dump(mode="json"))
+        
+        task = asyncio.create_task(run)
+        _publish_tasks.add(task)
+        task.add_done_callback(_publish_tasks.discard)
+        return api_response("Publishing started", job.model_dump(mode="json", exclude={"results"}))
+    
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/publish/{job_id}", response_model=APIResponse)
+async def get_publish_job(job_id: str, include_results: bool = False):
+    """
+    Get the progress of a publishing job.
+    
+    Args:
+        job_id: Job ID returned by POST /publish
+        include_results: Include per-submission outcomes
+    
+    Returns:
+        APIResponse with total/completed/failed counts
+    """
+    job = publish_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Publishing job not found")
+    return api_response(
+        "Publishing job retrieved successfully",
+        job.model_dump(mode="json", exclude=None if include_results else {"results"})
+    )
+
+
+@router.get("/leaderboard/{board}", response_model=APIResponse)
+async def get_leaderboard(board: str, offset: int = 0, limit: int = 10):
+    """
+    Get a writer leaderboard.
+    
+    Args:
+        board: average_score, improvement_rate, seo, eeat, quality or compliance
+        offset: Rank offset (0 = first place)
+        limit: Maximum number of entries
+    
+    Returns:
+        APIResponse with ranked writers (top K only, K = LEADERBOARD_SIZE)
+    """
+    if board not in BOARDS:
+        raise HTTPException(status_code=400, detail=f"Unknown leaderboard: {board} (choose from {', '.join(BOARDS)})")
+    
+    try:
+        entries, total = get_leaderboards().page(board, max(offset, 0), min(max(limit, 1), 100))
+        next_offset = offset + len(entries)
+        
+        return api_response(f"Leaderboard {board} retrieved successfully", {
+            "board": board,
+            "entries": entries,
+            "total": total,
+            "next_offset": next_offset if next_offset < total else None
+        })
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -287,53 +842,129 @@ async def get_team_analytics():
 async def list_submissions(
     status: Optional[str] = None,
     writer_id: Optional[str] = None,
+    manager_id: Optional[str] = None,
+    min_score: Optional[int] = None,
+    max_score: Optional[int] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    min_revisions: Optional[int] = None,
+    max_revisions: Optional[int] = None,
+    cursor: Optional[str] = None,
+    order: str = "desc",
     limit: int = 20
 ):
     """
-    List submissions with optional filters.
+    List submissions with optional filters, newest first, one page at a time.
     
     Args:
         status: Filter by status (pending_review, in_review, etc.)
         writer_id: Filter by writer ID
+        manager_id: Filter by assigned manager ID
+        min_score: Minimum overall score (excludes unreviewed submissions)
+        max_score: Maximum overall score (excludes unreviewed submissions)
+        created_from: Created at or after this time
+        created_to: Created at or before this time
+        min_revisions: Minimum revision count
+        max_revisions: Maximum revision count
+        cursor: `next_cursor` from the previous page
+        order: "desc" (newest first) or "asc"
         limit: Maximum number of results
     
     Returns:
-        APIResponse with list of submissions
+        APIResponse with one page of submissions and the next cursor
     """
+    query = ListingQuery(
+        status=status,
+        writer_id=writer_id,
+        manager_id=manager_id,
+        min_score=min_score,
+        max_score=max_score,
+        created_from=created_from,
+        created_to=created_to,
+        min_revisions=min_revisions,
+        max_revisions=max_revisions
+    )
     try:
-        submissions = list(submissions_db.values())
-        
-        # Apply filters
-        if status:
-            submissions = [s for s in submissions if s.status.value == status]
-        
-        if writer_id:
-            submissions = [s for s in submissions if s.writer_id == writer_id]
+        ids, next_cursor = get_list_index().page(
+            query, cursor=cursor, limit=min(max(limit, 1), 100), descending=order != "asc"
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    try:
+        store = get_store()
+        submissions = [s for s in map(store.get_record, ids) if s is not None]
         
-        # Sort by most recent
-        submissions.sort(key=lambda x: x.created_at, reverse=True)
+        return api_response(f"Found {len(submissions)} submissions", {
+            "submissions": [
+                {
+                    "submission_id": s.submission_id,
+                    "writer_name": s.writer_name,
+                    "title": s.title,
+                    "status": s.status.value,
+                    "overall_score": s.scores.overall_score if s.scores else None,
+                    "revision_count": s.revision_count,
+                    "created_at": s.created_at
+                }
+                for s in submissions
+            ],
+            "total": len(submissions),
+            "next_cursor": next_cursor
+        })
+    
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/search", response_model=APIResponse)
+async def search_submissions(
+    q: str,
+    status: Optional[str] = None,
+    writer_id: Optional[str] = None,
+    limit: int = 10
+):
+    """
+    Full-text search over titles, content and annotations (BM25 ranked).
+    
+    Args:
+        q: Search query (e.g. "wagering requirements")
+        status: Filter by status
+        writer_id: Filter by writer ID
+        limit: Maximum number of results
+    
+    Returns:
+        APIResponse with ranked results, highlighted titles and snippets
+    """
+    try:
+        index = get_search_index()
+        store = get_store()
+        started = time.perf_counter()
+        hits, total = index.search(q, limit=min(max(limit, 1), 100), writer_id=writer_id, status=status)
+        terms = index.query_terms(q)
         
-        # Limit results
-        submissions = submissions[:limit]
+        results = []
+        for submission_id, score in hits:
+            submission = store.get(submission_id)
+            if submission is None:
+                continue
+            results.append({
+                "submission_id": submission_id,
+                "writer_name": submission.writer_name,
+                "title": submission.title,
+                "title_highlighted": highlight(submission.title, terms),
+                "status": submission.status.value,
+                "score": round(score, 4),
+                "snippet": snippet(submission.content, terms),
+                "annotation_snippet": snippet(annotation_text(submission), terms) or None,
+                "created_at": submission.created_at
+            })
         
-        return APIResponse(
-            success=True,
-            message=f"Found {len(submissions)} submissions",
-            data={
-                "submissions": [
-                    {
-                        "submission_id": s.submission_id,
-                        "writer_name": s.writer_name,
-                        "title": s.title,
-                        "status": s.status.value,
-                        "overall_score": s.scores.overall_score if s.scores else None,
-                        "created_at": s.created_at.isoformat()
-                    }
-                    for s in submissions
-                ],
-                "total": len(submissions)
-            }
-        )
+        return api_response(f"Found {total} matching submissions", {
+            "query": q,
+            "results": results,
+            "total": total,
+            "took_ms": round((time.perf_counter() - started) * 1000, 2)
+        })
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
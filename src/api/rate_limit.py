@@ -0,0 +1,233 @@
+"""
+RankSmart 2.0 - Rate Limiting
+
+Per-client token buckets, split by route class: cheap reads and writes
+share one budget, LLM-backed reviews (`/review`, `/apply-fixes`) have a
+smaller one plus a cap on reviews in flight at once.
+
+Clients are identified by IP, or by a hash of their `X-API-Key` header when
+it is one of the configured keys. State is O(1) per (client, route class)
+and kept in LRU order; a bucket idle for a full refill window is
+indistinguishable from a fresh one, so it is evicted without changing any
+decision. Limits are per worker process.
+"""
+
+import hashlib
+import json
+import math
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, FrozenSet, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.config import RateLimitConfig
+
+
+READ = "read"
+REVIEW = "review"
+
+WINDOW_S = 60.0
+EXEMPT_PATHS = frozenset({"/", "/health", "/docs", "/redoc", "/openapi.json"})
+REVIEW_PREFIXES = ("/api/content-manager/review/", "/api/content-manager/apply-fixes/")
+
+
+def route_class(method: str, path: str) -> Optional[str]:
+    """Budget a request is charged to (None: not limited)"""
+    if method == "OPTIONS" or path in EXEMPT_PATHS:
+        return None
+    if method == "POST" and path.startswith(REVIEW_PREFIXES):
+        return REVIEW
+    return READ
+
+
+def client_key(scope, trust_forwarded: bool = False, api_keys: FrozenSet[str] = frozenset()) -> str:
+    """
+    Hashed API key if it is one of `api_keys`, else the client IP (first
+    `X-Forwarded-For` hop if trusted).
+
+    Unknown keys are ignored: otherwise a client could rotate made-up keys
+    to get a fresh bucket on every request.
+    """
+    headers = dict(scope.get("headers") or [])
+    api_key = headers.get(b"x-api-key", b"").decode("latin-1")
+    if api_key and api_key in api_keys:
+        return "key:" + hashlib.sha256(api_key.encode("latin-1")).hexdigest()[:16]
+    if trust_forwarded and b"x-forwarded-for" in headers:
+        return "ip:" + headers[b"x-forwarded-for"].decode("latin-1").split(",")[0].strip()
+    client = scope.get("client")
+    return "ip:" + (client[0] if client else "unknown")
+
+
+class Bucket:
+    """Token bucket state for one (client, route class)"""
+
+    __slots__ = ("tokens", "updated", "in_flight")
+
+    def __init__(self, tokens: float, updated: float):
+        self.tokens = tokens
+        self.updated = updated
+        self.in_flight = 0
+
+
+class Decision:
+    """Outcome of `RateLimiter.acquire`"""
+
+    __slots__ = ("allowed", "limit", "remaining", "retry_after")
+
+    def __init__(self, allowed: bool, limit: int, remaining: int, retry_after: int = 0):
+        self.allowed = allowed
+        self.limit = limit
+        self.remaining = remaining
+        self.retry_after = retry_after
+
+
+class RateLimiter:
+    """
+    Token buckets refilling `limit` tokens per minute, bursting up to `limit`.
+
+    Args:
+        limits: Requests per minute for each route class
+        max_concurrent: Requests in flight per client for each route class
+            (classes not listed are unbounded)
+        max_clients: Bucket count above which the least recently seen are dropped
+        time_fn: Monotonic clock (injectable for tests)
+    """
+
+    def __init__(
+        self,
+        limits: Dict[str, int],
+        max_concurrent: Optional[Dict[str, int]] = None,
+        max_clients: int = 10000,
+        time_fn: Callable[[], float] = time.monotonic
+    ):
+        self.limits = limits
+        self.max_concurrent = max_concurrent or {}
+        self.max_clients = max_clients
+        self.time_fn = time_fn
+        self._buckets: "OrderedDict[Tuple[str, str], Bucket]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def acquire(self, client: str, route: str) -> Decision:
+        """Charge one request; a successful acquire must be `release`d"""
+        now = self.time_fn()
+        limit = self.limits[route]
+        key = (client, route)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = Bucket(float(limit), now)
+        else:
+            self._buckets.move_to_end(key)
+            bucket.tokens = min(limit, bucket.tokens + (now - bucket.updated) * limit / WINDOW_S)
+            bucket.updated = now
+        self._evict(now)
+
+        if bucket.in_flight >= self.max_concurrent.get(route, math.inf):
+            return Decision(False, limit, int(bucket.tokens), retry_after=1)
+        if bucket.tokens < 1:
+            wait = (1 - bucket.tokens) * WINDOW_S / limit
+            return Decision(False, limit, 0, retry_after=max(1, math.ceil(wait)))
+        bucket.tokens -= 1
+        bucket.in_flight += 1
+        return Decision(True, limit, int(bucket.tokens))
+
+    def release(self, client: str, route: str):
+        """Mark an acquired request as finished"""
+        bucket = self._buckets.get((client, route))
+        if bucket is not None and bucket.in_flight:
+            bucket.in_flight -= 1
+
+    def _evict(self, now: float):
+        """Drop buckets that have refilled completely, then any over `max_clients`"""
+        while self._buckets:
+            key, bucket = next(iter(self._buckets.items()))
+            if now - bucket.updated < WINDOW_S and len(self._buckets) <= self.max_clients:
+                break
+            if bucket.in_flight and len(self._buckets) <= self.max_clients:
+                # Long-running request: keep its concurrency count
+                self._buckets.move_to_end(key)
+                bucket.tokens = float(self.limits[key[1]])
+                bucket.updated = now
+                continue
+            del self._buckets[key]
+
+
+class RateLimitMiddleware:
+    """
+    ASGI middleware answering over-limit requests with 429 and `Retry-After`.
+
+    Allowed responses carry `X-RateLimit-Limit` and `X-RateLimit-Remaining`.
+    Settings come from `config` or, on the first request, from
+    `get_config().rate_limit` (so importing the app has no config side effects).
+    """
+
+    def __init__(self, app, config: Optional["RateLimitConfig"] = None, time_fn: Callable[[], float] = time.monotonic):
+        self.app = app
+        self.config = config
+        self.time_fn = time_fn
+        self.limiter: Optional[RateLimiter] = None
+        self.api_keys: FrozenSet[str] = frozenset()
+
+    def _setup(self):
+        if self.config is None:
+            from src.config import get_config
+            self.config = get_config().rate_limit
+        self.limiter = RateLimiter(
+            {READ: self.config.per_minute, REVIEW: self.config.reviews_per_minute},
+            {REVIEW: self.config.max_concurrent_scans},
+            max_clients=self.config.max_clients,
+            time_fn=self.time_fn
+        )
+        self.api_keys = frozenset(self.config.api_keys)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        if self.limiter is None:
+            self._setup()
+        route = route_class(scope.get("method", "GET"), scope.get("path", ""))
+        if route is None or not self.config.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        client = client_key(scope, self.config.trust_forwarded, self.api_keys)
+        decision = self.limiter.acquire(client, route)
+        limit_headers = [
+            (b"x-ratelimit-limit", str(decision.limit).encode("latin-1")),
+            (b"x-ratelimit-remaining", str(decision.remaining).encode("latin-1"))
+        ]
+        if not decision.allowed:
+            await self._reject(send, decision, limit_headers)
+            return
+
+        async def send_with_limits(message):
+            if message["type"] == "http.response.start":
+                message = dict(message)
+                message["headers"] = list(message.get("headers", [])) + limit_headers
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_limits)
+        finally:
+            self.limiter.release(client, route)
+
+    @staticmethod
+    async def _reject(send, decision: Decision, limit_headers):
+        body = json.dumps({
+            "success": False,
+            "message": "Rate limit exceeded",
+            "data": None,
+            "error": f"Too many requests; retry after {decision.retry_after}s"
+        }).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("latin-1")),
+                (b"retry-after", str(decision.retry_after).encode("latin-1"))
+            ] + limit_headers
+        })
+        await send({"type": "http.response.body", "body": body})
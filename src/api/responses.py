@@ -0,0 +1,248 @@
+"""
+API Response Helpers
+
+Fast JSON responses (orjson when installed), `?fields=` projection of
+response models, and gzip/brotli compression for large response bodies.
+"""
+
+import json
+import zlib
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Dict, Optional
+
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional encoding
+    brotli = None
+
+
+# ===================================
+# JSON Encoding
+# ===================================
+
+def _default(value: Any) -> Any:
+    """Fallback encoder for the stdlib json path"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(data: Any) -> bytes:
+    """Serialize to compact JSON bytes (orjson if available)"""
+    if orjson is not None:
+        return orjson.dumps(data, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, default=_default, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with `dumps` (datetimes/enums handled natively)"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def api_response(message: str, data: Any = None) -> FastJSONResponse:
+    """Successful `APIResponse` envelope, serialized without a pydantic round-trip"""
+    return FastJSONResponse({"success": True, "message": message, "data": data, "error": None})
+
+
+# ===================================
+# Field Projection
+# ===================================
+
+FieldTree = Dict[str, "FieldTree"]
+
+
+def field_tree(fields: Optional[str]) -> Optional[FieldTree]:
+    """
+    Parse a `fields` query value into a nested selection.
+
+    "title,scores.overall_score,annotations.severity" ->
+    {"title": {}, "scores": {"overall_score": {}}, "annotations": {"severity": {}}}
+
+    Returns:
+        None when no projection was requested
+    """
+    if not fields or not fields.strip():
+        return None
+    tree: FieldTree = {}
+    for path in fields.split(","):
+        parts = [part for part in path.strip().split(".") if part]
+        if not parts:
+            continue
+        node: Optional[FieldTree] = tree
+        for part in parts[:-1]:
+            if part in node and not node[part]:
+                node = None  # Parent already selected in full
+                break
+            node = node.setdefault(part, {})
+        if node is not None:
+            node[parts[-1]] = {}
+    return tree
+
+
+def project(data: Any, tree: Optional[FieldTree]) -> Any:
+    """Keep only the selected keys; selections apply to every item of a list"""
+    if not tree:
+        return data
+    if isinstance(data, list):
+        return [project(item, tree) for item in data]
+    if isinstance(data, dict):
+        return {key: project(data[key], sub) for key, sub in tree.items() if key in data}
+    return data
+
+
+def dump_model(model: BaseModel, fields: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Dump a response model, restricted to `fields` when given.
+
+    Only the selected top-level fields are dumped at all, so e.g. a
+    submission's content and annotations are never touched unless requested.
+
+    Raises:
+        HTTPException: 400 if a top-level field doesn't exist on the model
+    """
+    tree = field_tree(fields)
+    if tree is None:
+        return model.model_dump()
+    unknown = sorted(set(tree) - set(type(model).model_fields))
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    return project(model.model_dump(include=set(tree)), tree)
+
+
+# ===================================
+# Compression
+# ===================================
+
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/", "application/javascript", "application/xml")
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick "br" or "gzip" from an Accept-Encoding header (brotli preferred)"""
+    offered = {}
+    for item in accept_encoding.lower().split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        offered[name.strip()] = quality
+    if brotli is not None and offered.get("br", 0) > 0:
+        return "br"
+    if offered.get("gzip", 0) > 0:
+        return "gzip"
+    return None
+
+
+class _Encoder:
+    """Streaming gzip/brotli encoder"""
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        self.encoding = encoding
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=brotli_quality)
+        else:
+            self._zlib = zlib.compressobj(gzip_level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        if self.encoding == "br":
+            out = self._brotli.process(data)
+            return out + (self._brotli.finish() if final else self._brotli.flush())
+        out = self._zlib.compress(data)
+        return out + self._zlib.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware compressing responses with brotli or gzip.
+
+    Bodies smaller than `minimum_size`, already-encoded responses and
+    non-text content types pass through untouched. Streaming responses are
+    compressed chunk by chunk (flushed per chunk, so NDJSON stays live).
+    """
+
+    def __init__(self, app, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        headers = dict(scope.get("headers") or [])
+        encoding = choose_encoding(headers.get(b"accept-encoding", b"").decode("latin-1"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Optional[dict] = None
+        encoder: Optional[_Encoder] = None
+        passthrough = False
+
+        async def send_compressed(message):
+            nonlocal start_message, encoder, passthrough
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if encoder is None:
+                response_headers = {k.lower(): v for k, v in start_message.get("headers", [])}
+                content_type = response_headers.get(b"content-type", b"").decode("latin-1")
+                if (
+                    b"content-encoding" in response_headers
+                    or not content_type.startswith(COMPRESSIBLE_TYPES)
+                    or (not more_body and len(body) < self.minimum_size)
+                ):
+                    passthrough = True
+                    await send(start_message)
+                    await send(message)
+                    return
+
+                encoder = _Encoder(encoding, self.gzip_level, self.brotli_quality)
+                body = encoder.compress(body, final=not more_body)
+                new_headers = [
+                    (k, v) for k, v in start_message.get("headers", [])
+                    if k.lower() not in (b"content-length", b"vary")
+                ]
+                vary = response_headers.get(b"vary")
+                new_headers.append((b"vary", vary + b", Accept-Encoding" if vary else b"Accept-Encoding"))
+                new_headers.append((b"content-encoding", encoding.encode("latin-1")))
+                if not more_body:
+                    new_headers.append((b"content-length", str(len(body)).encode("latin-1")))
+                await send({**start_message, "headers": new_headers})
+                await send({"type": "http.response.body", "body": body, "more_body": more_body})
+                return
+
+            await send({
+                "type": "http.response.body",
+                "body": encoder.compress(body, final=not more_body),
+                "more_body": more_body
+            })
+
+        await self.app(scope, receive, send_compressed)
+
@@ -5,8 +5,9 @@ Centralized configuration for the entire application.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, Field
 
 
@@ -21,12 +22,19 @@ class APIConfig(BaseModel):
 class DatabaseConfig(BaseModel):
     """Database Configuration"""
     url: str = Field(default="sqlite:///./ranksmart.db", description="Database URL")
+    state_backend: str = Field(default="memory", description="Submission state backend (memory/sqlite)")
+    state_path: str = Field(default="data/ranksmart_state.db", description="SQLite file for shared state")
+    blob_path: str = Field(default="data/blobs", description="Article body blob directory (sqlite state)")
+    blob_cache_mb: int = Field(default=64, description="LRU cache for hot article bodies (MB)")
+    snapshot_path: str = Field(default="data/analytics_snapshot", description="Columnar analytics snapshot directory")
 
 
 class AppConfig(BaseModel):
     """Application Configuration"""
     environment: str = Field(default="development", description="Environment")
     port: int = Field(default=8000, description="Application Port")
+    workers: int = Field(default=1, description="Server worker processes")
+    leaderboard_size: int = Field(default=100, description="Ranks exposed per writer leaderboard (K)")
     secret_key: str = Field(..., description="Secret key for sessions")
     log_level: str = Field(default="INFO", description="Logging level")
 
@@ -39,6 +47,12 @@ class IntegrationConfig(BaseModel):
     wordpress_username: Optional[str] = None
     wordpress_app_password: Optional[str] = None
     webflow_api_token: Optional[str] = None
+    webflow_collection_id: Optional[str] = Field(None, description="Webflow collection that receives published articles")
+    publish_concurrency: int = Field(default=4, description="Requests in flight per CMS site")
+    publish_ledger_path: str = Field(default="data/publications.db", description="SQLite idempotency ledger of published posts")
+    notification_queue_size: int = Field(default=1000, description="Events waiting for dispatch before new ones are dropped")
+    notification_batch_window_s: float = Field(default=2.0, description="Events within this window share one digest message")
+    notification_retry_path: str = Field(default="data/notifications.db", description="SQLite retry queue for failed webhook deliveries")
 
 
 class FeatureFlags(BaseModel):
@@ -51,8 +65,45 @@ class FeatureFlags(BaseModel):
 
 class RateLimitConfig(BaseModel):
     """Rate Limiting Configuration"""
+    enabled: bool = Field(default=True, description="Enforce per-client request limits")
     per_minute: int = Field(default=60, description="Max requests per minute")
+    reviews_per_minute: int = Field(default=10, description="Max LLM-backed reviews per minute")
     max_concurrent_scans: int = Field(default=5, description="Max concurrent scans")
+    max_clients: int = Field(default=10000, description="Tracked clients before least recently seen are dropped")
+    trust_forwarded: bool = Field(default=False, description="Identify clients by X-Forwarded-For (behind a proxy)")
+    api_keys: List[str] = Field(default_factory=list, description="API keys limited per key instead of per IP")
+
+
+class ImageConfig(BaseModel):
+    """Image Generation Pipeline Configuration"""
+    output_dir: str = Field(default="data/images", description="Content-addressed image cache directory")
+    base_url: str = Field(default="/images", description="URL prefix the output directory is served under")
+    width: int = Field(default=1200, description="Output image width (px)")
+    height: int = Field(default=630, description="Output image height (px)")
+    thumbnail_width: int = Field(default=400, description="Thumbnail width (px)")
+    format: str = Field(default="WEBP", description="Output format (WEBP/JPEG/PNG)")
+    quality: int = Field(default=85, ge=1, le=100, description="Lossy encoder quality")
+    concurrency: int = Field(default=4, description="Generations in flight at once")
+    process_workers: Optional[int] = Field(None, description="Post-processing processes (default: CPU count)")
+
+
+class LLMConfig(BaseModel):
+    """LLM Call Budget Configuration"""
+    requests_per_minute: int = Field(default=60, description="Max LLM requests per minute")
+    tokens_per_minute: int = Field(default=1_000_000, description="Max LLM tokens per minute")
+    initial_concurrency: int = Field(default=4, description="Starting concurrent LLM calls")
+    max_concurrency: int = Field(default=32, description="Upper bound for adaptive concurrency")
+    latency_target_s: Optional[float] = Field(None, description="Latency that triggers backing off")
+    max_retries: int = Field(default=5, description="Retries for throttled/transient failures")
+    json_mode: bool = Field(default=True, description="Request application/json output from the model")
+    max_reasks: int = Field(default=1, description="Follow-up requests for missing/invalid output fields")
+
+
+class TracingConfig(BaseModel):
+    """Request Tracing Configuration"""
+    enabled: bool = Field(default=True, description="Record request spans")
+    sample_rate: float = Field(default=0.1, ge=0.0, le=1.0, description="Fraction of traces written")
+    file: str = Field(default="logs/traces.jsonl", description="JSON-lines trace output")
 
 
 class Config:
@@ -67,12 +118,19 @@ class Config:
         )
         
         self.database = DatabaseConfig(
-            url=os.getenv("DATABASE_URL", "sqlite:///./ranksmart.db")
+            url=os.getenv("DATABASE_URL", "sqlite:///./ranksmart.db"),
+            state_backend=os.getenv("STATE_BACKEND", "memory"),
+            state_path=os.getenv("STATE_DB_PATH", "data/ranksmart_state.db"),
+            blob_path=os.getenv("BLOB_PATH", "data/blobs"),
+            blob_cache_mb=int(os.getenv("BLOB_CACHE_MB", "64")),
+            snapshot_path=os.getenv("SNAPSHOT_PATH", "data/analytics_snapshot")
         )
         
         self.app = AppConfig(
             environment=os.getenv("ENVIRONMENT", "development"),
             port=int(os.getenv("PORT", "8000")),
+            workers=int(os.getenv("WORKERS", "1")),
+            leaderboard_size=int(os.getenv("LEADERBOARD_SIZE", "100")),
             secret_key=os.getenv("SECRET_KEY", "change-me-in-production"),
             log_level=os.getenv("LOG_LEVEL", "INFO")
         )
@@ -83,7 +141,13 @@ class Config:
             wordpress_site_url=os.getenv("WORDPRESS_SITE_URL"),
             wordpress_username=os.getenv("WORDPRESS_USERNAME"),
             wordpress_app_password=os.getenv("WORDPRESS_APP_PASSWORD"),
-            webflow_api_token=os.getenv("WEBFLOW_API_TOKEN")
+            webflow_api_token=os.getenv("WEBFLOW_API_TOKEN"),
+            webflow_collection_id=os.getenv("WEBFLOW_COLLECTION_ID"),
+            publish_concurrency=int(os.getenv("PUBLISH_CONCURRENCY", "4")),
+            publish_ledger_path=os.getenv("PUBLISH_LEDGER_PATH", "data/publications.db"),
+            notification_queue_size=int(os.getenv("NOTIFICATION_QUEUE_SIZE", "1000")),
+            notification_batch_window_s=float(os.getenv("NOTIFICATION_BATCH_WINDOW_S", "2.0")),
+            notification_retry_path=os.getenv("NOTIFICATION_RETRY_PATH", "data/notifications.db")
         )
         
         self.features = FeatureFlags(
@@ -94,8 +158,42 @@ class Config:
         )
         
         self.rate_limit = RateLimitConfig(
+            enabled=os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true",
             per_minute=int(os.getenv("RATE_LIMIT_PER_MINUTE", "60")),
-            max_concurrent_scans=int(os.getenv("MAX_CONCURRENT_SCANS", "5"))
+            reviews_per_minute=int(os.getenv("RATE_LIMIT_REVIEWS_PER_MINUTE", "10")),
+            max_concurrent_scans=int(os.getenv("MAX_CONCURRENT_SCANS", "5")),
+            max_clients=int(os.getenv("RATE_LIMIT_MAX_CLIENTS", "10000")),
+            trust_forwarded=os.getenv("RATE_LIMIT_TRUST_FORWARDED", "false").lower() == "true",
+            api_keys=[key.strip() for key in os.getenv("RATE_LIMIT_API_KEYS", "").split(",") if key.strip()]
+        )
+        
+        self.images = ImageConfig(
+            output_dir=os.getenv("IMAGE_OUTPUT_DIR", "data/images"),
+            base_url=os.getenv("IMAGE_BASE_URL", "/images"),
+            width=int(os.getenv("IMAGE_WIDTH", "1200")),
+            height=int(os.getenv("IMAGE_HEIGHT", "630")),
+            thumbnail_width=int(os.getenv("IMAGE_THUMBNAIL_WIDTH", "400")),
+            format=os.getenv("IMAGE_FORMAT", "WEBP").upper(),
+            quality=int(os.getenv("IMAGE_QUALITY", "85")),
+            concurrency=int(os.getenv("IMAGE_CONCURRENCY", "4")),
+            process_workers=int(os.environ["IMAGE_PROCESS_WORKERS"]) if os.getenv("IMAGE_PROCESS_WORKERS") else None
+        )
+        
+        self.llm = LLMConfig(
+            requests_per_minute=int(os.getenv("LLM_REQUESTS_PER_MINUTE", "60")),
+            tokens_per_minute=int(os.getenv("LLM_TOKENS_PER_MINUTE", "1000000")),
+            initial_concurrency=int(os.getenv("LLM_INITIAL_CONCURRENCY", "4")),
+            max_concurrency=int(os.getenv("LLM_MAX_CONCURRENCY", "32")),
+            latency_target_s=float(os.environ["LLM_LATENCY_TARGET_S"]) if os.getenv("LLM_LATENCY_TARGET_S") else None,
+            max_retries=int(os.getenv("LLM_MAX_RETRIES", "5")),
+            json_mode=os.getenv("LLM_JSON_MODE", "true").lower() == "true",
+            max_reasks=int(os.getenv("LLM_MAX_REASKS", "1"))
+        )
+        
+        self.tracing = TracingConfig(
+            enabled=os.getenv("TRACE_ENABLED", "true").lower() == "true",
+            sample_rate=float(os.getenv("TRACE_SAMPLE_RATE", "0.1")),
+            file=os.getenv("TRACE_FILE", "logs/traces.jsonl")
         )
         
         # Create necessary directories
@@ -121,5 +219,15 @@ class Config:
         return True
 
 
-# Global configuration instance
-config = Config()
+@lru_cache(maxsize=None)
+def get_config() -> Config:
+    """Global configuration instance, created on first use"""
+    return Config()
+
+
+def __getattr__(name: str):
+    # `from src.config import config` still works, but no longer builds the
+    # config (and creates directories) just by importing this module
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
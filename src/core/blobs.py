@@ -0,0 +1,193 @@
+"""
+RankSmart 2.0 - Content-Addressed Blob Store
+
+Article bodies are stored once per distinct content (keyed by SHA-256),
+zlib-compressed at rest, with an LRU cache of hot decompressed bodies.
+
+- `MemoryBlobStore`: process-local (single worker, tests)
+- `FileBlobStore`: sharded files under a directory, shared by worker processes
+"""
+
+import os
+import tempfile
+import threading
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional
+
+from src.core.singleflight import content_hash
+
+
+class LRUCache:
+    """Least-recently-used cache of strings bounded by total characters"""
+
+    def __init__(self, max_chars: int):
+        self.max_chars = max_chars
+        self.size = 0
+        self._items: "OrderedDict[str, str]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[str]:
+        value = self._items.get(key)
+        if value is not None:
+            self._items.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: str):
+        if len(value) > self.max_chars:
+            return
+        old = self._items.pop(key, None)
+        if old is not None:
+            self.size -= len(old)
+        self._items[key] = value
+        self.size += len(value)
+        while self.size > self.max_chars:
+            _, evicted = self._items.popitem(last=False)
+            self.size -= len(evicted)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class BlobStore:
+    """
+    Content-addressed storage for text bodies.
+
+    Args:
+        cache_chars: LRU cache budget for decompressed bodies (characters)
+        compression_level: zlib level used at rest
+    """
+
+    def __init__(self, cache_chars: int = 64 * 1024 * 1024, compression_level: int = 6):
+        self.compression_level = compression_level
+        self.cache = LRUCache(cache_chars)
+        self._lock = threading.Lock()
+        self.stats = {
+            "puts": 0,
+            "dedup_hits": 0,
+            "cache_hits": 0,
+            "cache_misses": 0,
+            "raw_bytes": 0,
+            "stored_bytes": 0
+        }
+
+    def put(self, text: str) -> str:
+        """
+        Store a body (no-op if identical content already exists).
+
+        Returns:
+            Content hash referencing the body
+        """
+        key = content_hash(text)
+        with self._lock:
+            self.stats["puts"] += 1
+            if self.cache.get(key) is not None or self._exists(key):
+                self.stats["dedup_hits"] += 1
+            else:
+                raw = text.encode("utf-8")
+                data = zlib.compress(raw, self.compression_level)
+                self._write(key, data)
+                self.stats["raw_bytes"] += len(raw)
+                self.stats["stored_bytes"] += len(data)
+            self.cache.put(key, text)
+        return key
+
+    def get(self, key: str) -> str:
+        """
+        Load a body by hash.
+
+        Raises:
+            KeyError: If no blob exists for the hash
+        """
+        with self._lock:
+            text = self.cache.get(key)
+            if text is not None:
+                self.stats["cache_hits"] += 1
+                return text
+            self.stats["cache_misses"] += 1
+        data = self._read(key)
+        text = zlib.decompress(data).decode("utf-8")
+        with self._lock:
+            self.cache.put(key, text)
+        return text
+
+    def exists(self, key: str) -> bool:
+        """Whether a blob exists for the hash"""
+        return self._exists(key)
+
+    def _exists(self, key: str) -> bool:
+        raise NotImplementedError
+
+    def _write(self, key: str, data: bytes):
+        raise NotImplementedError
+
+    def _read(self, key: str) -> bytes:
+        raise NotImplementedError
+
+
+class MemoryBlobStore(BlobStore):
+    """Compressed blobs held in a process-local dict"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._blobs: Dict[str, bytes] = {}
+
+    def _exists(self, key: str) -> bool:
+        return key in self._blobs
+
+    def _write(self, key: str, data: bytes):
+        self._blobs[key] = data
+
+    def _read(self, key: str) -> bytes:
+        return self._blobs[key]
+
+
+class FileBlobStore(BlobStore):
+    """
+    Compressed blobs as immutable files (`<root>/ab/abcdef...`).
+
+    Writes go to a temp file and are renamed into place, so concurrent
+    workers writing the same content are safe.
+    """
+
+    def __init__(self, root: str, **kwargs):
+        super().__init__(**kwargs)
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / key
+
+    def _exists(self, key: str) -> bool:
+        return self._path(key).exists()
+
+    def _write(self, key: str, data: bytes):
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    def _read(self, key: str) -> bytes:
+        try:
+            return self._path(key).read_bytes()
+        except FileNotFoundError:
+            raise KeyError(key) from None
+
+
+def create_blob_store(backend: str = "memory", path: str = "data/blobs", cache_mb: int = 64) -> BlobStore:
+    """
+    Create the configured blob store.
+
+    Args:
+        backend: "memory" or "file"
+        path: Blob directory (file backend only)
+        cache_mb: LRU cache budget for hot bodies (millions of characters)
+    """
+    cache_chars = cache_mb * 1024 * 1024
+    if backend == "file":
+        return FileBlobStore(path, cache_chars=cache_chars)
+    if backend == "memory":
+        return MemoryBlobStore(cache_chars=cache_chars)
+    raise ValueError(f"Unknown blob backend: {backend}")
@@ -0,0 +1,327 @@
+"""
+RankSmart 2.0 - Columnar Analytics Snapshot
+
+A column-per-field snapshot of submissions, scores and annotations as NumPy
+arrays, saved as `.npy` files (memory-mapped on load), and the writer/team
+metrics of `WriterAnalysisAgent` computed as vectorized group-bys over it.
+
+Rows are submissions; writers and annotations are integer-coded:
+
+- `writer`: index into `writer_ids` / `writer_names`
+- `status`: index into `SubmissionStatus`
+- score columns: -1 for unscored submissions
+- `annotation_row` / `annotation_slot`: one entry per annotation, the
+  submission row and its `issues.slot` (issue type x severity)
+"""
+
+import json
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from src.core.issues import SLOTS, slot, top_issues
+from src.core.schemas import ContentSubmission, SubmissionStatus, WriterProgress, WriterSkillArea
+from src.core.trends import SKILL_COLUMNS, pad_groups, writer_trends
+
+
+SNAPSHOT_VERSION = 1
+
+STATUSES: Tuple[SubmissionStatus, ...] = tuple(SubmissionStatus)
+_STATUS_CODE = {status: i for i, status in enumerate(STATUSES)}
+
+SCORE_COLUMNS = ("overall_score",) + tuple(column for _, column in SKILL_COLUMNS)
+
+# Score trend length (`WriterProgress.score_trend`)
+TREND_LENGTH = 10
+
+NOT_A_TIME = np.datetime64("NaT", "us")
+
+
+class SubmissionColumns:
+    """
+    Columnar snapshot of submissions.
+
+    Args:
+        columns: Column name -> array (see module docstring)
+        writer_ids: Writer IDs by writer code
+        writer_names: Writer display names by writer code
+    """
+
+    COLUMNS = (
+        "submission_id", "writer", "status", "created_at", "reviewed_at",
+        *SCORE_COLUMNS, "annotation_row", "annotation_slot"
+    )
+
+    def __init__(self, columns: Dict[str, np.ndarray], writer_ids: List[str], writer_names: List[str]):
+        self.columns = columns
+        self.writer_ids = writer_ids
+        self.writer_names = writer_names
+
+    def __len__(self) -> int:
+        return len(self.columns["writer"])
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    @property
+    def nbytes(self) -> int:
+        """Size of all columns"""
+        return sum(column.nbytes for column in self.columns.values())
+
+    # ===================================
+    # Building and persistence
+    # ===================================
+
+    @classmethod
+    def from_submissions(cls, submissions: Iterable[ContentSubmission]) -> "SubmissionColumns":
+        """Snapshot submissions (metadata records are enough)"""
+        writer_codes: Dict[str, int] = {}
+        writer_names: List[str] = []
+        ids, writers, statuses, created, reviewed = [], [], [], [], []
+        scores: Dict[str, List[int]] = {column: [] for column in SCORE_COLUMNS}
+        annotation_rows, annotation_slots = [], []
+
+        for row, submission in enumerate(submissions):
+            code = writer_codes.get(submission.writer_id)
+            if code is None:
+                code = writer_codes[submission.writer_id] = len(writer_codes)
+                writer_names.append(submission.writer_name)
+            ids.append(submission.submission_id)
+            writers.append(code)
+            statuses.append(_STATUS_CODE[submission.status])
+            created.append(submission.created_at)
+            reviewed.append(submission.reviewed_at or NOT_A_TIME)
+            for column in SCORE_COLUMNS:
+                scores[column].append(getattr(submission.scores, column) if submission.scores else -1)
+            for annotation in submission.annotations:
+                annotation_rows.append(row)
+                annotation_slots.append(slot(annotation))
+
+        columns = {
+            "submission_id": np.array(ids, dtype=str),
+            "writer": np.array(writers, dtype=np.int32),
+            "status": np.array(statuses, dtype=np.int8),
+            "created_at": np.array(created, dtype="datetime64[us]"),
+            "reviewed_at": np.array(reviewed, dtype="datetime64[us]"),
+            **{column: np.array(values, dtype=np.int16) for column, values in scores.items()},
+            "annotation_row": np.array(annotation_rows, dtype=np.int32),
+            "annotation_slot": np.array(annotation_slots, dtype=np.int16)
+        }
+        return cls(columns, list(writer_codes), writer_names)
+
+    def save(self, path: str) -> Path:
+        """
+        Write the snapshot to a directory (one `.npy` per column plus
+        `meta.json`, written last so a snapshot without it is incomplete).
+        """
+        directory = Path(path)
+        directory.mkdir(parents=True, exist_ok=True)
+        for name in self.COLUMNS:
+            tmp = directory / f".{name}.npy.tmp"
+            with open(tmp, "wb") as f:
+                np.save(f, np.ascontiguousarray(self.columns[name]))
+            os.replace(tmp, directory / f"{name}.npy")
+
+        meta = {
+            "version": SNAPSHOT_VERSION,
+            "rows": len(self),
+            "annotations": len(self.columns["annotation_row"]),
+            "writer_ids": self.writer_ids,
+            "writer_names": self.writer_names,
+            "created_at": datetime.now().isoformat()
+        }
+        tmp = directory / ".meta.json.tmp"
+        tmp.write_text(json.dumps(meta), encoding="utf-8")
+        os.replace(tmp, directory / "meta.json")
+        return directory
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "SubmissionColumns":
+        """
+        Load a snapshot written by `save` (memory-mapped by default).
+
+        Raises:
+            FileNotFoundError: If there is no complete snapshot at `path`
+            ValueError: If the snapshot was written by another format version
+        """
+        directory = Path(path)
+        meta = json.loads((directory / "meta.json").read_text(encoding="utf-8"))
+        if meta.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version: {meta.get('version')}")
+        columns = {
+            name: np.load(directory / f"{name}.npy", mmap_mode="r" if mmap else None)
+            for name in cls.COLUMNS
+        }
+        return cls(columns, meta["writer_ids"], meta["writer_names"])
+
+    # ===================================
+    # Slicing
+    # ===================================
+
+    def between(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> "SubmissionColumns":
+        """Submissions created in [start, end) (writer codes are kept)"""
+        created = self.columns["created_at"]
+        mask = np.ones(len(self), dtype=bool)
+        if start is not None:
+            mask &= created >= np.datetime64(start, "us")
+        if end is not None:
+            mask &= created < np.datetime64(end, "us")
+
+        new_row = np.cumsum(mask) - 1
+        annotation_row = self.columns["annotation_row"]
+        kept = mask[annotation_row]
+        columns = {
+            name: np.asarray(column)[mask] for name, column in self.columns.items()
+            if not name.startswith("annotation_")
+        }
+        columns["annotation_row"] = new_row[annotation_row[kept]].astype(np.int32)
+        columns["annotation_slot"] = np.asarray(self.columns["annotation_slot"])[kept]
+        return SubmissionColumns(columns, self.writer_ids, self.writer_names)
+
+
+# ===================================
+# Vectorized metrics
+# ===================================
+
+def writer_progress(columns: SubmissionColumns) -> List[WriterProgress]:
+    """
+    `WriterAnalysisAgent.calculate_writer_progress` for every writer with
+    submissions in the snapshot, as group-bys over the columns.
+    """
+    n = len(columns)
+    writer_count = len(columns.writer_ids)
+    if n == 0:
+        return []
+
+    writer = np.asarray(columns["writer"])
+    overall = np.asarray(columns["overall_score"])
+    scored = overall >= 0
+
+    totals = np.bincount(writer, minlength=writer_count)
+    approved = np.bincount(writer[np.asarray(columns["status"]) == _STATUS_CODE[SubmissionStatus.APPROVED]], minlength=writer_count)
+    scored_counts = np.bincount(writer, weights=scored, minlength=writer_count)
+    score_sums = np.bincount(writer, weights=np.where(scored, overall, 0), minlength=writer_count)
+    averages = np.divide(score_sums, scored_counts, out=np.zeros(writer_count), where=scored_counts > 0)
+
+    # Rows grouped by writer, oldest first (stable, like sorted(..., key=created_at))
+    order, ends = _by_writer(columns, totals)
+    sorted_writer = writer[order]
+    sorted_scored = scored[order]
+    last_created = np.asarray(columns["created_at"])[order][np.maximum(ends - 1, 0)]
+
+    # Score trend: scored submissions among each writer's last TREND_LENGTH
+    in_trend = (ends[sorted_writer] - np.arange(n) <= TREND_LENGTH) & sorted_scored
+    trend_rows = order[in_trend]
+    trend_writer = sorted_writer[in_trend]
+    trend_lengths = np.bincount(trend_writer, minlength=writer_count)
+    trends = np.split(overall[trend_rows], np.cumsum(trend_lengths)[:-1])
+
+    # Every scored row per writer, oldest first, as padded trend matrices
+    scored_rows = order[sorted_scored]
+    scored_writer = sorted_writer[sorted_scored]
+    first_scored = np.searchsorted(scored_writer, np.arange(writer_count))
+    last_scored = np.searchsorted(scored_writer, np.arange(writer_count), side="right") - 1
+    has_scores = last_scored >= first_scored
+    history_positions = np.arange(len(scored_rows)) - first_scored[scored_writer]
+    trend_positions = np.arange(len(trend_rows)) - np.searchsorted(trend_writer, trend_writer)
+
+    def history(column: str):
+        values = np.asarray(columns[column])[scored_rows]
+        return pad_groups(scored_writer, history_positions, values, writer_count)
+
+    model = writer_trends(
+        pad_groups(trend_writer, trend_positions, overall[trend_rows], writer_count),
+        history("overall_score"),
+        {skill_name: history(column) for skill_name, column in SKILL_COLUMNS}
+    )
+    improvement_rates = model.improvement_rate.tolist()
+    smoothed_scores = model.smoothed_score.tolist()
+    skill_changes = {skill_name: np.round(change).astype(int).tolist() for skill_name, change in model.skill_improvement.items()}
+
+    skills = {}
+    for _, column in SKILL_COLUMNS:
+        values = np.asarray(columns[column])[scored_rows]
+        if len(values):
+            skills[column] = (
+                values[np.minimum(first_scored, len(values) - 1)].tolist(),
+                values[np.maximum(last_scored, 0)].tolist()
+            )
+    scored_counts_list = scored_counts.astype(int).tolist()
+
+    issue_counts = _writer_issue_counts(columns, writer_count)
+
+    progress = []
+    for code in np.flatnonzero(totals).tolist():
+        skill_areas = []
+        if has_scores[code]:
+            for skill_name, column in SKILL_COLUMNS:
+                initial, current = skills[column][0][code], skills[column][1][code]
+                skill_areas.append(WriterSkillArea(
+                    skill_name=skill_name,
+                    current_score=current,
+                    initial_score=initial,
+                    improvement=skill_changes[skill_name][code],
+                    articles_count=scored_counts_list[code]
+                ))
+        progress.append(WriterProgress(
+            writer_id=columns.writer_ids[code],
+            writer_name=columns.writer_names[code],
+            total_submissions=int(totals[code]),
+            approved_submissions=int(approved[code]),
+            average_score=round(float(averages[code]), 1),
+            score_trend=trends[code].tolist(),
+            skill_areas=skill_areas,
+            common_issues=top_issues(issue_counts[code].tolist(), 10),
+            improvement_rate=round(improvement_rates[code], 2),
+            smoothed_score=round(smoothed_scores[code], 1),
+            last_submission=last_created[code].item()
+        ))
+    return progress
+
+
+def team_metrics(columns: SubmissionColumns, now: Optional[datetime] = None) -> Dict[str, Any]:
+    """
+    Team-wide metrics of `TeamAnalytics` that come straight from the columns
+    (everything but the writer rankings).
+    """
+    now = now or datetime.now()
+    writer = np.asarray(columns["writer"])
+    created = np.asarray(columns["created_at"])
+    reviewed = np.asarray(columns["reviewed_at"])
+    overall = np.asarray(columns["overall_score"])
+
+    totals = np.bincount(writer, minlength=len(columns.writer_ids))
+    order, ends = _by_writer(columns, totals)
+    last_created = created[order][ends[totals > 0] - 1]
+    active = int(np.count_nonzero(last_created > np.datetime64(now - timedelta(days=30), "us")))
+
+    scores = overall[overall >= 0]
+    has_review = ~np.isnat(reviewed)
+    review_hours = (reviewed[has_review] - created[has_review]) / np.timedelta64(1, "h")
+    slots = np.bincount(np.asarray(columns["annotation_slot"]), minlength=SLOTS)
+
+    return {
+        "total_writers": int(np.count_nonzero(totals)),
+        "active_writers": active,
+        "total_submissions": len(columns),
+        "pending_review": int(np.count_nonzero(np.asarray(columns["status"]) == _STATUS_CODE[SubmissionStatus.PENDING_REVIEW])),
+        "average_team_score": round(float(scores.mean()), 1) if len(scores) else 0.0,
+        "common_team_issues": top_issues(slots.tolist(), 10),
+        "average_review_time": round(float(review_hours.mean()), 1) if len(review_hours) else 0.0
+    }
+
+
+def _by_writer(columns: SubmissionColumns, totals: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Row order grouped by writer, oldest first, and each writer's end offset in it"""
+    order = np.lexsort((np.asarray(columns["created_at"]), np.asarray(columns["writer"])))
+    return order, np.cumsum(totals)
+
+
+def _writer_issue_counts(columns: SubmissionColumns, writer_count: int) -> np.ndarray:
+    """(writers x issue slots) annotation counts"""
+    annotation_writer = np.asarray(columns["writer"])[np.asarray(columns["annotation_row"])].astype(np.int64)
+    flat = annotation_writer * SLOTS + np.asarray(columns["annotation_slot"])
+    return np.bincount(flat, minlength=writer_count * SLOTS).reshape(writer_count, SLOTS)
@@ -0,0 +1,367 @@
+"""
+RankSmart 2.0 - Image Generation Pipeline
+
+Async job queue from prompts to finished, web-ready images:
+
+1. Cache lookup: outputs are content-addressed by (generator, prompt, output
+   spec), so a prompt that was already rendered is served from disk.
+2. Generation: a bounded number of worker tasks call the image model;
+   identical prompts in flight share one generation (`SingleFlight`).
+3. Post-processing: resize/crop, format conversion and thumbnails with
+   Pillow, in a process pool so CPU-bound encoding never blocks the loop.
+
+Generators: Flux via fal (`FAL_API_KEY`), OpenAI images (`OPENAI_API_KEY`),
+or any object with `name` and `async generate(prompt, width, height)`.
+"""
+
+import asyncio
+import base64
+import hashlib
+import io
+import json
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import httpx
+
+from src.core.schemas import GeneratedImage, OptimizationResult
+from src.core.singleflight import SingleFlight
+
+
+# Bump when post-processing output changes, so cached files are regenerated
+PIPELINE_VERSION = 1
+
+FORMAT_EXTENSIONS = {"WEBP": "webp", "JPEG": "jpg", "PNG": "png"}
+
+
+class ImageSpec(NamedTuple):
+    """Post-processing output specification"""
+    width: int = 1200
+    height: int = 630
+    thumbnail_width: int = 400
+    format: str = "WEBP"
+    quality: int = 85
+
+    @property
+    def extension(self) -> str:
+        return FORMAT_EXTENSIONS[self.format]
+
+
+# ===================================
+# Generators
+# ===================================
+
+class ImageGenerator:
+    """An image model: prompt in, encoded image bytes out"""
+
+    name = "generator"
+
+    async def generate(self, prompt: str, width: int, height: int) -> bytes:
+        raise NotImplementedError
+
+    async def aclose(self):
+        """Release connections"""
+
+
+class FalImageGenerator(ImageGenerator):
+    """
+    Flux on fal.ai (synchronous `fal.run` endpoint).
+
+    Args:
+        api_key: fal API key
+        model: fal model path
+        timeout_s: Request timeout (generation included)
+    """
+
+    def __init__(self, api_key: str, model: str = "fal-ai/flux/schnell", timeout_s: float = 120.0):
+        self.name = f"fal:{model}"
+        self.url = f"https://fal.run/{model}"
+        self._client = httpx.AsyncClient(timeout=timeout_s, headers={"Authorization": f"Key {api_key}"})
+
+    async def generate(self, prompt: str, width: int, height: int) -> bytes:
+        response = await self._client.post(
+            self.url, json={"prompt": prompt, "image_size": {"width": width, "height": height}, "num_images": 1}
+        )
+        response.raise_for_status()
+        image = await self._client.get(response.json()["images"][0]["url"])
+        image.raise_for_status()
+        return image.content
+
+    async def aclose(self):
+        await self._client.aclose()
+
+
+class OpenAIImageGenerator(ImageGenerator):
+    """
+    OpenAI images API (the closest supported size; post-processing crops to spec).
+
+    Args:
+        api_key: OpenAI API key
+        model: Image model
+        timeout_s: Request timeout (generation included)
+    """
+
+    SIZES = ((1024, 1024), (1792, 1024), (1024, 1792))
+
+    def __init__(self, api_key: str, model: str = "dall-e-3", timeout_s: float = 120.0):
+        self.name = f"openai:{model}"
+        self.model = model
+        self._client = httpx.AsyncClient(timeout=timeout_s, headers={"Authorization": f"Bearer {api_key}"})
+
+    async def generate(self, prompt: str, width: int, height: int) -> bytes:
+        size = min(self.SIZES, key=lambda s: abs(s[0] / s[1] - width / height))
+        response = await self._client.post(
+            "https://api.openai.com/v1/images/generations",
+            json={"model": self.model, "prompt": prompt, "size": f"{size[0]}x{size[1]}", "response_format": "b64_json"}
+        )
+        response.raise_for_status()
+        return base64.b64decode(response.json()["data"][0]["b64_json"])
+
+    async def aclose(self):
+        await self._client.aclose()
+
+
+# ===================================
+# Post-processing (runs in worker processes)
+# ===================================
+
+def process_image(data: bytes, spec: ImageSpec, target: str) -> Tuple[int, int]:
+    """
+    Crop/resize to the spec, encode, and write `{target}.{ext}` and
+    `{target}-thumb.{ext}` (atomically).
+
+    Returns:
+        (image size, thumbnail size) in bytes
+    """
+    from PIL import Image, ImageOps
+
+    with Image.open(io.BytesIO(data)) as source:
+        image = ImageOps.exif_transpose(source)
+        has_alpha = image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info)
+        image = image.convert("RGBA" if has_alpha and spec.format != "JPEG" else "RGB")
+
+        main = ImageOps.fit(image, (spec.width, spec.height), Image.Resampling.LANCZOS)
+        thumbnail_size = (spec.thumbnail_width, max(1, round(spec.thumbnail_width * spec.height / spec.width)))
+        thumbnail = main.resize(thumbnail_size, Image.Resampling.LANCZOS)
+
+    sizes = []
+    for picture, path in ((main, f"{target}.{spec.extension}"), (thumbnail, f"{target}-thumb.{spec.extension}")):
+        buffer = io.BytesIO()
+        options = {"optimize": True} if spec.format == "PNG" else {"quality": spec.quality}
+        picture.save(buffer, spec.format, **options)
+        _write_atomic(path, buffer.getvalue())
+        sizes.append(buffer.tell())
+    return sizes[0], sizes[1]
+
+
+def _write_atomic(path: str, data: bytes):
+    fd, temp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temp, path)
+    except BaseException:
+        os.unlink(temp)
+        raise
+
+
+# ===================================
+# Content-addressed cache
+# ===================================
+
+class ImageCache:
+    """
+    Finished images on disk, keyed by generator, prompt and output spec.
+
+    Layout: `{directory}/{key[:2]}/{key}.{ext}`, `{key}-thumb.{ext}` and a
+    `{key}.json` manifest written last (its presence marks a complete entry).
+
+    Args:
+        directory: Cache root (served under `base_url`)
+        base_url: URL prefix of the cache root
+    """
+
+    def __init__(self, directory: str, base_url: str = "/images"):
+        self.directory = Path(directory)
+        self.base_url = base_url.rstrip("/")
+
+    @staticmethod
+    def key(generator: str, prompt: str, spec: ImageSpec) -> str:
+        identity = json.dumps([PIPELINE_VERSION, generator, " ".join(prompt.split()), list(spec)])
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+    def target(self, key: str) -> str:
+        """Path prefix for an entry's files (directory created)"""
+        shard = self.directory / key[:2]
+        shard.mkdir(parents=True, exist_ok=True)
+        return str(shard / key)
+
+    def url(self, key: str, suffix: str = "") -> str:
+        return f"{self.base_url}/{key[:2]}/{key}{suffix}"
+
+    def get(self, key: str) -> Optional[GeneratedImage]:
+        try:
+            manifest = (self.directory / key[:2] / f"{key}.json").read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        return GeneratedImage.model_validate_json(manifest).model_copy(update={"cached": True})
+
+    def put(self, image: GeneratedImage):
+        _write_atomic(f"{self.target(image.key)}.json", image.model_dump_json().encode("utf-8"))
+
+
+# ===================================
+# Pipeline
+# ===================================
+
+class ImagePipeline:
+    """
+    Async image job queue.
+
+    Use as an async context manager (workers and the process pool live
+    inside it), then `submit` prompts or `generate` a batch.
+
+    Args:
+        generator: Image model
+        cache: Output cache
+        spec: Default output spec
+        concurrency: Generations in flight at once (worker tasks)
+        max_queue: Jobs waiting for a worker before `submit` waits
+        process_workers: Post-processing processes (None: CPU count)
+    """
+
+    def __init__(
+        self,
+        generator: ImageGenerator,
+        cache: ImageCache,
+        spec: ImageSpec = ImageSpec(),
+        concurrency: int = 4,
+        max_queue: int = 100,
+        process_workers: Optional[int] = None
+    ):
+        self.generator = generator
+        self.cache = cache
+        self.spec = spec
+        self.concurrency = max(1, concurrency)
+        self.max_queue = max_queue
+        self.process_workers = process_workers
+        self._counts = {"generated": 0, "cache_hits": 0, "failed": 0}
+        self._flights = SingleFlight()
+        self._queue: Optional["asyncio.Queue[Optional[Tuple[str, ImageSpec, asyncio.Future]]]"] = None
+        self._workers: List[asyncio.Task] = []
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Generations, cache hits, prompts that joined an in-flight generation, failures"""
+        return {**self._counts, "coalesced": self._flights.stats["coalesced"]}
+
+    async def __aenter__(self) -> "ImagePipeline":
+        self._queue = asyncio.Queue(self.max_queue)
+        self._pool = ProcessPoolExecutor(self.process_workers)
+        self._workers = [asyncio.create_task(self._work()) for _ in range(self.concurrency)]
+        return self
+
+    async def __aexit__(self, *exc_info):
+        for _ in self._workers:
+            await self._queue.put(None)
+        await asyncio.gather(*self._workers)
+        self._workers = []
+        self._pool.shutdown()
+        await self.generator.aclose()
+
+    async def submit(self, prompt: str, spec: Optional[ImageSpec] = None) -> "asyncio.Future[GeneratedImage]":
+        """
+        Queue a prompt (waits while the queue is full).
+
+        Returns:
+            Future resolving to the GeneratedImage (or the generation error)
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((prompt, spec or self.spec, future))
+        return future
+
+    async def generate(self, prompts: List[str], spec: Optional[ImageSpec] = None) -> List[GeneratedImage]:
+        """Generate a batch; results are in prompt order (raises the first failure)"""
+        futures = [await self.submit(prompt, spec) for prompt in prompts]
+        return list(await asyncio.gather(*futures))
+
+    async def add_images(self, result: OptimizationResult, prompts: List[str]) -> OptimizationResult:
+        """Generate images for an optimization and record them on the result"""
+        images = await self.generate(prompts)
+        result.images.extend(images)
+        result.images_generated.extend(image.url for image in images)
+        return result
+
+    async def _work(self):
+        while True:
+            job = await self._queue.get()
+            if job is None:
+                return
+            prompt, spec, future = job
+            try:
+                image = await self._image(prompt, spec)
+            except Exception as e:
+                self._counts["failed"] += 1
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(image)
+
+    async def _image(self, prompt: str, spec: ImageSpec) -> GeneratedImage:
+        key = ImageCache.key(self.generator.name, prompt, spec)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self._counts["cache_hits"] += 1
+            return cached.model_copy(update={"prompt": prompt})
+        image = await self._flights.do(key, lambda: self._render(key, prompt, spec))
+        return image.model_copy(update={"prompt": prompt})
+
+    async def _render(self, key: str, prompt: str, spec: ImageSpec) -> GeneratedImage:
+        data = await self.generator.generate(prompt, spec.width, spec.height)
+        self._counts["generated"] += 1
+        loop = asyncio.get_running_loop()
+        size, thumbnail_size = await loop.run_in_executor(self._pool, process_image, data, spec, self.cache.target(key))
+        image = GeneratedImage(
+            prompt=prompt,
+            key=key,
+            url=self.cache.url(key, f".{spec.extension}"),
+            thumbnail_url=self.cache.url(key, f"-thumb.{spec.extension}"),
+            width=spec.width,
+            height=spec.height,
+            format=spec.format,
+            size_bytes=size,
+            thumbnail_size_bytes=thumbnail_size
+        )
+        self.cache.put(image)
+        return image
+
+
+def create_image_pipeline(generator: Optional[ImageGenerator] = None) -> Optional[ImagePipeline]:
+    """
+    Pipeline from the configuration (None when image generation is disabled
+    or no image API key is set and no generator is given).
+    """
+    from src.config import get_config
+    config = get_config()
+    if not config.features.enable_image_generation:
+        return None
+    if generator is None:
+        if config.api.fal_api_key:
+            generator = FalImageGenerator(config.api.fal_api_key)
+        elif config.api.openai_api_key:
+            generator = OpenAIImageGenerator(config.api.openai_api_key)
+        else:
+            return None
+    settings = config.images
+    return ImagePipeline(
+        generator,
+        ImageCache(settings.output_dir, settings.base_url),
+        ImageSpec(settings.width, settings.height, settings.thumbnail_width, settings.format, settings.quality),
+        concurrency=settings.concurrency,
+        process_workers=settings.process_workers
+    )
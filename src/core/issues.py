@@ -0,0 +1,229 @@
+"""
+RankSmart 2.0 - Issue Taxonomy
+
+Maps free-text issue annotations onto a fixed taxonomy of issue types (each
+with an `IssueCategory`), and keeps issue frequencies as integer count
+arrays indexed by `(issue type, severity)`.
+
+Explanations repeat heavily (the same model phrasing shows up across
+thousands of reviews), so classification is memoized per explanation and
+counting is an array increment rather than a dict of ad-hoc string keys.
+Per-writer and team counts follow a `SubmissionStore` through change
+notifications, like the search and listing indexes.
+"""
+
+import heapq
+import re
+import threading
+from array import array
+from typing import Any, Dict, Iterable, List, NamedTuple, Tuple
+
+from src.core.schemas import ContentSubmission, IssueAnnotation, IssueCategory, IssueSeverity
+from src.core.storage import StoreFollower
+
+
+class IssueType(NamedTuple):
+    """One entry of the taxonomy"""
+    key: str
+    label: str
+    category: IssueCategory
+    keywords: Tuple[str, ...]
+
+
+# Checked in order; the first type with a keyword in the explanation's title wins
+ISSUE_TYPES: Tuple[IssueType, ...] = (
+    IssueType("responsible_gambling", "Responsible gambling", IssueCategory.COMPLIANCE,
+              ("responsible gambling", "gambling notice", "18+", "age restriction", "self-exclusion", "gamcare", "problem gambling")),
+    IssueType("bonus_terms", "Bonus terms", IssueCategory.COMPLIANCE,
+              ("wagering", "bonus", "terms and conditions", "t&c", "promotion")),
+    IssueType("unsupported_claims", "Unsupported claims", IssueCategory.COMPLIANCE,
+              ("unsupported", "claim", "evidence", "misleading", "guarantee", "exaggerat")),
+    IssueType("licensing", "Licensing", IssueCategory.COMPLIANCE,
+              ("licen", "regulat", "jurisdiction", "legal")),
+    IssueType("author_expertise", "Author expertise", IssueCategory.CONTENT,
+              ("author", "bio", "expertise", "experience", "credential", "e-e-a-t", "eeat")),
+    IssueType("thin_content", "Thin content", IssueCategory.CONTENT,
+              ("thin", "word count", "too short", "depth", "expand", "detail")),
+    IssueType("outdated_information", "Outdated information", IssueCategory.CONTENT,
+              ("outdated", "out of date", "stale", "update")),
+    IssueType("call_to_action", "Call to action", IssueCategory.CONTENT,
+              ("call to action", "cta")),
+    IssueType("readability", "Readability", IssueCategory.CONTENT,
+              ("readab", "sentence", "passive", "grammar", "spelling", "tone", "jargon")),
+    IssueType("keyword_usage", "Keyword usage", IssueCategory.TECHNICAL,
+              ("keyword",)),
+    IssueType("meta_tags", "Meta tags", IssueCategory.META,
+              ("meta", "title tag", "description", "canonical", "schema")),
+    IssueType("headings", "Headings", IssueCategory.STRUCTURE,
+              ("heading", "h1", "h2", "h3", "subheading")),
+    IssueType("internal_links", "Internal links", IssueCategory.STRUCTURE,
+              ("internal link", "link")),
+    IssueType("images", "Images", IssueCategory.TECHNICAL,
+              ("image", "alt text", "alt attribute")),
+    IssueType("page_performance", "Page performance", IssueCategory.PERFORMANCE,
+              ("speed", "load time", "performance", "core web vitals")),
+    IssueType("other", "Other", IssueCategory.CONTENT, ()),
+)
+
+OTHER = len(ISSUE_TYPES) - 1
+
+SEVERITIES: Tuple[IssueSeverity, ...] = tuple(IssueSeverity)
+_SEVERITY_INDEX = {severity: i for i, severity in enumerate(SEVERITIES)}
+
+# Length of a count array: one slot per (issue type, severity)
+SLOTS = len(ISSUE_TYPES) * len(SEVERITIES)
+
+# Memoized explanations before the classifier cache is reset
+CLASSIFIER_CACHE_SIZE = 65536
+
+_WORD_RE = re.compile(r"\s+")
+
+# Keywords match at word starts, so stems ("licen", "regulat") cover their variants
+_PATTERNS = [
+    re.compile(r"\b(?:" + "|".join(re.escape(k) for k in t.keywords) + ")") if t.keywords else None
+    for t in ISSUE_TYPES
+]
+
+
+def _normalize_title(explanation: str) -> str:
+    title = explanation.split(":", 1)[0] if ":" in explanation else explanation[:80]
+    return _WORD_RE.sub(" ", title.lower()).strip()
+
+
+_classified: Dict[str, int] = {}
+_classified_lock = threading.Lock()
+
+
+def classify(explanation: str) -> int:
+    """
+    Issue type index of an annotation explanation.
+
+    The title (text before the first ':') is matched first, then the whole
+    explanation; anything unmatched is "other".
+    """
+    type_id = _classified.get(explanation)
+    if type_id is not None:
+        return type_id
+
+    type_id = OTHER
+    for text in (_normalize_title(explanation), explanation.lower()):
+        type_id = next((i for i, p in enumerate(_PATTERNS) if p is not None and p.search(text)), OTHER)
+        if type_id != OTHER:
+            break
+
+    with _classified_lock:
+        if len(_classified) >= CLASSIFIER_CACHE_SIZE:
+            _classified.clear()
+        _classified[explanation] = type_id
+    return type_id
+
+
+def slot(annotation: IssueAnnotation) -> int:
+    """Count-array slot of an annotation"""
+    return classify(annotation.explanation) * len(SEVERITIES) + _SEVERITY_INDEX[annotation.severity]
+
+
+def new_counts() -> array:
+    """Zeroed count array"""
+    return array("q", bytes(8 * SLOTS))
+
+
+def count_issues(submissions: Iterable[ContentSubmission]) -> array:
+    """Count array over every annotation of `submissions`"""
+    counts = new_counts()
+    for submission in submissions:
+        for annotation in submission.annotations:
+            counts[slot(annotation)] += 1
+    return counts
+
+
+def type_totals(counts: array) -> List[int]:
+    """Per-issue-type totals (all severities) of a count array"""
+    width = len(SEVERITIES)
+    return [sum(counts[i:i + width]) for i in range(0, SLOTS, width)]
+
+
+def top_issues(counts: array, k: int = 10) -> Dict[str, int]:
+    """The `k` most frequent issue types as {label: count}"""
+    totals = type_totals(counts)
+    best = heapq.nlargest(k, ((n, -i) for i, n in enumerate(totals) if n))
+    return {ISSUE_TYPES[-i].label: n for n, i in best}
+
+
+def breakdown(counts: array) -> List[Dict[str, Any]]:
+    """Per-issue-type counts with category and severity split, most frequent first"""
+    width = len(SEVERITIES)
+    result = []
+    for i, issue_type in enumerate(ISSUE_TYPES):
+        by_severity = counts[i * width:(i + 1) * width]
+        total = sum(by_severity)
+        if total:
+            result.append({
+                "issue_type": issue_type.key,
+                "label": issue_type.label,
+                "category": issue_type.category.value,
+                "count": total,
+                "by_severity": {severity.value: n for severity, n in zip(SEVERITIES, by_severity)}
+            })
+    result.sort(key=lambda entry: -entry["count"])
+    return result
+
+
+class IssueStats(StoreFollower):
+    """Per-writer and team issue count arrays for a store's submissions"""
+
+    def __init__(self):
+        super().__init__()
+        self._team = new_counts()
+        self._writers: Dict[str, array] = {}
+        self._slots: Dict[str, Tuple[str, Tuple[int, ...]]] = {}
+
+    # ===================================
+    # Maintenance
+    # ===================================
+
+    def _count(self, writer_id: str, slots: Tuple[int, ...], sign: int):
+        writer = self._writers.get(writer_id)
+        if writer is None:
+            writer = self._writers[writer_id] = new_counts()
+        for i in slots:
+            self._team[i] += sign
+            writer[i] += sign
+        if sign < 0 and not any(writer):
+            del self._writers[writer_id]
+
+    def add(self, submission: ContentSubmission):
+        """Count (or re-count) a submission's annotations"""
+        entry = (submission.writer_id, tuple(slot(a) for a in submission.annotations))
+        with self._lock:
+            previous = self._slots.get(submission.submission_id)
+            if previous == entry:
+                return
+            if previous is not None:
+                self._count(*previous, -1)
+            self._slots[submission.submission_id] = entry
+            self._count(*entry, 1)
+
+    def remove(self, submission_id: str):
+        """Retract a submission (no-op if absent)"""
+        with self._lock:
+            previous = self._slots.pop(submission_id, None)
+            if previous is not None:
+                self._count(*previous, -1)
+
+    # ===================================
+    # Reads
+    # ===================================
+
+    def team_counts(self) -> array:
+        """Copy of the team count array"""
+        self.refresh()
+        with self._lock:
+            return array("q", self._team)
+
+    def writer_counts(self, writer_id: str) -> array:
+        """Copy of a writer's count array (zeros for unknown writers)"""
+        self.refresh()
+        with self._lock:
+            counts = self._writers.get(writer_id)
+            return array("q", counts) if counts is not None else new_counts()
@@ -0,0 +1,164 @@
+"""
+RankSmart 2.0 - Writer Leaderboards
+
+Per-writer aggregates (`WriterProgress` plus per-skill averages) kept up to
+date from store change notifications, and sorted leaderboards over them.
+
+A change only recomputes the writers it touches; each board is a sorted
+list of `(-value, writer_id)`, so reading the top K (or any page of it) is
+a slice rather than a sort of every writer.
+"""
+
+from bisect import bisect_left, insort
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from src.core.schemas import ContentSubmission, WriterProgress
+from src.core.storage import StoreFollower
+
+
+# Computes a writer's progress from their submissions (`WriterAnalysisAgent.calculate_writer_progress`)
+ProgressFn = Callable[[str, str, List[ContentSubmission]], WriterProgress]
+
+# Board name -> value field reported in its entries
+BOARDS: Dict[str, str] = {
+    "average_score": "average_score",
+    "improvement_rate": "improvement_rate",
+    "seo": "seo_score",
+    "eeat": "eeat_score",
+    "quality": "content_quality",
+    "compliance": "compliance_score"
+}
+
+SKILL_BOARDS = ("seo", "eeat", "quality", "compliance")
+
+
+def writer_values(progress: WriterProgress, submissions: List[ContentSubmission]) -> Dict[str, float]:
+    """
+    Board values for one writer (boards they don't qualify for are omitted).
+
+    - average_score: every writer
+    - improvement_rate: writers who are improving (rate > 0)
+    - skill boards: writers with reviewed submissions (average skill score)
+    """
+    values = {"average_score": progress.average_score}
+    if progress.improvement_rate > 0:
+        values["improvement_rate"] = progress.improvement_rate
+    scored = [s.scores for s in submissions if s.scores]
+    if scored:
+        for board in SKILL_BOARDS:
+            field = BOARDS[board]
+            values[board] = round(sum(getattr(scores, field) for scores in scored) / len(scored), 1)
+    return values
+
+
+class Leaderboards(StoreFollower):
+    """
+    Maintained writer aggregates and leaderboards.
+
+    Args:
+        progress_fn: Computes a writer's progress from their submissions
+        size: K - how many ranks each board exposes
+    """
+
+    def __init__(self, progress_fn: ProgressFn, size: int = 100):
+        self.progress_fn = progress_fn
+        self.size = size
+        super().__init__()
+        self._progress: Dict[str, WriterProgress] = {}
+        self._values: Dict[str, Dict[str, float]] = {}
+        self._boards: Dict[str, List[Tuple[float, str]]] = {board: [] for board in BOARDS}
+        self._writer_of: Dict[str, str] = {}
+
+    # ===================================
+    # Maintenance
+    # ===================================
+
+    def update_writer(self, writer_id: str, submissions: List[ContentSubmission]):
+        """Recompute one writer's aggregates (removes the writer if `submissions` is empty)"""
+        with self._lock:
+            for board, value in self._values.pop(writer_id, {}).items():
+                entries = self._boards[board]
+                del entries[bisect_left(entries, (-value, writer_id))]
+            self._progress.pop(writer_id, None)
+            if not submissions:
+                return
+
+            progress = self.progress_fn(writer_id, submissions[0].writer_name, submissions)
+            values = writer_values(progress, submissions)
+            self._progress[writer_id] = progress
+            self._values[writer_id] = values
+            for board, value in values.items():
+                insort(self._boards[board], (-value, writer_id))
+
+    def _load(self, submissions: List[ContentSubmission]):
+        writers: Dict[str, List[ContentSubmission]] = {}
+        for submission in submissions:
+            writers.setdefault(submission.writer_id, []).append(submission)
+            self._writer_of[submission.submission_id] = submission.writer_id
+        for writer_id, writer_submissions in writers.items():
+            self.update_writer(writer_id, writer_submissions)
+
+    def _apply(self, dirty_ids: Set[str]):
+        """Re-aggregate the writers whose submissions changed"""
+        writers: Set[str] = set()
+        for submission_id in dirty_ids:
+            previous = self._writer_of.pop(submission_id, None)
+            if previous is not None:
+                writers.add(previous)
+            record = self._store.get_record(submission_id)
+            if record is not None:
+                self._writer_of[submission_id] = record.writer_id
+                writers.add(record.writer_id)
+        for writer_id in writers:
+            self.update_writer(writer_id, self._store.by_writer(writer_id))
+
+    # ===================================
+    # Reads
+    # ===================================
+
+    def progress(self, writer_id: str) -> Optional[WriterProgress]:
+        """A writer's current progress"""
+        self.refresh()
+        return self._progress.get(writer_id)
+
+    def writers(self) -> List[WriterProgress]:
+        """Current progress of every writer"""
+        self.refresh()
+        with self._lock:
+            return list(self._progress.values())
+
+    def page(self, board: str, offset: int = 0, limit: int = 10) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        A page of a leaderboard (ranks beyond `size` are not exposed).
+
+        Returns:
+            (entries best first, number of ranked writers up to `size`)
+
+        Raises:
+            KeyError: If the board doesn't exist
+        """
+        field = BOARDS[board]
+        self.refresh()
+        with self._lock:
+            entries = self._boards[board]
+            total = min(len(entries), self.size)
+            end = min(offset + limit, total)
+            result = []
+            for rank in range(offset, end):
+                value, writer_id = entries[rank]
+                progress = self._progress[writer_id]
+                result.append({
+                    "rank": rank + 1,
+                    "writer_id": writer_id,
+                    "writer_name": progress.writer_name,
+                    field: -value,
+                    "total_submissions": progress.total_submissions
+                })
+            return result, total
+
+    def top(self, board: str, k: int) -> List[Dict[str, Any]]:
+        """Top `k` entries of a board, in `TeamAnalytics` leader format"""
+        entries, _ = self.page(board, 0, k)
+        for entry in entries:
+            del entry["rank"]
+        return entries
@@ -0,0 +1,258 @@
+"""
+RankSmart 2.0 - Submission Listing Index
+
+Sorted in-memory indexes for keyset pagination over
+`(created_at, submission_id)`. Every filterable value keeps its own list of
+keys in that order, so a page is a bisect to the cursor plus a merge of the
+lists matching the most selective filter: deep pages cost the same as the
+first one.
+
+Like the search index, it follows a `SubmissionStore` through change
+notifications and only ever reads metadata records.
+"""
+
+import base64
+import heapq
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from src.core.schemas import ContentSubmission
+from src.core.storage import StoreFollower
+
+
+# (created_at timestamp, submission_id)
+Key = Tuple[float, str]
+
+# Submission ID upper bound for range keys
+MAX_ID = "\U0010ffff"
+
+
+class Entry(NamedTuple):
+    """Indexed metadata of one submission"""
+    key: Key
+    status: str
+    writer_id: str
+    manager_id: Optional[str]
+    score: Optional[int]
+    revisions: int
+
+
+class ListingQuery(NamedTuple):
+    """Filters for one page (None = unfiltered)"""
+    status: Optional[str] = None
+    writer_id: Optional[str] = None
+    manager_id: Optional[str] = None
+    min_score: Optional[int] = None
+    max_score: Optional[int] = None
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
+    min_revisions: Optional[int] = None
+    max_revisions: Optional[int] = None
+
+
+# Fields with per-value key lists
+BUCKET_FIELDS = ("status", "writer_id", "manager_id", "score", "revisions")
+
+
+def encode_cursor(key: Key) -> str:
+    """Opaque cursor for the last item of a page"""
+    return base64.urlsafe_b64encode(f"{key[0]!r}|{key[1]}".encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Key:
+    """
+    Parse a cursor from `encode_cursor`.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        timestamp, _, submission_id = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8").partition("|")
+        return float(timestamp), submission_id
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def make_entry(submission: ContentSubmission) -> Entry:
+    """Index entry for a (metadata-only) submission record"""
+    return Entry(
+        key=(submission.created_at.timestamp(), submission.submission_id),
+        status=submission.status.value,
+        writer_id=submission.writer_id,
+        manager_id=submission.manager_id,
+        score=submission.scores.overall_score if submission.scores else None,
+        revisions=submission.revision_count
+    )
+
+
+class SubmissionListIndex(StoreFollower):
+    """Keyset-paginated, filterable view of the store's submissions"""
+
+    def __init__(self):
+        super().__init__()
+        self._entries: Dict[str, Entry] = {}
+        self._all: List[Key] = []
+        self._buckets: Dict[str, Dict[Any, List[Key]]] = {field: {} for field in BUCKET_FIELDS}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ===================================
+    # Maintenance
+    # ===================================
+
+    def add(self, submission: ContentSubmission):
+        """Index (or re-index) a submission"""
+        entry = make_entry(submission)
+        with self._lock:
+            if self._entries.get(submission.submission_id) == entry:
+                return
+            self.remove(submission.submission_id)
+            self._entries[submission.submission_id] = entry
+            insort(self._all, entry.key)
+            for field in BUCKET_FIELDS:
+                insort(self._buckets[field].setdefault(getattr(entry, field), []), entry.key)
+
+    def remove(self, submission_id: str):
+        """Drop a submission (no-op if absent)"""
+        with self._lock:
+            entry = self._entries.pop(submission_id, None)
+            if entry is None:
+                return
+            _discard(self._all, entry.key)
+            for field in BUCKET_FIELDS:
+                buckets = self._buckets[field]
+                value = getattr(entry, field)
+                _discard(buckets[value], entry.key)
+                if not buckets[value]:
+                    del buckets[value]
+
+    def _load(self, submissions: List[ContentSubmission]):
+        # Bulk build: sort once instead of inserting entry by entry
+        entries = [make_entry(s) for s in submissions]
+        self._entries = {entry.key[1]: entry for entry in entries}
+        self._all = sorted(entry.key for entry in entries)
+        self._buckets = {field: {} for field in BUCKET_FIELDS}
+        for entry in entries:
+            for field in BUCKET_FIELDS:
+                self._buckets[field].setdefault(getattr(entry, field), []).append(entry.key)
+        for buckets in self._buckets.values():
+            for keys in buckets.values():
+                keys.sort()
+
+    # ===================================
+    # Querying
+    # ===================================
+
+    def _candidate_lists(self, query: ListingQuery) -> List[List[Key]]:
+        """Key lists for the most selective filter (all keys if unfiltered)"""
+        options: List[List[List[Key]]] = []
+        for field in ("status", "writer_id", "manager_id"):
+            value = getattr(query, field)
+            if value is not None:
+                options.append([self._buckets[field].get(value, [])])
+        for field, low, high in (
+            ("score", query.min_score, query.max_score),
+            ("revisions", query.min_revisions, query.max_revisions)
+        ):
+            if low is not None or high is not None:
+                options.append([
+                    keys for value, keys in self._buckets[field].items()
+                    if value is not None and (low is None or value >= low) and (high is None or value <= high)
+                ])
+        if not options:
+            return [self._all]
+        return min(options, key=lambda lists: sum(len(keys) for keys in lists))
+
+    def _matches(self, query: ListingQuery) -> Callable[[Entry], bool]:
+        def matches(entry: Entry) -> bool:
+            if query.status is not None and entry.status != query.status:
+                return False
+            if query.writer_id is not None and entry.writer_id != query.writer_id:
+                return False
+            if query.manager_id is not None and entry.manager_id != query.manager_id:
+                return False
+            if query.min_score is not None or query.max_score is not None:
+                if entry.score is None:
+                    return False
+                if query.min_score is not None and entry.score < query.min_score:
+                    return False
+                if query.max_score is not None and entry.score > query.max_score:
+                    return False
+            if query.min_revisions is not None and entry.revisions < query.min_revisions:
+                return False
+            if query.max_revisions is not None and entry.revisions > query.max_revisions:
+                return False
+            return True
+        return matches
+
+    def page(
+        self,
+        query: ListingQuery = ListingQuery(),
+        cursor: Optional[str] = None,
+        limit: int = 20,
+        descending: bool = True
+    ) -> Tuple[List[str], Optional[str]]:
+        """
+        One page of submission IDs.
+
+        Args:
+            query: Filters
+            cursor: `next_cursor` of the previous page
+            limit: Page size
+            descending: Newest first (default) or oldest first
+
+        Returns:
+            (submission IDs, cursor for the next page or None on the last page)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        after = decode_cursor(cursor) if cursor else None
+        low: Key = (query.created_from.timestamp(), "") if query.created_from else (float("-inf"), "")
+        high: Key = (query.created_to.timestamp(), MAX_ID) if query.created_to else (float("inf"), MAX_ID)
+        if after is not None:
+            if descending:
+                high = min(high, after)
+            else:
+                low = max(low, after)
+
+        self.refresh()
+        with self._lock:
+            iterators = [
+                _walk(keys, low, high, descending, exclusive=after is not None)
+                for keys in self._candidate_lists(query)
+            ]
+            merged = heapq.merge(*iterators, reverse=descending)
+            matches = self._matches(query)
+            entries = self._entries
+            result: List[Key] = []
+            for key in merged:
+                if matches(entries[key[1]]):
+                    result.append(key)
+                    if len(result) > limit:
+                        break
+
+        next_cursor = encode_cursor(result[limit - 1]) if len(result) > limit else None
+        return [key[1] for key in result[:limit]], next_cursor
+
+
+def _walk(keys: List[Key], low: Key, high: Key, descending: bool, exclusive: bool) -> Iterator[Key]:
+    """Keys within [low, high] in order; the cursor end of the range is exclusive when paging"""
+    if descending:
+        start = bisect_left(keys, high) if exclusive else bisect_right(keys, high)
+        stop = bisect_left(keys, low)
+        for i in range(start - 1, stop - 1, -1):
+            yield keys[i]
+    else:
+        start = bisect_right(keys, low) if exclusive else bisect_left(keys, low)
+        stop = bisect_right(keys, high)
+        for i in range(start, stop):
+            yield keys[i]
+
+
+def _discard(keys: List[Key], key: Key):
+    index = bisect_left(keys, key)
+    if index < len(keys) and keys[index] == key:
+        del keys[index]
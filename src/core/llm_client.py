@@ -0,0 +1,250 @@
+"""
+RankSmart 2.0 - LLM Client
+
+Rate-limited, adaptively concurrent wrapper around a Gemini `GenerativeModel`.
+Every agent LLM call goes through `LLMClient.generate`.
+"""
+
+import asyncio
+import random
+import time
+from typing import Any, Dict, Optional
+
+from google.api_core import exceptions as google_exceptions
+
+from src.core.tracing import Span, SpanKind, get_tracer
+
+
+# Upstream signals that mean "slow down"
+THROTTLE_ERRORS = (
+    google_exceptions.ResourceExhausted,
+    google_exceptions.TooManyRequests,
+)
+
+# Transient failures worth retrying
+RETRYABLE_ERRORS = THROTTLE_ERRORS + (
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.InternalServerError,
+    google_exceptions.DeadlineExceeded,
+    asyncio.TimeoutError,
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate (~4 characters per token)"""
+    return max(1, len(text) // 4)
+
+
+class TokenBucket:
+    """
+    Async token bucket.
+
+    Holds up to `capacity` tokens and refills continuously at
+    `refill_per_second`. Waiters are served in FIFO order.
+    """
+
+    def __init__(self, capacity: float, refill_per_second: float):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.refill_per_second)
+        self.updated_at = now
+
+    async def acquire(self, amount: float = 1.0) -> float:
+        """
+        Take `amount` tokens, waiting until they are available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        amount = min(amount, self.capacity)
+        waited = 0.0
+        async with self._lock:
+            self._refill()
+            while self.tokens < amount:
+                delay = (amount - self.tokens) / self.refill_per_second
+                await asyncio.sleep(delay)
+                waited += delay
+                self._refill()
+            self.tokens -= amount
+        return waited
+
+    def credit(self, amount: float):
+        """Return (positive) or charge (negative) tokens after the fact"""
+        self._refill()
+        self.tokens = max(-self.capacity, min(self.capacity, self.tokens + amount))
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD concurrency limiter.
+
+    The limit grows by roughly one slot per window of successful calls
+    (additive increase) and is cut multiplicatively on throttling or when
+    latency exceeds the target (multiplicative decrease).
+    """
+
+    def __init__(
+        self,
+        initial: int = 4,
+        minimum: int = 1,
+        maximum: int = 32,
+        throttle_decrease: float = 0.5,
+        latency_decrease: float = 0.9,
+        latency_target_s: Optional[float] = None
+    ):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.throttle_decrease = throttle_decrease
+        self.latency_decrease = latency_decrease
+        self.latency_target_s = latency_target_s
+        self.in_flight = 0
+        self._condition = asyncio.Condition()
+
+    @property
+    def current_limit(self) -> int:
+        """Integer concurrency limit currently enforced"""
+        return max(self.minimum, int(self.limit))
+
+    async def acquire(self):
+        """Wait for a free slot"""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < self.current_limit)
+            self.in_flight += 1
+
+    async def release(self, latency_s: Optional[float] = None, throttled: bool = False):
+        """
+        Free a slot and adapt the limit.
+
+        Args:
+            latency_s: Latency of the finished call (None if it failed)
+            throttled: Whether the call was throttled upstream
+        """
+        async with self._condition:
+            self.in_flight -= 1
+            if throttled:
+                self.limit = max(self.minimum, self.limit * self.throttle_decrease)
+            elif latency_s is not None:
+                if self.latency_target_s and latency_s > self.latency_target_s:
+                    self.limit = max(self.minimum, self.limit * self.latency_decrease)
+                else:
+                    self.limit = min(self.maximum, self.limit + 1 / self.limit)
+            self._condition.notify_all()
+
+
+class LLMClient:
+    """
+    Wrapper enforcing request/token budgets and adaptive concurrency.
+
+    - Token buckets for requests-per-minute and tokens-per-minute
+    - AIMD concurrency limit driven by throttling and latency
+    - Retries with full-jitter exponential backoff on transient errors
+    """
+
+    def __init__(
+        self,
+        model: Any,
+        requests_per_minute: int = 60,
+        tokens_per_minute: int = 1_000_000,
+        initial_concurrency: int = 4,
+        max_concurrency: int = 32,
+        latency_target_s: Optional[float] = None,
+        max_retries: int = 5,
+        base_backoff_s: float = 1.0,
+        max_backoff_s: float = 30.0,
+        expected_output_tokens: int = 1024
+    ):
+        self.model = model
+        self.request_bucket = TokenBucket(requests_per_minute, requests_per_minute / 60)
+        self.token_bucket = TokenBucket(tokens_per_minute, tokens_per_minute / 60)
+        self.limiter = AdaptiveConcurrencyLimiter(
+            initial=initial_concurrency,
+            maximum=max_concurrency,
+            latency_target_s=latency_target_s
+        )
+        self.max_retries = max_retries
+        self.base_backoff_s = base_backoff_s
+        self.max_backoff_s = max_backoff_s
+        self.expected_output_tokens = expected_output_tokens
+        self.stats: Dict[str, float] = {
+            "calls": 0,
+            "retries": 0,
+            "throttled": 0,
+            "failures": 0,
+            "rate_limit_wait_s": 0.0
+        }
+
+    def _backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff delay"""
+        return random.uniform(0, min(self.max_backoff_s, self.base_backoff_s * 2 ** attempt))
+
+    async def generate(self, prompt: str, **kwargs) -> Any:
+        """
+        Generate content through the model with rate limiting and retries.
+
+        Args:
+            prompt: Prompt text
+            **kwargs: Passed through to `generate_content_async`
+
+        Returns:
+            The model response
+        """
+        reserved = estimate_tokens(prompt) + self.expected_output_tokens
+        attributes = {"llm.prompt_tokens": estimate_tokens(prompt)}
+        with get_tracer().span("llm.generate", SpanKind.CLIENT, attributes) as span:
+            return await self._generate(prompt, reserved, span, **kwargs)
+
+    async def _generate(self, prompt: str, reserved: int, span: Span, **kwargs) -> Any:
+        """Retry loop for `generate`, recording attempts/waits/tokens on the span"""
+        total_wait = 0.0
+        for attempt in range(self.max_retries + 1):
+            waited = await self.request_bucket.acquire(1)
+            waited += await self.token_bucket.acquire(reserved)
+            self.stats["rate_limit_wait_s"] += waited
+            total_wait += waited
+            span.set_attribute("llm.attempts", attempt + 1)
+            span.set_attribute("llm.rate_limit_wait_ms", round(total_wait * 1000, 3))
+            await self.limiter.acquire()
+
+            # The slot is released in `finally` so cancelled calls don't leak it
+            start = time.monotonic()
+            latency_s: Optional[float] = None
+            throttled = False
+            try:
+                self.stats["calls"] += 1
+                response = await self.model.generate_content_async(prompt, **kwargs)
+                latency_s = time.monotonic() - start
+            except RETRYABLE_ERRORS as e:
+                throttled = isinstance(e, THROTTLE_ERRORS)
+                if throttled:
+                    self.stats["throttled"] += 1
+                    span.set_attribute("llm.throttled", True)
+                if attempt == self.max_retries:
+                    self.stats["failures"] += 1
+                    raise
+                self.stats["retries"] += 1
+            except Exception:
+                self.stats["failures"] += 1
+                raise
+            finally:
+                await self.limiter.release(latency_s=latency_s, throttled=throttled)
+
+            if latency_s is None:
+                await asyncio.sleep(self._backoff(attempt))
+                continue
+
+            usage = getattr(response, "usage_metadata", None)
+            actual = getattr(usage, "total_token_count", None) if usage is not None else None
+            if isinstance(usage, dict):
+                actual = usage.get("totalTokenCount")
+            if actual:
+                self.token_bucket.credit(reserved - actual)
+                span.set_attribute("llm.total_tokens", actual)
+
+            return response
@@ -0,0 +1,298 @@
+"""
+RankSmart 2.0 - Prompt Building & Token Budgets
+
+Builds the Content Manager prompts so that:
+- Static instructions come first (provider-side context caching can reuse them)
+- The article block is byte-identical across review stages (shared, cacheable prefix)
+- Every stage stays within a token budget
+- Token usage, cacheable prefixes and trimming are reported per review
+"""
+
+import os
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from src.core.llm_client import estimate_tokens
+
+
+TRUNCATION_MARKER = "\n\n[... content truncated to fit token budget ...]"
+
+SHARED_PREFIX = """You are RankSmart's content review assistant for iGaming and affiliate publishers.
+You evaluate articles for SEO, E-E-A-T (Experience, Expertise, Authoritativeness, Trustworthiness),
+content quality and regulatory compliance, and you help writers improve.
+Always reply in exactly the format requested - no extra prose, no code fences."""
+
+SCORES_INSTRUCTIONS = """## Task: Score the article above
+
+You are an expert content quality analyst. Provide scores (0-100) for each dimension:
+
+1. **SEO Score (0-100)**: Keywords usage, meta optimization, heading structure, internal linking potential
+2. **E-E-A-T Score (0-100)**: Experience signals, expertise demonstration, authoritativeness, trustworthiness
+3. **Content Quality (0-100)**: Originality, accuracy, readability, engagement
+4. **Compliance Score (0-100)**: Adherence to regulations, legal requirements, industry standards
+
+Return ONLY a JSON object with this exact structure:
+{
+    "seo_score": <number>,
+    "eeat_score": <number>,
+    "content_quality": <number>,
+    "compliance_score": <number>,
+    "reasoning": {
+        "seo": "<brief explanation>",
+        "eeat": "<brief explanation>",
+        "quality": "<brief explanation>",
+        "compliance": "<brief explanation>"
+    }
+}"""
+
+ISSUES_INSTRUCTIONS = """## Task: Annotate issues in the article above
+
+You are a content quality expert helping writers improve. Analyze the article and identify specific issues.
+
+For each issue found, provide:
+1. **Severity**: "critical" (🔴), "warning" (🟡), or "suggestion" (🟢)
+2. **Explanation**: WHY this is an issue (educational)
+3. **Fix**: HOW to fix it (actionable)
+4. **Learning Note**: Educational context to help writer improve
+
+Focus on the TOP 10 most impactful issues. Return JSON array:
+[
+    {
+        "severity": "critical|warning|suggestion",
+        "title": "<short title>",
+        "explanation": "<why this matters>",
+        "fix_suggestion": "<how to fix>",
+        "learning_note": "<educational context>",
+        "highlighted_text": "<text to highlight in article>"
+    }
+]"""
+
+FEEDBACK_INSTRUCTIONS = """## Task: Write feedback for the writer of the article above
+
+You are a supportive content manager providing feedback to a writer.
+
+Provide constructive feedback with:
+1. **Overall Comment**: Encouraging but honest assessment
+2. **Strengths**: 3-5 things the writer did well
+3. **Areas for Improvement**: 3-5 specific areas to work on
+4. **Learning Resources**: 2-3 helpful links or resources
+
+Return JSON:
+{
+    "overall_comment": "<encouraging feedback>",
+    "strengths": ["<strength 1>", "<strength 2>", ...],
+    "areas_for_improvement": ["<area 1>", "<area 2>", ...],
+    "learning_resources": ["<resource 1>", "<resource 2>", ...]
+}"""
+
+FIXES_INSTRUCTIONS = """Apply these fixes to the article while preserving the writer's voice and style.
+Return the updated content with fixes applied. Maintain the original format (markdown/HTML).
+Return only the updated content."""
+
+
+class PromptBudgets(BaseModel):
+    """Token budgets per prompt (estimated tokens)"""
+    article_tokens: int = Field(default=1500, description="Article block shared by scoring and annotation")
+    scores: int = Field(default=2500, description="Max scoring prompt size")
+    annotations: int = Field(default=2500, description="Max annotation prompt size")
+    feedback: int = Field(default=1200, description="Max feedback prompt size")
+    apply_fixes: int = Field(default=6000, description="Max apply-fixes prompt size (article is chunked)")
+
+    @classmethod
+    def from_env(cls) -> "PromptBudgets":
+        """Budgets from PROMPT_BUDGET_* environment variables"""
+        overrides = {
+            name: int(os.environ[f"PROMPT_BUDGET_{name.upper()}"])
+            for name in cls.model_fields
+            if os.getenv(f"PROMPT_BUDGET_{name.upper()}")
+        }
+        return cls(**overrides)
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Trim text to a token budget, preferring a paragraph or line boundary.
+
+    Returns the text unchanged if it already fits.
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    limit = max(0, max_tokens * 4 - len(TRUNCATION_MARKER))
+    cut = text[:limit]
+    boundary = max(cut.rfind("\n\n"), cut.rfind("\n"))
+    if boundary > limit // 2:
+        cut = cut[:boundary]
+    return cut.rstrip() + TRUNCATION_MARKER
+
+
+def split_to_budget(text: str, max_tokens: int) -> List[Tuple[str, str]]:
+    """
+    Split text into chunks of at most `max_tokens`, on paragraph boundaries.
+
+    A paragraph larger than the budget is split on line boundaries, and a
+    line larger than the budget at the character limit.
+
+    Returns:
+        (chunk, separator) pairs; `"".join(chunk + separator ...)` reproduces
+        the original text
+    """
+    max_chars = max(1, max_tokens * 4)
+
+    # Smallest units that fit the budget, each with the separator after it
+    units: List[Tuple[str, str]] = []
+    paragraphs = text.split("\n\n")
+    for p, paragraph in enumerate(paragraphs):
+        paragraph_sep = "\n\n" if p < len(paragraphs) - 1 else ""
+        if len(paragraph) <= max_chars:
+            units.append((paragraph, paragraph_sep))
+            continue
+        lines = paragraph.split("\n")
+        for n, line in enumerate(lines):
+            line_sep = "\n" if n < len(lines) - 1 else paragraph_sep
+            pieces = [line[k:k + max_chars] for k in range(0, len(line), max_chars)] or [""]
+            units.extend((piece, "") for piece in pieces[:-1])
+            units.append((pieces[-1], line_sep))
+
+    chunks: List[Tuple[str, str]] = []
+    current: Optional[str] = None
+    current_sep = ""
+    for unit, sep in units:
+        if current is not None and len(current) + len(current_sep) + len(unit) > max_chars:
+            chunks.append((current, current_sep))
+            current = None
+        current = unit if current is None else f"{current}{current_sep}{unit}"
+        current_sep = sep
+    chunks.append((current or "", current_sep))
+    return chunks
+
+
+class ReviewPromptSession:
+    """
+    Builds the three review prompts for one submission and tracks tokens.
+
+    The scoring and annotation prompts share `SHARED_PREFIX` + the article
+    block byte-for-byte, so the provider can serve that prefix from its
+    context cache on the second call; the feedback prompt shares
+    `SHARED_PREFIX` + title.
+    """
+
+    def __init__(self, title: str, content: str, budgets: Optional[PromptBudgets] = None):
+        self.budgets = budgets or PromptBudgets()
+        self.prompts: Dict[str, str] = {}
+        self.trimmed_tokens = 0
+
+        # One article budget for every stage that embeds the article,
+        # so the block stays identical across stages
+        overhead = estimate_tokens(SHARED_PREFIX) + max(
+            estimate_tokens(SCORES_INSTRUCTIONS), estimate_tokens(ISSUES_INSTRUCTIONS)
+        ) + estimate_tokens(title) + 200
+        article_budget = min(
+            self.budgets.article_tokens,
+            max(100, min(self.budgets.scores, self.budgets.annotations) - overhead)
+        )
+        article = truncate_to_tokens(content, article_budget)
+        self.trimmed_tokens = max(0, estimate_tokens(content) - estimate_tokens(article))
+
+        self.article = article
+        self.title_block = f"{SHARED_PREFIX}\n\n**Article Title:** {title}\n"
+        self.article_block = self._article_block(article)
+
+    def _article_block(self, article: str) -> str:
+        return f"{self.title_block}\n**Article Content:**\n{article}\n\n"
+
+    def _record(self, stage: str, head: str, tail: str, budget: int) -> str:
+        """
+        Enforce a stage budget and remember the prompt for reporting.
+
+        Over-budget prompts give up article text first (never the stage
+        instructions at the end); prompts without an article are truncated.
+        """
+        prompt = head + tail
+        overflow = estimate_tokens(prompt) - budget
+        if overflow > 0 and head == self.article_block:
+            article = truncate_to_tokens(self.article, max(0, estimate_tokens(self.article) - overflow - 20))
+            self.trimmed_tokens += estimate_tokens(self.article) - estimate_tokens(article)
+            prompt = self._article_block(article) + tail
+        elif overflow > 0:
+            self.trimmed_tokens += overflow
+            prompt = truncate_to_tokens(prompt, budget)
+        self.prompts[stage] = prompt
+        return prompt
+
+    def scores_prompt(self, target_keywords: Optional[List[str]], jurisdiction: Optional[str]) -> str:
+        """Prompt for the scoring stage"""
+        return self._record("scores", self.article_block, (
+            f"{SCORES_INSTRUCTIONS}\n\n"
+            f"**Target Keywords:** {', '.join(target_keywords) if target_keywords else 'Not specified'}\n"
+            f"**Jurisdiction:** {jurisdiction or 'Not specified'}\n"
+        ), self.budgets.scores)
+
+    def annotations_prompt(self, scores) -> str:
+        """Prompt for the annotation stage"""
+        return self._record("annotations", self.article_block, (
+            f"{ISSUES_INSTRUCTIONS}\n\n"
+            "**Current Scores:**\n"
+            f"- SEO: {scores.seo_score}/100\n"
+            f"- E-E-A-T: {scores.eeat_score}/100\n"
+            f"- Quality: {scores.content_quality}/100\n"
+            f"- Compliance: {scores.compliance_score}/100\n"
+        ), self.budgets.annotations)
+
+    def feedback_prompt(self, writer_name: str, scores, critical: int, warnings: int, suggestions: int) -> str:
+        """Prompt for the feedback stage (no article body needed)"""
+        return self._record("feedback", self.title_block, (
+            f"\n{FEEDBACK_INSTRUCTIONS}\n\n"
+            f"**Writer:** {writer_name}\n"
+            f"**Overall Score:** {scores.overall_score}/100\n\n"
+            "**Scores Breakdown:**\n"
+            f"- SEO: {scores.seo_score}/100\n"
+            f"- E-E-A-T: {scores.eeat_score}/100\n"
+            f"- Quality: {scores.content_quality}/100\n"
+            f"- Compliance: {scores.compliance_score}/100\n\n"
+            "**Issues Found:**\n"
+            f"- 🔴 Critical: {critical}\n"
+            f"- 🟡 Warnings: {warnings}\n"
+            f"- 🟢 Suggestions: {suggestions}\n"
+        ), self.budgets.feedback)
+
+    def report(self) -> Dict[str, int]:
+        """
+        Token report for the review.
+
+        `cacheable_prefix_tokens` counts, for every prompt after the first,
+        the leading tokens identical to an earlier prompt (eligible for
+        provider context caching, but still sent). `trimmed_tokens` counts
+        the tokens actually removed by budgets.
+        """
+        prompts = list(self.prompts.values())
+        reused = 0
+        for i, prompt in enumerate(prompts[1:], start=1):
+            shared = max(len(os.path.commonprefix([prompt, earlier])) for earlier in prompts[:i])
+            reused += shared // 4
+        report = {f"{stage}_tokens": estimate_tokens(p) for stage, p in self.prompts.items()}
+        report.update({
+            "prompt_tokens": sum(estimate_tokens(p) for p in prompts),
+            "cacheable_prefix_tokens": reused,
+            "trimmed_tokens": self.trimmed_tokens
+        })
+        return report
+
+
+def fixes_prompts(
+    content: str,
+    fix_instructions: str,
+    budgets: Optional[PromptBudgets] = None
+) -> List[Tuple[str, str, str]]:
+    """
+    Build apply-fixes prompts, chunking the article to the budget.
+
+    Returns:
+        (article chunk, separator, prompt) triples, in article order; the
+        chunks joined with their separators reproduce `content`
+    """
+    budgets = budgets or PromptBudgets()
+    header = f"{SHARED_PREFIX}\n\n{FIXES_INSTRUCTIONS}\n\n**Original Content:**\n"
+    footer = f"\n\n**Fixes to Apply:**\n{fix_instructions}\n"
+    chunk_budget = max(200, budgets.apply_fixes - estimate_tokens(header) - estimate_tokens(footer))
+    return [(chunk, sep, f"{header}{chunk}{footer}") for chunk, sep in split_to_budget(content, chunk_budget)]
@@ -0,0 +1,119 @@
+"""
+RankSmart 2.0 - Revision History
+
+Delta-compressed article versions. Version 1 and every
+`CHECKPOINT_INTERVAL`-th version are stored in full (zlib); the others as
+line-level deltas against the previous version, so any version is rebuilt
+from the nearest checkpoint with a bounded number of delta applications.
+"""
+
+import difflib
+import json
+import zlib
+from typing import Callable, List, Tuple
+
+from src.core.schemas import SubmissionRevision
+
+# Full copy every N versions (bounds reconstruction to N - 1 deltas)
+CHECKPOINT_INTERVAL = 10
+
+# A delta larger than this fraction of the body is stored as a checkpoint instead
+MAX_DELTA_RATIO = 0.5
+
+# (metadata, payload) as persisted by the submission stores
+RevisionRow = Tuple[SubmissionRevision, bytes]
+
+
+def encode_full(text: str) -> bytes:
+    """Compressed full copy"""
+    return zlib.compress(text.encode("utf-8"), 9)
+
+
+def make_delta(old: str, new: str) -> bytes:
+    """
+    Encode `new` as a line-level delta against `old`.
+
+    The delta is a compressed JSON list of `[start, end]` ranges copied from
+    the old lines and strings inserted verbatim.
+    """
+    old_lines = old.splitlines(keepends=True)
+    new_lines = new.splitlines(keepends=True)
+    ops: list = []
+    matcher = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append([i1, i2])
+        elif tag in ("replace", "insert"):
+            ops.append("".join(new_lines[j1:j2]))
+    return zlib.compress(json.dumps(ops, separators=(",", ":")).encode("utf-8"), 9)
+
+
+def apply_delta(old: str, delta: bytes) -> str:
+    """Rebuild a version from its predecessor and delta"""
+    old_lines = old.splitlines(keepends=True)
+    parts = []
+    for op in json.loads(zlib.decompress(delta)):
+        parts.append("".join(old_lines[op[0]:op[1]]) if isinstance(op, list) else op)
+    return "".join(parts)
+
+
+def build_revision(
+    history: List[RevisionRow],
+    content: str,
+    content_hash: str,
+    previous_content: Callable[[], str]
+) -> RevisionRow:
+    """
+    Create the next revision for a submission.
+
+    Args:
+        history: Existing revisions, oldest first
+        content: New body
+        content_hash: Blob hash of the new body
+        previous_content: Returns the body of the latest existing revision
+
+    Returns:
+        (metadata, payload) for the new version
+    """
+    version = len(history) + 1
+    payload = None
+    if (version - 1) % CHECKPOINT_INTERVAL != 0:
+        delta = make_delta(previous_content(), content)
+        if len(delta) <= len(content) * MAX_DELTA_RATIO:
+            payload = delta
+    checkpoint = payload is None
+    if checkpoint:
+        payload = encode_full(content)
+    meta = SubmissionRevision(
+        version=version,
+        content_hash=content_hash,
+        checkpoint=checkpoint,
+        chars=len(content),
+        stored_bytes=len(payload)
+    )
+    return meta, payload
+
+
+def reconstruct(history: List[RevisionRow], version: int) -> str:
+    """
+    Rebuild a version from the nearest checkpoint at or before it.
+
+    Raises:
+        IndexError: If the version doesn't exist
+    """
+    if not 1 <= version <= len(history):
+        raise IndexError(version)
+    start = version - 1
+    while not history[start][0].checkpoint:
+        start -= 1
+    text = zlib.decompress(history[start][1]).decode("utf-8")
+    for _, delta in history[start + 1:version]:
+        text = apply_delta(text, delta)
+    return text
+
+
+def diff_text(old: str, new: str, from_label: str, to_label: str) -> str:
+    """Unified diff between two versions"""
+    return "".join(difflib.unified_diff(
+        old.splitlines(keepends=True), new.splitlines(keepends=True), fromfile=from_label, tofile=to_label
+    ))
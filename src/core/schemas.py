@@ -5,7 +5,7 @@ Pydantic models for structured data throughout the application.
 """
 
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl, field_validator
 from datetime import datetime
 from enum import Enum
 
@@ -189,6 +189,20 @@ class ContentFix(BaseModel):
     reason: str = Field(..., description="Reason for the fix")
 
 
+class GeneratedImage(BaseModel):
+    """A generated, post-processed image"""
+    prompt: str = Field(..., description="Generation prompt")
+    key: str = Field(..., description="Content-addressed cache key (generator, prompt, output spec)")
+    url: str = Field(..., description="URL of the resized image")
+    thumbnail_url: str = Field(..., description="URL of the thumbnail")
+    width: int = Field(..., description="Image width (px)")
+    height: int = Field(..., description="Image height (px)")
+    format: str = Field(..., description="Image format (e.g. WEBP)")
+    size_bytes: int = Field(..., description="Image file size")
+    thumbnail_size_bytes: int = Field(..., description="Thumbnail file size")
+    cached: bool = Field(default=False, description="Served from the cache without generating")
+
+
 class OptimizationResult(BaseModel):
     """Content optimization results"""
     mode: ContentMode = Field(..., description="Optimization mode used")
@@ -197,6 +211,7 @@ class OptimizationResult(BaseModel):
     fixes_applied: List[ContentFix] = Field(default_factory=list, description="All fixes applied")
     optimized_content: str = Field(..., description="Optimized content (HTML or Markdown)")
     images_generated: List[str] = Field(default_factory=list, description="URLs of generated images")
+    images: List[GeneratedImage] = Field(default_factory=list, description="Generated image files (sizes, thumbnails)")
     estimated_improvement: str = Field(..., description="Estimated ranking improvement")
 
 
@@ -289,11 +304,13 @@ class ContentSubmission(BaseModel):
     manager_id: Optional[str] = Field(None, description="Assigned manager ID")
     title: str = Field(..., description="Article title")
     content: str = Field(..., description="Article content (markdown/HTML)")
+    content_hash: Optional[str] = Field(None, description="Blob store key of the content (SHA-256)")
     content_format: str = Field(default="markdown", description="Content format")
     status: SubmissionStatus = Field(default=SubmissionStatus.PENDING_REVIEW)
     scores: Optional[ContentScore] = Field(None, description="Content scores")
     annotations: List[IssueAnnotation] = Field(default_factory=list, description="Issue annotations")
     feedback: Optional[WriterFeedback] = Field(None, description="Manager feedback")
+    review_tokens: Dict[str, int] = Field(default_factory=dict, description="Prompt token report of the latest review")
     revision_count: int = Field(default=0, description="Number of revisions")
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
@@ -301,12 +318,22 @@ class ContentSubmission(BaseModel):
     published_at: Optional[datetime] = Field(None)
 
 
+class SubmissionRevision(BaseModel):
+    """One stored version of a submission's content"""
+    version: int = Field(..., description="Version number (1 = original draft)")
+    content_hash: str = Field(..., description="Blob hash of this version's content")
+    checkpoint: bool = Field(..., description="Stored in full rather than as a delta")
+    chars: int = Field(..., description="Content length")
+    stored_bytes: int = Field(..., description="Compressed size of the stored copy or delta")
+    created_at: datetime = Field(default_factory=datetime.now)
+
+
 class WriterSkillArea(BaseModel):
     """Skill area tracking for writer"""
     skill_name: str = Field(..., description="Skill area (e.g., 'SEO Optimization', 'E-E-A-T')")
     current_score: int = Field(..., ge=0, le=100, description="Current skill level")
     initial_score: int = Field(..., ge=0, le=100, description="Initial skill level")
-    improvement: int = Field(..., description="Score improvement")
+    improvement: int = Field(..., description="Score improvement (fitted change from first to latest article)")
     articles_count: int = Field(..., description="Number of articles in this area")
 
 
@@ -321,6 +348,7 @@ class WriterProgress(BaseModel):
     skill_areas: List[WriterSkillArea] = Field(default_factory=list, description="Skill area breakdown")
     common_issues: Dict[str, int] = Field(default_factory=dict, description="Frequency of issue types")
     improvement_rate: float = Field(default=0.0, description="Score improvement per article")
+    smoothed_score: float = Field(default=0.0, description="EWMA of overall scores (recent articles weigh most)")
     last_submission: Optional[datetime] = Field(None)
     joined_at: datetime = Field(default_factory=datetime.now)
 
@@ -338,6 +366,83 @@ class TeamAnalytics(BaseModel):
     average_review_time: float = Field(..., description="Average review time in hours")
 
 
+class ImportReport(BaseModel):
+    """Outcome of a bulk NDJSON submission import"""
+    imported: int = Field(default=0, description="Submissions written")
+    skipped: int = Field(default=0, description="Existing submissions left untouched")
+    failed: int = Field(default=0, description="Lines that failed validation")
+    errors: List[Dict[str, Any]] = Field(default_factory=list, description="First validation errors (line number and message)")
+    seconds: float = Field(default=0.0, description="Wall time")
+    records_per_second: float = Field(default=0.0, description="Imported records per second")
+
+
+class PublishResult(BaseModel):
+    """Outcome of publishing one submission to one CMS"""
+    submission_id: str = Field(..., description="Submission ID")
+    platform: str = Field(..., description="CMS target (wordpress/webflow)")
+    state: str = Field(..., description="created / updated / unchanged / failed")
+    remote_id: Optional[str] = Field(None, description="Post/item ID in the CMS")
+    url: Optional[str] = Field(None, description="Public URL, when the CMS reports one")
+    error: Optional[str] = Field(None, description="Failure reason")
+
+
+class PublishJob(BaseModel):
+    """Progress of a bulk publishing run"""
+    job_id: str = Field(..., description="Job ID")
+    total: int = Field(default=0, description="Submission x platform pairs to publish")
+    completed: int = Field(default=0, description="Pairs finished (any outcome)")
+    failed: int = Field(default=0, description="Pairs that failed")
+    done: bool = Field(default=False, description="Every pair finished")
+    results: List[PublishResult] = Field(default_factory=list, description="Per-pair outcomes, in completion order")
+    started_at: datetime = Field(default_factory=datetime.now)
+    finished_at: Optional[datetime] = Field(None)
+
+
+# ===================================
+# LLM Structured Output
+# ===================================
+
+class ScoreReasoning(BaseModel):
+    """Model reasoning behind each score"""
+    seo: str = Field(default="", description="SEO reasoning")
+    eeat: str = Field(default="", description="E-E-A-T reasoning")
+    quality: str = Field(default="", description="Quality reasoning")
+    compliance: str = Field(default="", description="Compliance reasoning")
+
+
+class ScoresOutput(BaseModel):
+    """Expected LLM output of the scoring stage"""
+    seo_score: int = Field(..., ge=0, le=100, description="SEO score (0-100)")
+    eeat_score: int = Field(..., ge=0, le=100, description="E-E-A-T score (0-100)")
+    content_quality: int = Field(..., ge=0, le=100, description="Content quality (0-100)")
+    compliance_score: int = Field(..., ge=0, le=100, description="Compliance score (0-100)")
+    reasoning: Optional[ScoreReasoning] = Field(None, description="Brief explanation per score")
+
+
+class IssueOutput(BaseModel):
+    """Expected LLM output for one issue in the annotation stage"""
+    severity: IssueSeverity = Field(..., description="critical, warning or suggestion")
+    title: Optional[str] = Field(None, description="Short title")
+    explanation: str = Field(..., description="Why this matters")
+    fix_suggestion: str = Field(..., description="How to fix")
+    learning_note: Optional[str] = Field(None, description="Educational context")
+    highlighted_text: Optional[str] = Field(None, description="Text to highlight in article")
+    
+    @field_validator("severity", mode="before")
+    @classmethod
+    def normalize_severity(cls, value):
+        """Accept 'Critical', ' WARNING ' etc."""
+        return value.strip().lower() if isinstance(value, str) else value
+
+
+class FeedbackOutput(BaseModel):
+    """Expected LLM output of the feedback stage"""
+    overall_comment: str = Field(..., description="Encouraging but honest assessment")
+    strengths: List[str] = Field(default_factory=list, description="What the writer did well")
+    areas_for_improvement: List[str] = Field(default_factory=list, description="What to improve")
+    learning_resources: List[str] = Field(default_factory=list, description="Helpful resources/links")
+
+
 # ===================================
 # API Response Models
 # ===================================
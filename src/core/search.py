@@ -0,0 +1,362 @@
+"""
+RankSmart 2.0 - Full-Text Search
+
+Incrementally maintained inverted index over submission titles, content and
+annotation text, ranked with BM25 (field-weighted term frequencies), plus
+snippet extraction with highlighting.
+
+The index follows a `SubmissionStore` through its change notifications:
+changed IDs are queued and re-indexed on the next search, so writes (submit,
+review, apply-fixes) stay cheap and other workers' writes are picked up too.
+"""
+
+import heapq
+import html
+import math
+import re
+from typing import Dict, List, Optional, Set, Tuple
+
+from src.core.schemas import ContentSubmission
+from src.core.storage import StoreFollower
+
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have in is it its of on or that the their there "
+    "they this to was were will with you your our we".split()
+)
+
+# Title matches count three times, annotation text twice
+FIELD_WEIGHTS = {"title": 3.0, "annotations": 2.0, "content": 1.0}
+
+# Posting lists of terms whose best score is below this fraction of the
+# strongest term's are not walked during top-k (bounded by their maximum)
+WALK_RATIO = 0.1
+
+
+def normalize(token: str) -> str:
+    """Lowercased token with a light plural strip ("requirements" -> "requirement")"""
+    if len(token) > 4 and token.endswith("s") and not token.endswith("ss"):
+        return token[:-1]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    """Index terms for a piece of text"""
+    return [normalize(t) for t in TOKEN_RE.findall(text.lower()) if t not in STOPWORDS]
+
+
+def annotation_text(submission: ContentSubmission) -> str:
+    """Searchable text of a submission's annotations"""
+    return " ".join(
+        " ".join(filter(None, (a.explanation, a.fix_suggestion, a.learning_note, a.highlighted_text)))
+        for a in submission.annotations
+    )
+
+
+def highlight(text: str, terms: Set[str], tag: str = "mark") -> str:
+    """HTML-escape `text`, wrapping tokens that match `terms`"""
+    parts = []
+    last = 0
+    lowered = text.lower()
+    for match in TOKEN_RE.finditer(lowered):
+        if normalize(match.group()) in terms:
+            parts.append(html.escape(text[last:match.start()]))
+            parts.append(f"<{tag}>{html.escape(text[match.start():match.end()])}</{tag}>")
+            last = match.end()
+    parts.append(html.escape(text[last:]))
+    return "".join(parts)
+
+
+def snippet(text: str, terms: Set[str], width: int = 30, tag: str = "mark") -> str:
+    """
+    Highlighted excerpt of about `width` words around the densest cluster of matches.
+
+    Args:
+        text: Document text
+        terms: Normalized query terms
+        width: Window size in words
+        tag: HTML tag wrapped around matches
+    """
+    words = list(TOKEN_RE.finditer(text.lower()))
+    if not words:
+        return ""
+    hits = [i for i, word in enumerate(words) if normalize(word.group()) in terms]
+
+    # Window start covering the most matches (two pointers over hit positions)
+    best_start, best_count, left = 0, 0, 0
+    for right, position in enumerate(hits):
+        while position - hits[left] >= width:
+            left += 1
+        if right - left + 1 > best_count:
+            best_count = right - left + 1
+            best_start = max(0, hits[left] - 3)
+
+    end_word = min(len(words), best_start + width) - 1
+    start = words[best_start].start() if best_start else 0
+    end = words[end_word].end() if end_word < len(words) - 1 else len(text)
+    excerpt = " ".join(text[start:end].split())
+    prefix = "… " if start > 0 else ""
+    suffix = " …" if end < len(text) else ""
+    return prefix + highlight(excerpt, terms, tag) + suffix
+
+
+class _TermScores:
+    """
+    Cached BM25 contributions of one term, plus its impact-ordered postings.
+
+    Scores depend on the corpus through IDF (document count) and average
+    document length, so each entry remembers the (count, total_len) it was
+    computed with and is only reused while both are unchanged.
+    """
+
+    __slots__ = ("stats", "scores", "ranked")
+
+    def __init__(self, stats: Tuple[int, float], scores: Dict[int, float]):
+        self.stats = stats
+        self.scores = scores
+        # (score, doc) best first
+        self.ranked = sorted(((score, doc) for doc, score in scores.items()), reverse=True)
+
+
+class SearchIndex(StoreFollower):
+    """
+    BM25 inverted index keyed by submission ID.
+
+    Queries use the threshold algorithm over impact-ordered posting lists,
+    so top-k results are found without scoring every matching document.
+
+    Args:
+        k1: Term-frequency saturation
+        b: Length normalization strength
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        super().__init__()
+
+        # Documents are interned to ints; postings map term -> {doc: weighted tf}
+        self._doc_ids: Dict[str, int] = {}
+        self._submission_ids: List[Optional[str]] = []
+        self._free: List[int] = []
+        self._doc_terms: Dict[int, Tuple[str, ...]] = {}
+        self._doc_len: Dict[int, float] = {}
+        self._doc_meta: Dict[int, Tuple[str, str]] = {}
+        self._writer_docs: Dict[str, Set[int]] = {}
+        self._status_docs: Dict[str, Set[int]] = {}
+        self.postings: Dict[str, Dict[int, float]] = {}
+        self.total_len = 0.0
+        self._scores: Dict[str, _TermScores] = {}
+
+    def __len__(self) -> int:
+        return len(self._doc_ids)
+
+    # ===================================
+    # Indexing
+    # ===================================
+
+    def add(self, submission: ContentSubmission):
+        """Index (or re-index) a submission; `content` must be loaded"""
+        frequencies: Dict[str, float] = {}
+        fields = (
+            ("title", submission.title),
+            ("content", submission.content),
+            ("annotations", annotation_text(submission))
+        )
+        for field, text in fields:
+            weight = FIELD_WEIGHTS[field]
+            for term in tokenize(text):
+                frequencies[term] = frequencies.get(term, 0.0) + weight
+        length = sum(frequencies.values())
+
+        with self._lock:
+            self.remove(submission.submission_id)
+            doc = self._free.pop() if self._free else len(self._submission_ids)
+            if doc == len(self._submission_ids):
+                self._submission_ids.append(submission.submission_id)
+            else:
+                self._submission_ids[doc] = submission.submission_id
+            self._doc_ids[submission.submission_id] = doc
+            self._doc_terms[doc] = tuple(frequencies)
+            self._doc_len[doc] = length
+            meta = (submission.writer_id, submission.status.value)
+            self._doc_meta[doc] = meta
+            self._writer_docs.setdefault(meta[0], set()).add(doc)
+            self._status_docs.setdefault(meta[1], set()).add(doc)
+            self.total_len += length
+            for term, tf in frequencies.items():
+                self.postings.setdefault(term, {})[doc] = tf
+                self._scores.pop(term, None)
+
+    def remove(self, submission_id: str):
+        """Drop a submission from the index (no-op if absent)"""
+        with self._lock:
+            doc = self._doc_ids.pop(submission_id, None)
+            if doc is None:
+                return
+            for term in self._doc_terms.pop(doc):
+                postings = self.postings[term]
+                del postings[doc]
+                if not postings:
+                    del self.postings[term]
+                self._scores.pop(term, None)
+            self.total_len -= self._doc_len.pop(doc)
+            writer_id, status = self._doc_meta.pop(doc)
+            self._writer_docs[writer_id].discard(doc)
+            self._status_docs[status].discard(doc)
+            self._submission_ids[doc] = None
+            self._free.append(doc)
+
+    # ===================================
+    # Store Integration
+    # ===================================
+
+    def _load(self, submissions: List[ContentSubmission]):
+        # Records are metadata-only: index the full submissions on the next refresh
+        with self._dirty_lock:
+            self._dirty.update(s.submission_id for s in submissions)
+
+    def _apply(self, dirty_ids: Set[str]):
+        for submission_id in dirty_ids:
+            submission = self._store.get(submission_id)
+            if submission is None:
+                self.remove(submission_id)
+            else:
+                self.add(submission)
+
+    # ===================================
+    # Querying
+    # ===================================
+
+    def _term_scores(self, term: str) -> _TermScores:
+        """BM25 contribution of `term` for every document containing it"""
+        count = len(self._doc_ids)
+        stats = (count, self.total_len)
+        cached = self._scores.get(term)
+        if cached is not None and cached.stats == stats:
+            return cached
+        postings = self.postings[term]
+        df = len(postings)
+        idf = math.log(1 + (count - df + 0.5) / (df + 0.5))
+        k1, b, doc_len = self.k1, self.b, self._doc_len
+        scale = idf * (k1 + 1)
+        norm = k1 * (1 - b)
+        slope = k1 * b / (self.total_len / count)
+        scores = {doc: scale * tf / (tf + norm + slope * doc_len[doc]) for doc, tf in postings.items()}
+        cached = self._scores[term] = _TermScores(stats, scores)
+        return cached
+
+    @staticmethod
+    def _top_k(terms: List[_TermScores], limit: int, allowed: Optional[Set[int]]) -> List[Tuple[float, int]]:
+        """
+        Threshold algorithm: walk the impact-ordered lists in parallel, fully
+        scoring each newly seen document, and stop once the k-th best score
+        reaches the best score any unseen document could still have.
+
+        Low-impact terms (e.g. words in nearly every document) aren't walked;
+        their maximum contribution is added to the bound instead.
+        """
+        heap: List[Tuple[float, int]] = []
+        seen: Set[int] = set()
+        strongest = max(term.ranked[0][0] if term.ranked else 0.0 for term in terms)
+        walked = [term for term in terms if term.ranked and term.ranked[0][0] >= strongest * WALK_RATIO]
+        fixed_bound = sum(term.ranked[0][0] for term in terms if term.ranked and term not in walked)
+
+        def consider(doc: int):
+            seen.add(doc)
+            if allowed is not None and doc not in allowed:
+                return
+            score = 0.0
+            for term in terms:
+                score += term.scores.get(doc, 0.0)
+            if score <= 0.0:
+                return
+            if len(heap) < limit:
+                heapq.heappush(heap, (score, doc))
+            elif score > heap[0][0]:
+                heapq.heapreplace(heap, (score, doc))
+
+        # Walk the strong lists first; if they run out before the bound is met,
+        # the remaining unseen documents are only in the weak lists
+        rest = [term for term in terms if term.ranked and term not in walked]
+        for lists, bound in ((walked, fixed_bound), (rest, 0.0)):
+            positions = [0] * len(lists)
+            while True:
+                threshold = bound
+                exhausted = True
+                for i, term in enumerate(lists):
+                    ranked = term.ranked
+                    position = positions[i]
+                    if position < len(ranked):
+                        doc = ranked[position][1]
+                        if doc not in seen:
+                            consider(doc)
+                        positions[i] = position = position + 1
+                    if position < len(ranked):
+                        threshold += ranked[position][0]
+                        exhausted = False
+                if len(heap) == limit and heap[0][0] >= threshold:
+                    return sorted(heap, reverse=True)
+                if exhausted:
+                    break
+        return sorted(heap, reverse=True)
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        writer_id: Optional[str] = None,
+        status: Optional[str] = None
+    ) -> Tuple[List[Tuple[str, float]], int]:
+        """
+        Rank submissions for a query.
+
+        Args:
+            query: Free-text query
+            limit: Maximum results
+            writer_id: Only this writer's submissions
+            status: Only submissions with this status
+
+        Returns:
+            ([(submission_id, score)] best first, total matching documents)
+        """
+        self.refresh()
+        with self._lock:
+            terms = [self._term_scores(t) for t in dict.fromkeys(tokenize(query)) if t in self.postings]
+            if not terms:
+                return [], 0
+            allowed: Optional[Set[int]] = None
+            if writer_id:
+                allowed = self._writer_docs.get(writer_id, set())
+            if status:
+                status_docs = self._status_docs.get(status, set())
+                allowed = status_docs if allowed is None else allowed & status_docs
+
+            # A term found in every document makes everything (allowed) match
+            universal = any(len(t.scores) == len(self._doc_ids) for t in terms)
+            if allowed is None:
+                if universal:
+                    total = len(self._doc_ids)
+                elif len(terms) == 1:
+                    total = len(terms[0].scores)
+                else:
+                    total = len(set(terms[0].scores).union(*(t.scores.keys() for t in terms[1:])))
+                top = self._top_k(terms, limit, None)
+            else:
+                if universal:
+                    matching = allowed
+                else:
+                    matching = set(terms[0].scores).union(*(t.scores.keys() for t in terms[1:])) & allowed
+                total = len(matching)
+                if len(matching) <= limit * 50:
+                    # Small candidate set (e.g. one writer): score it directly
+                    top = heapq.nlargest(limit, [(sum(t.scores.get(doc, 0.0) for t in terms), doc) for doc in matching])
+                else:
+                    top = self._top_k(terms, limit, allowed)
+            return [(self._submission_ids[doc], score) for score, doc in top], total
+
+    def query_terms(self, query: str) -> Set[str]:
+        """Normalized terms of a query (for highlighting)"""
+        return set(tokenize(query))
@@ -0,0 +1,77 @@
+"""
+RankSmart 2.0 - Single-Flight Request Coalescing
+
+Concurrent calls with the same key share one in-flight computation instead
+of each running (and paying for) the full LLM pipeline.
+"""
+
+import asyncio
+import hashlib
+import json
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+def content_hash(text: str) -> str:
+    """SHA-256 hex digest of a text body"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def make_key(*parts: Any) -> str:
+    """
+    Build a stable coalescing key from request parameters.
+
+    Lists, sets and tuples are treated as unordered, so `["a", "b"]` and
+    `["b", "a"]` produce the same key.
+    """
+    normalized = [
+        sorted(str(p) for p in part) if isinstance(part, (list, set, frozenset, tuple)) else part
+        for part in parts
+    ]
+    return hashlib.sha256(json.dumps(normalized, default=str).encode("utf-8")).hexdigest()
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent async calls by key.
+
+    The first caller for a key starts the computation as a task; callers that
+    arrive while it is running await the same task. The task is shielded, so
+    a cancelled caller (e.g. a disconnected client) does not cancel the work
+    for everyone else. Keys are forgotten as soon as the task finishes.
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+        self.stats = {"executed": 0, "coalesced": 0}
+
+    def _forget(self, key: Hashable, task: asyncio.Task):
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+
+    def in_flight(self, key: Hashable) -> bool:
+        """Whether a computation for `key` is currently running"""
+        return key in self._in_flight
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run `fn` once per key across concurrent callers.
+
+        Args:
+            key: Coalescing key
+            fn: Coroutine factory, only called by the first caller
+
+        Returns:
+            Result of the shared computation (exceptions propagate to all callers)
+        """
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+            self.stats["executed"] += 1
+        else:
+            self.stats["coalesced"] += 1
+
+        return await asyncio.shield(task)
@@ -0,0 +1,565 @@
+"""
+RankSmart 2.0 - Submission Storage
+
+Shared state for submissions, writers and review jobs.
+
+- `MemorySubmissionStore`: process-local dicts (single worker, tests)
+- `SQLiteSubmissionStore`: SQLite in WAL mode shared by every worker process,
+  with a per-process cache invalidated through a change log
+
+Article bodies live in a content-addressed `BlobStore`: stores keep
+metadata-only records (`content=""`, `content_hash` set), `get()` hydrates
+the body, and `list_all()` / `by_writer()` never touch content bytes.
+Every content change also appends a delta-compressed revision
+(`src.core.revisions`), so earlier versions stay retrievable.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from src.core.blobs import BlobStore, FileBlobStore, LRUCache, MemoryBlobStore
+from src.core.revisions import RevisionRow, build_revision, reconstruct
+from src.core.schemas import ContentSubmission, SubmissionRevision
+from src.core.tracing import get_tracer
+
+
+# Called with the submission ID whenever a submission changes (locally or in another process)
+ChangeListener = Callable[[str], None]
+
+
+class SubmissionStore:
+    """
+    Storage interface used by the API routes.
+
+    Args:
+        blobs: Blob store holding article bodies (process-local by default)
+    """
+
+    # Reconstructed versions kept hot (characters)
+    REVISION_CACHE_CHARS = 16 * 1024 * 1024
+
+    def __init__(self, blobs: Optional[BlobStore] = None):
+        self.blobs = blobs or MemoryBlobStore()
+        self._listeners: List[ChangeListener] = []
+        self._revision_cache = LRUCache(self.REVISION_CACHE_CHARS)
+
+    def subscribe(self, listener: ChangeListener):
+        """Register a callback for submission changes"""
+        self._listeners.append(listener)
+
+    def _notify(self, submission_id: str):
+        for listener in self._listeners:
+            listener(submission_id)
+
+    def refresh(self):
+        """Pick up changes made by other processes (notifying listeners)"""
+
+    def _prepare(
+        self, submission: ContentSubmission, history: List[RevisionRow]
+    ) -> Tuple[ContentSubmission, Optional[RevisionRow]]:
+        """
+        Move the body into the blob store, recording a revision if it changed.
+
+        Args:
+            submission: Submission being saved (`content_hash` and
+                `revision_count` are updated in place)
+            history: The submission's existing revisions
+
+        Returns:
+            (metadata-only record, new revision or None)
+        """
+        submission.content_hash = self.blobs.put(submission.content)
+        revision = None
+        if not history or history[-1][0].content_hash != submission.content_hash:
+            revision = build_revision(
+                history, submission.content, submission.content_hash, lambda: self._latest_content(history)
+            )
+            submission.revision_count = revision[0].version - 1
+        return submission.model_copy(update={"content": ""}), revision
+
+    def _latest_content(self, history: List[RevisionRow]) -> str:
+        """Body of the latest revision (usually the hot current body)"""
+        try:
+            return self.blobs.get(history[-1][0].content_hash)
+        except KeyError:
+            return reconstruct(history, len(history))
+
+    def _hydrate(self, record: ContentSubmission) -> ContentSubmission:
+        """Full submission (with body) for a metadata-only record"""
+        if record.content_hash is None:
+            return record  # Stored before bodies moved to the blob store
+        return record.model_copy(update={"content": self.blobs.get(record.content_hash)})
+
+    def save(self, submission: ContentSubmission):
+        """Insert or update a submission"""
+        raise NotImplementedError
+
+    def save_many(self, submissions: Iterable[ContentSubmission]):
+        """Insert or update many submissions"""
+        for submission in submissions:
+            self.save(submission)
+
+    def get(self, submission_id: str) -> Optional[ContentSubmission]:
+        """Get a submission by ID (content included)"""
+        record = self.get_record(submission_id)
+        return self._hydrate(record) if record is not None else None
+
+    def get_record(self, submission_id: str) -> Optional[ContentSubmission]:
+        """Get a submission's metadata-only record (`content` empty)"""
+        raise NotImplementedError
+
+    def list_all(self) -> List[ContentSubmission]:
+        """All submissions in creation order (metadata only, `content` empty)"""
+        raise NotImplementedError
+
+    def by_writer(self, writer_id: str) -> List[ContentSubmission]:
+        """A writer's submissions in creation order (metadata only, `content` empty)"""
+        raise NotImplementedError
+
+    def writer_ids(self) -> List[str]:
+        """IDs of every writer with at least one submission"""
+        raise NotImplementedError
+
+    def revisions(self, submission_id: str) -> List[SubmissionRevision]:
+        """Revision metadata for a submission, oldest first"""
+        return [meta for meta, _ in self._revision_rows(submission_id)]
+
+    def revision_content(self, submission_id: str, version: int) -> Optional[str]:
+        """
+        Content of one version.
+
+        Returns:
+            None if the submission or version doesn't exist
+        """
+        cache_key = f"{submission_id}:{version}"
+        content = self._revision_cache.get(cache_key)
+        if content is None:
+            history = self._revision_rows(submission_id)
+            if not 1 <= version <= len(history):
+                return None
+            content = reconstruct(history, version)
+            self._revision_cache.put(cache_key, content)
+        return content
+
+    def _revision_rows(self, submission_id: str) -> List[RevisionRow]:
+        raise NotImplementedError
+
+    def clear(self):
+        """Remove all submissions, revisions and jobs"""
+        raise NotImplementedError
+
+    def start_job(self, key: str, lease_s: float = 300.0) -> bool:
+        """
+        Claim a job key across processes.
+
+        Returns:
+            True if claimed, False if another worker holds a live lease
+        """
+        raise NotImplementedError
+
+    def finish_job(self, key: str):
+        """Release a job key"""
+        raise NotImplementedError
+
+    def job_running(self, key: str) -> bool:
+        """Whether a live lease exists for the job key"""
+        raise NotImplementedError
+
+
+class MemorySubmissionStore(SubmissionStore):
+    """Process-local storage (the original module-level dicts)"""
+
+    def __init__(self, blobs: Optional[BlobStore] = None):
+        super().__init__(blobs)
+        self.submissions: Dict[str, ContentSubmission] = {}
+        self.writers: Dict[str, List[ContentSubmission]] = {}
+        self.revision_rows: Dict[str, List[RevisionRow]] = {}
+        self.jobs: Dict[str, float] = {}
+
+    def save(self, submission: ContentSubmission):
+        with get_tracer().span("storage.save", attributes={"storage.backend": "memory", "storage.rows": 1}):
+            history = self.revision_rows.setdefault(submission.submission_id, [])
+            record, revision = self._prepare(submission, history)
+            if revision is not None:
+                history.append(revision)
+            existing = self.submissions.get(record.submission_id)
+            self.submissions[record.submission_id] = record
+            writer_submissions = self.writers.setdefault(record.writer_id, [])
+            if existing is None:
+                writer_submissions.append(record)
+            else:
+                writer_submissions[writer_submissions.index(existing)] = record
+            self._notify(record.submission_id)
+
+    def get_record(self, submission_id: str) -> Optional[ContentSubmission]:
+        return self.submissions.get(submission_id)
+
+    def list_all(self) -> List[ContentSubmission]:
+        return list(self.submissions.values())
+
+    def by_writer(self, writer_id: str) -> List[ContentSubmission]:
+        return list(self.writers.get(writer_id, []))
+
+    def writer_ids(self) -> List[str]:
+        return list(self.writers)
+
+    def _revision_rows(self, submission_id: str) -> List[RevisionRow]:
+        return list(self.revision_rows.get(submission_id, []))
+
+    def clear(self):
+        ids = list(self.submissions)
+        self.submissions.clear()
+        self.writers.clear()
+        self.revision_rows.clear()
+        self.jobs.clear()
+        self._revision_cache = LRUCache(self.REVISION_CACHE_CHARS)
+        for submission_id in ids:
+            self._notify(submission_id)
+
+    def start_job(self, key: str, lease_s: float = 300.0) -> bool:
+        now = time.time()
+        if self.jobs.get(key, 0) > now:
+            return False
+        self.jobs[key] = now + lease_s
+        return True
+
+    def finish_job(self, key: str):
+        self.jobs.pop(key, None)
+
+    def job_running(self, key: str) -> bool:
+        return self.jobs.get(key, 0) > time.time()
+
+
+class SQLiteSubmissionStore(SubmissionStore):
+    """
+    SQLite-backed storage shared by multiple worker processes.
+
+    Every write appends to a `changes` log. Before serving reads, a process
+    checks `PRAGMA data_version` (which moves when *another* connection
+    commits) and evicts only the submissions listed in new change-log rows,
+    so each worker keeps a warm local cache without serving stale data.
+    """
+
+    CHANGE_LOG_KEEP = 10000
+
+    def __init__(self, path: str, blobs: Optional[BlobStore] = None):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        # Bodies must be visible to every worker: default to files beside the database
+        super().__init__(blobs or FileBlobStore(str(Path(path).parent / "blobs")))
+        self.path = path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS submissions (
+                submission_id TEXT PRIMARY KEY,
+                writer_id TEXT NOT NULL,
+                status TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                data TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_submissions_writer ON submissions (writer_id, created_at);
+            CREATE INDEX IF NOT EXISTS idx_submissions_created ON submissions (created_at);
+            CREATE TABLE IF NOT EXISTS revisions (
+                submission_id TEXT NOT NULL,
+                version INTEGER NOT NULL,
+                meta TEXT NOT NULL,
+                payload BLOB NOT NULL,
+                PRIMARY KEY (submission_id, version)
+            );
+            CREATE TABLE IF NOT EXISTS changes (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                submission_id TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_key TEXT PRIMARY KEY,
+                owner_pid INTEGER NOT NULL,
+                expires_at REAL NOT NULL
+            );
+        """)
+
+        # Per-process cache of metadata-only records, kept consistent via the change log
+        self._cache: Dict[str, ContentSubmission] = {}
+        self._cache_complete = False
+        self._data_version = self._read_data_version()
+        self._last_seq = self._max_seq()
+
+    def _read_data_version(self) -> int:
+        return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def _max_seq(self) -> int:
+        return self._conn.execute("SELECT COALESCE(MAX(seq), 0) FROM changes").fetchone()[0]
+
+    def _sync(self):
+        """Evict entries changed by other processes since the last check"""
+        data_version = self._read_data_version()
+        if data_version != self._data_version:
+            self._data_version = data_version
+            self._apply_changes()
+
+    def refresh(self):
+        with self._lock:
+            self._sync()
+
+    def _apply_changes(self):
+        """Evict every submission logged after `_last_seq`"""
+        rows = self._conn.execute(
+            "SELECT seq, submission_id FROM changes WHERE seq > ? ORDER BY seq", (self._last_seq,)
+        ).fetchall()
+        for seq, submission_id in rows:
+            self._last_seq = seq
+            self._cache.pop(submission_id, None)
+            self._cache_complete = False
+            self._notify(submission_id)
+
+    @staticmethod
+    def _row(submission: ContentSubmission) -> tuple:
+        return (
+            submission.submission_id,
+            submission.writer_id,
+            submission.status.value,
+            submission.created_at.isoformat(),
+            submission.updated_at.isoformat(),
+            submission.model_dump_json()
+        )
+
+    def _write(self, submissions: List[ContentSubmission]):
+        attributes = {"storage.backend": "sqlite", "storage.rows": len(submissions)}
+        with get_tracer().span("storage.save", attributes=attributes), self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Holding the write lock: catch up on remote changes first so
+                # our own log rows can be skipped without missing any
+                self._apply_changes()
+
+                # Revisions are numbered inside the transaction so concurrent
+                # workers can't both claim the next version
+                records = []
+                revisions = []
+                histories: Dict[str, List[RevisionRow]] = {}
+                for submission in submissions:
+                    submission_id = submission.submission_id
+                    if submission_id not in histories:
+                        histories[submission_id] = self._revision_rows(submission_id)
+                    record, revision = self._prepare(submission, histories[submission_id])
+                    records.append(record)
+                    if revision is not None:
+                        histories[submission_id].append(revision)
+                        revisions.append((submission_id, revision))
+
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO submissions VALUES (?, ?, ?, ?, ?, ?)",
+                    [self._row(r) for r in records]
+                )
+                self._conn.executemany(
+                    "INSERT INTO revisions VALUES (?, ?, ?, ?)",
+                    [(i, meta.version, meta.model_dump_json(), payload) for i, (meta, payload) in revisions]
+                )
+                self._conn.executemany(
+                    "INSERT INTO changes (submission_id) VALUES (?)",
+                    [(s.submission_id,) for s in submissions]
+                )
+                last_seq = self._max_seq()
+                if last_seq // 1000 != (last_seq - len(submissions)) // 1000:
+                    self._conn.execute("DELETE FROM changes WHERE seq <= ?", (last_seq - self.CHANGE_LOG_KEEP,))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._last_seq = last_seq
+            self._data_version = self._read_data_version()
+            for record in records:
+                self._cache[record.submission_id] = record
+                self._notify(record.submission_id)
+
+    def save(self, submission: ContentSubmission):
+        self._write([submission])
+
+    def save_many(self, submissions: Iterable[ContentSubmission]):
+        batch = list(submissions)
+        if batch:
+            self._write(batch)
+
+    def get_record(self, submission_id: str) -> Optional[ContentSubmission]:
+        with self._lock:
+            self._sync()
+            record = self._cache.get(submission_id)
+            if record is None:
+                row = self._conn.execute(
+                    "SELECT data FROM submissions WHERE submission_id = ?", (submission_id,)
+                ).fetchone()
+                if row is None:
+                    return None
+                record = ContentSubmission.model_validate_json(row[0])
+                self._cache[submission_id] = record
+            return record
+
+    def _load(self, query: str, params: tuple = ()) -> List[ContentSubmission]:
+        """Load rows as submissions, reusing cached objects"""
+        result = []
+        for submission_id, data in self._conn.execute(query, params).fetchall():
+            submission = self._cache.get(submission_id)
+            if submission is None:
+                submission = ContentSubmission.model_validate_json(data)
+                self._cache[submission_id] = submission
+            result.append(submission)
+        return result
+
+    def list_all(self) -> List[ContentSubmission]:
+        with self._lock:
+            self._sync()
+            if self._cache_complete:
+                return sorted(self._cache.values(), key=lambda s: s.created_at)
+            result = self._load("SELECT submission_id, data FROM submissions ORDER BY created_at")
+            self._cache_complete = True
+            return result
+
+    def by_writer(self, writer_id: str) -> List[ContentSubmission]:
+        with self._lock:
+            self._sync()
+            return self._load(
+                "SELECT submission_id, data FROM submissions WHERE writer_id = ? ORDER BY created_at",
+                (writer_id,)
+            )
+
+    def writer_ids(self) -> List[str]:
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT DISTINCT writer_id FROM submissions")]
+
+    def _revision_rows(self, submission_id: str) -> List[RevisionRow]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT meta, payload FROM revisions WHERE submission_id = ? ORDER BY version", (submission_id,)
+            ).fetchall()
+        return [(SubmissionRevision.model_validate_json(meta), payload) for meta, payload in rows]
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._apply_changes()
+                ids = [row[0] for row in self._conn.execute("SELECT submission_id FROM submissions")]
+                self._conn.execute("DELETE FROM submissions")
+                self._conn.execute("DELETE FROM revisions")
+                self._conn.execute("DELETE FROM jobs")
+                self._conn.executemany("INSERT INTO changes (submission_id) VALUES (?)", [(i,) for i in ids])
+                last_seq = self._max_seq()
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._last_seq = last_seq
+            self._data_version = self._read_data_version()
+            self._cache.clear()
+            self._cache_complete = False
+            self._revision_cache = LRUCache(self.REVISION_CACHE_CHARS)
+            for submission_id in ids:
+                self._notify(submission_id)
+
+    def start_job(self, key: str, lease_s: float = 300.0) -> bool:
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute("SELECT expires_at FROM jobs WHERE job_key = ?", (key,)).fetchone()
+                claimed = not (row and row[0] > now)
+                if claimed:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO jobs VALUES (?, ?, ?)", (key, os.getpid(), now + lease_s)
+                    )
+                self._conn.execute("COMMIT")
+                return claimed
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def finish_job(self, key: str):
+        with self._lock:
+            self._conn.execute("DELETE FROM jobs WHERE job_key = ?", (key,))
+
+    def job_running(self, key: str) -> bool:
+        with self._lock:
+            row = self._conn.execute("SELECT expires_at FROM jobs WHERE job_key = ?", (key,)).fetchone()
+            return bool(row and row[0] > time.time())
+
+
+class StoreFollower:
+    """
+    Base for in-memory indexes kept in sync with a `SubmissionStore`.
+
+    `attach` loads the store's current contents (`_load`) and subscribes to
+    changes; `refresh` picks up changes, including other processes', and
+    hands the IDs changed since the last refresh to `_apply` under the index
+    lock.
+
+    Change notifications arrive with the store's lock held, while `_apply`
+    reads the store under the index lock, so the dirty set has a lock of
+    its own that is never held while taking another one.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._store: Optional[SubmissionStore] = None
+        self._dirty: Set[str] = set()
+        self._dirty_lock = threading.Lock()
+
+    def attach(self, store: SubmissionStore):
+        """Follow a store: index everything in it now, and every change later"""
+        with self._lock:
+            self._store = store
+            store.subscribe(self._mark_dirty)
+            self._load(store.list_all())
+
+    def _mark_dirty(self, submission_id: str):
+        with self._dirty_lock:
+            self._dirty.add(submission_id)
+
+    def refresh(self):
+        """Apply submissions changed since the last refresh"""
+        if self._store is None:
+            return
+        self._store.refresh()
+        with self._lock:
+            with self._dirty_lock:
+                dirty, self._dirty = self._dirty, set()
+            self._apply(dirty)
+
+    def _load(self, submissions: List[ContentSubmission]):
+        """Index a store's current (metadata-only) records"""
+        for submission in submissions:
+            self.add(submission)
+
+    def _apply(self, dirty_ids: Set[str]):
+        """Re-index changed submissions (default: `add` the record, or `remove` it if deleted)"""
+        for submission_id in dirty_ids:
+            record = self._store.get_record(submission_id)
+            if record is None:
+                self.remove(submission_id)
+            else:
+                self.add(record)
+
+
+def create_store(
+    backend: str = "memory",
+    path: str = "data/ranksmart_state.db",
+    blobs: Optional[BlobStore] = None
+) -> SubmissionStore:
+    """
+    Create the configured submission store.
+
+    Args:
+        backend: "memory" or "sqlite"
+        path: SQLite database path (sqlite backend only)
+        blobs: Blob store for article bodies (must be shared when the state is)
+    """
+    if backend == "sqlite":
+        return SQLiteSubmissionStore(path, blobs)
+    if backend == "memory":
+        return MemorySubmissionStore(blobs)
+    raise ValueError(f"Unknown storage backend: {backend}")
@@ -0,0 +1,256 @@
+"""
+RankSmart 2.0 - Structured LLM Output
+
+Requests JSON directly from the model, validates it against a per-stage
+pydantic schema, applies one local repair pass and, if fields are still
+missing or invalid, re-asks the model for just those fields.
+"""
+
+import json
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import TypeAdapter, ValidationError
+
+
+JSON_GENERATION_CONFIG = {"response_mime_type": "application/json"}
+
+_FENCE = re.compile(r"```(?:json)?\s*|```", re.IGNORECASE)
+_SMART_QUOTES = str.maketrans({"“": '"', "”": '"', "‘": "'", "’": "'"})
+_PY_LITERALS = {"True": "true", "False": "false", "None": "null"}
+
+
+class StructuredOutputError(ValueError):
+    """Raised when a stage's output is still invalid after repair and re-asks"""
+
+    def __init__(self, stage: str, errors: List[str], raw_text: str):
+        self.stage = stage
+        self.errors = errors
+        self.raw_text = raw_text
+        super().__init__(f"Invalid {stage} output from LLM: {'; '.join(errors[:5])}")
+
+
+@lru_cache(maxsize=None)
+def _adapter(schema: Any) -> TypeAdapter:
+    """Cached TypeAdapter per schema (building one is expensive)"""
+    return TypeAdapter(schema)
+
+
+def extract_json(text: str) -> Any:
+    """
+    Extract the first JSON object or array from model text.
+
+    Handles markdown code fences and prose before/after the JSON.
+
+    Raises:
+        ValueError: If no JSON value can be decoded
+    """
+    text = _FENCE.sub("", text).strip()
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        pass
+
+    # Only try where the outermost object/array can start, so a broken
+    # document never decodes to one of its nested values
+    decoder = json.JSONDecoder()
+    for start in sorted(i for i in (text.find("{"), text.find("[")) if i != -1):
+        try:
+            value, _ = decoder.raw_decode(text, start)
+            return value
+        except json.JSONDecodeError:
+            continue
+    raise ValueError("No JSON value found in response")
+
+
+def repair_json(text: str) -> str:
+    """
+    Single local repair pass for almost-JSON.
+
+    Outside of string literals it drops trailing commas, converts Python
+    literals (True/False/None), and closes unterminated strings, arrays and
+    objects (typical of truncated responses). Smart quotes are normalized.
+    """
+    text = _FENCE.sub("", text).translate(_SMART_QUOTES).strip()
+    start = min((i for i in (text.find("{"), text.find("[")) if i != -1), default=0)
+    text = text[start:]
+
+    out: List[str] = []
+    stack: List[str] = []
+    in_string = False
+    escaped = False
+    i = 0
+    while i < len(text):
+        char = text[i]
+        if in_string:
+            out.append(char)
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+            i += 1
+            continue
+
+        if char == '"':
+            in_string = True
+        elif char in "{[":
+            stack.append("}" if char == "{" else "]")
+        elif char in "}]":
+            # Drop a trailing comma before the closing bracket
+            while out and out[-1].isspace():
+                out.pop()
+            if out and out[-1] == ",":
+                out.pop()
+            if stack:
+                stack.pop()
+        else:
+            word = re.match(r"True|False|None", text[i:])
+            if word and not (out and (out[-1].isalnum() or out[-1] == "_")):
+                out.append(_PY_LITERALS[word.group()])
+                i += len(word.group())
+                continue
+        out.append(char)
+        i += 1
+
+    if in_string:
+        out.append('"')
+    repaired = "".join(out).rstrip().rstrip(",")
+    return repaired + "".join(reversed(stack))
+
+
+def error_paths(error: ValidationError) -> List[str]:
+    """Dotted field paths that failed validation (e.g. 'seo_score', '3.fix_suggestion')"""
+    paths = []
+    for item in error.errors():
+        path = ".".join(str(part) for part in item["loc"])
+        if path and path not in paths:
+            paths.append(path)
+    return paths
+
+
+def set_path(data: Any, path: str, value: Any):
+    """Set a dotted path inside nested dicts/lists, creating dicts as needed"""
+    parts = path.split(".")
+    target = data
+    for part in parts[:-1]:
+        key = int(part) if isinstance(target, list) else part
+        if isinstance(target, dict) and not isinstance(target.get(key), (dict, list)):
+            target[key] = {}
+        target = target[key]
+    last = parts[-1]
+    if isinstance(target, list):
+        target[int(last)] = value
+    else:
+        target[last] = value
+
+
+def parse_and_validate(text: str, adapter: TypeAdapter) -> Tuple[Any, Any, Optional[ValidationError], bool]:
+    """
+    Parse model text and validate it, repairing once if needed.
+
+    Returns:
+        (validated value or None, parsed data or None, validation error or None, repaired flag)
+    """
+    repaired = False
+    try:
+        data = extract_json(text)
+    except ValueError:
+        try:
+            data = json.loads(repair_json(text))
+            repaired = True
+        except json.JSONDecodeError:
+            return None, None, None, False
+
+    try:
+        return adapter.validate_python(data), data, None, repaired
+    except ValidationError as e:
+        return None, data, e, repaired
+
+
+def build_reask_prompt(prompt: str, data: Any, paths: List[str]) -> str:
+    """Prompt asking only for the fields that were missing or invalid"""
+    if data is None or not paths:
+        return (
+            f"{prompt}\n\nYour previous reply was not valid JSON. "
+            "Reply with the JSON only, no prose and no code fences."
+        )
+    return (
+        f"{prompt}\n\nYou already returned this JSON:\n{json.dumps(data)[:4000]}\n\n"
+        "These fields were missing or invalid: " + ", ".join(paths) + ".\n"
+        "Return ONLY a JSON object whose keys are exactly these field paths and whose "
+        "values are the corrected values, e.g. {\"" + paths[0] + "\": <value>}."
+    )
+
+
+async def generate_structured(
+    llm: Any,
+    prompt: str,
+    schema: Any,
+    stage: str,
+    json_mode: bool = True,
+    max_reasks: int = 1,
+    stats: Optional[Dict[str, int]] = None
+) -> Any:
+    """
+    Generate and validate structured output for one stage.
+
+    Args:
+        llm: LLMClient (anything with an async `generate(prompt, **kwargs)`)
+        prompt: Stage prompt
+        schema: Pydantic model or type (e.g. `List[IssueOutput]`)
+        stage: Stage name used in errors and stats
+        json_mode: Ask the model for `application/json` output
+        max_reasks: Maximum follow-up requests for missing/invalid fields
+        stats: Optional counter dict ('repaired', 'reasked', 'failed')
+
+    Returns:
+        Validated schema instance
+
+    Raises:
+        StructuredOutputError: If output is still invalid after all re-asks
+    """
+    adapter = _adapter(schema)
+    kwargs = {"generation_config": JSON_GENERATION_CONFIG} if json_mode else {}
+    stats = stats if stats is not None else {}
+
+    response = await llm.generate(prompt, **kwargs)
+    value, data, error, repaired = parse_and_validate(response.text, adapter)
+    if repaired:
+        stats["repaired"] = stats.get("repaired", 0) + 1
+
+    for _ in range(max_reasks):
+        if value is not None:
+            return value
+
+        paths = error_paths(error) if error is not None else []
+        stats["reasked"] = stats.get("reasked", 0) + 1
+        response = await llm.generate(build_reask_prompt(prompt, data, paths), **kwargs)
+
+        if data is None or not paths:
+            value, data, error, _ = parse_and_validate(response.text, adapter)
+            continue
+
+        try:
+            patch = extract_json(response.text)
+        except ValueError:
+            patch = {}
+        if isinstance(patch, dict):
+            for path, patch_value in patch.items():
+                try:
+                    set_path(data, path, patch_value)
+                except (IndexError, KeyError, TypeError, ValueError):
+                    continue
+        try:
+            value, error = adapter.validate_python(data), None
+        except ValidationError as e:
+            value, error = None, e
+
+    if value is not None:
+        return value
+
+    stats["failed"] = stats.get("failed", 0) + 1
+    errors = error_paths(error) if error is not None else ["response is not valid JSON"]
+    raise StructuredOutputError(stage, errors, response.text)
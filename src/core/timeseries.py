@@ -0,0 +1,226 @@
+"""
+RankSmart 2.0 - Time-Bucketed Analytics
+
+Hourly, daily and weekly counters of submission lifecycle events
+(submissions, reviews, approvals, score sums, review times and a review-time
+histogram), kept up to date from store change notifications.
+
+Each submission contributes a handful of increments to the buckets its
+`created_at` / `reviewed_at` fall into; a change retracts the old
+contribution and applies the new one. A trend or window query then reads
+buckets - O(buckets), whatever the number of submissions.
+
+Buckets follow the wall clock of the stored datetimes: days start at
+midnight and weeks on Monday.
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Tuple
+
+from src.core.schemas import ContentSubmission, SubmissionStatus
+from src.core.storage import StoreFollower
+
+
+EPOCH = datetime(1970, 1, 1)
+
+# Bucket widths in hours
+GRANULARITIES: Dict[str, int] = {"hour": 1, "day": 24, "week": 168}
+
+# Review-time histogram upper bounds in hours (the last bin is open-ended)
+REVIEW_TIME_EDGES = (1, 4, 12, 24, 48, 72, 168)
+
+# Counter slots of a bucket
+SUBMISSIONS = 0
+REVIEWS = 1
+APPROVALS = 2
+SCORE_SUM = 3
+SCORED = 4
+REVIEW_SECONDS = 5
+HISTOGRAM = 6
+SLOTS = HISTOGRAM + len(REVIEW_TIME_EDGES) + 1
+
+# (bucket hour, slot, increment)
+Increment = Tuple[int, int, int]
+
+
+def local_time(moment: datetime) -> datetime:
+    """Naive wall-clock time (aware datetimes are converted to local time)"""
+    if moment.tzinfo is not None:
+        return moment.astimezone().replace(tzinfo=None)
+    return moment
+
+
+def hour_index(moment: datetime) -> int:
+    """Hours since the epoch, on the datetime's own wall clock"""
+    return int((local_time(moment) - EPOCH).total_seconds() // 3600)
+
+
+def bucket_start(hour: int, granularity: str) -> int:
+    """First hour of the bucket containing `hour`"""
+    if granularity == "week":
+        day = hour // 24
+        return (day - (day + 3) % 7) * 24  # 1970-01-01 was a Thursday
+    return hour - hour % GRANULARITIES[granularity]
+
+
+def histogram_bin(hours: float) -> int:
+    """Histogram bin of a review time"""
+    for i, edge in enumerate(REVIEW_TIME_EDGES):
+        if hours < edge:
+            return i
+    return len(REVIEW_TIME_EDGES)
+
+
+def histogram_labels() -> List[str]:
+    """Display labels of the histogram bins ("<1h", "1-4h", ..., "168h+")"""
+    labels = [f"<{REVIEW_TIME_EDGES[0]}h"]
+    labels += [f"{low}-{high}h" for low, high in zip(REVIEW_TIME_EDGES, REVIEW_TIME_EDGES[1:])]
+    labels.append(f"{REVIEW_TIME_EDGES[-1]}h+")
+    return labels
+
+
+def contribution(submission: ContentSubmission) -> List[Increment]:
+    """
+    Counter increments of one submission (metadata records are enough).
+
+    Submissions count at `created_at`; reviews, scores and approvals at
+    `reviewed_at` (`updated_at` for records scored or approved without one).
+    """
+    created = hour_index(submission.created_at)
+    increments = [(created, SUBMISSIONS, 1)]
+    reviewed = hour_index(submission.reviewed_at or submission.updated_at)
+    if submission.reviewed_at:
+        seconds = max(0, round((submission.reviewed_at - submission.created_at).total_seconds()))
+        increments.append((reviewed, REVIEWS, 1))
+        increments.append((reviewed, REVIEW_SECONDS, seconds))
+        increments.append((reviewed, HISTOGRAM + histogram_bin(seconds / 3600), 1))
+    if submission.scores:
+        increments.append((reviewed, SCORE_SUM, submission.scores.overall_score))
+        increments.append((reviewed, SCORED, 1))
+    if submission.status in (SubmissionStatus.APPROVED, SubmissionStatus.PUBLISHED):
+        increments.append((reviewed, APPROVALS, 1))
+    return increments
+
+
+def summarize(counters: List[int]) -> Dict[str, Any]:
+    """Dashboard view of a bucket (or of a sum of buckets)"""
+    reviews = counters[REVIEWS]
+    scored = counters[SCORED]
+    return {
+        "submissions": counters[SUBMISSIONS],
+        "reviews": reviews,
+        "approvals": counters[APPROVALS],
+        "approval_rate": round(counters[APPROVALS] / reviews * 100, 1) if reviews else 0.0,
+        "average_score": round(counters[SCORE_SUM] / scored, 1) if scored else 0.0,
+        "average_review_time": round(counters[REVIEW_SECONDS] / reviews / 3600, 1) if reviews else 0.0,
+        "review_time_histogram": dict(zip(histogram_labels(), counters[HISTOGRAM:]))
+    }
+
+
+class RollingAnalytics(StoreFollower):
+    """Time-bucketed lifecycle counters for a store's submissions"""
+
+    def __init__(self):
+        super().__init__()
+        self._buckets: Dict[str, Dict[int, List[int]]] = {g: {} for g in GRANULARITIES}
+        self._totals = [0] * SLOTS
+        self._contributions: Dict[str, List[Increment]] = {}
+
+    # ===================================
+    # Maintenance
+    # ===================================
+
+    def _count(self, increments: List[Increment], sign: int):
+        for hour, slot, value in increments:
+            value *= sign
+            self._totals[slot] += value
+            for granularity, buckets in self._buckets.items():
+                start = bucket_start(hour, granularity)
+                counters = buckets.get(start)
+                if counters is None:
+                    counters = buckets[start] = [0] * SLOTS
+                counters[slot] += value
+                if sign < 0 and not any(counters):
+                    del buckets[start]
+
+    def add(self, submission: ContentSubmission):
+        """Count (or re-count) a submission"""
+        increments = contribution(submission)
+        with self._lock:
+            previous = self._contributions.get(submission.submission_id)
+            if previous == increments:
+                return
+            if previous is not None:
+                self._count(previous, -1)
+            self._contributions[submission.submission_id] = increments
+            self._count(increments, 1)
+
+    def remove(self, submission_id: str):
+        """Retract a submission (no-op if absent)"""
+        with self._lock:
+            previous = self._contributions.pop(submission_id, None)
+            if previous is not None:
+                self._count(previous, -1)
+
+    # ===================================
+    # Queries
+    # ===================================
+
+    def totals(self) -> Dict[str, Any]:
+        """All-time summary"""
+        self.refresh()
+        with self._lock:
+            return summarize(self._totals)
+
+    def window(self, start: datetime, end: datetime) -> Dict[str, Any]:
+        """
+        Summary of events in [start, end), at hour resolution.
+
+        Whole weeks and days inside the window are read from the coarser
+        buckets, so a window costs at most ~60 bucket reads plus one per week.
+        """
+        start, end = local_time(start), local_time(end)
+        first = hour_index(start)
+        last = hour_index(end)
+        if end > EPOCH + timedelta(hours=last):
+            last += 1  # a partial last hour counts as a whole one
+
+        self.refresh()
+        with self._lock:
+            counters = [0] * SLOTS
+            hour = first
+            while hour < last:
+                for granularity in ("week", "day", "hour"):
+                    width = GRANULARITIES[granularity]
+                    if bucket_start(hour, granularity) == hour and hour + width <= last:
+                        break
+                bucket = self._buckets[granularity].get(hour)
+                if bucket is not None:
+                    for slot, value in enumerate(bucket):
+                        counters[slot] += value
+                hour += width
+            return summarize(counters)
+
+    def series(self, granularity: str, start: datetime, end: datetime) -> List[Dict[str, Any]]:
+        """
+        Per-bucket summaries from the bucket containing `start` to the one
+        containing `end` (empty buckets included).
+
+        Raises:
+            KeyError: If the granularity isn't hour, day or week
+        """
+        width = GRANULARITIES[granularity]
+        first = bucket_start(hour_index(start), granularity)
+        last = bucket_start(hour_index(end), granularity)
+
+        self.refresh()
+        with self._lock:
+            buckets = self._buckets[granularity]
+            empty = [0] * SLOTS
+            result = []
+            for hour in range(first, last + 1, width):
+                result.append({
+                    "start": (EPOCH + timedelta(hours=hour)).isoformat(),
+                    **summarize(buckets.get(hour, empty))
+                })
+            return result
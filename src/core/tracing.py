@@ -0,0 +1,329 @@
+"""
+RankSmart 2.0 - Request Tracing
+
+Lightweight spans propagated through context variables:
+HTTP route -> ContentManagerAgent stage -> LLM call -> storage write.
+
+Sampling is decided once per trace (at the root span). Sampled spans are
+queued and written by a background thread as JSON lines in the OTLP/JSON
+`resourceSpans` shape, so recording a span never blocks the event loop.
+Every span, sampled or not, carries a trace ID for log correlation.
+"""
+
+import atexit
+import json
+import queue
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+class SpanKind:
+    """OTLP span kinds"""
+    INTERNAL = 1
+    SERVER = 2
+    CLIENT = 3
+
+
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("ranksmart_current_span", default=None)
+
+
+class Span:
+    """One timed operation within a trace"""
+
+    __slots__ = (
+        "name", "kind", "trace_id", "span_id", "parent_span_id", "sampled",
+        "start_ns", "end_ns", "attributes", "status_code", "status_message"
+    )
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: str,
+        parent_span_id: Optional[str],
+        sampled: bool,
+        kind: int = SpanKind.INTERNAL,
+        attributes: Optional[Dict[str, Any]] = None
+    ):
+        self.name = name
+        self.kind = kind
+        self.trace_id = trace_id
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_span_id = parent_span_id
+        self.sampled = sampled
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.status_code = STATUS_OK
+        self.status_message = ""
+
+    def set_attribute(self, key: str, value: Any):
+        """Attach an attribute (str, int, float or bool)"""
+        self.attributes[key] = value
+
+    def record_exception(self, error: BaseException):
+        """Mark the span as failed"""
+        self.status_code = STATUS_ERROR
+        self.status_message = f"{type(error).__name__}: {error}"[:500]
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end_ns or time.time_ns()
+        return (end - self.start_ns) / 1e6
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """OTLP/JSON span representation"""
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [{"key": k, "value": _otlp_value(v)} for k, v in self.attributes.items()],
+            "status": {"code": self.status_code}
+        }
+        if self.parent_span_id:
+            span["parentSpanId"] = self.parent_span_id
+        if self.status_message:
+            span["status"]["message"] = self.status_message
+        return span
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class JSONLSpanExporter:
+    """
+    Writes finished spans to a JSON-lines file from a background thread.
+
+    `export` only enqueues; when the queue is full the span is dropped and
+    counted rather than blocking the caller.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        service_name: str = "ranksmart",
+        max_queue: int = 10000,
+        batch_size: int = 512,
+        flush_interval_s: float = 1.0
+    ):
+        self.path = Path(path)
+        self.service_name = service_name
+        self.batch_size = batch_size
+        self.flush_interval_s = flush_interval_s
+        self.dropped = 0
+        self._queue: "queue.Queue[Optional[Span]]" = queue.Queue(maxsize=max_queue)
+        self._thread = threading.Thread(target=self._run, name="span-exporter", daemon=True)
+        self._thread.start()
+        atexit.register(self.shutdown)
+
+    def export(self, span: Span):
+        """Queue a finished span (never blocks)"""
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self):
+        while True:
+            batch: List[Span] = []
+            stop = False
+            deadline = time.monotonic() + self.flush_interval_s
+            while len(batch) < self.batch_size:
+                try:
+                    span = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if span is None:
+                    stop = True
+                    break
+                batch.append(span)
+            if batch:
+                self._write(batch)
+            if stop:
+                return
+
+    def _write(self, batch: List[Span]):
+        payload = {
+            "resourceSpans": [{
+                "resource": {"attributes": [
+                    {"key": "service.name", "value": {"stringValue": self.service_name}}
+                ]},
+                "scopeSpans": [{
+                    "scope": {"name": "ranksmart.tracing"},
+                    "spans": [span.to_otlp() for span in batch]
+                }]
+            }]
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(payload, separators=(",", ":")) + "\n")
+
+    def shutdown(self, timeout_s: float = 5.0):
+        """Flush queued spans and stop the writer thread"""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout_s)
+
+
+class Tracer:
+    """
+    Creates spans and hands sampled ones to an exporter.
+
+    Args:
+        exporter: Destination for finished sampled spans (None disables export)
+        sample_rate: Fraction of new traces that are recorded (0.0-1.0)
+    """
+
+    def __init__(self, exporter: Optional[JSONLSpanExporter] = None, sample_rate: float = 1.0):
+        self.exporter = exporter
+        self.sample_rate = sample_rate if exporter else 0.0
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        kind: int = SpanKind.INTERNAL,
+        attributes: Optional[Dict[str, Any]] = None,
+        remote_parent: Optional[Tuple[str, str, bool]] = None
+    ) -> Iterator[Span]:
+        """
+        Record a span around a block of (sync or async) code.
+
+        Args:
+            name: Span name (e.g. "agent.scores")
+            kind: `SpanKind` value
+            attributes: Initial attributes
+            remote_parent: (trace_id, span_id, sampled) from an incoming traceparent header
+        """
+        parent = _current_span.get()
+        if parent is not None:
+            trace_id, parent_id, sampled = parent.trace_id, parent.span_id, parent.sampled
+        elif remote_parent is not None:
+            trace_id, parent_id, sampled = remote_parent
+            sampled = sampled and self.exporter is not None
+        else:
+            trace_id, parent_id = f"{random.getrandbits(128):032x}", None
+            sampled = self.sample_rate > 0 and random.random() < self.sample_rate
+
+        span = Span(name, trace_id, parent_id, sampled, kind, attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_exception(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end_ns = time.time_ns()
+            if span.sampled and self.exporter is not None:
+                self.exporter.export(span)
+
+
+def current_span() -> Optional[Span]:
+    """Span active in the current context, if any"""
+    return _current_span.get()
+
+
+def parse_traceparent(header: Optional[str]) -> Optional[Tuple[str, str, bool]]:
+    """Parse a W3C `traceparent` header into (trace_id, parent span_id, sampled)"""
+    if not header:
+        return None
+    parts = header.strip().split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    try:
+        flags = int(parts[3], 16)
+        int(parts[1], 16), int(parts[2], 16)
+    except ValueError:
+        return None
+    return parts[1], parts[2], bool(flags & 1)
+
+
+def add_trace_context(record: Dict[str, Any]):
+    """Loguru patcher that tags every log record with the current trace/span ID"""
+    span = _current_span.get()
+    record["extra"]["trace_id"] = span.trace_id if span else "-"
+    record["extra"]["span_id"] = span.span_id if span else "-"
+
+
+_tracer: Optional[Tracer] = None
+
+
+@lru_cache(maxsize=None)
+def _configured_tracer() -> Tracer:
+    from src.config import get_config
+    settings = get_config().tracing
+    if not settings.enabled or settings.sample_rate <= 0:
+        return Tracer()
+    return Tracer(JSONLSpanExporter(settings.file), settings.sample_rate)
+
+
+def get_tracer() -> Tracer:
+    """Process-wide tracer (configured from `TRACE_*` settings on first use)"""
+    return _tracer or _configured_tracer()
+
+
+def set_tracer(tracer: Optional[Tracer]):
+    """Override the process-wide tracer (None restores the configured one)"""
+    global _tracer
+    _tracer = tracer
+
+
+class TracingMiddleware:
+    """
+    ASGI middleware opening a server span per HTTP request.
+
+    Continues an incoming W3C `traceparent` and returns the trace ID in the
+    `X-Trace-Id` response header.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers") or [])
+        remote = parse_traceparent(headers.get(b"traceparent", b"").decode("latin-1"))
+        method = scope.get("method", "GET")
+        attributes = {"http.method": method, "http.target": scope.get("path", "")}
+
+        with get_tracer().span(f"{method} {scope.get('path', '')}", SpanKind.SERVER, attributes, remote) as span:
+            async def send_with_trace(message):
+                if message["type"] == "http.response.start":
+                    span.set_attribute("http.status_code", message["status"])
+                    if message["status"] >= 500:
+                        span.status_code = STATUS_ERROR
+                    message = dict(message)
+                    message["headers"] = list(message.get("headers", [])) + [
+                        (b"x-trace-id", span.trace_id.encode("latin-1"))
+                    ]
+                await send(message)
+
+            await self.app(scope, receive, send_with_trace)
+
+            # Name by route template once routing has happened
+            route = scope.get("route")
+            if route is not None and getattr(route, "path", None):
+                span.name = f"{method} {route.path}"
+                span.set_attribute("http.route", route.path)
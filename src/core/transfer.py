@@ -0,0 +1,216 @@
+"""
+RankSmart 2.0 - Bulk Import / Export
+
+Streaming NDJSON export of submissions (content, scores, annotations and
+feedback; one `ContentSubmission` per line) and batched bulk import through
+the storage layer.
+
+Export walks the listing index page by page and hydrates one submission at
+a time, so memory stays constant however many submissions are exported.
+Import validates each line, and writes valid records with `save_many` in
+batches (one transaction per batch on SQLite).
+
+Usage:
+    python -m src.core.transfer export --output submissions.ndjson
+    python -m src.core.transfer import submissions.ndjson --batch-size 2000
+"""
+
+import argparse
+import sys
+import time
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Union
+
+from pydantic import ValidationError
+
+from src.core.listing import ListingQuery, SubmissionListIndex
+from src.core.schemas import ContentSubmission, ImportReport
+
+if TYPE_CHECKING:
+    from src.core.storage import SubmissionStore
+
+
+# Submissions hydrated per listing page during export
+EXPORT_PAGE_SIZE = 500
+
+# Validation errors kept in an import report
+MAX_REPORTED_ERRORS = 100
+
+
+def export_ndjson(
+    store: "SubmissionStore",
+    index: SubmissionListIndex,
+    query: ListingQuery = ListingQuery()
+) -> Iterator[bytes]:
+    """
+    Stream submissions as NDJSON lines, oldest first.
+
+    Args:
+        store: Store to read full submissions from
+        index: Listing index following `store` (provides the order and filters)
+        query: Optional filters (status, writer, score, dates, ...)
+
+    Yields:
+        One UTF-8 encoded JSON line per submission
+    """
+    cursor = None
+    while True:
+        ids, cursor = index.page(query, cursor, EXPORT_PAGE_SIZE, descending=False)
+        for submission_id in ids:
+            submission = store.get(submission_id)
+            if submission is not None:  # deleted since the page was read
+                yield submission.model_dump_json().encode("utf-8") + b"\n"
+        if cursor is None:
+            return
+
+
+class BulkImporter:
+    """
+    Incremental NDJSON importer: feed lines, then `finish()`.
+
+    Args:
+        store: Store to write submissions to
+        batch_size: Records per `save_many` call (one transaction on SQLite)
+        skip_existing: Leave submissions whose ID already exists untouched
+            (default: replace them)
+    """
+
+    def __init__(self, store: "SubmissionStore", batch_size: int = 1000, skip_existing: bool = False):
+        self.store = store
+        self.batch_size = max(1, batch_size)
+        self.skip_existing = skip_existing
+        self.report = ImportReport()
+        self._batch: List[ContentSubmission] = []
+        self._line_number = 0
+        self._started = time.perf_counter()
+
+    def add_line(self, line: Union[str, bytes]):
+        """Validate one NDJSON line and queue it (blank lines are ignored)"""
+        self._line_number += 1
+        if not line.strip():
+            return
+        try:
+            submission = ContentSubmission.model_validate_json(line)
+        except ValidationError as e:
+            self.report.failed += 1
+            if len(self.report.errors) < MAX_REPORTED_ERRORS:
+                self.report.errors.append({"line": self._line_number, "error": _first_error(e)})
+            return
+        self._batch.append(submission)
+        if len(self._batch) >= self.batch_size:
+            self.flush()
+
+    def add_lines(self, lines: Iterable[Union[str, bytes]]):
+        """`add_line` for each of `lines`"""
+        for line in lines:
+            self.add_line(line)
+
+    def flush(self):
+        """Write queued records"""
+        batch, self._batch = self._batch, []
+        if self.skip_existing:
+            kept = [s for s in batch if self.store.get_record(s.submission_id) is None]
+            self.report.skipped += len(batch) - len(kept)
+            batch = kept
+        if batch:
+            self.store.save_many(batch)
+            self.report.imported += len(batch)
+
+    def finish(self) -> ImportReport:
+        """Write remaining records and return the report"""
+        self.flush()
+        self.report.seconds = round(time.perf_counter() - self._started, 3)
+        self.report.records_per_second = round(self.report.imported / self.report.seconds, 1) if self.report.seconds else 0.0
+        return self.report
+
+
+def import_ndjson(
+    store: "SubmissionStore",
+    lines: Iterable[Union[str, bytes]],
+    batch_size: int = 1000,
+    skip_existing: bool = False
+) -> ImportReport:
+    """
+    Import NDJSON submission lines.
+
+    Args:
+        store: Store to write submissions to
+        lines: NDJSON lines (e.g. an open file)
+        batch_size: Records per storage transaction
+        skip_existing: Leave existing submission IDs untouched
+
+    Returns:
+        ImportReport with counts, the first validation errors and throughput
+    """
+    importer = BulkImporter(store, batch_size, skip_existing)
+    importer.add_lines(lines)
+    return importer.finish()
+
+
+def _first_error(error: ValidationError) -> str:
+    details = error.errors()
+    if not details:
+        return str(error)
+    location = ".".join(str(part) for part in details[0].get("loc", ()))
+    return f"{location}: {details[0]['msg']}" if location else details[0]["msg"]
+
+
+# ===================================
+# CLI
+# ===================================
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Bulk import/export of content manager submissions (NDJSON)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = commands.add_parser("export", help="Write every submission as NDJSON")
+    export_parser.add_argument("--output", help="Output file (default: stdout)")
+    export_parser.add_argument("--status", help="Only submissions with this status")
+    export_parser.add_argument("--writer-id", help="Only this writer's submissions")
+
+    import_parser = commands.add_parser("import", help="Load submissions from NDJSON")
+    import_parser.add_argument("input", help="NDJSON file ('-' for stdin)")
+    import_parser.add_argument("--batch-size", type=int, default=1000, help="Records per transaction")
+    import_parser.add_argument("--skip-existing", action="store_true", help="Keep existing submissions")
+
+    args = parser.parse_args(argv)
+
+    # The store the API uses (STATE_BACKEND / STATE_DB_PATH / BLOB_PATH)
+    from src.api.content_manager_routes import get_store
+    store = get_store()
+
+    if args.command == "export":
+        index = SubmissionListIndex()
+        index.attach(store)
+        query = ListingQuery(status=args.status, writer_id=args.writer_id)
+        out = open(args.output, "wb") if args.output else sys.stdout.buffer
+        count = 0
+        started = time.perf_counter()
+        try:
+            for line in export_ndjson(store, index, query):
+                out.write(line)
+                count += 1
+        finally:
+            if args.output:
+                out.close()
+        seconds = time.perf_counter() - started
+        print(f"Exported {count} submissions in {seconds:.1f}s ({count / max(seconds, 1e-9):.0f} records/s)", file=sys.stderr)
+        return 0
+
+    source = sys.stdin.buffer if args.input == "-" else open(args.input, "rb")
+    try:
+        report = import_ndjson(store, source, args.batch_size, args.skip_existing)
+    finally:
+        if source is not sys.stdin.buffer:
+            source.close()
+    print(
+        f"Imported {report.imported}, skipped {report.skipped}, failed {report.failed} "
+        f"in {report.seconds:.1f}s ({report.records_per_second:.0f} records/s)",
+        file=sys.stderr
+    )
+    for error in report.errors[:10]:
+        print(f"  line {error['line']}: {error['error']}", file=sys.stderr)
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""
+RankSmart 2.0 - Writer Trend Engine
+
+Score trends for many writers at once, as NumPy operations over padded
+score matrices: least-squares slopes, EWMA-smoothed scores and the fitted
+change of each skill over a writer's history.
+
+A batch is a `(writers x positions)` integer matrix plus a validity mask,
+left-aligned: column j holds each writer's j-th score, oldest first. Sums
+run over integers and smoothing runs column by column, so one writer alone
+and the same writer in a batch of thousands get identical numbers.
+"""
+
+from typing import Dict, List, NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+
+# Weight of the newest score in the smoothed score
+EWMA_ALPHA = 0.3
+
+# Skill area name -> `ContentScore` field, in `WriterProgress.skill_areas` order
+SKILL_COLUMNS = (
+    ("SEO Optimization", "seo_score"),
+    ("E-E-A-T", "eeat_score"),
+    ("Content Quality", "content_quality"),
+    ("Compliance", "compliance_score")
+)
+
+# (scores, mask), both (writers x positions)
+Padded = Tuple[np.ndarray, np.ndarray]
+
+
+class WriterTrends(NamedTuple):
+    """Trend model outputs, one entry per writer"""
+    improvement_rate: np.ndarray  # Slope of the recent score trend (points per article)
+    smoothed_score: np.ndarray    # EWMA of every overall score (0 without scores)
+    skill_improvement: Dict[str, np.ndarray]  # Fitted change from first to latest article, per skill
+
+
+def pad(sequences: Sequence[Sequence[int]]) -> Padded:
+    """Pad per-writer score sequences into a matrix"""
+    lengths = np.fromiter((len(s) for s in sequences), dtype=np.int64, count=len(sequences))
+    groups = np.repeat(np.arange(len(sequences)), lengths)
+    positions = np.arange(len(groups)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    values = np.fromiter((v for s in sequences for v in s), dtype=np.int64, count=len(groups))
+    return pad_groups(groups, positions, values, len(sequences))
+
+
+def pad_groups(groups: np.ndarray, positions: np.ndarray, values: np.ndarray, group_count: int) -> Padded:
+    """
+    Pad flat (group, position, value) entries into a matrix.
+
+    Args:
+        groups: Writer index of each score
+        positions: Index of each score within its writer's history (0 = oldest)
+        values: Scores
+        group_count: Number of writers (rows)
+    """
+    width = int(positions.max()) + 1 if len(positions) else 1
+    scores = np.zeros((group_count, width), dtype=np.int64)
+    mask = np.zeros((group_count, width), dtype=bool)
+    scores[groups, positions] = values
+    mask[groups, positions] = True
+    return scores, mask
+
+
+def slopes(padded: Padded) -> np.ndarray:
+    """Least-squares slope of each row over its positions (0 under two scores)"""
+    scores, mask = padded
+    n = mask.sum(axis=1)
+    x = np.where(mask, np.arange(scores.shape[1]), 0)
+    sum_x = x.sum(axis=1)
+    numerator = n * (x * scores).sum(axis=1) - sum_x * scores.sum(axis=1)
+    denominator = n * (x * x).sum(axis=1) - sum_x * sum_x
+    return np.divide(numerator, denominator, out=np.zeros(len(n)), where=denominator > 0)
+
+
+def fitted_change(padded: Padded) -> np.ndarray:
+    """Change between the first and latest score along each row's fitted line"""
+    return slopes(padded) * np.maximum(padded[1].sum(axis=1) - 1, 0)
+
+
+def ewma(padded: Padded, alpha: float = EWMA_ALPHA) -> np.ndarray:
+    """Exponentially weighted moving average of each row, at its latest score"""
+    scores, mask = padded
+    smoothed = np.where(mask[:, 0], scores[:, 0], 0).astype(np.float64)
+    for j in range(1, scores.shape[1]):
+        smoothed = np.where(mask[:, j], alpha * scores[:, j] + (1 - alpha) * smoothed, smoothed)
+    return smoothed
+
+
+def writer_trends(
+    score_trend: Padded,
+    overall_history: Padded,
+    skill_histories: Dict[str, Padded],
+    alpha: float = EWMA_ALPHA
+) -> WriterTrends:
+    """
+    Trend model for a batch of writers.
+
+    Args:
+        score_trend: Recent overall scores (`WriterProgress.score_trend`)
+        overall_history: Every overall score, oldest first
+        skill_histories: Skill name -> every score of that skill, oldest first
+        alpha: EWMA weight of the newest score
+
+    Returns:
+        WriterTrends with one entry per writer (row)
+    """
+    return WriterTrends(
+        improvement_rate=slopes(score_trend),
+        smoothed_score=ewma(overall_history, alpha),
+        skill_improvement={skill: fitted_change(history) for skill, history in skill_histories.items()}
+    )
+
+
+def single_writer_trends(
+    score_trend: List[int],
+    overall_history: List[int],
+    skill_histories: Dict[str, List[int]],
+    alpha: float = EWMA_ALPHA
+) -> Tuple[float, float, Dict[str, float]]:
+    """
+    `writer_trends` for one writer's score lists.
+
+    Plain Python (NumPy call overhead dominates for a single short row),
+    performing the same integer sums and float operations in the same order,
+    so results are identical to the batch computation.
+
+    Returns:
+        (improvement rate, smoothed score, skill -> fitted change)
+    """
+    smoothed = float(overall_history[0]) if overall_history else 0.0
+    for score in overall_history[1:]:
+        smoothed = alpha * score + (1 - alpha) * smoothed
+    return (
+        _slope(score_trend),
+        smoothed,
+        {skill: _slope(history) * max(len(history) - 1, 0) for skill, history in skill_histories.items()}
+    )
+
+
+def _slope(values: List[int]) -> float:
+    n = len(values)
+    sum_x = n * (n - 1) // 2
+    denominator = n * (n - 1) * (2 * n - 1) // 6 * n - sum_x * sum_x
+    if denominator <= 0:
+        return 0.0
+    numerator = n * sum(x * y for x, y in enumerate(values)) - sum_x * sum(values)
+    return numerator / denominator
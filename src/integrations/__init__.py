@@ -0,0 +1,40 @@
+"""
+RankSmart 2.0 - Integrations Package
+
+Outbound integrations: team notifications (Slack/Discord webhooks) and
+CMS publishing (WordPress/Webflow).
+"""
+
+from .notifications import (
+    Notification,
+    NotificationDispatcher,
+    RetryQueue,
+    Webhook,
+    discord_webhook,
+    publish_event,
+    review_event,
+    slack_webhook
+)
+from .publishing import (
+    CMSTarget,
+    PublicationLedger,
+    Publisher,
+    WebflowTarget,
+    WordPressTarget
+)
+
+__all__ = [
+    "CMSTarget",
+    "Notification",
+    "NotificationDispatcher",
+    "PublicationLedger",
+    "Publisher",
+    "RetryQueue",
+    "Webhook",
+    "WebflowTarget",
+    "WordPressTarget",
+    "discord_webhook",
+    "publish_event",
+    "review_event",
+    "slack_webhook"
+]
@@ -0,0 +1,35 @@
+"""
+RankSmart 2.0 - Outbound HTTP Helpers
+
+Retry classification and backoff shared by the webhook and CMS clients.
+"""
+
+import random
+from typing import Optional
+
+import httpx
+
+
+# Statuses worth retrying (rate limited / transient server errors)
+RETRY_STATUSES = {408, 425, 429, 500, 502, 503, 504}
+
+
+def retry_after(response: httpx.Response) -> Optional[float]:
+    """Delay requested by the server's `Retry-After` header (seconds), if any"""
+    try:
+        return float(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, base_s: float, cap_s: float, minimum_s: Optional[float] = None) -> float:
+    """
+    Full-jitter exponential backoff.
+
+    Args:
+        attempt: Attempts made so far (1 = first retry)
+        base_s: Delay bound for the first retry (doubles per attempt)
+        cap_s: Delay bound cap
+        minimum_s: Lower bound (e.g. the server's Retry-After)
+    """
+    return max(random.uniform(0, min(cap_s, base_s * 2 ** (attempt - 1))), minimum_s or 0.0)
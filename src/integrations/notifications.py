@@ -0,0 +1,402 @@
+"""
+RankSmart 2.0 - Team Notifications
+
+Review and publish events posted to Slack and Discord incoming webhooks.
+
+`NotificationDispatcher.notify` only enqueues (bounded; events are dropped
+and counted when the queue is full), so request handlers never wait on a
+webhook. A background thread runs an event loop that:
+
+- coalesces events arriving within `batch_window_s` into one digest message
+  per webhook, keeping bursts under the webhooks' rate limits
+- posts over a pooled `httpx.AsyncClient` (keep-alive connections)
+- puts failed deliveries (network errors, 429, 5xx) in a SQLite retry queue
+  and resends them with full-jitter exponential backoff, honouring
+  `Retry-After`; the queue survives restarts
+"""
+
+import asyncio
+import atexit
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import httpx
+from loguru import logger
+
+from src.core.schemas import ContentSubmission
+from src.integrations.http import RETRY_STATUSES, backoff_delay, retry_after
+
+
+# Lines listed in one digest message (the rest are summarized)
+MAX_DIGEST_LINES = 20
+
+# Discord rejects messages longer than this
+DISCORD_MAX_CHARS = 2000
+
+
+class Notification(NamedTuple):
+    """One event for the team channels"""
+    kind: str  # "review" / "publish"
+    text: str
+    url: Optional[str] = None
+
+
+class Webhook(NamedTuple):
+    """A webhook endpoint and how to render a batch of events for it"""
+    name: str
+    url: str
+    render: Callable[[List[Notification]], dict]
+
+
+# ===================================
+# Events
+# ===================================
+
+def review_event(submission: ContentSubmission) -> Notification:
+    """Notification for a completed review"""
+    critical = sum(1 for a in submission.annotations if a.severity.value == "critical")
+    score = f"{submission.scores.overall_score}/100" if submission.scores else "unscored"
+    text = f"Reviewed \"{submission.title}\" by {submission.writer_name}: {score}"
+    if critical:
+        text += f", {critical} critical issue{'s' if critical > 1 else ''}"
+    return Notification("review", text)
+
+
+def publish_event(submission: ContentSubmission, platform: str, url: Optional[str] = None) -> Notification:
+    """Notification for an article published to `platform`"""
+    return Notification("publish", f"Published \"{submission.title}\" by {submission.writer_name} to {platform}", url)
+
+
+# ===================================
+# Message formats
+# ===================================
+
+def _digest_lines(events: List[Notification], link: Callable[[Notification], str]) -> List[str]:
+    lines = [f"• {link(event)}" for event in events[:MAX_DIGEST_LINES]]
+    if len(events) > MAX_DIGEST_LINES:
+        lines.append(f"…and {len(events) - MAX_DIGEST_LINES} more")
+    return lines
+
+
+def slack_payload(events: List[Notification]) -> dict:
+    """Slack incoming-webhook body (mrkdwn links)"""
+    def link(event: Notification) -> str:
+        return f"{event.text} (<{event.url}|view>)" if event.url else event.text
+
+    if len(events) == 1:
+        return {"text": link(events[0])}
+    return {"text": "\n".join([f"*RankSmart: {len(events)} updates*"] + _digest_lines(events, link))}
+
+
+def discord_payload(events: List[Notification]) -> dict:
+    """Discord webhook body (markdown, capped at DISCORD_MAX_CHARS)"""
+    def link(event: Notification) -> str:
+        return f"{event.text} (<{event.url}>)" if event.url else event.text
+
+    if len(events) == 1:
+        content = link(events[0])
+    else:
+        content = "\n".join([f"**RankSmart: {len(events)} updates**"] + _digest_lines(events, link))
+    if len(content) > DISCORD_MAX_CHARS:
+        content = content[:DISCORD_MAX_CHARS - 1] + "…"
+    return {"content": content}
+
+
+def slack_webhook(url: str) -> Webhook:
+    return Webhook("slack", url, slack_payload)
+
+
+def discord_webhook(url: str) -> Webhook:
+    return Webhook("discord", url, discord_payload)
+
+
+# ===================================
+# Durable retry queue
+# ===================================
+
+class RetryItem(NamedTuple):
+    id: int
+    webhook: str
+    payload: dict
+    attempts: int
+
+
+class RetryQueue:
+    """
+    Failed deliveries awaiting another attempt, in SQLite.
+
+    Args:
+        path: Database file (":memory:" for a non-durable queue)
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS notification_retries (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                webhook TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                attempts INTEGER NOT NULL,
+                not_before REAL NOT NULL
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_notification_retries_due ON notification_retries (not_before)"
+        )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM notification_retries").fetchone()[0]
+
+    def push(self, webhook: str, payload: dict, attempts: int, not_before: float):
+        """Queue a delivery for another attempt at `not_before` (epoch seconds)"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO notification_retries (webhook, payload, attempts, not_before) VALUES (?, ?, ?, ?)",
+                (webhook, json.dumps(payload), attempts, not_before)
+            )
+
+    def due(self, now: float, limit: int = 50) -> List[RetryItem]:
+        """Deliveries whose retry time has come, oldest first"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, webhook, payload, attempts FROM notification_retries "
+                "WHERE not_before <= ? ORDER BY not_before LIMIT ?",
+                (now, limit)
+            ).fetchall()
+        return [RetryItem(row[0], row[1], json.loads(row[2]), row[3]) for row in rows]
+
+    def claim(self, item_id: int, now: float, lease_s: float) -> bool:
+        """
+        Take a due delivery for `lease_s` seconds.
+
+        Every worker process polls the same queue; only the one whose claim
+        succeeds posts the message. Should it die mid-post, the item comes
+        due again when the lease runs out.
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE notification_retries SET not_before = ? WHERE id = ? AND not_before <= ?",
+                (now + lease_s, item_id, now)
+            )
+        return cursor.rowcount == 1
+
+    def reschedule(self, item_id: int, attempts: int, not_before: float):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE notification_retries SET attempts = ?, not_before = ? WHERE id = ?",
+                (attempts, not_before, item_id)
+            )
+
+    def remove(self, item_id: int):
+        with self._lock:
+            self._conn.execute("DELETE FROM notification_retries WHERE id = ?", (item_id,))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+# ===================================
+# Dispatcher
+# ===================================
+
+class NotificationDispatcher:
+    """
+    Batches events into webhook messages from a background event loop.
+
+    Args:
+        webhooks: Destinations (an empty list makes `notify` a no-op)
+        retry_queue: Durable store for failed deliveries
+        max_queue: Events waiting for dispatch before new ones are dropped
+        batch_window_s: How long to gather events into one digest
+        max_batch: Events per digest
+        max_connections: HTTP connection pool size
+        timeout_s: Per-request timeout
+        base_backoff_s: First retry delay bound (doubles per attempt)
+        max_backoff_s: Retry delay cap
+        max_attempts: Deliveries given up after this many attempts
+        retry_poll_s: How often the retry queue is checked
+    """
+
+    def __init__(
+        self,
+        webhooks: List[Webhook],
+        retry_queue: Optional[RetryQueue] = None,
+        max_queue: int = 1000,
+        batch_window_s: float = 2.0,
+        max_batch: int = 50,
+        max_connections: int = 10,
+        timeout_s: float = 10.0,
+        base_backoff_s: float = 2.0,
+        max_backoff_s: float = 600.0,
+        max_attempts: int = 8,
+        retry_poll_s: float = 1.0
+    ):
+        self.webhooks: Dict[str, Webhook] = {webhook.name: webhook for webhook in webhooks}
+        self.retry_queue = retry_queue if retry_queue is not None else RetryQueue()
+        self.max_queue = max_queue
+        self.batch_window_s = batch_window_s
+        self.max_batch = max_batch
+        self.max_connections = max_connections
+        self.timeout_s = timeout_s
+        self.base_backoff_s = base_backoff_s
+        self.max_backoff_s = max_backoff_s
+        self.max_attempts = max_attempts
+        self.retry_poll_s = retry_poll_s
+
+        self.sent = 0      # messages delivered
+        self.dropped = 0   # events refused because the queue was full
+        self.failed = 0    # messages given up on (rejected, or out of attempts)
+
+        self._start_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._events: Optional["asyncio.Queue[Optional[Notification]]"] = None
+        self._ready = threading.Event()
+        self._closed = False
+
+    # ----- producer side (any thread) -----
+
+    def notify(self, event: Notification):
+        """Queue an event for the team channels (never blocks)"""
+        if not self.webhooks or self._closed:
+            return
+        self._ensure_started()
+        self._loop.call_soon_threadsafe(self._enqueue, event)
+
+    def close(self, timeout_s: float = 10.0):
+        """Send queued events and stop (pending retries stay in the retry queue)"""
+        self._closed = True
+        if self._thread is None or not self._thread.is_alive():
+            return
+        self._loop.call_soon_threadsafe(self._events.put_nowait, None)
+        self._thread.join(timeout_s)
+
+    def _ensure_started(self):
+        with self._start_lock:
+            if self._thread is not None:
+                return
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self._run, name="notification-dispatcher", daemon=True)
+            self._thread.start()
+            atexit.register(self.close)
+        self._ready.wait()
+
+    def _enqueue(self, event: Notification):
+        if self._events.qsize() >= self.max_queue:
+            self.dropped += 1
+            logger.warning(f"Notification queue full, dropped {event.kind} event")
+            return
+        self._events.put_nowait(event)
+
+    # ----- background loop -----
+
+    def _run(self):
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_until_complete(self._main())
+        finally:
+            self._loop.close()
+
+    async def _main(self):
+        # Unbounded here; `_enqueue` enforces max_queue so the stop sentinel always fits
+        self._events = asyncio.Queue()
+        self._ready.set()
+        limits = httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_connections)
+        async with httpx.AsyncClient(timeout=self.timeout_s, limits=limits) as client:
+            retries = asyncio.create_task(self._retry_loop(client))
+            try:
+                await self._dispatch_loop(client)
+            finally:
+                retries.cancel()
+                try:
+                    await retries
+                except asyncio.CancelledError:
+                    pass
+
+    async def _dispatch_loop(self, client: httpx.AsyncClient):
+        loop = asyncio.get_running_loop()
+        while True:
+            event = await self._events.get()
+            if event is None:
+                return
+            batch = [event]
+            stop = False
+            deadline = loop.time() + self.batch_window_s
+            while len(batch) < self.max_batch:
+                try:
+                    event = await asyncio.wait_for(self._events.get(), max(0.0, deadline - loop.time()))
+                except asyncio.TimeoutError:
+                    break
+                if event is None:
+                    stop = True
+                    break
+                batch.append(event)
+            await asyncio.gather(*(
+                self._deliver(client, webhook, webhook.render(batch)) for webhook in self.webhooks.values()
+            ))
+            if stop:
+                return
+
+    async def _deliver(self, client: httpx.AsyncClient, webhook: Webhook, payload: dict):
+        """First attempt at a message; failures go to the retry queue"""
+        done, requested_delay = await self._post(client, webhook, payload)
+        if not done:
+            self.retry_queue.push(webhook.name, payload, 1, time.time() + self._retry_delay(1, requested_delay))
+
+    async def _retry_loop(self, client: httpx.AsyncClient):
+        while True:
+            for item in self.retry_queue.due(time.time()):
+                webhook = self.webhooks.get(item.webhook)
+                if webhook is None:  # no longer configured
+                    self.retry_queue.remove(item.id)
+                    continue
+                if not self.retry_queue.claim(item.id, time.time(), lease_s=2 * self.timeout_s):
+                    continue  # another worker is posting it
+                done, requested_delay = await self._post(client, webhook, item.payload)
+                attempts = item.attempts + 1
+                if done:
+                    self.retry_queue.remove(item.id)
+                elif attempts >= self.max_attempts:
+                    self.retry_queue.remove(item.id)
+                    self.failed += 1
+                    logger.error(f"Giving up on {webhook.name} notification after {attempts} attempts")
+                else:
+                    self.retry_queue.reschedule(item.id, attempts, time.time() + self._retry_delay(attempts, requested_delay))
+            await asyncio.sleep(self.retry_poll_s)
+
+    async def _post(self, client: httpx.AsyncClient, webhook: Webhook, payload: dict) -> Tuple[bool, Optional[float]]:
+        """
+        POST one message.
+
+        Returns:
+            (done, retry_after): done is False when the message should be
+            retried; retry_after is the server's requested delay, if any
+        """
+        try:
+            response = await client.post(webhook.url, json=payload)
+        except httpx.HTTPError as e:
+            logger.warning(f"{webhook.name} notification failed: {e!r}")
+            return False, None
+        if response.status_code < 300:
+            self.sent += 1
+            return True, None
+        if response.status_code in RETRY_STATUSES:
+            logger.warning(f"{webhook.name} notification got HTTP {response.status_code}, will retry")
+            return False, retry_after(response)
+        self.failed += 1
+        logger.error(f"{webhook.name} rejected notification: HTTP {response.status_code} {response.text[:200]}")
+        return True, None
+
+    def _retry_delay(self, attempts: int, retry_after_s: Optional[float]) -> float:
+        """Full-jitter exponential backoff, at least the server's Retry-After"""
+        return backoff_delay(attempts, self.base_backoff_s, self.max_backoff_s, retry_after_s)
@@ -0,0 +1,500 @@
+"""
+RankSmart 2.0 - CMS Publishing
+
+Pushes approved submissions to WordPress (REST API, application passwords)
+and Webflow (CMS API v2) over one pooled `httpx.AsyncClient`, with a
+concurrency limit per site.
+
+Idempotency: each (submission, platform) pair has a key. The publication
+ledger (SQLite) records the key before a post is created and the remote ID
+once it exists. A retry after a timeout or crash between the two looks the
+post up by its deterministic slug instead of creating it again, and
+republishing unchanged content sends no request at all. Changed content
+updates the existing post.
+"""
+
+import asyncio
+import hashlib
+import html
+import re
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import httpx
+from loguru import logger
+
+from src.core.schemas import ContentSubmission, PublishJob, PublishResult, SubmissionStatus
+from src.integrations.http import RETRY_STATUSES, backoff_delay, retry_after
+from src.integrations.notifications import NotificationDispatcher, publish_event
+
+if TYPE_CHECKING:
+    from src.core.storage import SubmissionStore
+
+try:
+    import markdown
+except ImportError:  # pragma: no cover - optional renderer
+    markdown = None
+
+
+# Submissions that may go to a CMS (published ones can be updated)
+PUBLISHABLE = {SubmissionStatus.APPROVED, SubmissionStatus.PUBLISHED}
+
+# Title characters kept in slugs
+SLUG_TITLE_CHARS = 60
+
+
+class Post(NamedTuple):
+    """What a CMS receives for a submission"""
+    title: str
+    slug: str
+    html: str
+
+
+class RemotePost(NamedTuple):
+    """A post/item as it exists in a CMS"""
+    remote_id: str
+    url: Optional[str] = None
+
+
+# `request(method, url, **httpx_kwargs)` -> response (raises for error statuses)
+Request = Callable[..., Awaitable[httpx.Response]]
+
+
+def idempotency_key(submission_id: str, platform: str) -> str:
+    """Stable key for publishing a submission to a platform"""
+    return hashlib.sha256(f"{platform}:{submission_id}".encode("utf-8")).hexdigest()[:32]
+
+
+def slugify(submission: ContentSubmission) -> str:
+    """Deterministic slug: the title plus a submission ID prefix (unique per submission)"""
+    title = re.sub(r"[^a-z0-9]+", "-", submission.title.lower()).strip("-")[:SLUG_TITLE_CHARS].strip("-")
+    suffix = submission.submission_id.replace("-", "")[:8]
+    return f"{title}-{suffix}" if title else suffix
+
+
+def render_html(submission: ContentSubmission) -> str:
+    """Article body as HTML (markdown is converted; HTML passes through)"""
+    if submission.content_format == "html":
+        return submission.content
+    if markdown is not None:
+        return markdown.markdown(submission.content)
+    # Without the markdown package: one paragraph per blank-line separated block
+    blocks = [block.strip() for block in submission.content.split("\n\n") if block.strip()]
+    return "\n".join(f"<p>{html.escape(block, quote=False)}</p>" for block in blocks)
+
+
+def build_post(submission: ContentSubmission) -> Post:
+    return Post(submission.title, slugify(submission), render_html(submission))
+
+
+def _digest(post: Post) -> str:
+    return hashlib.sha256(f"{post.title}\0{post.slug}\0{post.html}".encode("utf-8")).hexdigest()
+
+
+# ===================================
+# CMS targets
+# ===================================
+
+class CMSTarget:
+    """
+    A CMS site: how to find, create and update posts.
+
+    Args:
+        name: Platform name used in requests and results
+        concurrency: Requests in flight to this site at once
+    """
+
+    def __init__(self, name: str, concurrency: int = 4):
+        self.name = name
+        self.concurrency = max(1, concurrency)
+
+    async def find(self, request: Request, slug: str) -> Optional[RemotePost]:
+        """Existing post with this slug, if any"""
+        raise NotImplementedError
+
+    async def create(self, request: Request, post: Post, key: str) -> RemotePost:
+        """Create and publish a post"""
+        raise NotImplementedError
+
+    async def update(self, request: Request, remote_id: str, post: Post) -> RemotePost:
+        """Replace an existing post's title and body"""
+        raise NotImplementedError
+
+
+class WordPressTarget(CMSTarget):
+    """
+    WordPress REST API (`/wp-json/wp/v2/posts`) with an application password.
+
+    Args:
+        site_url: Site root (e.g. https://example.com)
+        username: WordPress user
+        app_password: Application password for that user
+        concurrency: Requests in flight to the site at once
+    """
+
+    def __init__(self, site_url: str, username: str, app_password: str, concurrency: int = 4):
+        super().__init__("wordpress", concurrency)
+        self.posts_url = f"{site_url.rstrip('/')}/wp-json/wp/v2/posts"
+        self.auth = httpx.BasicAuth(username, app_password)
+
+    async def find(self, request: Request, slug: str) -> Optional[RemotePost]:
+        response = await request(
+            "GET", self.posts_url, auth=self.auth,
+            params={"slug": slug, "status": "publish,future,draft,pending,private", "_fields": "id,link"}
+        )
+        posts = response.json()
+        return RemotePost(str(posts[0]["id"]), posts[0].get("link")) if posts else None
+
+    async def create(self, request: Request, post: Post, key: str) -> RemotePost:
+        response = await request(
+            "POST", self.posts_url, auth=self.auth, headers={"Idempotency-Key": key},
+            json={"title": post.title, "slug": post.slug, "content": post.html, "status": "publish"}
+        )
+        data = response.json()
+        return RemotePost(str(data["id"]), data.get("link"))
+
+    async def update(self, request: Request, remote_id: str, post: Post) -> RemotePost:
+        response = await request(
+            "POST", f"{self.posts_url}/{remote_id}", auth=self.auth,
+            json={"title": post.title, "slug": post.slug, "content": post.html, "status": "publish"}
+        )
+        data = response.json()
+        return RemotePost(str(data["id"]), data.get("link"))
+
+
+class WebflowTarget(CMSTarget):
+    """
+    Webflow CMS API v2: live items in one collection.
+
+    Args:
+        api_token: Webflow API token
+        collection_id: Blog post collection
+        body_field: Rich text field slug that holds the article body
+        api_url: API root
+        concurrency: Requests in flight to the API at once
+    """
+
+    def __init__(
+        self,
+        api_token: str,
+        collection_id: str,
+        body_field: str = "post-body",
+        api_url: str = "https://api.webflow.com/v2",
+        concurrency: int = 4
+    ):
+        super().__init__("webflow", concurrency)
+        self.items_url = f"{api_url.rstrip('/')}/collections/{collection_id}/items"
+        self.body_field = body_field
+        self.headers = {"Authorization": f"Bearer {api_token}"}
+
+    def _item(self, post: Post) -> Dict[str, Any]:
+        return {
+            "isArchived": False,
+            "isDraft": False,
+            "fieldData": {"name": post.title, "slug": post.slug, self.body_field: post.html}
+        }
+
+    async def find(self, request: Request, slug: str) -> Optional[RemotePost]:
+        response = await request("GET", self.items_url, headers=self.headers, params={"slug": slug})
+        items = response.json().get("items", [])
+        return RemotePost(items[0]["id"]) if items else None
+
+    async def create(self, request: Request, post: Post, key: str) -> RemotePost:
+        response = await request(
+            "POST", f"{self.items_url}/live", headers={**self.headers, "Idempotency-Key": key}, json=self._item(post)
+        )
+        return RemotePost(response.json()["id"])
+
+    async def update(self, request: Request, remote_id: str, post: Post) -> RemotePost:
+        response = await request("PATCH", f"{self.items_url}/{remote_id}/live", headers=self.headers, json=self._item(post))
+        return RemotePost(response.json()["id"])
+
+
+# ===================================
+# Publication ledger
+# ===================================
+
+class LedgerEntry(NamedTuple):
+    key: str
+    submission_id: str
+    platform: str
+    remote_id: Optional[str]  # None while the first create is in flight (or was interrupted)
+    url: Optional[str]
+    digest: Optional[str]     # What was last published (unchanged content is skipped)
+
+
+class PublicationLedger:
+    """
+    Idempotency keys and remote IDs of published submissions, in SQLite.
+
+    Args:
+        path: Database file (":memory:" for a non-durable ledger)
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS publications (
+                idempotency_key TEXT PRIMARY KEY,
+                submission_id TEXT NOT NULL,
+                platform TEXT NOT NULL,
+                remote_id TEXT,
+                url TEXT,
+                digest TEXT,
+                updated_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_publications_submission ON publications (submission_id)")
+
+    def get(self, key: str) -> Optional[LedgerEntry]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT idempotency_key, submission_id, platform, remote_id, url, digest "
+                "FROM publications WHERE idempotency_key = ?",
+                (key,)
+            ).fetchone()
+        return LedgerEntry(*row) if row else None
+
+    def for_submission(self, submission_id: str) -> List[LedgerEntry]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT idempotency_key, submission_id, platform, remote_id, url, digest "
+                "FROM publications WHERE submission_id = ? ORDER BY platform",
+                (submission_id,)
+            ).fetchall()
+        return [LedgerEntry(*row) for row in rows]
+
+    def begin(self, key: str, submission_id: str, platform: str):
+        """Record that a create is about to be sent"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO publications (idempotency_key, submission_id, platform, updated_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, submission_id, platform, time.time())
+            )
+
+    def complete(self, key: str, remote: RemotePost, digest: str):
+        """Record the remote post and the content it now holds"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE publications SET remote_id = ?, url = ?, digest = ?, updated_at = ? WHERE idempotency_key = ?",
+                (remote.remote_id, remote.url, digest, time.time(), key)
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+# ===================================
+# Publisher
+# ===================================
+
+class Publisher:
+    """
+    Publishes submissions to CMS targets.
+
+    Args:
+        targets: Configured CMS sites
+        ledger: Idempotency ledger (in-memory by default)
+        store: If given, fully published submissions are marked PUBLISHED
+        notifier: If given, receives a publish event per created post
+        max_connections: HTTP connection pool size (all sites)
+        timeout_s: Per-request timeout
+        max_retries: Retries per submission and platform on transient failures
+        base_backoff_s: First retry delay bound (doubles per attempt)
+        max_backoff_s: Retry delay cap
+        transport: httpx transport override (e.g. a mock CMS in tests)
+    """
+
+    def __init__(
+        self,
+        targets: List[CMSTarget],
+        ledger: Optional[PublicationLedger] = None,
+        store: Optional["SubmissionStore"] = None,
+        notifier: Optional[NotificationDispatcher] = None,
+        max_connections: int = 20,
+        timeout_s: float = 30.0,
+        max_retries: int = 3,
+        base_backoff_s: float = 0.5,
+        max_backoff_s: float = 30.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        self.targets: Dict[str, CMSTarget] = {target.name: target for target in targets}
+        self.ledger = ledger if ledger is not None else PublicationLedger()
+        self.store = store
+        self.notifier = notifier
+        self.max_connections = max_connections
+        self.timeout_s = timeout_s
+        self.max_retries = max_retries
+        self.base_backoff_s = base_backoff_s
+        self.max_backoff_s = max_backoff_s
+        self.transport = transport
+
+    def resolve(self, platforms: Optional[Iterable[str]] = None) -> List[CMSTarget]:
+        """
+        Targets for platform names (all configured targets by default).
+
+        Raises:
+            ValueError: If a platform isn't configured
+        """
+        if not platforms:
+            return list(self.targets.values())
+        unknown = [p for p in platforms if p not in self.targets]
+        if unknown:
+            raise ValueError(f"CMS not configured: {', '.join(unknown)} (configured: {', '.join(self.targets) or 'none'})")
+        return [self.targets[p] for p in dict.fromkeys(platforms)]
+
+    async def publish(self, submission: ContentSubmission, platforms: Optional[List[str]] = None) -> List[PublishResult]:
+        """Publish one submission; returns one result per platform"""
+        return (await self.publish_many([submission], platforms)).results
+
+    async def publish_many(
+        self,
+        submissions: Iterable[ContentSubmission],
+        platforms: Optional[List[str]] = None,
+        job: Optional[PublishJob] = None
+    ) -> PublishJob:
+        """
+        Publish submissions to every requested platform.
+
+        Args:
+            submissions: Submissions to publish (duplicates are published once)
+            platforms: Platform names (default: all configured)
+            job: Progress record to update as pairs finish (created if omitted)
+
+        Returns:
+            The finished PublishJob
+
+        Raises:
+            ValueError: If a platform isn't configured
+        """
+        targets = self.resolve(platforms)
+        unique = list({s.submission_id: s for s in submissions}.values())
+        job = job or PublishJob(job_id=str(uuid.uuid4()))
+        job.total = len(unique) * len(targets)
+        limits = {target.name: asyncio.Semaphore(target.concurrency) for target in targets}
+
+        pool = httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_connections)
+        async with httpx.AsyncClient(timeout=self.timeout_s, limits=pool, transport=self.transport) as client:
+            async def request(method: str, url: str, **kwargs) -> httpx.Response:
+                response = await client.request(method, url, **kwargs)
+                response.raise_for_status()
+                return response
+
+            async def publish_submission(submission: ContentSubmission):
+                results = await asyncio.gather(*(
+                    self._publish_one(request, limits[target.name], submission, target, job) for target in targets
+                ))
+                if all(result.state != "failed" for result in results):
+                    self._mark_published(submission, results)
+
+            await asyncio.gather(*(publish_submission(s) for s in unique))
+
+        job.done = True
+        job.finished_at = datetime.now()
+        return job
+
+    async def _publish_one(
+        self,
+        request: Request,
+        limit: asyncio.Semaphore,
+        submission: ContentSubmission,
+        target: CMSTarget,
+        job: PublishJob
+    ) -> PublishResult:
+        """Publish one pair, retrying transient failures; records the result on `job`"""
+        if submission.status not in PUBLISHABLE:
+            result = PublishResult(
+                submission_id=submission.submission_id, platform=target.name, state="failed",
+                error=f"Submission is {submission.status.value}, not approved"
+            )
+        else:
+            async with limit:
+                result = await self._publish_with_retries(request, submission, target)
+        job.results.append(result)
+        job.completed += 1
+        if result.state == "failed":
+            job.failed += 1
+        return result
+
+    async def _publish_with_retries(self, request: Request, submission: ContentSubmission, target: CMSTarget) -> PublishResult:
+        key = idempotency_key(submission.submission_id, target.name)
+        post = build_post(submission)
+        attempt = 0
+        while True:
+            try:
+                state, remote = await self._sync(request, target, key, submission.submission_id, post)
+                return PublishResult(
+                    submission_id=submission.submission_id, platform=target.name,
+                    state=state, remote_id=remote.remote_id, url=remote.url
+                )
+            except httpx.HTTPError as e:
+                transient, requested_delay = _classify(e)
+                attempt += 1
+                if not transient or attempt > self.max_retries:
+                    logger.warning(f"Publishing {submission.submission_id} to {target.name} failed: {e!r}")
+                    return PublishResult(
+                        submission_id=submission.submission_id, platform=target.name, state="failed", error=str(e) or repr(e)
+                    )
+                await asyncio.sleep(backoff_delay(attempt, self.base_backoff_s, self.max_backoff_s, requested_delay))
+            except (ValueError, KeyError) as e:
+                # A 2xx with a body that isn't the API's JSON: retrying won't help
+                logger.warning(f"Publishing {submission.submission_id} to {target.name} got an unexpected response: {e!r}")
+                return PublishResult(
+                    submission_id=submission.submission_id, platform=target.name, state="failed",
+                    error=f"Unexpected {target.name} response: {e!r}"
+                )
+
+    async def _sync(self, request: Request, target: CMSTarget, key: str, submission_id: str, post: Post) -> Tuple[str, RemotePost]:
+        """Bring the remote post in line with `post`; every step is safe to repeat"""
+        digest = _digest(post)
+        entry = self.ledger.get(key)
+        if entry is not None and entry.remote_id is not None:
+            if entry.digest == digest:
+                return "unchanged", RemotePost(entry.remote_id, entry.url)
+            remote = await target.update(request, entry.remote_id, post)
+            state = "updated"
+        else:
+            # An earlier attempt may have created the post before failing
+            remote = await target.find(request, post.slug) if entry is not None else None
+            if remote is None:
+                self.ledger.begin(key, submission_id, target.name)
+                remote = await target.create(request, post, key)
+            else:
+                remote = await target.update(request, remote.remote_id, post)
+            state = "created"
+        self.ledger.complete(key, remote, digest)
+        return state, remote
+
+    def _mark_published(self, submission: ContentSubmission, results: List[PublishResult]):
+        """Set PUBLISHED/published_at and announce new posts"""
+        if self.store is not None:
+            current = self.store.get(submission.submission_id)
+            if current is not None and current.status == SubmissionStatus.APPROVED:
+                current.status = SubmissionStatus.PUBLISHED
+                current.published_at = datetime.now()
+                current.updated_at = current.published_at
+                self.store.save(current)
+        if self.notifier is not None:
+            for result in results:
+                if result.state == "created":
+                    self.notifier.notify(publish_event(submission, result.platform, result.url))
+
+
+def _classify(error: httpx.HTTPError) -> Tuple[bool, Optional[float]]:
+    """(transient, requested delay) for a failed request"""
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status in RETRY_STATUSES, retry_after(error.response)
+    return isinstance(error, httpx.TransportError), None
@@ -8,25 +8,50 @@ It initializes the FastAPI server with Content Manager routes.
 import os
 import sys
 from pathlib import Path
+from typing import Optional
 from dotenv import load_dotenv
 from loguru import logger
-import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from src.api.rate_limit import RateLimitMiddleware
+from src.api.responses import CompressionMiddleware
+from src.config import get_config
+from src.core.tracing import TracingMiddleware, add_trace_context
+
 # Add src directory to Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
 # Load environment variables
 load_dotenv()
 
-# Configure logging
-logger.add(
-    "logs/ranksmart.log",
-    rotation="500 MB",
-    retention="10 days",
-    level=os.getenv("LOG_LEVEL", "INFO")
-)
+# Records carry the trace ID of the active request
+logger.configure(patcher=add_trace_context)
+
+_file_sink: Optional[int] = None
+
+
+def configure_file_logging():
+    """
+    Add the log file sink (LOG_FILE, empty to disable), once per process.
+
+    Done at startup rather than import so importing the app (tests, tools)
+    writes no log files. The sink writes from a background thread so it
+    never blocks the loop.
+    """
+    global _file_sink
+    path = os.getenv("LOG_FILE", "logs/ranksmart.log")
+    if _file_sink is not None or not path:
+        return
+    _file_sink = logger.add(
+        path,
+        rotation="500 MB",
+        retention="10 days",
+        level=os.getenv("LOG_LEVEL", "INFO"),
+        format="{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | trace={extra[trace_id]} | {name}:{function}:{line} - {message}",
+        enqueue=True
+    )
+
 
 # Create FastAPI app
 app = FastAPI(
@@ -35,6 +60,9 @@ app = FastAPI(
     version="2.0.0"
 )
 
+# Per-client rate limits, RATE_LIMIT_* settings (inside CORS so 429s stay readable by browsers)
+app.add_middleware(RateLimitMiddleware)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -44,6 +72,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress JSON/NDJSON responses above a size threshold (brotli if installed, else gzip)
+app.add_middleware(CompressionMiddleware, minimum_size=int(os.getenv("COMPRESSION_MIN_BYTES", "1024")))
+
+# Request tracing (route -> agent stage -> LLM call -> storage write)
+app.add_middleware(TracingMiddleware)
+
 
 @app.get("/")
 async def root():
@@ -66,6 +100,28 @@ async def health_check():
     return {"status": "healthy", "version": "2.0.0"}
 
 
+def create_app() -> FastAPI:
+    """
+    Register routes and return the app.
+
+    Used as the uvicorn app factory so every worker process registers the
+    routes itself.
+    """
+    configure_file_logging()
+    from src.api.content_manager_routes import router as content_manager_router
+    if not any(getattr(route, "path", "").startswith(content_manager_router.prefix) for route in app.routes):
+        app.include_router(content_manager_router)
+    
+    # Serve generated images at the URLs recorded on results (an absolute
+    # IMAGE_BASE_URL means another server, e.g. a CDN, serves the directory)
+    from fastapi.staticfiles import StaticFiles
+    images = get_config().images
+    base_url = images.base_url.rstrip("/")
+    if base_url.startswith("/") and not any(getattr(route, "path", None) == base_url for route in app.routes):
+        app.mount(base_url, StaticFiles(directory=images.output_dir, check_dir=False), name="images")
+    return app
+
+
 def main():
     """Main application entry point."""
     logger.info("🚀 Starting RankSmart 2.0...")
@@ -79,22 +135,43 @@ def main():
         logger.info("💡 Please copy .env.example to .env and add your API keys")
         sys.exit(1)
     
+    config = get_config()
+    workers = config.app.workers
+    if workers > 1 and config.database.state_backend == "memory":
+        # Per-process dicts would split submissions across workers
+        # (the environment carries the switch into the worker processes)
+        config.database.state_backend = "sqlite"
+        os.environ["STATE_BACKEND"] = "sqlite"
+        logger.info("🗄️ Multiple workers: using shared SQLite state")
+    
     try:
-        # Import and register routes
-        from src.api.content_manager_routes import router as content_manager_router
-        app.include_router(content_manager_router)
+        # Imported here: not needed to build the app (e.g. under an external server)
+        import uvicorn
+        
+        # Import and register routes (fails fast before forking workers)
+        create_app()
         
         logger.info("✅ Environment configured successfully")
         logger.info("✅ Content Manager routes registered")
-        logger.info("🌐 Starting FastAPI server...")
+        logger.info(f"🌐 Starting FastAPI server ({workers} worker{'s' if workers > 1 else ''})...")
         
         # Start server
-        uvicorn.run(
-            app,
-            host="0.0.0.0",
-            port=8000,
-            log_level="info"
-        )
+        if workers > 1:
+            uvicorn.run(
+                "src.main:create_app",
+                factory=True,
+                host="0.0.0.0",
+                port=config.app.port,
+                workers=workers,
+                log_level="info"
+            )
+        else:
+            uvicorn.run(
+                app,
+                host="0.0.0.0",
+                port=config.app.port,
+                log_level="info"
+            )
         
     except ImportError as e:
         logger.error(f"❌ Failed to import routes: {e}")
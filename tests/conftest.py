@@ -0,0 +1,27 @@
+"""
+Shared Test Setup
+
+Tests build the app with the default configuration. Request tracing and
+the log file are turned off so test runs don't leave `logs/traces.jsonl` or
+`logs/ranksmart.log` behind; the tracing tests install their own tracer
+writing under `tmp_path`.
+"""
+
+import os
+
+import pytest
+
+
+QUIET_ENV = {"TRACE_ENABLED": "false", "LOG_FILE": ""}
+
+
+@pytest.fixture(autouse=True, scope="session")
+def disable_tracing_and_log_file():
+    previous = {name: os.environ.get(name) for name in QUIET_ENV}
+    os.environ.update(QUIET_ENV)
+    yield
+    for name, value in previous.items():
+        if value is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = value
@@ -0,0 +1,87 @@
+"""
+Audit Stage Graph Tests
+
+Independent audit stages run concurrently, outputs are cached by input hash
+and unchanged stages are skipped on re-runs.
+"""
+
+import asyncio
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+STAGES_PATH = Path(__file__).parent.parent / "🧩 ai_seo_audit_team" / "🧠 ai_seo_audit_team" / "stages.py"
+spec = importlib.util.spec_from_file_location("audit_stages", STAGES_PATH)
+stages = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(stages)
+
+
+def audit_graph(calls, cache=None, delay_s=0.05):
+    async def fetch(kind, value):
+        calls.append(kind)
+        await asyncio.sleep(delay_s)
+        return f"{kind}:{value}"
+
+    graph = stages.StageGraph(inputs=["url"], cache=cache)
+    graph.add("page", lambda url: asyncio.run(fetch("page", url)), ["url"])
+    graph.add("serp", lambda url: asyncio.run(fetch("serp", url)), ["url"])
+    for rank in range(3):
+        async def competitor(serp, rank=rank):
+            return await fetch(f"competitor_{rank}", serp)
+        graph.add(f"competitor_{rank}", competitor, ["serp"])
+    graph.add("report", lambda page, **competitors: " | ".join([page, *sorted(competitors.values())]),
+              ["page", "competitor_0", "competitor_1", "competitor_2"], cache=False)
+    return graph
+
+
+def test_independent_stages_overlap():
+    calls = []
+    run = asyncio.run(audit_graph(calls).run({"url": "https://example.com"}))
+    assert run.outputs["report"].startswith("page:https://example.com | competitor_0:serp:")
+    assert sorted(calls) == sorted(["page", "serp", "competitor_0", "competitor_1", "competitor_2"])
+
+    # Critical path is serp -> competitor (2 delays), not the sum of all five
+    stage_total = sum(t.seconds for t in run.timings)
+    assert run.wall_s < 0.17 and stage_total > 0.24
+    assert [t.name for t in run.timings][-1] == "report"
+    assert "| page |" in run.summary()
+
+
+def test_reruns_skip_unchanged_stages(tmp_path):
+    calls = []
+    cache = stages.StageCache(str(tmp_path))
+    asyncio.run(audit_graph(calls, cache).run({"url": "https://example.com"}))
+
+    # A new process (fresh memory) with the same inputs only runs uncached stages
+    calls.clear()
+    run = asyncio.run(audit_graph(calls, stages.StageCache(str(tmp_path))).run({"url": "https://example.com"}))
+    assert calls == []
+    assert run.cached == ["page", "serp", "competitor_0", "competitor_1", "competitor_2"]
+
+    run = asyncio.run(audit_graph(calls, cache).run({"url": "https://example.org"}, targets=["competitor_1"]))
+    assert sorted(calls) == ["competitor_1", "serp"]
+    assert set(run.outputs) == {"url", "serp", "competitor_1"}
+
+    expired = stages.StageCache(str(tmp_path), ttl_s=0)
+    calls.clear()
+    asyncio.run(audit_graph(calls, expired).run({"url": "https://example.com"}, targets=["page"]))
+    assert calls == ["page"]
+
+
+def test_graph_validation():
+    graph = stages.StageGraph(inputs=["url"])
+    graph.add("page", lambda url: url, ["url"])
+    with pytest.raises(ValueError):
+        graph.add("report", lambda serp: serp, ["serp"])
+    with pytest.raises(ValueError):
+        graph.add("page", lambda url: url, ["url"])
+    with pytest.raises(ValueError):
+        asyncio.run(graph.run({}))
+
+    def boom(page):
+        raise RuntimeError("scrape failed")
+
+    graph.add("broken", boom, ["page"])
+    with pytest.raises(RuntimeError):
+        asyncio.run(graph.run({"url": "https://example.com"}))
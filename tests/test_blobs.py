@@ -0,0 +1,89 @@
+"""
+Blob Store Tests
+
+Article bodies are deduplicated by hash, compressed at rest and served
+from an LRU cache; submission stores keep only metadata.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.blobs import FileBlobStore, LRUCache, MemoryBlobStore
+from src.core.schemas import ContentSubmission
+from src.core.storage import MemorySubmissionStore, SQLiteSubmissionStore
+
+BODY = "Casino A is great. Casino B pays out fast.\n" * 300
+
+
+def make_submission(submission_id: str, content: str = BODY) -> ContentSubmission:
+    return ContentSubmission(
+        submission_id=submission_id, writer_id="w1", writer_name="Writer", title="Best Casinos", content=content
+    )
+
+
+def test_blobs_are_deduplicated_and_compressed():
+    blobs = MemoryBlobStore()
+    first = blobs.put(BODY)
+    assert blobs.put(BODY) == first
+    assert blobs.stats["dedup_hits"] == 1
+    assert blobs.stats["stored_bytes"] < blobs.stats["raw_bytes"] / 10
+    assert blobs.get(first) == BODY
+
+    with pytest.raises(KeyError):
+        blobs.get("0" * 64)
+
+
+def test_file_blobs_are_shared_between_instances(tmp_path):
+    key = FileBlobStore(str(tmp_path)).put(BODY)
+    other = FileBlobStore(str(tmp_path))
+    assert other.exists(key)
+    assert other.get(key) == BODY
+    assert other.stats["cache_misses"] == 1
+    assert other.get(key) == BODY
+    assert other.stats["cache_hits"] == 1
+    assert not list(tmp_path.rglob(".tmp-*"))
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(max_chars=10)
+    cache.put("a", "aaaa")
+    cache.put("b", "bbbb")
+    cache.get("a")
+    cache.put("c", "cccc")
+    assert cache.get("b") is None
+    assert cache.get("a") == "aaaa" and cache.get("c") == "cccc"
+    assert cache.size == 8
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_stores_keep_metadata_only(tmp_path, backend):
+    blobs = MemoryBlobStore()
+    if backend == "sqlite":
+        store = SQLiteSubmissionStore(str(tmp_path / "state.db"), blobs)
+    else:
+        store = MemorySubmissionStore(blobs)
+
+    submission = make_submission("s1")
+    store.save(submission)
+    store.save(make_submission("s2"))
+    assert submission.content_hash is not None
+    assert blobs.stats["dedup_hits"] == 1
+
+    # Listing and analytics never load bodies
+    gets = blobs.stats["cache_hits"] + blobs.stats["cache_misses"]
+    listed = store.list_all() + store.by_writer("w1")
+    assert all(s.content == "" and s.content_hash == submission.content_hash for s in listed)
+    assert blobs.stats["cache_hits"] + blobs.stats["cache_misses"] == gets
+
+    full = store.get("s1")
+    assert full.content == BODY
+
+    full.content = "Revised body"
+    store.save(full)
+    assert store.get("s1").content == "Revised body"
+    assert store.get("s2").content == BODY
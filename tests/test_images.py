@@ -0,0 +1,112 @@
+"""
+Image Pipeline Tests
+
+Prompts are deduplicated (in flight and through the content-addressed
+cache), post-processed into resized images and thumbnails in a process
+pool, and recorded on the optimization result.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.stub_images import StubImageGenerator
+from src.core.images import ImageCache, ImagePipeline, ImageSpec
+from src.core.schemas import ContentMode, OptimizationResult
+
+
+def test_prompts_are_deduplicated_and_post_processed(tmp_path):
+    generator = StubImageGenerator(latency_s=0.05)
+    cache = ImageCache(str(tmp_path / "images"), "https://cdn.example.com/images")
+
+    async def run():
+        async with ImagePipeline(generator, cache, concurrency=4, process_workers=2) as pipeline:
+            images = await pipeline.generate(["Casino lobby", "Slot reels", "Casino   lobby", "Casino lobby"])
+            return images, pipeline.stats
+
+    images, stats = asyncio.run(run())
+    assert generator.calls == 2
+    assert stats["generated"] == 2 and stats["coalesced"] == 2
+    assert images[0].key == images[2].key == images[3].key != images[1].key
+    assert images[2].prompt == "Casino   lobby"
+    assert images[0].url.startswith("https://cdn.example.com/images/")
+
+    path = tmp_path / "images" / images[0].key[:2] / images[0].key
+    with Image.open(f"{path}.webp") as main, Image.open(f"{path}-thumb.webp") as thumbnail:
+        assert (main.format, main.size) == ("WEBP", (1200, 630))
+        assert thumbnail.size == (400, 210)
+    assert images[0].size_bytes == Path(f"{path}.webp").stat().st_size
+
+    # A new pipeline serves the same prompt from the cache without generating
+    async def again():
+        async with ImagePipeline(generator, cache, process_workers=1) as pipeline:
+            return await pipeline.generate(["Casino lobby"])
+
+    cached = asyncio.run(again())[0]
+    assert cached.cached and cached.key == images[0].key
+    assert generator.calls == 2
+
+
+def test_outputs_recorded_on_optimization_result(tmp_path):
+    generator = StubImageGenerator()
+    cache = ImageCache(str(tmp_path / "images"))
+    result = OptimizationResult(
+        mode=ContentMode.FIX, original_score=60, new_score=75,
+        optimized_content="...", estimated_improvement="+15"
+    )
+    spec = ImageSpec(width=800, height=800, thumbnail_width=200, format="JPEG", quality=80)
+
+    async def run():
+        async with ImagePipeline(generator, cache, spec, process_workers=1) as pipeline:
+            await pipeline.add_images(result, ["Hero image", "Bonus table"])
+
+    asyncio.run(run())
+    assert result.images_generated == [image.url for image in result.images]
+    assert all(url.startswith("/images/") and url.endswith(".jpg") for url in result.images_generated)
+    assert (result.images[0].width, result.images[0].format) == (800, "JPEG")
+
+
+def test_generation_failure_reaches_caller(tmp_path):
+    class FailingGenerator(StubImageGenerator):
+        async def generate(self, prompt, width, height):
+            raise RuntimeError("model unavailable")
+
+    async def run():
+        async with ImagePipeline(FailingGenerator(), ImageCache(str(tmp_path)), process_workers=1) as pipeline:
+            with pytest.raises(RuntimeError, match="model unavailable"):
+                await pipeline.generate(["Anything"])
+            return pipeline.stats
+
+    assert asyncio.run(run())["failed"] == 1
+
+
+def test_app_serves_recorded_urls(tmp_path, monkeypatch):
+    from fastapi.testclient import TestClient
+    from src.config import get_config
+    from src.main import app, create_app
+
+    monkeypatch.setattr(get_config().images, "output_dir", str(tmp_path / "images"))
+    monkeypatch.setattr(app.router, "routes", [r for r in app.router.routes if getattr(r, "name", None) != "images"])
+    create_app()
+    cache = ImageCache(get_config().images.output_dir, get_config().images.base_url)
+    result = OptimizationResult(
+        mode=ContentMode.FIX, original_score=60, new_score=75,
+        optimized_content="...", estimated_improvement="+15"
+    )
+
+    async def run():
+        async with ImagePipeline(StubImageGenerator(), cache, process_workers=1) as pipeline:
+            await pipeline.add_images(result, ["Hero image"])
+
+    asyncio.run(run())
+    client = TestClient(app)
+    image = result.images[0]
+    assert client.get(image.url).content == Path(tmp_path / "images" / image.key[:2] / f"{image.key}.webp").read_bytes()
+    assert client.get(image.thumbnail_url).status_code == 200
+    assert client.get(f"{get_config().images.base_url}/missing.webp").status_code == 404
@@ -0,0 +1,76 @@
+"""
+Issue Taxonomy Tests
+
+Annotations classify into stable issue types, and maintained count arrays
+agree with a recount as submissions change.
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.synthetic import make_submissions
+from src.agents.content_manager.writer_agent import WriterAnalysisAgent
+from src.core.issues import ISSUE_TYPES, IssueStats, breakdown, classify, count_issues, top_issues
+from src.core.schemas import IssueAnnotation, IssueCategory, IssueSeverity
+from src.core.storage import MemorySubmissionStore
+
+
+def key(explanation: str) -> str:
+    return ISSUE_TYPES[classify(explanation)].key
+
+
+def test_classifier_maps_phrasings_to_one_type():
+    assert key("Missing responsible gambling notice") == "responsible_gambling"
+    assert key("No 18+ notice near the top") == "responsible_gambling"
+    assert key("Unsupported claims: 'the best' without evidence") == "unsupported_claims"
+    assert key("Wagering requirements not explained") == "bonus_terms"
+    assert key("Keyword placement: primary keyword missing from H2s") == "keyword_usage"
+    assert key("Not licensed for UK players") == "licensing"
+    assert key("Meets expectations") == "other"
+    assert ISSUE_TYPES[classify("Slow page load time")].category == IssueCategory.PERFORMANCE
+
+
+def test_counts_match_recount_and_follow_changes():
+    store = MemorySubmissionStore()
+    store.save_many(make_submissions(300, submissions_per_writer=10, seed=3))
+    stats = IssueStats()
+    stats.attach(store)
+    assert stats.team_counts() == count_issues(store.list_all())
+
+    writer_id = store.list_all()[0].writer_id
+    assert stats.writer_counts(writer_id) == count_issues(store.by_writer(writer_id))
+
+    submission = store.get(store.by_writer(writer_id)[0].submission_id)
+    submission.annotations.append(IssueAnnotation(
+        issue_id="extra", severity=IssueSeverity.CRITICAL,
+        explanation="Missing responsible gambling notice", fix_suggestion="Add one"
+    ))
+    store.save(submission)
+    assert stats.team_counts() == count_issues(store.list_all())
+    assert stats.writer_counts(writer_id) == count_issues(store.by_writer(writer_id))
+
+    store.clear()
+    assert sum(stats.team_counts()) == 0
+    assert sum(stats.writer_counts(writer_id)) == 0
+
+
+def test_breakdown_and_top_issues():
+    submissions = make_submissions(200, submissions_per_writer=10, seed=4)
+    counts = count_issues(submissions)
+    annotations = [a for s in submissions for a in s.annotations]
+
+    rows = breakdown(counts)
+    assert sum(row["count"] for row in rows) == len(annotations)
+    assert [row["count"] for row in rows] == sorted((row["count"] for row in rows), reverse=True)
+    assert all(sum(row["by_severity"].values()) == row["count"] for row in rows)
+
+    top = top_issues(counts, 3)
+    assert list(top.values()) == [row["count"] for row in rows[:3]]
+
+    agent = WriterAnalysisAgent()
+    analytics = agent.generate_team_analytics(submissions, [])
+    assert analytics.common_team_issues == top_issues(counts, 10)
+    assert len(analytics.common_team_issues) <= len(ISSUE_TYPES)
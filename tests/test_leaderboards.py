@@ -0,0 +1,107 @@
+"""
+Leaderboard Tests
+
+Maintained writer aggregates and leaderboards stay consistent with a full
+recomputation as submissions change.
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.synthetic import group_by_writer, make_submissions
+from src.agents.content_manager.writer_agent import WriterAnalysisAgent
+from src.core.leaderboards import Leaderboards
+from src.core.schemas import ContentScore
+from src.core.storage import MemorySubmissionStore
+
+
+def build(count: int = 400):
+    agent = WriterAnalysisAgent()
+    store = MemorySubmissionStore()
+    submissions = make_submissions(count, submissions_per_writer=10, seed=11)
+    store.save_many(submissions)
+    leaderboards = Leaderboards(agent.calculate_writer_progress, size=25)
+    leaderboards.attach(store)
+    return agent, store, leaderboards
+
+
+def expected_board(agent, store, field: str) -> list:
+    progress = [
+        agent.calculate_writer_progress(w, s[0].writer_name, s)
+        for w, s in group_by_writer(store.list_all()).items()
+    ]
+    return sorted((getattr(p, field) for p in progress if field != "improvement_rate" or p.improvement_rate > 0), reverse=True)
+
+
+def test_boards_match_full_recomputation():
+    agent, store, leaderboards = build()
+    for board in ("average_score", "improvement_rate"):
+        entries, total = leaderboards.page(board, 0, 25)
+        assert [e[board] for e in entries] == expected_board(agent, store, board)[:25]
+        assert total == min(25, len(expected_board(agent, store, board)))
+
+    # Pages tile the top K without overlap
+    first, _ = leaderboards.page("seo", 0, 10)
+    second, _ = leaderboards.page("seo", 10, 10)
+    assert [e["rank"] for e in first + second] == list(range(1, 21))
+    assert [e["seo_score"] for e in first + second] == sorted((e["seo_score"] for e in first + second), reverse=True)
+    assert leaderboards.page("seo", 25, 10) == ([], 25)
+
+
+def test_boards_follow_reviews_and_removals():
+    agent, store, leaderboards = build()
+
+    # A perfect review for a low-ranked writer moves them up
+    writer_id = store.list_all()[-1].writer_id
+    for submission in store.by_writer(writer_id):
+        reviewed = store.get(submission.submission_id)
+        reviewed.scores = ContentScore(
+            seo_score=100, eeat_score=100, content_quality=100, compliance_score=100, overall_score=100
+        )
+        store.save(reviewed)
+    top = leaderboards.top("average_score", 1)[0]
+    assert top == {
+        "writer_id": writer_id,
+        "writer_name": top["writer_name"],
+        "average_score": 100.0,
+        "total_submissions": len(store.by_writer(writer_id))
+    }
+    assert leaderboards.page("compliance", 0, 1)[0][0]["compliance_score"] == 100.0
+    assert leaderboards.progress(writer_id).average_score == 100.0
+
+    store.clear()
+    assert leaderboards.page("average_score", 0, 10) == ([], 0)
+    assert leaderboards.writers() == []
+
+
+def test_team_analytics_reads_leaderboards():
+    agent, store, leaderboards = build()
+    submissions = store.list_all()
+    progress = [agent.calculate_writer_progress(w, s[0].writer_name, s) for w, s in group_by_writer(submissions).items()]
+
+    sorted_analytics = agent.generate_team_analytics(submissions, progress)
+    board_analytics = agent.generate_team_analytics(submissions, leaderboards.writers(), leaderboards)
+    assert [w["average_score"] for w in board_analytics.top_performers] == \
+        [w["average_score"] for w in sorted_analytics.top_performers]
+    assert [w["improvement_rate"] for w in board_analytics.improvement_leaders] == \
+        [w["improvement_rate"] for w in sorted_analytics.improvement_leaders]
+    assert board_analytics.total_writers == sorted_analytics.total_writers
+
+
+def test_leaderboard_endpoint():
+    from fastapi.testclient import TestClient
+    from src.main import app, create_app
+    import src.api.content_manager_routes as routes
+
+    create_app()
+    routes.get_store().save_many(make_submissions(60, submissions_per_writer=5, seed=21))
+    client = TestClient(app)
+
+    data = client.get("/api/content-manager/leaderboard/eeat", params={"limit": 3}).json()["data"]
+    assert [e["rank"] for e in data["entries"]] == [1, 2, 3]
+    assert data["next_offset"] == 3
+
+    assert client.get("/api/content-manager/leaderboard/nope").status_code == 400
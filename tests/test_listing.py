@@ -0,0 +1,108 @@
+"""
+Listing Tests
+
+Keyset pagination and filters over the sorted listing index.
+"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.synthetic import make_submissions
+from src.core.listing import ListingQuery, SubmissionListIndex
+from src.core.storage import MemorySubmissionStore
+
+
+def all_pages(index: SubmissionListIndex, query: ListingQuery, limit: int, descending: bool = True) -> list:
+    ids, cursor = index.page(query, limit=limit, descending=descending)
+    while cursor:
+        page, cursor = index.page(query, cursor=cursor, limit=limit, descending=descending)
+        assert page
+        ids.extend(page)
+    return ids
+
+
+def test_pages_match_filtered_sort():
+    store = MemorySubmissionStore()
+    submissions = make_submissions(600, seed=3)
+    # Identical timestamps must still page deterministically
+    for twin in submissions[10:20]:
+        twin.created_at = submissions[10].created_at
+    for submission in submissions[::7]:
+        submission.manager_id = "m1"
+    store.save_many(submissions)
+    index = SubmissionListIndex()
+    index.attach(store)
+
+    start = submissions[0].created_at
+    queries = [
+        ListingQuery(),
+        ListingQuery(status="approved"),
+        ListingQuery(min_score=60, max_score=75),
+        ListingQuery(manager_id="m1", min_score=50),
+        ListingQuery(created_from=start + timedelta(days=30), created_to=start + timedelta(days=90)),
+        ListingQuery(writer_id=submissions[0].writer_id, max_revisions=0)
+    ]
+    for query in queries:
+        expected = [
+            s for s in submissions
+            if (query.status is None or s.status.value == query.status)
+            and (query.writer_id is None or s.writer_id == query.writer_id)
+            and (query.manager_id is None or s.manager_id == query.manager_id)
+            and (query.min_score is None or (s.scores and s.scores.overall_score >= query.min_score))
+            and (query.max_score is None or (s.scores and s.scores.overall_score <= query.max_score))
+            and (query.created_from is None or s.created_at >= query.created_from)
+            and (query.created_to is None or s.created_at <= query.created_to)
+        ]
+        expected.sort(key=lambda s: (s.created_at, s.submission_id))
+        assert all_pages(index, query, limit=25, descending=False) == [s.submission_id for s in expected]
+        assert all_pages(index, query, limit=7) == [s.submission_id for s in reversed(expected)]
+
+
+def test_index_follows_store_changes():
+    store = MemorySubmissionStore()
+    submissions = make_submissions(20, seed=5)
+    store.save_many(submissions)
+    index = SubmissionListIndex()
+    index.attach(store)
+
+    first_page, cursor = index.page(limit=5)
+    updated = store.get(first_page[0])
+    updated.content = "Revised"
+    store.save(updated)
+    newest = make_submissions(1, seed=6)[0]
+    newest.created_at = datetime.now() + timedelta(days=1)
+    store.save(newest)
+
+    assert index.page(ListingQuery(min_revisions=1))[0] == [first_page[0]]
+    assert index.page(limit=1)[0] == [newest.submission_id]
+    # A cursor from before the insert still continues where it left off
+    assert index.page(cursor=cursor, limit=5)[0] == all_pages(index, ListingQuery(), 5)[6:11]
+
+
+def test_list_endpoint_pages_and_rejects_bad_cursors():
+    from fastapi.testclient import TestClient
+    from src.main import app, create_app
+    import src.api.content_manager_routes as routes
+
+    create_app()
+    writer_id = "w-listing"
+    for i in range(5):
+        routes.get_store().save(make_submissions(1, seed=100 + i)[0].model_copy(update={"writer_id": writer_id}))
+    client = TestClient(app)
+
+    seen = []
+    params = {"writer_id": writer_id, "limit": 2}
+    while True:
+        data = client.get("/api/content-manager/submissions", params=params).json()["data"]
+        seen.extend(s["submission_id"] for s in data["submissions"])
+        if not data["next_cursor"]:
+            break
+        params["cursor"] = data["next_cursor"]
+    assert len(seen) == len(set(seen)) == 5
+
+    response = client.get("/api/content-manager/submissions", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
@@ -0,0 +1,123 @@
+"""
+LLM Client Tests
+
+Token bucket, AIMD concurrency and retry behaviour against fake models.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from google.api_core import exceptions as google_exceptions
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.llm_client import AdaptiveConcurrencyLimiter, LLMClient, TokenBucket
+
+
+class FlakyModel:
+    """Fails with the given errors, then succeeds"""
+    
+    def __init__(self, errors):
+        self.errors = list(errors)
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+    
+    async def generate_content_async(self, prompt, **kwargs):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if self.errors:
+                raise self.errors.pop(0)
+            return type("Response", (), {"text": "ok"})()
+        finally:
+            self.in_flight -= 1
+
+
+def test_token_bucket_waits_for_refill():
+    async def run():
+        bucket = TokenBucket(capacity=2, refill_per_second=20)
+        await bucket.acquire()
+        await bucket.acquire()
+        start = time.monotonic()
+        await bucket.acquire()
+        return time.monotonic() - start
+    
+    assert asyncio.run(run()) >= 0.04
+
+
+def test_limiter_halves_on_throttle_and_grows_on_success():
+    async def run():
+        limiter = AdaptiveConcurrencyLimiter(initial=8, maximum=16)
+        await limiter.acquire()
+        await limiter.release(throttled=True)
+        after_throttle = limiter.current_limit
+        for _ in range(20):
+            await limiter.acquire()
+            await limiter.release(latency_s=0.01)
+        return after_throttle, limiter.current_limit
+    
+    after_throttle, after_success = asyncio.run(run())
+    assert after_throttle == 4
+    assert after_success > after_throttle
+
+
+def test_retries_throttled_calls_then_succeeds():
+    model = FlakyModel([google_exceptions.ResourceExhausted("quota"), google_exceptions.ServiceUnavailable("busy")])
+    client = LLMClient(model, base_backoff_s=0.001)
+    
+    response = asyncio.run(client.generate("prompt"))
+    
+    assert response.text == "ok"
+    assert model.calls == 3
+    assert client.stats["retries"] == 2
+    assert client.stats["throttled"] == 1
+
+
+def test_gives_up_after_max_retries():
+    model = FlakyModel([google_exceptions.ResourceExhausted("quota")] * 3)
+    client = LLMClient(model, max_retries=2, base_backoff_s=0.001)
+    
+    with pytest.raises(google_exceptions.ResourceExhausted):
+        asyncio.run(client.generate("prompt"))
+    assert client.stats["failures"] == 1
+
+
+def test_non_retryable_errors_are_raised_immediately():
+    model = FlakyModel([google_exceptions.InvalidArgument("bad prompt")])
+    client = LLMClient(model)
+    
+    with pytest.raises(google_exceptions.InvalidArgument):
+        asyncio.run(client.generate("prompt"))
+    assert model.calls == 1
+
+
+def test_concurrency_is_bounded():
+    model = FlakyModel([])
+    client = LLMClient(model, requests_per_minute=10 ** 6, initial_concurrency=3, max_concurrency=3)
+    
+    async def run():
+        await asyncio.gather(*(client.generate(f"prompt {i}") for i in range(20)))
+    
+    asyncio.run(run())
+    assert model.max_in_flight <= 3
+
+
+def test_cancelled_calls_release_their_slot():
+    model = FlakyModel([])
+    client = LLMClient(model, requests_per_minute=10 ** 6, initial_concurrency=2, max_concurrency=2)
+    
+    async def run():
+        for _ in range(3):
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(client.generate("prompt"), timeout=0.001)
+        assert client.limiter.in_flight == 0
+        await asyncio.wait_for(client.generate("prompt"), timeout=1.0)
+    
+    asyncio.run(run())
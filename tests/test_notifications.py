@@ -0,0 +1,138 @@
+"""
+Notification Dispatcher Tests
+
+Events are coalesced into digest messages, posted to webhooks (a local stub
+server here), and failed deliveries are retried from the durable queue.
+"""
+
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.integrations.notifications import (
+    MAX_DIGEST_LINES,
+    Notification,
+    NotificationDispatcher,
+    RetryQueue,
+    discord_webhook,
+    slack_webhook
+)
+
+
+class StubWebhookServer:
+    """Records POSTed JSON bodies per path; replies with queued statuses, then 200"""
+
+    def __init__(self):
+        self.received = {}
+        self.statuses = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                status = stub.statuses.pop(0) if stub.statuses else 200
+                if status == 200:
+                    stub.received.setdefault(self.path, []).append(body)
+                self.send_response(status)
+                if status == 429:
+                    self.send_header("Retry-After", "0")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def url(self, path: str) -> str:
+        return f"http://127.0.0.1:{self.server.server_port}{path}"
+
+    def wait_for(self, path: str, count: int, timeout_s: float = 5.0) -> list:
+        deadline = time.monotonic() + timeout_s
+        while len(self.received.get(path, [])) < count and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return self.received.get(path, [])
+
+
+@pytest.fixture
+def stub():
+    server = StubWebhookServer()
+    yield server
+    server.server.shutdown()
+
+
+def test_burst_is_coalesced_into_one_digest(stub):
+    dispatcher = NotificationDispatcher(
+        [slack_webhook(stub.url("/slack")), discord_webhook(stub.url("/discord"))], batch_window_s=0.3
+    )
+    for i in range(30):
+        dispatcher.notify(Notification("review", f"Reviewed article {i}"))
+    dispatcher.notify(Notification("publish", "Published article", "https://example.com/a"))
+    dispatcher.close()
+
+    slack = stub.received["/slack"]
+    discord = stub.received["/discord"]
+    assert len(slack) == len(discord) == 1
+    lines = slack[0]["text"].splitlines()
+    assert lines[0] == "*RankSmart: 31 updates*"
+    assert len(lines) == MAX_DIGEST_LINES + 2 and lines[-1] == "…and 11 more"
+    assert discord[0]["content"].startswith("**RankSmart: 31 updates**")
+    assert dispatcher.sent == 2 and dispatcher.dropped == 0
+
+
+def test_failed_deliveries_are_retried_with_backoff(stub):
+    stub.statuses = [503, 429]
+    dispatcher = NotificationDispatcher(
+        [slack_webhook(stub.url("/slack"))], batch_window_s=0.0, base_backoff_s=0.05, retry_poll_s=0.02
+    )
+    dispatcher.notify(Notification("review", "Reviewed article"))
+    assert stub.wait_for("/slack", 1) == [{"text": "Reviewed article"}]
+    dispatcher.close()
+    assert len(dispatcher.retry_queue) == 0
+
+    # Permanent rejections are not retried
+    stub.statuses = [400]
+    dispatcher = NotificationDispatcher([slack_webhook(stub.url("/slack"))], batch_window_s=0.0)
+    dispatcher.notify(Notification("review", "Rejected"))
+    dispatcher.close()
+    assert dispatcher.failed == 1 and len(dispatcher.retry_queue) == 0
+
+
+def test_retry_queue_survives_restart(stub, tmp_path):
+    path = str(tmp_path / "notifications.db")
+    stub.statuses = [503]
+    dispatcher = NotificationDispatcher(
+        [slack_webhook(stub.url("/slack"))], RetryQueue(path), batch_window_s=0.0, base_backoff_s=60
+    )
+    dispatcher.notify(Notification("review", "Queued while the webhook was down"))
+    dispatcher.close()
+    assert len(RetryQueue(path)) == 1
+
+    # A new process picks the delivery up once it is due
+    queue = RetryQueue(path)
+    item = queue.due(time.time() + 3600)[0]
+    queue.reschedule(item.id, item.attempts, 0)
+    dispatcher = NotificationDispatcher([slack_webhook(stub.url("/slack"))], queue, batch_window_s=0.0, retry_poll_s=0.02)
+    dispatcher.notify(Notification("review", "Back up"))
+    received = stub.wait_for("/slack", 2)
+    dispatcher.close()
+    assert {"text": "Queued while the webhook was down"} in received
+    assert len(queue) == 0
+
+    # Workers sharing the queue claim each due delivery exactly once
+    first, second = RetryQueue(path), RetryQueue(path)
+    first.push("slack", {"text": "retry me"}, 1, 0)
+    item = second.due(time.time())[0]
+    assert first.claim(item.id, time.time(), lease_s=60)
+    assert not second.claim(item.id, time.time(), lease_s=60)
+    assert second.due(time.time()) == []
+    assert second.claim(item.id, time.time() + 61, lease_s=60)
@@ -0,0 +1,124 @@
+"""
+Prompt Budget Tests
+
+Prompt layout, token budgets and savings reports against a stub model.
+"""
+
+import asyncio
+import os
+import sys
+import uuid
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.agents.content_manager import ContentManagerAgent
+from src.core.llm_client import estimate_tokens
+from src.core.prompts import SHARED_PREFIX, PromptBudgets, split_to_budget, truncate_to_tokens
+from src.core.schemas import ContentSubmission
+from benchmarks.stub_llm import StubGenerativeModel
+
+
+LONG_ARTICLE = "\n\n".join(
+    f"## Section {i}\n\nCasino {i} offers slots, live dealer games and a welcome bonus. " * 3
+    for i in range(200)
+)
+
+
+def make_agent(budgets: PromptBudgets = None):
+    agent = ContentManagerAgent(gemini_api_key="test", prompt_budgets=budgets)
+    stub = StubGenerativeModel()
+    prompts = []
+    original = stub.generate_content_async
+    
+    async def recording(contents, **kwargs):
+        prompts.append(contents)
+        return await original(contents, **kwargs)
+    
+    stub.generate_content_async = recording
+    agent.llm.model = stub
+    return agent, prompts
+
+
+def make_submission(content: str) -> ContentSubmission:
+    return ContentSubmission(
+        submission_id=str(uuid.uuid4()),
+        writer_id="w1",
+        writer_name="Writer One",
+        title="Best Online Casinos",
+        content=content
+    )
+
+
+def test_static_prefix_first_and_article_block_shared():
+    agent, prompts = make_agent()
+    submission = asyncio.run(agent.review_submission(make_submission(LONG_ARTICLE), ["casinos"], "UK"))
+    
+    scores_prompt, annotations_prompt, feedback_prompt = prompts
+    assert all(p.startswith(SHARED_PREFIX) for p in prompts)
+    shared = os.path.commonprefix([scores_prompt, annotations_prompt])
+    assert "**Article Content:**" in shared
+    assert "Section 1" in shared
+    assert "**Article Content:**" not in feedback_prompt
+    
+    report = submission.review_tokens
+    assert report["cacheable_prefix_tokens"] >= estimate_tokens(shared) - 1
+
+
+def test_stage_budgets_are_enforced():
+    budgets = PromptBudgets(article_tokens=400, scores=900, annotations=900, feedback=600)
+    agent, prompts = make_agent(budgets)
+    submission = asyncio.run(agent.review_submission(make_submission(LONG_ARTICLE)))
+    
+    scores_prompt, annotations_prompt, feedback_prompt = prompts
+    assert estimate_tokens(scores_prompt) <= 900
+    assert estimate_tokens(annotations_prompt) <= 900
+    assert estimate_tokens(feedback_prompt) <= 600
+    assert submission.review_tokens["trimmed_tokens"] > 0
+
+
+def test_apply_fixes_chunks_large_articles_and_skips_unrelated_chunks():
+    agent, prompts = make_agent(PromptBudgets(apply_fixes=1500))
+    submission = asyncio.run(agent.review_submission(make_submission(LONG_ARTICLE)))
+    annotation = submission.annotations[0]
+    annotation.highlighted_text = "Casino 150 offers"
+    prompts.clear()
+    
+    updated = asyncio.run(agent.apply_fixes(submission, [annotation.issue_id]))
+    
+    assert len(prompts) == 1
+    assert all(estimate_tokens(p) <= 1500 for p in prompts)
+    assert "Casino 150 offers" in prompts[0]
+    assert "## Section 0" in updated and "## Section 199" in updated
+    assert "<!-- fixes applied -->" in updated
+
+
+def test_split_and_truncate_respect_budget():
+    chunks = split_to_budget(LONG_ARTICLE, 500)
+    assert "".join(chunk + sep for chunk, sep in chunks) == LONG_ARTICLE
+    assert all(estimate_tokens(chunk) <= 500 for chunk, _ in chunks)
+    assert estimate_tokens(truncate_to_tokens(LONG_ARTICLE, 300)) <= 300
+
+
+def test_split_round_trips_oversized_paragraphs_and_lines():
+    text = "a" * 30 + "\n" + "b" * 30 + "\n" + "c" * 30 + "\n\nend"
+    for budget in (1, 10, 20):
+        chunks = split_to_budget(text, budget)
+        assert "".join(chunk + sep for chunk, sep in chunks) == text
+        assert all(len(chunk) <= budget * 4 for chunk, _ in chunks)
+    
+    chunks = split_to_budget("x" * 500, 10)
+    assert [len(chunk) for chunk, _ in chunks] == [40] * 12 + [20]
+    assert "".join(chunk + sep for chunk, sep in chunks) == "x" * 500
+    assert split_to_budget("", 10) == [("", "")]
+
+
+def test_over_budget_stage_keeps_its_instructions():
+    budgets = PromptBudgets(article_tokens=2000, scores=1200, annotations=5000)
+    agent, prompts = make_agent(budgets)
+    asyncio.run(agent.review_submission(make_submission(LONG_ARTICLE), ["kw"] * 300, "UK"))
+    
+    assert estimate_tokens(prompts[0]) <= 1200
+    assert '"compliance_score": <number>' in prompts[0]
+    assert "**Jurisdiction:** UK" in prompts[0]
@@ -0,0 +1,120 @@
+"""
+CMS Publishing Tests
+
+Approved submissions are published to mocked WordPress and Webflow APIs with
+per-site concurrency limits; retries and re-publishes never duplicate posts.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.stub_cms import MockCMS, mock_targets
+from benchmarks.synthetic import make_submissions
+from src.core.schemas import SubmissionStatus
+from src.core.storage import MemorySubmissionStore
+from src.integrations.publishing import PublicationLedger, Publisher
+
+
+def approved_submissions(count: int, seed: int = 20):
+    submissions = make_submissions(count, submissions_per_writer=5, seed=seed)
+    for submission in submissions:
+        submission.status = SubmissionStatus.APPROVED
+    return submissions
+
+
+def test_bulk_publish_is_concurrent_and_idempotent(tmp_path):
+    cms = MockCMS(latency_s=0.005)
+    store = MemorySubmissionStore()
+    submissions = approved_submissions(60)
+    store.save_many(submissions)
+    ledger_path = str(tmp_path / "publications.db")
+    publisher = Publisher(mock_targets(concurrency=3), PublicationLedger(ledger_path), store=store, transport=cms.transport)
+
+    job = asyncio.run(publisher.publish_many(submissions))
+    assert (job.total, job.completed, job.failed, job.done) == (120, 120, 0, True)
+    assert {r.state for r in job.results} == {"created"}
+    assert len(cms.wordpress.posts) == len(cms.webflow.posts) == 60
+    assert cms.wordpress.max_in_flight == 3 and cms.webflow.max_in_flight == 3
+    assert all(s.status == SubmissionStatus.PUBLISHED and s.published_at for s in store.list_all())
+
+    # Re-publishing unchanged content sends nothing, even from a new process
+    requests = cms.wordpress.requests + cms.webflow.requests
+    again = Publisher(mock_targets(), PublicationLedger(ledger_path), transport=cms.transport)
+    published = [store.get(s.submission_id) for s in submissions]
+    assert {r.state for r in asyncio.run(again.publish_many(published)).results} == {"unchanged"}
+    assert cms.wordpress.requests + cms.webflow.requests == requests
+
+    # Edited content updates the existing posts
+    published[0].title = "Updated title"
+    results = asyncio.run(again.publish(published[0]))
+    assert [r.state for r in results] == ["updated", "updated"]
+    assert len(cms.wordpress.posts) == 60
+    assert cms.wordpress.posts[results[0].remote_id]["title"] == "Updated title"
+
+
+def test_retries_never_duplicate_posts():
+    cms = MockCMS()
+    cms.wordpress.fail_statuses = [503, 429]
+    cms.wordpress.lose_responses = 3
+    cms.webflow.lose_responses = 2
+    submissions = approved_submissions(10, seed=21)
+    publisher = Publisher(mock_targets(), transport=cms.transport, base_backoff_s=0.001)
+
+    job = asyncio.run(publisher.publish_many(submissions))
+    assert job.failed == 0
+    assert len(cms.wordpress.posts) == len(cms.webflow.posts) == 10
+    assert len({post["slug"] for post in cms.wordpress.posts.values()}) == 10
+
+    # Drafts are refused; permanent errors are not retried
+    draft = make_submissions(1, seed=22)[0]
+    draft.status = SubmissionStatus.NEEDS_REVISION
+    assert {r.state for r in asyncio.run(publisher.publish(draft))} == {"failed"}
+    cms.webflow.fail_statuses = [400]
+    results = asyncio.run(publisher.publish(approved_submissions(1, seed=23)[0], ["webflow"]))
+    assert results[0].state == "failed" and "400" in results[0].error
+
+    # A 2xx that isn't the API's JSON fails the pair instead of the whole job
+    html = httpx.MockTransport(lambda request: httpx.Response(200, text="<html>maintenance</html>"))
+    job = asyncio.run(Publisher(mock_targets(), transport=html).publish_many(approved_submissions(2, seed=25)))
+    assert job.done and (job.completed, job.failed) == (4, 4)
+    assert all("Unexpected" in r.error for r in job.results)
+
+
+def test_publish_endpoints(monkeypatch):
+    from fastapi.testclient import TestClient
+    from src.main import app, create_app
+    import src.api.content_manager_routes as routes
+
+    create_app()
+    cms = MockCMS(latency_s=0.002)
+    routes.get_store().clear()
+    submissions = approved_submissions(12, seed=24)
+    submissions[0].status = SubmissionStatus.PENDING_REVIEW
+    routes.get_store().save_many(submissions)
+    publisher = Publisher(mock_targets(), store=routes.get_store(), transport=cms.transport)
+    monkeypatch.setattr(routes, "get_publisher", lambda: publisher)
+
+    with TestClient(app) as client:
+        data = client.post("/api/content-manager/publish", json={"platforms": ["wordpress"]}).json()["data"]
+        assert data["total"] == 11
+        deadline = time.monotonic() + 5
+        while not data["done"] and time.monotonic() < deadline:
+            time.sleep(0.02)
+            data = client.get(f"/api/content-manager/publish/{data['job_id']}").json()["data"]
+        assert (data["completed"], data["failed"]) == (11, 0)
+        assert len(cms.wordpress.posts) == 11 and not cms.webflow.posts
+
+        response = client.post(
+            "/api/content-manager/publish", params={"wait": True},
+            json={"submission_ids": [submissions[1].submission_id], "platforms": ["webflow"]}
+        )
+        assert response.json()["data"]["results"][0]["state"] == "created"
+        assert client.post("/api/content-manager/publish", json={"platforms": ["ghost"]}).status_code == 400
+        assert client.get("/api/content-manager/publish/unknown").status_code == 404
@@ -0,0 +1,103 @@
+"""
+Rate Limiting Tests
+
+Per-client token buckets by route class, 429 with Retry-After, concurrency
+caps on reviews and lossless eviction of idle clients.
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.api.rate_limit import READ, REVIEW, RateLimiter, RateLimitMiddleware, route_class
+from src.config import RateLimitConfig
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_limits_per_client_and_route_class():
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    app = FastAPI()
+
+    @app.get("/api/content-manager/submissions")
+    async def submissions():
+        return {"ok": True}
+
+    @app.post("/api/content-manager/review/{submission_id}")
+    async def review(submission_id: str):
+        return {"ok": True}
+
+    @app.get("/health")
+    async def health():
+        return {"ok": True}
+
+    clock = Clock()
+    config = RateLimitConfig(per_minute=3, reviews_per_minute=1, api_keys=["partner"])
+    app.add_middleware(RateLimitMiddleware, config=config, time_fn=clock)
+
+    with TestClient(app) as client:
+        responses = [client.get("/api/content-manager/submissions") for _ in range(4)]
+        assert [r.status_code for r in responses] == [200, 200, 200, 429]
+        assert [r.headers["x-ratelimit-remaining"] for r in responses] == ["2", "1", "0", "0"]
+        rejected = responses[-1]
+        assert rejected.headers["retry-after"] == "20"
+        assert rejected.json()["success"] is False and rejected.json()["error"]
+
+        # Reviews have their own budget; other clients and exempt paths are unaffected
+        assert client.post("/api/content-manager/review/s1").status_code == 200
+        assert client.post("/api/content-manager/review/s1").status_code == 429
+        assert client.get("/api/content-manager/submissions", headers={"X-API-Key": "partner"}).status_code == 200
+        assert client.get("/health").status_code == 200
+
+        # Made-up keys don't buy a fresh bucket: they are charged to the IP
+        rotated = [client.post("/api/content-manager/review/s1", headers={"X-API-Key": f"key{i}"}) for i in range(3)]
+        assert {r.status_code for r in rotated} == {429}
+
+        clock.now += 20
+        assert client.get("/api/content-manager/submissions").status_code == 200
+        assert client.get("/api/content-manager/submissions").status_code == 429
+
+
+def test_concurrent_reviews_are_capped():
+    clock = Clock()
+    limiter = RateLimiter({READ: 60, REVIEW: 10}, {REVIEW: 2}, time_fn=clock)
+    assert limiter.acquire("a", REVIEW).allowed and limiter.acquire("a", REVIEW).allowed
+    third = limiter.acquire("a", REVIEW)
+    assert not third.allowed and third.retry_after == 1
+    assert limiter.acquire("b", REVIEW).allowed
+    limiter.release("a", REVIEW)
+    assert limiter.acquire("a", REVIEW).allowed
+
+    assert route_class("POST", "/api/content-manager/apply-fixes/s1") == REVIEW
+    assert route_class("GET", "/api/content-manager/review/s1") == READ
+    assert route_class("OPTIONS", "/api/content-manager/submissions") is None
+
+
+def test_idle_clients_are_evicted():
+    clock = Clock()
+    limiter = RateLimiter({READ: 60}, max_clients=100, time_fn=clock)
+    for i in range(50):
+        limiter.acquire(f"client{i}", READ)
+        limiter.release(f"client{i}", READ)
+    assert len(limiter) == 50
+
+    # Buckets that have fully refilled are dropped as new clients arrive
+    clock.now += 60
+    assert limiter.acquire("fresh", READ).remaining == 59
+    assert len(limiter) == 1
+
+    # Above max_clients the least recently seen go first
+    for i in range(150):
+        limiter.acquire(f"burst{i}", READ)
+    assert len(limiter) == 100
+    assert limiter.acquire("burst149", READ).remaining == 58
@@ -0,0 +1,109 @@
+"""
+Response Tests
+
+Field projection, fast JSON responses and response compression.
+"""
+
+import gzip
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from src.api.responses import CompressionMiddleware, api_response, brotli, dump_model, field_tree
+from src.core.schemas import ContentScore, ContentSubmission
+
+
+def make_submission() -> ContentSubmission:
+    scores = ContentScore(seo_score=80, eeat_score=70, content_quality=90, compliance_score=60, overall_score=0)
+    scores.calculate_overall()
+    return ContentSubmission(
+        submission_id="s1", writer_id="w1", writer_name="Writer", title="Best Casinos",
+        content="Casino A is great. " * 500, scores=scores
+    )
+
+
+def test_field_projection():
+    data = dump_model(make_submission(), "title,scores.overall_score,status")
+    assert set(data) == {"title", "scores", "status"}
+    assert set(data["scores"]) == {"overall_score"}
+    assert field_tree("scores,scores.seo_score") == {"scores": {}}
+
+    with pytest.raises(HTTPException) as error:
+        dump_model(make_submission(), "title,nope")
+    assert error.value.status_code == 400
+
+
+def build_app(minimum_size: int = 1024) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=minimum_size)
+
+    @app.get("/big")
+    async def big():
+        return api_response("ok", dump_model(make_submission()))
+
+    @app.get("/small")
+    async def small():
+        return api_response("ok", {"n": 1})
+
+    @app.get("/stream")
+    async def stream():
+        lines = (f'{{"line": {i}}}\n' for i in range(200))
+        return StreamingResponse(lines, media_type="application/x-ndjson")
+
+    return app
+
+
+def test_large_responses_are_gzipped():
+    client = TestClient(build_app())
+    response = client.get("/big", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert int(response.headers["content-length"]) < 2000
+    assert response.json()["data"]["title"] == "Best Casinos"
+
+    small = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+
+    plain = client.get("/big", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+
+
+@pytest.mark.skipif(brotli is None, reason="brotli not installed")
+def test_brotli_preferred_when_accepted():
+    client = TestClient(build_app())
+    response = client.get("/big", headers={"Accept-Encoding": "gzip, br"})
+    assert response.headers["content-encoding"] == "br"
+    assert response.json()["data"]["submission_id"] == "s1"
+
+
+def test_streaming_responses_are_compressed_per_chunk():
+    client = TestClient(build_app(minimum_size=10))
+    with client.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as response:
+        assert response.headers["content-encoding"] == "gzip"
+        raw = b"".join(response.iter_raw())
+    lines = gzip.decompress(raw).decode().splitlines()
+    assert len(lines) == 200 and lines[-1] == '{"line": 199}'
+
+
+def test_submission_endpoint_honours_fields():
+    from src.main import app, create_app
+    import src.api.content_manager_routes as routes
+
+    create_app()
+    submission = make_submission()
+    routes.get_store().save(submission)
+    client = TestClient(app)
+
+    response = client.get(f"/api/content-manager/submission/{submission.submission_id}?fields=title,scores.overall_score")
+    assert response.json()["data"] == {"title": "Best Casinos", "scores": {"overall_score": submission.scores.overall_score}}
+
+    full = client.get(f"/api/content-manager/submission/{submission.submission_id}").json()["data"]
+    assert full["content"] == submission.content
+    assert full["created_at"] == submission.created_at.isoformat()
@@ -0,0 +1,92 @@
+"""
+Revision History Tests
+
+Versions are stored as deltas between checkpoints, any version can be
+rebuilt, and the API exposes history and diffs.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.revisions import CHECKPOINT_INTERVAL, apply_delta, make_delta
+from src.core.schemas import ContentSubmission
+from src.core.storage import MemorySubmissionStore, SQLiteSubmissionStore
+
+
+def article(version: int) -> str:
+    lines = [f"Paragraph {i}: Casino A offers a generous welcome bonus.\n" for i in range(200)]
+    for i in range(version):
+        lines[i * 7 % 200] = f"Paragraph {i * 7 % 200}: revised in version {i + 1}.\n"
+    return "".join(lines)
+
+
+def test_delta_round_trip():
+    old, new = article(0), article(3) + "A closing line without newline"
+    delta = make_delta(old, new)
+    assert apply_delta(old, delta) == new
+    assert len(delta) < len(new) / 20
+    assert apply_delta("", make_delta("", "x")) == "x"
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_history_rebuilds_every_version(tmp_path, backend):
+    if backend == "sqlite":
+        store = SQLiteSubmissionStore(str(tmp_path / "state.db"))
+    else:
+        store = MemorySubmissionStore()
+
+    submission = ContentSubmission(
+        submission_id="s1", writer_id="w1", writer_name="Writer", title="Best Casinos", content=article(0)
+    )
+    store.save(submission)
+    store.save(submission)  # Unchanged content adds no version
+    versions = CHECKPOINT_INTERVAL + 5
+    for version in range(1, versions):
+        submission = store.get("s1")
+        submission.content = article(version)
+        store.save(submission)
+
+    revisions = store.revisions("s1")
+    assert [r.version for r in revisions] == list(range(1, versions + 1))
+    assert [r.version for r in revisions if r.checkpoint] == [1, CHECKPOINT_INTERVAL + 1]
+    assert store.get("s1").revision_count == versions - 1
+    assert sum(r.stored_bytes for r in revisions) < sum(r.chars for r in revisions) / 20
+
+    for version in range(1, versions + 1):
+        assert store.revision_content("s1", version) == article(version - 1)
+    assert store.revision_content("s1", versions + 1) is None
+    assert store.revisions("missing") == []
+
+
+def test_revision_endpoints():
+    from fastapi.testclient import TestClient
+    from src.main import app, create_app
+    import src.api.content_manager_routes as routes
+
+    create_app()
+    store = routes.get_store()
+    submission = ContentSubmission(
+        submission_id="rev-1", writer_id="w1", writer_name="Writer", title="Best Casinos", content=article(0)
+    )
+    store.save(submission)
+    submission.content = article(1)
+    store.save(submission)
+    client = TestClient(app)
+
+    listed = client.get("/api/content-manager/submission/rev-1/revisions").json()["data"]
+    assert [r["version"] for r in listed["revisions"]] == [1, 2]
+
+    original = client.get("/api/content-manager/submission/rev-1/revisions/1").json()["data"]
+    assert original["content"] == article(0)
+
+    diff = client.get("/api/content-manager/submission/rev-1/diff").json()["data"]
+    assert (diff["from_version"], diff["to_version"]) == (1, 2)
+    assert diff["lines_added"] == 1 and diff["lines_removed"] == 1
+    assert "+Paragraph 0: revised in version 1." in diff["diff"]
+
+    assert client.get("/api/content-manager/submission/rev-1/revisions/9").status_code == 404
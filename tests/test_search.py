@@ -0,0 +1,138 @@
+"""
+Search Tests
+
+BM25 ranking, incremental index maintenance through store notifications,
+and highlighted snippets.
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.schemas import ContentSubmission, IssueAnnotation, IssueSeverity, SubmissionStatus
+from src.core import search
+from src.core.search import SearchIndex, highlight, snippet
+from src.core.storage import SQLiteSubmissionStore
+
+
+def make_submission(submission_id: str, title: str, content: str, writer_id: str = "w1") -> ContentSubmission:
+    return ContentSubmission(
+        submission_id=submission_id, writer_id=writer_id, writer_name="Writer", title=title, content=content
+    )
+
+
+def test_bm25_ranks_rare_and_title_matches_higher():
+    index = SearchIndex()
+    index.add(make_submission("s1", "Casino Bonuses", "Bonuses with 35x wagering requirements apply."))
+    index.add(make_submission("s2", "Wagering Requirements Explained", "How casinos count playthrough."))
+    index.add(make_submission("s3", "Poker Sites", "Casino poker rooms and tournaments."))
+
+    hits, total = index.search("wagering requirement")
+    assert [submission_id for submission_id, _ in hits] == ["s2", "s1"]
+    assert total == 2
+
+    assert index.search("casino", writer_id="w2") == ([], 0)
+    assert index.search("the and") == ([], 0)
+
+
+def test_top_k_matches_exhaustive_scoring():
+    import random
+
+    rng = random.Random(7)
+    words = [f"word{i}" for i in range(40)]
+    index = SearchIndex()
+    for i in range(400):
+        body = " ".join(rng.choice(words[:rng.randint(3, 40)]) for _ in range(rng.randint(5, 60)))
+        index.add(make_submission(f"s{i}", "Title", body, writer_id=f"w{i % 3}"))
+    index.search("word1 word7 word30")  # Cache term scores, then change the corpus
+    for i in range(0, 400, 97):
+        index.add(make_submission(f"s{i}", "Title", "word1 word7 word7", writer_id="w0"))
+    index.remove("s5")
+
+    for query in ["word1 word7 word30", "word2", "word0 word39"]:
+        terms = [index._term_scores(t) for t in search.tokenize(query) if t in index.postings]
+        expected = sorted((sum(t.scores.get(doc, 0.0) for t in terms) for doc in index._doc_meta), reverse=True)
+        hits, _ = index.search(query, limit=15)
+        assert [round(score, 9) for _, score in hits] == [round(score, 9) for score in expected[:15]]
+
+
+def test_cached_scores_follow_corpus_statistics():
+    docs = [
+        make_submission("s1", "Alpha", "alpha beta"),
+        make_submission("s2", "Beta", "beta beta gamma delta epsilon"),
+        make_submission("s3", "Notes", "alpha gamma")
+    ]
+    extra = [make_submission(f"x{i}", "Filler", "beta " + "filler " * 40) for i in range(5)]
+
+    warm = SearchIndex()
+    for submission in docs:
+        warm.add(submission)
+    warm.search("alpha beta")  # Cache scores, then change IDF and average length
+    for submission in extra:
+        warm.add(submission)
+
+    cold = SearchIndex()
+    for submission in docs + extra:
+        cold.add(submission)
+
+    assert warm.search("alpha beta") == cold.search("alpha beta")
+
+
+def test_index_follows_store_changes(tmp_path):
+    store = SQLiteSubmissionStore(str(tmp_path / "state.db"))
+    other_worker = SQLiteSubmissionStore(str(tmp_path / "state.db"))
+    index = SearchIndex()
+    store.save(make_submission("s1", "Slots", "Classic fruit machines."))
+    index.attach(store)
+    assert index.search("fruit")[1] == 1
+
+    # Review adds annotations; another worker applies fixes
+    reviewed = store.get("s1")
+    reviewed.status = SubmissionStatus.NEEDS_REVISION
+    reviewed.annotations = [IssueAnnotation(
+        issue_id="i1", severity=IssueSeverity.CRITICAL,
+        explanation="Missing responsible gambling disclaimer", fix_suggestion="Add a disclaimer"
+    )]
+    store.save(reviewed)
+    assert index.search("disclaimer", status="needs_revision")[1] == 1
+
+    fixed = other_worker.get("s1")
+    fixed.content = "Modern video slots with megaways."
+    other_worker.save(fixed)
+    assert index.search("fruit")[1] == 0
+    assert index.search("megaways")[0][0][0] == "s1"
+
+    store.clear()
+    assert index.search("megaways")[1] == 0
+    assert len(index) == 0
+
+
+def test_snippets_highlight_and_escape():
+    text = "Intro. " * 40 + "Watch the <b>wagering</b> requirements on every bonus. " + "Outro. " * 40
+    result = snippet(text, {"wagering", "requirement"}, width=12)
+    assert result.startswith("… ") and result.endswith(" …")
+    assert "&lt;b&gt;<mark>wagering</mark>&lt;/b&gt; <mark>requirements</mark>" in result
+    assert highlight("Wagering Guide", {"wagering"}) == "<mark>Wagering</mark> Guide"
+    assert snippet("", {"x"}) == ""
+
+
+def test_search_endpoint():
+    from fastapi.testclient import TestClient
+    from src.main import app, create_app
+    import src.api.content_manager_routes as routes
+
+    create_app()
+    client = TestClient(app)
+    submitted = client.post("/api/content-manager/submit", params={
+        "writer_id": "w-search", "writer_name": "Writer", "title": "Zanzibar Casino Review",
+        "content": "Zanzibar Casino has 40x wagering requirements on its welcome bonus."
+    }).json()["data"]
+
+    data = client.get("/api/content-manager/search", params={"q": "zanzibar wagering"}).json()["data"]
+    top = data["results"][0]
+    assert top["submission_id"] == submitted["submission_id"]
+    assert top["title_highlighted"] == "<mark>Zanzibar</mark> Casino Review"
+    assert "<mark>wagering</mark>" in top["snippet"]
+    assert routes.get_search_index().search("zanzibar", writer_id="w-other") == ([], 0)
@@ -0,0 +1,91 @@
+"""
+Single-Flight Tests
+
+Concurrent identical reviews and fix requests share one LLM pipeline run.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.singleflight import SingleFlight, make_key
+from benchmarks.stub_llm import StubGenerativeModel
+
+
+def test_concurrent_calls_share_one_execution():
+    flights = SingleFlight()
+    calls = []
+    
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "done"
+    
+    async def run():
+        return await asyncio.gather(*(flights.do("k", work) for _ in range(5)))
+    
+    assert asyncio.run(run()) == ["done"] * 5
+    assert len(calls) == 1
+    assert flights.stats == {"executed": 1, "coalesced": 4}
+    assert not flights.in_flight("k")
+
+
+def test_errors_propagate_to_every_caller():
+    flights = SingleFlight()
+    
+    async def work():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+    
+    async def run():
+        return await asyncio.gather(*(flights.do("k", work) for _ in range(3)), return_exceptions=True)
+    
+    results = asyncio.run(run())
+    assert all(isinstance(r, ValueError) for r in results)
+
+
+def test_cancelled_caller_does_not_cancel_shared_work():
+    flights = SingleFlight()
+    
+    async def work():
+        await asyncio.sleep(0.02)
+        return 42
+    
+    async def run():
+        leader = asyncio.create_task(flights.do("k", work))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flights.do("k", work))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await follower
+    
+    assert asyncio.run(run()) == 42
+
+
+def test_key_ignores_list_order():
+    assert make_key("s1", ["a", "b"]) == make_key("s1", ["b", "a"])
+    assert make_key("s1", ["a"]) != make_key("s2", ["a"])
+
+
+def test_duplicate_review_requests_run_pipeline_once():
+    routes = pytest.importorskip("src.api.content_manager_routes")
+    stub = StubGenerativeModel(latency_s=0.01)
+    routes.get_manager_agent().llm.model = stub
+    
+    async def run():
+        submitted = await routes.submit_content("w1", "Writer One", "Best Casinos", "Casino A is great.")
+        submission_id = submitted.data["submission_id"]
+        first, second = await asyncio.gather(
+            routes.review_submission(submission_id, ["casinos"], "UK"),
+            routes.review_submission(submission_id, ["casinos"], "UK")
+        )
+        return first, second
+    
+    first, second = asyncio.run(run())
+    assert first.data == second.data
+    assert stub.calls == 3
@@ -0,0 +1,34 @@
+"""
+Startup Tests
+
+Importing the app must stay cheap: no Gemini SDK, no config side effects.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).parent.parent
+
+CHECK = (
+    "import sys, os; "
+    "import src.main, src.api.content_manager_routes as routes; "
+    "print('google.generativeai' in sys.modules, os.path.exists('data')); "
+    "routes.get_manager_agent(); "
+    "print('google.generativeai' in sys.modules, os.path.exists('data'))"
+)
+
+
+def test_import_defers_agents_and_config(tmp_path):
+    output = subprocess.run(
+        [sys.executable, "-c", CHECK],
+        cwd=tmp_path,
+        env=dict(os.environ, PYTHONPATH=str(REPO_ROOT), GOOGLE_API_KEY="test"),
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    before, after = output.stdout.strip().splitlines()[-2:]
+    assert before == "False False"
+    assert after == "True True"
@@ -0,0 +1,136 @@
+"""
+Storage Tests
+
+Submission stores, and cross-process cache invalidation for the SQLite
+backend (two store instances on one file stand in for two workers).
+"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.schemas import ContentSubmission, SubmissionStatus
+from src.core.storage import MemorySubmissionStore, SQLiteSubmissionStore
+
+
+def make_submission(submission_id: str, writer_id: str = "w1", minutes: int = 0) -> ContentSubmission:
+    return ContentSubmission(
+        submission_id=submission_id,
+        writer_id=writer_id,
+        writer_name=f"Writer {writer_id}",
+        title="Best Casinos",
+        content="Casino A is great.",
+        created_at=datetime(2025, 1, 1) + timedelta(minutes=minutes)
+    )
+
+
+def test_memory_store_tracks_writers():
+    store = MemorySubmissionStore()
+    store.save(make_submission("s1"))
+    store.save(make_submission("s2", minutes=1))
+    store.save(make_submission("s3", writer_id="w2"))
+
+    updated = make_submission("s1")
+    updated.status = SubmissionStatus.APPROVED
+    store.save(updated)
+
+    assert [s.submission_id for s in store.by_writer("w1")] == ["s1", "s2"]
+    assert store.by_writer("w1")[0].status == SubmissionStatus.APPROVED
+    assert sorted(store.writer_ids()) == ["w1", "w2"]
+    assert len(store.list_all()) == 3
+
+
+def test_sqlite_store_round_trip(tmp_path):
+    store = SQLiteSubmissionStore(str(tmp_path / "state.db"))
+    store.save_many([make_submission("s2", minutes=1), make_submission("s1")])
+
+    reopened = SQLiteSubmissionStore(str(tmp_path / "state.db"))
+    assert reopened.get("s1").title == "Best Casinos"
+    assert [s.submission_id for s in reopened.list_all()] == ["s1", "s2"]
+    assert [s.submission_id for s in reopened.by_writer("w1")] == ["s1", "s2"]
+    assert reopened.get("missing") is None
+
+
+def test_sqlite_cache_invalidated_by_other_process(tmp_path):
+    path = str(tmp_path / "state.db")
+    worker_a = SQLiteSubmissionStore(path)
+    worker_b = SQLiteSubmissionStore(path)
+    changed = []
+    worker_b.subscribe(changed.append)
+
+    worker_a.save(make_submission("s1"))
+    assert worker_b.get("s1").status == SubmissionStatus.PENDING_REVIEW
+    assert len(worker_b.list_all()) == 1
+
+    # Warm cache on B must not serve stale data after A writes
+    updated = make_submission("s1")
+    updated.status = SubmissionStatus.APPROVED
+    worker_a.save(updated)
+    worker_a.save(make_submission("s2", minutes=1))
+
+    assert worker_b.get("s1").status == SubmissionStatus.APPROVED
+    assert [s.submission_id for s in worker_b.list_all()] == ["s1", "s2"]
+    assert "s1" in changed and "s2" in changed
+
+    # B's own write is seen by A, and B doesn't invalidate its own entry
+    worker_b.save(worker_b.get("s2"))
+    cached = worker_b._cache["s2"]
+    assert worker_b.get("s2").content == "Casino A is great."
+    assert worker_b._cache["s2"] is cached
+    assert worker_a.get("s2").submission_id == "s2"
+
+
+def test_job_lease_is_shared_between_processes(tmp_path):
+    path = str(tmp_path / "state.db")
+    worker_a = SQLiteSubmissionStore(path)
+    worker_b = SQLiteSubmissionStore(path)
+
+    assert worker_a.start_job("review:k")
+    assert not worker_b.start_job("review:k")
+    assert worker_b.job_running("review:k")
+
+    worker_a.finish_job("review:k")
+    assert not worker_b.job_running("review:k")
+    assert worker_b.start_job("review:k")
+
+    # Expired leases can be taken over (e.g. the owner crashed)
+    assert worker_a.start_job("fixes:k", lease_s=-1)
+    assert worker_b.start_job("fixes:k")
+
+
+def test_followers_refresh_while_the_store_writes(tmp_path):
+    import threading
+    from src.core.listing import SubmissionListIndex
+
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # interleave the threads as much as possible
+
+    store = SQLiteSubmissionStore(str(tmp_path / "state.db"))
+    index = SubmissionListIndex()
+    index.attach(store)
+    done = threading.Event()
+
+    def write():
+        for i in range(1000):
+            store.save(make_submission(f"s{i}", writer_id=f"w{i % 5}", minutes=i))
+        done.set()
+
+    def refresh():
+        while not done.is_set():
+            index.refresh()
+
+    # Notifications arrive under the store lock while refresh reads the store
+    threads = [threading.Thread(target=target, daemon=True) for target in (write, refresh, refresh)]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+    finally:
+        sys.setswitchinterval(switch_interval)
+    assert not any(thread.is_alive() for thread in threads), "store writes and follower refresh deadlocked"
+    index.refresh()
+    assert len(index) == 1000
@@ -0,0 +1,113 @@
+"""
+Structured Output Tests
+
+Parsing, local repair and bounded re-asks for each review stage schema.
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+from typing import List
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.schemas import FeedbackOutput, IssueOutput, IssueSeverity, ScoresOutput
+from src.core.structured_output import (
+    StructuredOutputError,
+    extract_json,
+    generate_structured,
+    repair_json
+)
+
+
+class ScriptedLLM:
+    """Returns queued responses and records prompts"""
+    
+    def __init__(self, *texts):
+        self.texts = list(texts)
+        self.prompts = []
+        self.kwargs = []
+    
+    async def generate(self, prompt, **kwargs):
+        self.prompts.append(prompt)
+        self.kwargs.append(kwargs)
+        return type("Response", (), {"text": self.texts.pop(0)})()
+
+
+SCORES = {"seo_score": 70, "eeat_score": 60, "content_quality": 80, "compliance_score": 50}
+
+
+def test_extract_json_handles_fenced_arrays_and_prose():
+    text = 'Here you go:\n```json\n[{"severity": "critical"}]\n```\nThanks!'
+    assert extract_json(text) == [{"severity": "critical"}]
+    assert extract_json('Result: {"a": 1} and more') == {"a": 1}
+
+
+def test_repair_fixes_trailing_commas_literals_and_truncation():
+    assert json.loads(repair_json('{"a": [1, 2,], "b": True,}')) == {"a": [1, 2], "b": True}
+    assert json.loads(repair_json('[{"explanation": "None of these, really", "x": None')) == [
+        {"explanation": "None of these, really", "x": None}
+    ]
+
+
+def test_valid_output_needs_one_call_in_json_mode():
+    llm = ScriptedLLM(json.dumps(SCORES))
+    result = asyncio.run(generate_structured(llm, "score it", ScoresOutput, "scores"))
+    
+    assert result.seo_score == 70
+    assert len(llm.prompts) == 1
+    assert llm.kwargs[0]["generation_config"]["response_mime_type"] == "application/json"
+
+
+def test_issue_arrays_are_parsed_and_severity_normalized():
+    issues = [{"severity": "Critical", "explanation": "No RG notice", "fix_suggestion": "Add one"}]
+    llm = ScriptedLLM("```json\n" + json.dumps(issues) + "\n```")
+    result = asyncio.run(generate_structured(llm, "find issues", List[IssueOutput], "annotations"))
+    
+    assert result[0].severity == IssueSeverity.CRITICAL
+
+
+def test_reask_requests_only_missing_fields():
+    partial = {k: v for k, v in SCORES.items() if k != "compliance_score"}
+    llm = ScriptedLLM(json.dumps(partial), '{"compliance_score": 65}')
+    stats = {}
+    result = asyncio.run(generate_structured(llm, "score it", ScoresOutput, "scores", stats=stats))
+    
+    assert result.compliance_score == 65
+    assert "compliance_score" in llm.prompts[1]
+    assert "seo_score" not in llm.prompts[1].split("missing or invalid:")[1]
+    assert stats == {"reasked": 1}
+
+
+def test_reask_patches_fields_inside_arrays():
+    issues = [
+        {"severity": "warning", "explanation": "Thin", "fix_suggestion": "Expand"},
+        {"severity": "warning", "explanation": "No links"}
+    ]
+    llm = ScriptedLLM(json.dumps(issues), '{"1.fix_suggestion": "Add internal links"}')
+    result = asyncio.run(generate_structured(llm, "find issues", List[IssueOutput], "annotations"))
+    
+    assert result[1].fix_suggestion == "Add internal links"
+
+
+def test_invalid_output_raises_instead_of_defaulting():
+    llm = ScriptedLLM("I cannot help with that.", "Still not JSON")
+    stats = {}
+    with pytest.raises(StructuredOutputError):
+        asyncio.run(generate_structured(llm, "feedback", FeedbackOutput, "feedback", stats=stats))
+    assert len(llm.prompts) == 2
+    assert stats["failed"] == 1
+
+
+def test_broken_document_is_repaired_not_truncated_to_nested_value():
+    text = '{"overall_comment": "Good", "strengths": ["a", "b",], }'
+    llm = ScriptedLLM(text)
+    stats = {}
+    result = asyncio.run(generate_structured(llm, "feedback", FeedbackOutput, "feedback", stats=stats))
+    
+    assert result.strengths == ["a", "b"]
+    assert stats == {"repaired": 1}
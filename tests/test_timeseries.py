@@ -0,0 +1,142 @@
+"""
+Time-Bucketed Analytics Tests
+
+Rolling hourly/daily/weekly counters agree with a scan of the submissions
+for any window, and follow reviews and removals.
+"""
+
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.synthetic import make_submissions
+from src.agents.content_manager.writer_agent import WriterAnalysisAgent
+from src.core.schemas import ContentScore, SubmissionStatus
+from src.core.storage import MemorySubmissionStore
+from src.core.timeseries import RollingAnalytics, bucket_start, hour_index
+
+
+def build(count: int = 600):
+    store = MemorySubmissionStore()
+    store.save_many(make_submissions(count, submissions_per_writer=10, seed=5))
+    rolling = RollingAnalytics()
+    rolling.attach(store)
+    return store, rolling
+
+
+def scan(store, start: datetime, end: datetime) -> dict:
+    """Window counts the slow way (hour resolution, like the index)"""
+    low, high = hour_index(start), hour_index(end) + 1
+    created = [s for s in store.list_all() if low <= hour_index(s.created_at) < high]
+    reviewed = [s for s in store.list_all() if s.reviewed_at and low <= hour_index(s.reviewed_at) < high]
+    scores = [s.scores.overall_score for s in reviewed if s.scores]
+    hours = [(s.reviewed_at - s.created_at).total_seconds() / 3600 for s in reviewed]
+    return {
+        "submissions": len(created),
+        "reviews": len(reviewed),
+        "approvals": sum(1 for s in reviewed if s.status in (SubmissionStatus.APPROVED, SubmissionStatus.PUBLISHED)),
+        "average_score": round(sum(scores) / len(scores), 1) if scores else 0.0,
+        "average_review_time": round(sum(hours) / len(hours), 1) if hours else 0.0
+    }
+
+
+def test_windows_match_a_scan():
+    store, rolling = build()
+    now = datetime.now()
+    for days, offset_hours in ((1, 0), (7, 5), (30, 13), (100, 200), (400, 0)):
+        end = now - timedelta(hours=offset_hours, minutes=17)
+        start = end - timedelta(days=days, hours=3)
+        summary = rolling.window(start, end)
+        assert {k: summary[k] for k in scan(store, start, end)} == scan(store, start, end)
+        assert sum(summary["review_time_histogram"].values()) == summary["reviews"]
+    assert rolling.window(start.astimezone(timezone.utc), end.astimezone(timezone.utc)) == summary
+
+
+def test_series_buckets():
+    store, rolling = build()
+    end = datetime.now()
+    start = end - timedelta(weeks=20)
+
+    weeks = rolling.series("week", start, end)
+    assert all(datetime.fromisoformat(w["start"]).weekday() == 0 for w in weeks)
+    assert datetime.fromisoformat(weeks[0]["start"]) <= start < datetime.fromisoformat(weeks[1]["start"])
+    days = rolling.series("day", start, end)
+    assert sum(w["submissions"] for w in weeks) == sum(d["submissions"] for d in days)
+    assert all(datetime.fromisoformat(d["start"]).hour == 0 for d in days)
+
+    # Buckets nest: a week starts on a day boundary
+    hour = hour_index(end)
+    assert bucket_start(bucket_start(hour, "week"), "day") == bucket_start(hour, "week")
+
+
+def test_counters_follow_changes():
+    store, rolling = build(50)
+    pending = next(s for s in store.list_all() if not s.reviewed_at)
+    before = rolling.totals()
+
+    reviewed = store.get(pending.submission_id)
+    reviewed.scores = ContentScore(
+        seo_score=90, eeat_score=90, content_quality=90, compliance_score=90, overall_score=90
+    )
+    reviewed.status = SubmissionStatus.APPROVED
+    reviewed.reviewed_at = reviewed.created_at + timedelta(hours=2)
+    store.save(reviewed)
+
+    after = rolling.totals()
+    assert after["submissions"] == before["submissions"]
+    assert after["reviews"] == before["reviews"] + 1
+    assert after["approvals"] == before["approvals"] + 1
+    assert after["review_time_histogram"]["1-4h"] == before["review_time_histogram"]["1-4h"] + 1
+
+    store.clear()
+    assert rolling.totals()["submissions"] == 0
+    assert rolling.series("day", datetime.now() - timedelta(days=2), datetime.now())[0]["submissions"] == 0
+
+
+def test_team_analytics_reads_counters():
+    store, rolling = build()
+    agent = WriterAnalysisAgent()
+    submissions = store.list_all()
+
+    scanned = agent.generate_team_analytics(submissions, [])
+    counted = agent.generate_team_analytics(submissions, [], rolling=rolling)
+    assert counted.average_team_score == scanned.average_team_score
+    assert abs(counted.average_review_time - scanned.average_review_time) <= 0.1
+
+
+def test_trends_endpoint():
+    from fastapi.testclient import TestClient
+    from src.main import app, create_app
+    import src.api.content_manager_routes as routes
+
+    create_app()
+    routes.get_store().save_many(make_submissions(60, submissions_per_writer=5, seed=21))
+    client = TestClient(app)
+
+    data = client.get("/api/content-manager/team/trends", params={"granularity": "week"}).json()["data"]
+    assert len(data["buckets"]) in (30, 31)
+    # Buckets cover whole weeks, the summary only the window itself
+    assert 0 < data["summary"]["submissions"] <= sum(b["submissions"] for b in data["buckets"])
+
+    assert client.get("/api/content-manager/team/trends", params={"granularity": "month"}).status_code == 400
+    assert client.get("/api/content-manager/team/trends", params={
+        "granularity": "hour", "start": "2020-01-01T00:00:00"
+    }).status_code == 400
+
+    # UTC bounds are compared with the naive stored datetimes on the local clock
+    end = datetime.now().astimezone(timezone.utc)
+    utc = client.get("/api/content-manager/team/trends", params={
+        "granularity": "day",
+        "start": (end - timedelta(days=10)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "end": end.strftime("%Y-%m-%dT%H:%M:%SZ")
+    })
+    assert utc.status_code == 200 and len(utc.json()["data"]["buckets"]) in (10, 11)
+    assert client.get("/api/content-manager/team/trends", params={
+        "start": "2026-10-02T00:00:00Z", "end": "2026-10-01T00:00:00Z"
+    }).status_code == 400
+    assert client.get("/api/content-manager/team/trends", params={
+        "granularity": "week", "end": "0001-01-01T00:00:00"
+    }).status_code == 400
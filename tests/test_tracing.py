@@ -0,0 +1,126 @@
+"""
+Tracing Tests
+
+Spans propagate through context variables, are sampled per trace and are
+written as OTLP-shaped JSON lines.
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.tracing import (
+    JSONLSpanExporter,
+    Tracer,
+    current_span,
+    parse_traceparent,
+    set_tracer
+)
+from benchmarks.stub_llm import StubGenerativeModel
+
+
+def read_spans(path: Path) -> list:
+    spans = []
+    for line in path.read_text().splitlines():
+        for resource in json.loads(line)["resourceSpans"]:
+            for scope in resource["scopeSpans"]:
+                spans.extend(scope["spans"])
+    return spans
+
+
+def test_spans_nest_across_tasks(tmp_path):
+    exporter = JSONLSpanExporter(str(tmp_path / "traces.jsonl"))
+    tracer = Tracer(exporter, sample_rate=1.0)
+
+    async def stage(name):
+        with tracer.span(name):
+            await asyncio.sleep(0)
+            return current_span().trace_id
+
+    async def run():
+        with tracer.span("root") as root:
+            trace_ids = await asyncio.gather(stage("a"), stage("b"))
+        return root, trace_ids
+
+    root, trace_ids = asyncio.run(run())
+    exporter.shutdown()
+
+    spans = {s["name"]: s for s in read_spans(tmp_path / "traces.jsonl")}
+    assert set(trace_ids) == {root.trace_id}
+    assert spans["a"]["parentSpanId"] == spans["root"]["spanId"]
+    assert spans["b"]["traceId"] == root.trace_id
+    assert "parentSpanId" not in spans["root"]
+    assert current_span() is None
+
+
+def test_unsampled_traces_keep_ids_but_are_not_written(tmp_path):
+    exporter = JSONLSpanExporter(str(tmp_path / "traces.jsonl"))
+    tracer = Tracer(exporter, sample_rate=0.0)
+
+    with tracer.span("root") as root:
+        with tracer.span("child") as child:
+            assert child.trace_id == root.trace_id
+    exporter.shutdown()
+
+    assert not (tmp_path / "traces.jsonl").exists()
+
+
+def test_errors_are_recorded(tmp_path):
+    exporter = JSONLSpanExporter(str(tmp_path / "traces.jsonl"))
+    tracer = Tracer(exporter, sample_rate=1.0)
+
+    with pytest.raises(ValueError):
+        with tracer.span("fails"):
+            raise ValueError("bad output")
+    exporter.shutdown()
+
+    span = read_spans(tmp_path / "traces.jsonl")[0]
+    assert span["status"] == {"code": 2, "message": "ValueError: bad output"}
+
+
+def test_parse_traceparent():
+    assert parse_traceparent("00-" + "a" * 32 + "-" + "b" * 16 + "-01") == ("a" * 32, "b" * 16, True)
+    assert parse_traceparent("garbage") is None
+    assert parse_traceparent(None) is None
+
+
+def test_review_request_traces_route_agent_llm_and_storage(tmp_path):
+    testclient = pytest.importorskip("fastapi.testclient")
+    from src.main import app, create_app
+    import src.api.content_manager_routes as routes
+
+    create_app()
+    routes.get_manager_agent().llm.model = StubGenerativeModel()
+    exporter = JSONLSpanExporter(str(tmp_path / "traces.jsonl"))
+    set_tracer(Tracer(exporter, sample_rate=1.0))
+    try:
+        client = testclient.TestClient(app)
+        submitted = client.post("/api/content-manager/submit", params={
+            "writer_id": "w1", "writer_name": "Writer One", "title": "Best Casinos", "content": "Casino A is great."
+        }).json()
+        trace_id = "c" * 32
+        response = client.post(
+            f"/api/content-manager/review/{submitted['data']['submission_id']}",
+            headers={"traceparent": f"00-{trace_id}-{'d' * 16}-01"}
+        )
+    finally:
+        set_tracer(None)
+        exporter.shutdown()
+
+    assert response.status_code == 200
+    assert response.headers["x-trace-id"] == trace_id
+
+    spans = [s for s in read_spans(tmp_path / "traces.jsonl") if s["traceId"] == trace_id]
+    by_id = {s["spanId"]: s for s in spans}
+    names = {s["name"] for s in spans}
+    assert "POST /api/content-manager/review/{submission_id}" in names
+    assert {"agent.review_submission", "agent.scores", "agent.annotations", "agent.feedback", "storage.save"} <= names
+
+    llm_parents = {by_id[s["parentSpanId"]]["name"] for s in spans if s["name"] == "llm.generate"}
+    assert llm_parents == {"agent.scores", "agent.annotations", "agent.feedback"}
@@ -0,0 +1,69 @@
+"""
+Writer Trend Engine Tests
+
+Batched slopes, EWMA-smoothed scores and skill trends over padded score
+matrices match their definitions and the single-writer computation.
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.trends import EWMA_ALPHA, fitted_change, pad, single_writer_trends, slopes, writer_trends
+
+
+def random_histories(writers: int, seed: int) -> list:
+    rng = random.Random(seed)
+    return [[rng.randint(0, 100) for _ in range(rng.randint(0, 30))] for _ in range(writers)]
+
+
+def test_slopes_and_ewma_match_definitions():
+    histories = random_histories(200, seed=1)
+    padded = pad(histories)
+
+    for history, slope, change, smoothed in zip(
+        histories, slopes(padded), fitted_change(padded), writer_trends(padded, padded, {}).smoothed_score
+    ):
+        if len(history) >= 2:
+            expected = np.polyfit(np.arange(len(history)), history, 1)[0]
+            assert abs(slope - expected) < 1e-9
+            assert abs(change - expected * (len(history) - 1)) < 1e-9
+        else:
+            assert slope == 0 and change == 0
+
+        value = history[0] if history else 0.0
+        for score in history[1:]:
+            value = EWMA_ALPHA * score + (1 - EWMA_ALPHA) * value
+        assert abs(smoothed - value) < 1e-9
+
+    assert fitted_change(pad([[60, 75]]))[0] == 15
+
+
+def test_batch_matches_single_writer():
+    overall = random_histories(300, seed=2)
+    skills = {"seo": [[(score * 7) % 101 for score in history] for history in overall]}
+    trends = [history[-10:] for history in overall]
+
+    batch = writer_trends(pad(trends), pad(overall), {"seo": pad(skills["seo"])})
+    for i in range(300):
+        rate, smoothed, changes = single_writer_trends(trends[i], overall[i], {"seo": skills["seo"][i]})
+        assert rate == batch.improvement_rate[i]
+        assert smoothed == batch.smoothed_score[i]
+        assert changes["seo"] == batch.skill_improvement["seo"][i]
+
+
+def test_whole_team_recompute_is_fast():
+    histories = random_histories(2000, seed=4)
+    padded = pad(histories)
+    skills = {name: padded for name in ("a", "b", "c", "d")}
+
+    start = time.perf_counter()
+    trends = writer_trends(padded, padded, skills)
+    assert time.perf_counter() - start < 0.5
+    assert len(trends.improvement_rate) == 2000
@@ -2,9 +2,17 @@
 RankSmart — Multi-Agent SEO Audit Team
 """
 
-import os, re, textwrap
+import os, re, json, textwrap
 from google.adk import ADKAgent, tool, state
 
+from .stages import StageCache, StageGraph
+
+# Competitor pages scraped from the SERP (each its own stage)
+MAX_COMPETITORS = int(os.getenv("AUDIT_MAX_COMPETITORS", "3"))
+
+# Stage outputs shared across audits; scrapes and SERP lookups are reused for an hour
+STAGE_CACHE = StageCache(os.getenv("AUDIT_CACHE_DIR"), ttl_s=float(os.getenv("AUDIT_CACHE_TTL_S", "3600")))
+
 # === Shared Firecrawl + Google CSE tools ===
 
 @tool
@@ -37,35 +45,113 @@ def perform_google_search(query: str, limit: int = 10) -> str:
     return r.text
 
 
+# === Audit stage graph ===
+
+def competitor_url(serp_json: str, rank: int, target: str) -> str:
+    """URL of the `rank`-th SERP result other than the audited page ("" if none)"""
+    try:
+        items = json.loads(serp_json).get("items", [])
+    except (ValueError, AttributeError):
+        return ""
+    links = [item.get("link", "") for item in items if item.get("link") and item.get("link") != target]
+    return links[rank] if rank < len(links) else ""
+
+
+def build_report(url: str, page_markdown: str, competitor_pages=()) -> str:
+    """SEO audit report with Quick View summary."""
+    from textwrap import dedent
+    content = page_markdown[:10000]  # keep LLM input small
+    report = dedent(f"""
+    ## ⚡ Quick View Summary
+    - URL: {url}
+    - Keywords & Intent inferred from content
+    - Core technical checks (noindex, meta tags, headings, links)
+    - Content depth & keyword coverage
+    - Competitor themes via SERP snapshot
+
+    ## 🔍 Audit Narrative
+    {content[:2000]}...
+    """)
+    pages = [page for page in competitor_pages if page.get("url")]
+    if pages:
+        report += "\n## 🏁 Competitors\n" + "\n".join(
+            f"- {page['url']} ({len(page['markdown'].split())} words)" for page in pages
+        ) + "\n"
+    return report
+
+
+def build_draft(report: str) -> str:
+    """Ready-to-publish draft built on the audit report."""
+    return f"# SEO Draft Article\n\n{report}\n\n(Generated by RankSmart)"
+
+
+def build_audit_graph(scrape, search, competitors: int = MAX_COMPETITORS, cache: StageCache = STAGE_CACHE) -> StageGraph:
+    """
+    Audit stages for a target URL: page scrape and SERP lookup run together,
+    then one scrape per competitor, then report and draft.
+
+    `scrape(url)` and `search(query)` are async callables (the ADK tools).
+    """
+    graph = StageGraph(inputs=["url"], cache=cache)
+
+    async def page(url):
+        return await scrape(url)
+
+    async def serp(url):
+        return await search(url)
+
+    graph.add("page", page, ["url"])
+    graph.add("serp", serp, ["url"])
+    for rank in range(competitors):
+        async def competitor(url, serp, rank=rank):
+            link = competitor_url(serp, rank, url)
+            return {"url": link, "markdown": await scrape(link) if link else ""}
+        graph.add(f"competitor_{rank}", competitor, ["url", "serp"])
+
+    competitor_stages = [f"competitor_{rank}" for rank in range(competitors)]
+    graph.add(
+        "report",
+        lambda url, page, **pages: build_report(url, page, [pages[name] for name in competitor_stages]),
+        ["url", "page", *competitor_stages],
+        cache=False
+    )
+    graph.add("draft", build_draft, ["report"], cache=False)
+    return graph
+
+
+def target_url(text: str) -> str:
+    """The URL to audit from the user's message."""
+    target = text.strip()
+    if not target.startswith("http"):
+        target = re.search(r"https?://[^\s]+", text).group(0)
+    return target
+
+
 # === Core agents ===
 
 class PageAuditorAgent(ADKAgent):
-    """Collects data: scrape page + SERP."""
+    """Collects data: scrape page + SERP + competitor pages, concurrently."""
     async def run(self, s: state):
-        target = s.input.strip()
-        if not target.startswith("http"):
-            target = re.search(r"https?://[^\s]+", s.input).group(0)
-        s.page_markdown = await self.use(firecrawl_scrape, url=target)
-        s.serp_json = await self.use(perform_google_search, query=target)
-        return "Page content and SERP data collected."
+        async def scrape(url):
+            return await self.use(firecrawl_scrape, url=url)
+
+        async def search(query):
+            return await self.use(perform_google_search, query=query)
+
+        graph = build_audit_graph(scrape, search)
+        competitors = [name for name in graph.stages if name.startswith("competitor_")]
+        run = await graph.run({"url": target_url(s.input)}, targets=["page", "serp", *competitors])
+        s.page_markdown = run.outputs["page"]
+        s.serp_json = run.outputs["serp"]
+        s.competitor_pages = [run.outputs[name] for name in competitors if run.outputs[name]["url"]]
+        s.stage_timings = run.summary()
+        return f"Page content, SERP data and {len(s.competitor_pages)} competitor pages collected.\n\n{run.summary()}"
 
 
 class OptimizationAdvisorAgent(ADKAgent):
     """Creates the SEO audit report with Quick View summary."""
     async def run(self, s: state):
-        from textwrap import dedent
-        content = s.page_markdown[:10000]  # keep LLM input small
-        report = dedent(f"""
-        ## ⚡ Quick View Summary
-        - URL: {s.input}
-        - Keywords & Intent inferred from content
-        - Core technical checks (noindex, meta tags, headings, links)
-        - Content depth & keyword coverage
-        - Competitor themes via SERP snapshot
-
-        ## 🔍 Audit Narrative
-        {content[:2000]}...
-        """)
+        report = build_report(s.input, s.page_markdown, getattr(s, "competitor_pages", []))
         s.audit_report = report
         return report
 
@@ -73,8 +159,7 @@ class OptimizationAdvisorAgent(ADKAgent):
 class ContentWriterAgent(ADKAgent):
     """Creates a ready-to-publish SEO-optimized article."""
     async def run(self, s: state):
-        base = getattr(s, "audit_report", "")
-        draft = f"# SEO Draft Article\n\n{base}\n\n(Generated by RankSmart)"
+        draft = build_draft(getattr(s, "audit_report", ""))
         s.draft_article = draft
         return draft
 
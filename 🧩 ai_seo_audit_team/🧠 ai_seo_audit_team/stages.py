@@ -0,0 +1,182 @@
+"""
+RankSmart — Audit Stage Graph
+
+A small dependency-graph executor for audit stages. Each stage starts as
+soon as the stages it depends on have finished, so independent work (page
+scrape, SERP lookup, per-competitor scrapes) overlaps and a full audit takes
+as long as its critical path.
+
+Stage outputs are cached under a hash of the stage name and its inputs; a
+re-run with unchanged inputs skips the stage. Every run reports per-stage
+timings.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+
+class Stage(NamedTuple):
+    name: str
+    fn: Callable[..., Any]  # called with one keyword argument per dependency
+    deps: Tuple[str, ...]
+    cache: bool
+
+
+class StageTiming(NamedTuple):
+    name: str
+    seconds: float
+    cached: bool
+
+
+def input_hash(name: str, kwargs: Dict[str, Any]) -> str:
+    """Cache key for running stage `name` on `kwargs`"""
+    payload = json.dumps([name, kwargs], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class StageCache:
+    """
+    Stage outputs by input hash, in memory and optionally as JSON files.
+
+    Args:
+        directory: Persist outputs here so re-runs in new processes hit too
+        ttl_s: Age after which an output is recomputed (None: never); bounds
+            how stale a cached scrape or SERP lookup can get
+    """
+
+    def __init__(self, directory: Optional[str] = None, ttl_s: Optional[float] = None):
+        self.directory = Path(directory) if directory else None
+        self.ttl_s = ttl_s
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        if self.directory:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is None and self.directory:
+            path = self.directory / f"{key}.json"
+            if path.exists():
+                entry = tuple(json.loads(path.read_text(encoding="utf-8")))
+                self._entries[key] = entry
+        if entry is None or (self.ttl_s is not None and time.time() - entry[0] > self.ttl_s):
+            return False, None
+        return True, entry[1]
+
+    def put(self, key: str, value: Any):
+        entry = (time.time(), value)
+        self._entries[key] = entry
+        if self.directory:
+            path = self.directory / f"{key}.json"
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(entry, default=str), encoding="utf-8")
+            os.replace(tmp, path)
+
+
+class AuditRun:
+    """Outputs and timings of one `StageGraph.run`"""
+
+    def __init__(self, outputs: Dict[str, Any], timings: List[StageTiming], wall_s: float):
+        self.outputs = outputs
+        self.timings = timings
+        self.wall_s = wall_s
+
+    @property
+    def cached(self) -> List[str]:
+        return [t.name for t in self.timings if t.cached]
+
+    def summary(self) -> str:
+        """Markdown table of stage timings"""
+        lines = ["| Stage | Time | Cached |", "|---|---|---|"]
+        lines += [f"| {t.name} | {t.seconds:.2f}s | {'yes' if t.cached else ''} |" for t in self.timings]
+        total = sum(t.seconds for t in self.timings)
+        lines.append(f"\nWall time {self.wall_s:.2f}s (stages sum to {total:.2f}s)")
+        return "\n".join(lines)
+
+
+class StageGraph:
+    """
+    Audit stages and their dependencies.
+
+    Stages are added after everything they depend on (which rules out
+    cycles). Synchronous stage functions run in worker threads; async ones
+    on the event loop.
+
+    Args:
+        inputs: Names of the values supplied to `run`
+        cache: Where stage outputs are cached (a private in-memory cache if None)
+    """
+
+    def __init__(self, inputs: Sequence[str] = (), cache: Optional[StageCache] = None):
+        self.inputs = tuple(inputs)
+        self.cache = cache if cache is not None else StageCache()
+        self.stages: Dict[str, Stage] = {}
+
+    def add(self, name: str, fn: Callable[..., Any], deps: Iterable[str] = (), cache: bool = True) -> "StageGraph":
+        """Register a stage; `fn` receives its dependencies' outputs by name"""
+        deps = tuple(deps)
+        if name in self.stages or name in self.inputs:
+            raise ValueError(f"Duplicate stage: {name}")
+        unknown = [d for d in deps if d not in self.stages and d not in self.inputs]
+        if unknown:
+            raise ValueError(f"Stage {name} depends on unknown stages: {', '.join(unknown)}")
+        self.stages[name] = Stage(name, fn, deps, cache)
+        return self
+
+    def _required(self, targets: Optional[Iterable[str]]) -> List[Stage]:
+        """Stages needed for `targets`, in registration (topological) order"""
+        if targets is None:
+            return list(self.stages.values())
+        needed = set()
+        pending = list(targets)
+        while pending:
+            name = pending.pop()
+            if name in needed or name in self.inputs:
+                continue
+            if name not in self.stages:
+                raise ValueError(f"Unknown stage: {name}")
+            needed.add(name)
+            pending.extend(self.stages[name].deps)
+        return [stage for stage in self.stages.values() if stage.name in needed]
+
+    async def run(self, inputs: Dict[str, Any], targets: Optional[Iterable[str]] = None) -> AuditRun:
+        """Run the stages `targets` need (all by default), independent ones concurrently"""
+        missing = [name for name in self.inputs if name not in inputs]
+        if missing:
+            raise ValueError(f"Missing inputs: {', '.join(missing)}")
+
+        outputs: Dict[str, Any] = {name: inputs[name] for name in self.inputs}
+        timings: Dict[str, StageTiming] = {}
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def run_stage(stage: Stage):
+            await asyncio.gather(*(tasks[d] for d in stage.deps if d in tasks))
+            kwargs = {d: outputs[d] for d in stage.deps}
+            start = time.perf_counter()
+            key = input_hash(stage.name, kwargs)
+            hit, value = self.cache.get(key) if stage.cache else (False, None)
+            if not hit:
+                if asyncio.iscoroutinefunction(stage.fn):
+                    value = await stage.fn(**kwargs)
+                else:
+                    value = await asyncio.to_thread(stage.fn, **kwargs)
+                if stage.cache:
+                    self.cache.put(key, value)
+            outputs[stage.name] = value
+            timings[stage.name] = StageTiming(stage.name, time.perf_counter() - start, hit)
+
+        start = time.perf_counter()
+        required = self._required(targets)
+        for stage in required:
+            tasks[stage.name] = asyncio.ensure_future(run_stage(stage))
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            raise
+        return AuditRun(outputs, [timings[stage.name] for stage in required], time.perf_counter() - start)